@@ -0,0 +1,364 @@
+"""
+AOF (Append Only File) 영속성 구현
+
+이 모듈은 변경 명령어(SET, MSET, INCRBY, HSET, HDEL, DEL, PEXPIREAT, PERSIST)를 RESP 형식으로 파일 끝에 기록하고,
+재시작 시 파일을 재생(replay)하여 키스페이스를 복원합니다.
+
+fsync 정책:
+- always:   명령어마다 write + fsync (가장 안전, 가장 느림)
+- everysec: 버퍼에 모아 이벤트 루프마다 한 번 write, fsync는 1초에 한 번
+- no:       버퍼에 모아 write만 하고 fsync는 OS에 맡김
+
+백그라운드 재작성(BGREWRITEAOF):
+    os.fork()로 자식 프로세스를 만들어 현재 키스페이스를 최소 명령어로 임시 파일에 기록합니다.
+    그동안 부모는 계속 명령어를 처리하며, 새 명령어를 재작성 버퍼에도 복사해 둡니다.
+    자식이 끝나면 재작성 버퍼를 임시 파일 끝에 붙이고 원자적으로 교체(os.replace)합니다.
+"""
+
+import os
+import sys
+import time
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from protocol import RespParser, encode_command
+from data_structures.hash_object import HashObject
+
+
+FSYNC_ALWAYS = "always"
+FSYNC_EVERYSEC = "everysec"
+FSYNC_NO = "no"
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_EVERYSEC, FSYNC_NO)
+
+
+class AppendOnlyFile:
+    """
+    AOF 기록기
+
+    Attributes:
+        path: AOF 파일 경로
+        fsync_policy: fsync 정책 (always / everysec / no)
+        _fd: AOF 파일 디스크립터 (O_APPEND)
+        _buf: 아직 write되지 않은 명령어 버퍼
+        _rewrite_buf: 재작성 중 들어온 명령어 버퍼 (재작성 중이 아니면 None)
+        _rewrite_pid: 재작성 자식 프로세스 PID (없으면 None)
+    """
+
+    # 버퍼가 이 크기를 넘으면 다음 flush를 기다리지 않고 즉시 write
+    MAX_BUFFER_BYTES = 4 * 1024 * 1024
+
+    # 재작성 시 TTL 없는 키를 MSET 하나로 묶는 개수
+    REWRITE_BATCH = 64
+
+    def __init__(self, path, fsync_policy=FSYNC_EVERYSEC):
+        """
+        AOF 파일 열기 (없으면 생성)
+
+        Args:
+            path: AOF 파일 경로
+            fsync_policy: fsync 정책
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"invalid appendfsync policy '{fsync_policy}'")
+
+        self.path = path
+        self.fsync_policy = fsync_policy
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._buf = bytearray()
+        self._rewrite_buf = None
+        self._rewrite_pid = None
+        self._rewrite_tmp = None
+        self._rewrite_start = 0.0
+
+        self._last_fsync = time.time()
+        self._fsync_pending = False
+
+        # 통계
+        self.current_size = os.fstat(self._fd).st_size
+        self.base_size = self.current_size
+        self.last_rewrite_time_sec = -1
+        self.last_bgrewrite_status = "ok"
+        self.rewrites = 0
+
+    # ==================== 명령어 기록 ====================
+
+    def feed(self, tokens):
+        """
+        변경 명령어 하나를 기록
+
+        always 정책이 아니면 메모리 버퍼에만 추가하고,
+        실제 write는 flush()에서 모아서 한 번에 수행합니다.
+
+        Args:
+            tokens: 명령어 토큰 (예: ("SET", key, value))
+        """
+        frame = encode_command(tokens)
+        self._buf += frame
+        if self._rewrite_buf is not None:
+            self._rewrite_buf += frame
+
+        if self.fsync_policy == FSYNC_ALWAYS:
+            self.flush()
+        elif len(self._buf) >= self.MAX_BUFFER_BYTES:
+            self.flush()
+
+    def flush(self):
+        """
+        버퍼를 파일에 write (정책이 always이면 fsync까지)
+
+        이벤트 루프 한 바퀴(또는 파이프라인 배치)마다 호출되어
+        명령어 여러 개를 write 한 번으로 묶습니다.
+        """
+        if self._buf:
+            data = bytes(self._buf)
+            self._buf.clear()
+            self._write_all(self._fd, data)
+            self.current_size += len(data)
+            self._fsync_pending = True
+
+        if self.fsync_policy == FSYNC_ALWAYS and self._fsync_pending:
+            self._fsync()
+
+    def cron(self):
+        """
+        주기 작업 (서버 cron에서 호출)
+
+        1. 버퍼 flush
+        2. everysec 정책이면 마지막 fsync 후 1초가 지났을 때 fsync
+        3. 백그라운드 재작성 자식 프로세스 종료 확인
+        """
+        self.flush()
+
+        if (self.fsync_policy == FSYNC_EVERYSEC and self._fsync_pending
+                and time.time() - self._last_fsync >= 1.0):
+            self._fsync()
+
+        if self._rewrite_pid is not None:
+            self._check_rewrite_done()
+
+    def close(self):
+        """
+        남은 버퍼를 기록하고 fsync 후 파일 닫기
+        """
+        self.flush()
+        if self.fsync_policy != FSYNC_NO:
+            self._fsync()
+        os.close(self._fd)
+        self._fd = None
+
+    def _fsync(self):
+        """fsync 수행 및 시각 기록"""
+        os.fsync(self._fd)
+        self._last_fsync = time.time()
+        self._fsync_pending = False
+
+    def _write_all(self, fd, data):
+        """부분 write를 처리하며 data 전체 기록"""
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    # ==================== 재작성 (Rewrite) ====================
+
+    def rewrite_in_progress(self):
+        """
+        백그라운드 재작성 진행 여부
+
+        Returns:
+            bool: 진행 중이면 True
+        """
+        return self._rewrite_pid is not None
+
+    def rewrite_background(self, redis):
+        """
+        BGREWRITEAOF - 백그라운드 재작성 시작
+
+        fork를 지원하지 않는 플랫폼에서는 동기적으로 재작성합니다.
+
+        Args:
+            redis: 키스페이스를 가진 MiniRedis 인스턴스
+
+        Raises:
+            RuntimeError: 이미 재작성 중인 경우
+        """
+        if self._rewrite_pid is not None:
+            raise RuntimeError("Background append only file rewriting already in progress")
+
+        self.flush()
+        tmp_path = f"{self.path}.rewrite-{os.getpid()}.tmp"
+        self._rewrite_start = time.time()
+
+        if not hasattr(os, "fork"):
+            self.rewrite(redis)
+            return
+
+        pid = os.fork()
+        if pid == 0:
+            # 자식 프로세스: fork 시점의 키스페이스 사본을 기록
+            code = 0
+            try:
+                write_dataset(tmp_path, redis, self.REWRITE_BATCH)
+            except BaseException:
+                code = 1
+            os._exit(code)
+
+        # 부모 프로세스: 이후 명령어를 재작성 버퍼에도 누적
+        self._rewrite_pid = pid
+        self._rewrite_tmp = tmp_path
+        self._rewrite_buf = bytearray()
+
+    def rewrite(self, redis):
+        """
+        동기 재작성 (명령어 처리를 멈추고 즉시 수행)
+
+        Args:
+            redis: 키스페이스를 가진 MiniRedis 인스턴스
+        """
+        self.flush()
+        start = time.time()
+        tmp_path = f"{self.path}.rewrite-{os.getpid()}.tmp"
+        write_dataset(tmp_path, redis, self.REWRITE_BATCH)
+        self._install_rewrite(tmp_path, b"")
+        self.last_rewrite_time_sec = int(time.time() - start)
+
+    def _check_rewrite_done(self):
+        """자식 프로세스가 끝났으면 재작성 결과 반영"""
+        pid, status = os.waitpid(self._rewrite_pid, os.WNOHANG)
+        if pid == 0:
+            return  # 아직 진행 중
+
+        tmp_path = self._rewrite_tmp
+        rewrite_buf = self._rewrite_buf
+        self._rewrite_pid = None
+        self._rewrite_tmp = None
+        self._rewrite_buf = None
+        self.last_rewrite_time_sec = int(time.time() - self._rewrite_start)
+
+        if os.waitstatus_to_exitcode(status) != 0:
+            self.last_bgrewrite_status = "err"
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+
+        self.flush()
+        self._install_rewrite(tmp_path, rewrite_buf)
+
+    def _install_rewrite(self, tmp_path, tail):
+        """
+        재작성 파일에 누적 버퍼를 붙이고 기존 AOF와 원자적으로 교체
+
+        Args:
+            tmp_path: 재작성된 임시 파일 경로
+            tail: 재작성 중 들어온 명령어 바이트
+        """
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_APPEND)
+        try:
+            if tail:
+                self._write_all(fd, bytes(tail))
+            os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        os.replace(tmp_path, self.path)
+        os.close(self._fd)
+        self._fd = fd
+        self.current_size = os.fstat(fd).st_size
+        self.base_size = self.current_size
+        self._last_fsync = time.time()
+        self._fsync_pending = False
+        self.last_bgrewrite_status = "ok"
+        self.rewrites += 1
+
+    def info(self):
+        """
+        INFO persistence용 AOF 통계
+
+        Returns:
+            dict: AOF 상태 정보
+        """
+        return {
+            'aof_enabled': 1,
+            'aof_fsync': self.fsync_policy,
+            'aof_rewrite_in_progress': 1 if self._rewrite_pid is not None else 0,
+            'aof_rewrites': self.rewrites,
+            'aof_last_rewrite_time_sec': self.last_rewrite_time_sec,
+            'aof_last_bgrewrite_status': self.last_bgrewrite_status,
+            'aof_current_size': self.current_size,
+            'aof_base_size': self.base_size,
+            'aof_buffer_length': len(self._buf),
+            'aof_rewrite_buffer_length': len(self._rewrite_buf) if self._rewrite_buf is not None else 0,
+        }
+
+
+def write_dataset(path, redis, batch=64):
+    """
+    현재 키스페이스를 최소 명령어 집합으로 파일에 기록
+
+    TTL 없는 키는 MSET으로 묶고, TTL 있는 키는 SET + PEXPIREAT(절대 시각)으로 기록합니다.
+    Hash는 필드를 batch개씩 묶은 HSET으로 기록합니다.
+
+    Args:
+        path: 기록할 파일 경로
+        redis: MiniRedis 인스턴스
+        batch: MSET 하나에 묶을 키 개수 (HSET 하나에 묶을 필드 개수)
+    """
+    ttl_map = redis._ttl_map
+    with open(path, "wb", buffering=1024 * 1024) as f:
+        pending = ["MSET"]
+        for entry in redis._store.entries():
+            ttl_entry = ttl_map.get(entry.key)
+            if type(entry.value) is HashObject:
+                fields = entry.value.flat()
+                for i in range(0, len(fields), batch * 2):
+                    f.write(encode_command(["HSET", entry.key, *fields[i:i + batch * 2]]))
+                if ttl_entry is not None:
+                    f.write(encode_command(("PEXPIREAT", entry.key, ttl_entry.value)))
+            elif ttl_entry is None:
+                pending.append(entry.key)
+                pending.append(entry.value)
+                if len(pending) > batch * 2:
+                    f.write(encode_command(pending))
+                    pending = ["MSET"]
+            else:
+                f.write(encode_command(("SET", entry.key, entry.value)))
+                f.write(encode_command(("PEXPIREAT", entry.key, ttl_entry.value)))
+        if len(pending) > 1:
+            f.write(encode_command(pending))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def load_aof(path, redis, chunk_size=4 * 1024 * 1024):
+    """
+    AOF 파일을 재생하여 키스페이스 복원
+
+    파일을 큰 청크 단위로 읽어 파싱하고, 명령어마다 만료 정리/메모리 제한 확인을
+    하지 않는 내부 적재 경로(MiniRedis._load_command)로 적용합니다.
+    마지막 프레임이 잘려 있으면(기록 중 비정상 종료) 그 부분만 무시합니다.
+
+    Args:
+        path: AOF 파일 경로
+        redis: 복원할 MiniRedis 인스턴스
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        int: 재생한 명령어 개수
+    """
+    parser = RespParser()
+    count = 0
+    apply = redis._load_command
+
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            parser.feed(data)
+            for tokens in parser.get_commands():
+                apply(tokens)
+                count += 1
+
+    return count
@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+"""
+Mini Redis 부하 생성기 / 벤치마크 (mini-redis-benchmark)
+
+워크로드 설정에 따라 명령어 스트림을 미리 만든 뒤 실행하고,
+명령어별 처리량(ops/sec)과 지연 시간 백분위(p50 / p99 / p99.9, HDR 히스토그램)를 출력합니다.
+
+    --mode inproc   같은 프로세스의 MiniRedis 메서드를 직접 호출 (네트워크 / 파싱 비용 제외)
+    --mode network  실행 중인 server.py에 클라이언트 -c개가 파이프라인 -P개씩 RESP2로 전송
+
+워크로드:
+    --ratio SET:GET       명령어 비율 (예: 1:10)
+    --keyspace N          키 개수 (key:0 ~ key:N-1, 시작 전에 모두 채움)
+    --zipf S              키 선택 분포의 치우침 (0 = 균등, 0.99 = 상위 소수 키에 접근 집중)
+    --value-size A[-B]    값 크기 (바이트, 범위면 균등 분포)
+    --ttl-share F         PX TTL을 붙이는 SET 비율 (--ttl-ms)
+    --maxmemory SIZE      메모리 제한 (예: 64mb, --maxmemory-policy와 함께 제거 압력을 줌)
+
+--json으로 결과(설정, git 커밋, 명령어별 처리량 / 백분위, 서버 통계)를 저장하고,
+--baseline으로 이전 결과와 비교해 처리량이 --max-regression% 넘게 떨어지면 종료 코드 1을 반환합니다.
+
+inproc 모드는 서버처럼 cron_interval()마다 cron()을 실행하며, cron 시간은 명령어 지연에 넣지 않습니다.
+network 모드의 지연은 파이프라인 하나를 보내고 응답을 모두 받을 때까지의 시간이며,
+묶인 명령어 모두에 그 값을 기록합니다 (redis-benchmark와 같음).
+
+실행 방법:
+    python benchmark.py                                        # inproc, 기본 워크로드
+    python benchmark.py -n 1000000 --ratio 1:10 --zipf 0.99
+    python benchmark.py --value-size 64-4096 --ttl-share 0.2 --maxmemory 32mb --maxmemory-policy allkeys-lfu
+    python benchmark.py --mode network --port 6379 -c 50 -P 16
+    python benchmark.py --json results.json --baseline baseline.json --max-regression 10
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import platform
+import random
+import subprocess
+import sys
+import os
+import time
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from redis_core import MiniRedis, OutOfMemoryError
+from client import MiniRedisClient
+from protocol import RespParser, ErrorReply, encode_command
+from histogram import HdrHistogram
+
+
+# 출력 / JSON에 기록할 백분위
+PERCENTILES = (50, 99, 99.9)
+
+# inproc 모드에서 cron 시각을 확인하는 간격 (명령어 수)
+CRON_CHECK_OPS = 256
+
+# 크기 접미사 (redis.conf와 같이 1k = 1000, 1kb = 1024)
+SIZE_UNITS = {"k": 1000, "kb": 1024, "m": 1000 ** 2, "mb": 1024 ** 2, "g": 1000 ** 3, "gb": 1024 ** 3}
+
+
+def parse_size(text):
+    """
+    크기 문자열을 바이트로 변환 (예: "64mb", "100000", "1g")
+
+    Args:
+        text: 크기 문자열
+
+    Returns:
+        int: 바이트
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    text = text.strip().lower()
+    for suffix in sorted(SIZE_UNITS, key=len, reverse=True):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * SIZE_UNITS[suffix])
+    return int(text)
+
+
+# ==================== 워크로드 ====================
+
+class ZipfGenerator:
+    """
+    0 ~ n-1 순위를 Zipf 분포(순위 r의 확률 ∝ 1 / (r+1)^s)로 선택
+
+    누적 가중치를 미리 계산해 두고 이진 탐색으로 뽑습니다. s = 0이면 균등 분포입니다.
+    """
+
+    def __init__(self, n, s, rng):
+        """
+        Args:
+            n: 순위 개수 (키 개수)
+            s: 치우침 지수 (0 이상)
+            rng: random.Random
+        """
+        self._n = n
+        self._rng = rng
+        self._cumulative = None
+        if s > 0:
+            total = 0.0
+            cumulative = []
+            for rank in range(n):
+                total += 1.0 / (rank + 1) ** s
+                cumulative.append(total)
+            self._cumulative = cumulative
+
+    def sample(self):
+        """
+        순위 하나 선택
+
+        Returns:
+            int: 0 ~ n-1
+        """
+        if self._cumulative is None:
+            return self._rng.randrange(self._n)
+        point = self._rng.random() * self._cumulative[-1]
+        return min(bisect.bisect_right(self._cumulative, point), self._n - 1)
+
+
+class Workload:
+    """
+    명령어 스트림 생성 설정
+
+    명령어는 (이름, 키, 값, px) 튜플입니다. GET은 값과 px가 None입니다.
+    """
+
+    def __init__(self, set_ratio, get_ratio, keyspace, zipf, value_min, value_max, ttl_share, ttl_ms, seed):
+        self.set_ratio = set_ratio
+        self.get_ratio = get_ratio
+        self.keyspace = keyspace
+        self.zipf = zipf
+        self.value_min = value_min
+        self.value_max = value_max
+        self.ttl_share = ttl_share
+        self.ttl_ms = ttl_ms
+        self.seed = seed
+
+    @classmethod
+    def from_args(cls, args):
+        """
+        커맨드라인 인자로 워크로드 생성
+
+        Raises:
+            ValueError: 인자 형식이 잘못된 경우
+        """
+        set_part, _, get_part = args.ratio.partition(":")
+        set_ratio, get_ratio = int(set_part), int(get_part or 0)
+        if set_ratio < 0 or get_ratio < 0 or set_ratio + get_ratio == 0:
+            raise ValueError(f"invalid ratio '{args.ratio}'")
+        low, _, high = args.value_size.partition("-")
+        value_min, value_max = parse_size(low), parse_size(high or low)
+        if not 0 <= value_min <= value_max:
+            raise ValueError(f"invalid value size '{args.value_size}'")
+        if not 0.0 <= args.ttl_share <= 1.0:
+            raise ValueError("ttl share must be between 0 and 1")
+        return cls(set_ratio, get_ratio, args.keyspace, args.zipf, value_min, value_max,
+                   args.ttl_share, args.ttl_ms, args.seed)
+
+    def describe(self):
+        """
+        설정을 JSON에 기록할 딕셔너리로 반환
+        """
+        return {
+            "ratio": f"{self.set_ratio}:{self.get_ratio}",
+            "keyspace": self.keyspace,
+            "zipf": self.zipf,
+            "value_size": [self.value_min, self.value_max],
+            "ttl_share": self.ttl_share,
+            "ttl_ms": self.ttl_ms,
+            "seed": self.seed,
+        }
+
+    def _make_set(self, rng, key, values):
+        """
+        SET 명령어 하나 (값 문자열은 크기별로 재사용)
+        """
+        size = rng.randint(self.value_min, self.value_max)
+        value = values.get(size)
+        if value is None:
+            value = values[size] = "x" * size
+        px = self.ttl_ms if self.ttl_share and rng.random() < self.ttl_share else None
+        return ("SET", key, value, px)
+
+    def preload_commands(self):
+        """
+        키스페이스 전체를 채우는 SET 명령어 리스트 (TTL 비율 포함)
+        """
+        rng = random.Random(self.seed - 1)
+        values = {}
+        return [self._make_set(rng, f"key:{i}", values) for i in range(self.keyspace)]
+
+    def generate(self, count, seed_offset=0):
+        """
+        명령어 count개 생성
+
+        Args:
+            count: 명령어 개수
+            seed_offset: 클라이언트별로 다른 스트림을 만들기 위한 시드 오프셋
+
+        Returns:
+            list: 명령어 튜플 리스트
+        """
+        rng = random.Random(self.seed + seed_offset)
+        keys = ZipfGenerator(self.keyspace, self.zipf, rng)
+        set_share = self.set_ratio / (self.set_ratio + self.get_ratio)
+        values = {}
+        commands = []
+        for _ in range(count):
+            key = f"key:{keys.sample()}"
+            if rng.random() < set_share:
+                commands.append(self._make_set(rng, key, values))
+            else:
+                commands.append(("GET", key, None, None))
+        return commands
+
+
+# ==================== 결과 집계 ====================
+
+class Results:
+    """
+    명령어별 히스토그램 (지연 시간은 나노초로 기록) 및 GET 적중 수
+    """
+
+    def __init__(self):
+        self.histograms = {"SET": HdrHistogram(), "GET": HdrHistogram()}
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.stats = {}
+
+    def summary(self):
+        """
+        명령어별 (ALL 포함) 처리량과 백분위 (마이크로초)
+
+        Returns:
+            dict: 명령어 -> 요약 딕셔너리
+        """
+        total = HdrHistogram()
+        for histogram in self.histograms.values():
+            total.merge(histogram)
+
+        summary = {}
+        for name, histogram in [("ALL", total)] + list(self.histograms.items()):
+            if histogram.count() == 0:
+                continue
+            latency = {f"p{p:g}": round(v / 1000, 2) for p, v in histogram.percentiles(PERCENTILES).items()}
+            latency["mean"] = round(histogram.mean() / 1000, 2)
+            latency["max"] = round(histogram.max() / 1000, 2)
+            summary[name] = {
+                "ops": histogram.count(),
+                "ops_per_sec": round(histogram.count() / self.elapsed, 1) if self.elapsed else 0.0,
+                "latency_us": latency,
+            }
+        lookups = self.hits + self.misses
+        if lookups:
+            summary["GET"]["hit_rate"] = round(self.hits / lookups, 4)
+        return summary
+
+
+# ==================== inproc 모드 ====================
+
+def run_inproc(workload, args):
+    """
+    같은 프로세스의 MiniRedis로 실행
+
+    Returns:
+        Results: 결과
+    """
+    redis = MiniRedis(lru_tracking=args.lru_tracking, ttl_index=args.ttl_index, hash_table=args.hash_table)
+    redis.config_set("maxmemory-policy", args.maxmemory_policy)
+    if args.maxmemory:
+        redis.config_set_maxmemory(parse_size(args.maxmemory))
+
+    results = Results()
+    for _, key, value, px in workload.preload_commands():
+        try:
+            redis.set(key, value, px=px)
+        except OutOfMemoryError:
+            break
+
+    commands = workload.generate(args.requests)
+    histograms = results.histograms
+    set_hist = histograms["SET"]
+    get_hist = histograms["GET"]
+    clock = time.perf_counter_ns
+    interval_ns = int(redis.cron_interval() * 1e9)
+    next_cron = clock() + interval_ns
+    hits = 0
+    errors = 0
+    cron_ns = 0
+
+    start = clock()
+    for i, (name, key, value, px) in enumerate(commands):
+        if name == "GET":
+            t0 = clock()
+            reply = redis.get(key)
+            get_hist.record(clock() - t0)
+            if reply is not None:
+                hits += 1
+        else:
+            t0 = clock()
+            try:
+                redis.set(key, value, px=px)
+            except OutOfMemoryError:
+                errors += 1
+            set_hist.record(clock() - t0)
+
+        if i % CRON_CHECK_OPS == 0 and clock() >= next_cron:
+            t0 = clock()
+            redis.cron()
+            now = clock()
+            cron_ns += now - t0
+            next_cron = now + interval_ns
+    results.elapsed = (clock() - start) / 1e9
+
+    results.hits = hits
+    results.misses = get_hist.count() - hits
+    results.errors = errors
+    results.stats = dict(redis.info_memory())
+    results.stats.update(redis.info_stats())
+    results.stats["dbsize"] = redis.dbsize()
+    results.stats["cron_ms"] = round(cron_ns / 1e6, 1)
+    return results
+
+
+# ==================== network 모드 ====================
+
+def _resp_command(command):
+    """
+    명령어 튜플을 RESP 프레임으로 인코딩
+    """
+    name, key, value, px = command
+    if name == "GET":
+        return encode_command(("GET", key))
+    if px is not None:
+        return encode_command(("SET", key, value, "PX", px))
+    return encode_command(("SET", key, value))
+
+
+async def _run_client(args, commands, results):
+    """
+    클라이언트 하나: commands를 pipeline개씩 보내고 배치 왕복 시간을 명령어마다 기록
+    """
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    parser = RespParser()
+    histograms = results.histograms
+    clock = time.perf_counter_ns
+
+    for offset in range(0, len(commands), args.pipeline):
+        batch = commands[offset:offset + args.pipeline]
+        frame = b"".join(_resp_command(command) for command in batch)
+        t0 = clock()
+        writer.write(frame)
+        replies = []
+        while len(replies) < len(batch):
+            data = await reader.read(65536)
+            if not data:
+                raise ConnectionError("server closed connection")
+            parser.feed(data)
+            replies.extend(parser.get_replies())
+        elapsed = clock() - t0
+
+        for command, reply in zip(batch, replies):
+            histograms[command[0]].record(elapsed)
+            if isinstance(reply, ErrorReply):
+                results.errors += 1
+            elif command[0] == "GET":
+                if reply is None:
+                    results.misses += 1
+                else:
+                    results.hits += 1
+
+    writer.close()
+    await writer.wait_closed()
+
+
+def _parse_info(text):
+    """
+    INFO 응답 텍스트를 딕셔너리로 변환 (숫자는 int / float로)
+    """
+    info = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#") or ":" not in line:
+            continue
+        name, _, value = line.partition(":")
+        for convert in (int, float):
+            try:
+                value = convert(value)
+                break
+            except ValueError:
+                continue
+        info[name] = value
+    return info
+
+
+def run_network(workload, args):
+    """
+    실행 중인 서버에 접속하여 실행
+
+    Returns:
+        Results: 결과
+    """
+    with MiniRedisClient(host=args.host, port=args.port) as client:
+        client.execute("CONFIG", "SET", "maxmemory-policy", args.maxmemory_policy)
+        if args.maxmemory:
+            client.execute("CONFIG", "SET", "maxmemory", parse_size(args.maxmemory))
+        preload = workload.preload_commands()
+        for offset in range(0, len(preload), 1000):
+            client.pipeline([
+                ("SET", key, value) + (("PX", px) if px is not None else ())
+                for _, key, value, px in preload[offset:offset + 1000]
+            ])
+
+    per_client = args.requests // args.clients
+    streams = [workload.generate(per_client, seed_offset=index) for index in range(args.clients)]
+    results = Results()
+
+    async def run_all():
+        await asyncio.gather(*(_run_client(args, commands, results) for commands in streams))
+
+    start = time.perf_counter()
+    asyncio.run(run_all())
+    results.elapsed = time.perf_counter() - start
+
+    with MiniRedisClient(host=args.host, port=args.port) as client:
+        results.stats = _parse_info(client.execute("INFO", "memory"))
+        results.stats.update(_parse_info(client.execute("INFO", "stats")))
+        results.stats["dbsize"] = client.execute("DBSIZE")
+    return results
+
+
+# ==================== 출력 / 비교 ====================
+
+def git_commit():
+    """
+    현재 git 커밋 해시 (git 저장소가 아니면 None)
+    """
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def print_summary(summary, results):
+    """
+    사람이 읽는 결과 표 출력
+    """
+    header = f"{'':>4} {'ops':>9} {'ops/sec':>11}"
+    for p in PERCENTILES:
+        header += f" {f'p{p:g}(us)':>10}"
+    header += f" {'max(us)':>10}"
+    print(header)
+    for name, row in summary.items():
+        latency = row["latency_us"]
+        line = f"{name:>4} {row['ops']:>9} {row['ops_per_sec']:>11.0f}"
+        for p in PERCENTILES:
+            line += f" {latency[f'p{p:g}']:>10.2f}"
+        line += f" {latency['max']:>10.2f}"
+        if "hit_rate" in row:
+            line += f"  hit {row['hit_rate']:.1%}"
+        print(line)
+    if results.errors:
+        print(f"errors: {results.errors}")
+    stats = results.stats
+    print(f"dbsize={stats.get('dbsize')} used_memory={stats.get('used_memory')} "
+          f"evicted_keys={stats.get('evicted_keys')} expired_keys={stats.get('expired_keys')}")
+
+
+def compare_baseline(summary, path, max_regression):
+    """
+    이전 JSON 결과와 명령어별 처리량 / p99 비교
+
+    Args:
+        summary: 이번 결과 요약
+        path: 기준 JSON 파일
+        max_regression: 허용하는 처리량 감소율 (%)
+
+    Returns:
+        bool: 처리량이 허용 범위 넘게 떨어진 명령어가 있으면 True
+    """
+    with open(path) as f:
+        baseline = json.load(f)
+    print(f"baseline: {path} (commit {baseline.get('commit')})")
+
+    regressed = False
+    for name, row in summary.items():
+        old = baseline.get("results", {}).get(name)
+        if old is None:
+            continue
+        change = (row["ops_per_sec"] - old["ops_per_sec"]) / old["ops_per_sec"] * 100 if old["ops_per_sec"] else 0.0
+        p99_old = old["latency_us"].get("p99")
+        p99_new = row["latency_us"].get("p99")
+        status = "ok"
+        if change < -max_regression:
+            status = "REGRESSION"
+            regressed = True
+        print(f"{name:>4} ops/sec {old['ops_per_sec']:>11.0f} -> {row['ops_per_sec']:>11.0f} ({change:+.1f}%)  "
+              f"p99 {p99_old} -> {p99_new} us  [{status}]")
+    return regressed
+
+
+def parse_args(argv=None):
+    """
+    커맨드라인 인자 파싱
+    """
+    parser = argparse.ArgumentParser(description="Mini Redis load generator and benchmark")
+    parser.add_argument("--mode", choices=("inproc", "network"), default="inproc")
+    parser.add_argument("-n", "--requests", type=int, default=200000, help="commands to run (after preload)")
+    parser.add_argument("--ratio", default="1:10", help="SET:GET ratio")
+    parser.add_argument("-r", "--keyspace", type=int, default=100000, help="number of keys")
+    parser.add_argument("--zipf", type=float, default=0.0, help="key popularity skew (0 = uniform)")
+    parser.add_argument("-d", "--value-size", default="16", help="value size in bytes, or a range like 16-1024")
+    parser.add_argument("--ttl-share", type=float, default=0.0, help="fraction of SETs with a PX TTL")
+    parser.add_argument("--ttl-ms", type=int, default=10000, help="TTL for those SETs")
+    parser.add_argument("--maxmemory", default=None, help="memory limit, e.g. 64mb (default: unlimited)")
+    parser.add_argument("--maxmemory-policy", default="allkeys-lru")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--lru-tracking", choices=("sampled", "list", "indexed", "clock"), default="sampled",
+                        help="inproc: LRU tracking mode")
+    parser.add_argument("--ttl-index", choices=("heap", "wheel"), default="heap", help="inproc: TTL index")
+    parser.add_argument("--hash-table", choices=("chaining", "open"), default="chaining",
+                        help="inproc: keyspace hash table")
+    parser.add_argument("--host", default="127.0.0.1", help="network: server host")
+    parser.add_argument("-p", "--port", type=int, default=6379, help="network: server port")
+    parser.add_argument("-c", "--clients", type=int, default=50, help="network: concurrent connections")
+    parser.add_argument("-P", "--pipeline", type=int, default=1, help="network: commands per round trip")
+    parser.add_argument("--json", default=None, help="write results as JSON to this file ('-' = stdout)")
+    parser.add_argument("--baseline", default=None, help="JSON results to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0,
+                        help="exit 1 if ops/sec drops more than this percent below the baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        workload = Workload.from_args(args)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    description = workload.describe()
+    print(f"mode={args.mode} requests={args.requests} keyspace={workload.keyspace} ratio={description['ratio']} "
+          f"zipf={workload.zipf} value={args.value_size} ttl_share={workload.ttl_share} "
+          f"maxmemory={args.maxmemory or 0} ({args.maxmemory_policy})")
+
+    if args.mode == "inproc":
+        results = run_inproc(workload, args)
+    else:
+        results = run_network(workload, args)
+    summary = results.summary()
+    print_summary(summary, results)
+
+    if args.json:
+        config = {"mode": args.mode, "requests": args.requests, "maxmemory": args.maxmemory,
+                  "maxmemory_policy": args.maxmemory_policy}
+        if args.mode == "inproc":
+            config.update(lru_tracking=args.lru_tracking, ttl_index=args.ttl_index, hash_table=args.hash_table)
+        else:
+            config.update(clients=args.clients, pipeline=args.pipeline)
+        config.update(description)
+        document = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "config": config,
+            "results": summary,
+            "errors": results.errors,
+            "stats": results.stats,
+        }
+        text = json.dumps(document, indent=2, sort_keys=True)
+        if args.json == "-":
+            print(text)
+        else:
+            with open(args.json, "w") as f:
+                f.write(text + "\n")
+
+    if args.baseline and compare_baseline(summary, args.baseline, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+AOF 벤치마크
+
+1. fsync 정책별 SET 처리량 (서버처럼 --batch개 명령어마다 flush)
+2. 시작 시 AOF 재생(replay) 속도 (commands/sec, MB/s)
+
+실행 방법:
+    python benchmarks/bench_aof.py -n 200000 --replay 2000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from redis_core import MiniRedis
+from protocol import encode_command
+
+
+def bench_write(policy, count, batch, directory):
+    """
+    fsync 정책 하나에 대해 SET 처리량 측정
+
+    Returns:
+        float: 초당 SET 수
+    """
+    path = os.path.join(directory, f"bench-{policy}.aof")
+    redis = MiniRedis()
+    redis.enable_aof(path, policy)
+
+    start = time.perf_counter()
+    for i in range(count):
+        redis.set(f"key:{i}", "value")
+        if i % batch == batch - 1:
+            redis.flush_aof()
+            redis.cron()
+    redis.shutdown()
+    elapsed = time.perf_counter() - start
+
+    os.unlink(path)
+    return count / elapsed
+
+
+def bench_replay(count, keyspace, directory):
+    """
+    count개 명령어가 담긴 AOF를 만들고 재생 속도 측정
+
+    Returns:
+        tuple: (commands/sec, MB/s, 복원된 키 개수)
+    """
+    path = os.path.join(directory, "bench-replay.aof")
+    with open(path, "wb", buffering=1024 * 1024) as f:
+        for i in range(count):
+            f.write(encode_command(("SET", f"key:{i % keyspace}", f"value:{i}")))
+    size = os.path.getsize(path)
+
+    redis = MiniRedis()
+    start = time.perf_counter()
+    loaded = redis.load_aof(path)
+    elapsed = time.perf_counter() - start
+
+    os.unlink(path)
+    assert loaded == count
+    return count / elapsed, size / elapsed / (1024 * 1024), redis.dbsize()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis AOF benchmark")
+    parser.add_argument("-n", "--requests", type=int, default=100000, help="SETs per fsync policy")
+    parser.add_argument("--batch", type=int, default=16, help="commands per flush (pipeline size)")
+    parser.add_argument("--replay", type=int, default=1000000, help="commands in the replay file")
+    parser.add_argument("--keyspace", type=int, default=100000, help="distinct keys in the replay file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"SET with AOF ({args.requests} ops, flush every {args.batch})")
+        for policy in ("no", "everysec", "always"):
+            count = args.requests if policy != "always" else max(1, args.requests // 100)
+            ops = bench_write(policy, count, args.batch, directory)
+            print(f"  appendfsync {policy:<8}: {ops:12.0f} ops/sec")
+
+        print(f"Replay ({args.replay} commands, {args.keyspace} keys)")
+        cps, mbps, keys = bench_replay(args.replay, args.keyspace, directory)
+        print(f"  {cps:12.0f} commands/sec  {mbps:8.1f} MB/s  ({keys} keys restored)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+클러스터 확장 벤치마크 (워커 수별 전체 처리량)
+
+server.py --cluster-workers W 로 워커 W개를 띄우고, 클라이언트 프로세스 여러 개가
+ClusterClient 파이프라인(-P)으로 SET/GET을 보내 전체 처리량(ops/sec)을 측정합니다.
+W를 1부터 CPU 개수까지 늘려 가며 반복합니다.
+
+클라이언트도 같은 머신의 코어를 쓰므로, 워커 수가 코어 수에 가까워지면
+클라이언트와 워커가 코어를 나누어 써서 증가 폭이 줄어듭니다.
+
+실행 방법:
+    python benchmarks/bench_cluster.py -c 4 -n 100000 -P 32
+    python benchmarks/bench_cluster.py --workers 1,2,4,8 --port 7000
+"""
+
+import argparse
+import multiprocessing
+import random
+import signal
+import socket
+import subprocess
+import sys
+import os
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cluster_client import ClusterClient
+from protocol import ErrorReply
+
+
+VALUE = "x" * 16
+
+
+def start_cluster(workers, port):
+    """
+    클러스터 프로세스 시작 후 모든 워커가 접속 가능해질 때까지 대기
+
+    Returns:
+        subprocess.Popen: 런처 프로세스
+    """
+    cmd = [sys.executable, os.path.join(ROOT, "server.py"),
+           "--cluster-workers", str(workers), "--port", str(port)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+
+    deadline = time.time() + 20
+    pending = list(range(port, port + workers))
+    while pending and time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", pending[0])).close()
+            pending.pop(0)
+        except OSError:
+            time.sleep(0.05)
+    if pending:
+        stop_cluster(proc)
+        raise RuntimeError("cluster did not start")
+    return proc
+
+
+def stop_cluster(proc):
+    """
+    런처에 SIGTERM을 보내 워커까지 종료
+    """
+    proc.send_signal(signal.SIGTERM)
+    proc.wait()
+
+
+def run_client(port, requests, pipeline, keyspace, write_ratio, seed, results):
+    """
+    클라이언트 프로세스 하나: requests개 명령어를 pipeline개씩 묶어 전송
+    """
+    rng = random.Random(seed)
+    client = ClusterClient([("127.0.0.1", port)])
+    errors = 0
+    sent = 0
+    while sent < requests:
+        batch = min(pipeline, requests - sent)
+        commands = []
+        for _ in range(batch):
+            key = f"key:{rng.randrange(keyspace)}"
+            if rng.random() < write_ratio:
+                commands.append(("SET", key, VALUE))
+            else:
+                commands.append(("GET", key))
+        for reply in client.pipeline(commands):
+            if isinstance(reply, ErrorReply):
+                errors += 1
+        sent += batch
+    client.close()
+    results.put(errors)
+
+
+def run(workers, args):
+    """
+    워커 workers개 클러스터에서 측정 후 (ops/sec, 에러 수) 반환
+    """
+    proc = start_cluster(workers, args.port)
+    try:
+        results = multiprocessing.Queue()
+        clients = [
+            multiprocessing.Process(
+                target=run_client,
+                args=(args.port, args.requests // args.clients, args.pipeline, args.keyspace,
+                      args.write_ratio, seed, results))
+            for seed in range(args.clients)
+        ]
+        start = time.perf_counter()
+        for client in clients:
+            client.start()
+        errors = sum(results.get() for _ in clients)
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        stop_cluster(proc)
+    total = args.requests // args.clients * args.clients
+    return total / elapsed, errors
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Mini Redis cluster scaling benchmark")
+    parser.add_argument("--workers", default=",".join(str(w) for w in range(1, cpus + 1)),
+                        help="worker counts (default: 1..CPU count)")
+    parser.add_argument("-c", "--clients", type=int, default=max(2, cpus), help="client processes")
+    parser.add_argument("-n", "--requests", type=int, default=200000, help="total requests per run")
+    parser.add_argument("-P", "--pipeline", type=int, default=32, help="commands per pipeline")
+    parser.add_argument("-r", "--keyspace", type=int, default=100000, help="random keys")
+    parser.add_argument("--write-ratio", type=float, default=0.5, help="fraction of SETs")
+    parser.add_argument("--port", type=int, default=7000, help="first worker port")
+    args = parser.parse_args()
+
+    print(f"{cpus} CPUs, {args.clients} clients, {args.requests} requests, "
+          f"pipeline {args.pipeline}, {args.write_ratio:.0%} SET")
+    print(f"{'workers':>7} {'ops/sec':>12} {'errors':>7}")
+    for workers in [int(x) for x in args.workers.split(",")]:
+        ops, errors = run(workers, args)
+        print(f"{workers:>7} {ops:12.0f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+카운터 벤치마크 (GET + SET 왕복 vs INCR)
+
+요청 수 제한 카운터처럼 키 값을 1씩 올리는 작업을 두 가지 방식으로 비교합니다.
+
+    GET+SET:  GET으로 값을 읽어 클라이언트에서 int()로 바꾸고 1을 더해 SET (명령어 2개, 왕복 2번)
+    INCR:     서버가 int 인코딩된 값을 그대로 갱신 (명령어 1개, 왕복 1번)
+
+1. inproc:  CLI.dispatch로 직접 실행하여 명령어 처리 비용만 비교
+2. network: server.py를 띄우고 클라이언트 하나로 왕복 포함 처리량 비교
+3. race:    스레드 여러 개가 같은 키를 올린 뒤 최종 값과 기대값을 비교
+            (GET+SET은 읽기와 쓰기 사이에 다른 클라이언트의 쓰기가 끼어들어 증가분을 잃음)
+
+실행 방법:
+    python benchmarks/bench_counters.py -n 100000 --keys 1000
+    python benchmarks/bench_counters.py --threads 8 --race-increments 2000
+    python benchmarks/bench_counters.py --skip-network
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cli import CLI
+from client import MiniRedisClient
+
+
+def free_port():
+    """
+    사용 가능한 TCP 포트 하나 반환
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    """
+    서버 프로세스 시작 후 접속 가능해질 때까지 대기
+
+    Returns:
+        subprocess.Popen: 서버 프로세스
+    """
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, "server.py"), "--port", str(port)],
+                            stdout=subprocess.DEVNULL)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port)).close()
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+def run_inproc(n, keys):
+    """
+    CLI.dispatch로 GET+SET과 INCR을 각각 n번 실행하여 초당 증가 횟수 반환
+    """
+    rates = []
+    for mode in ("get+set", "incr"):
+        dispatch = CLI().dispatch
+        names = [f"counter:{i}" for i in range(keys)]
+        start = time.perf_counter()
+        for i in range(n):
+            key = names[i % keys]
+            if mode == "incr":
+                dispatch(["INCR", key])
+            else:
+                value = dispatch(["GET", key])
+                dispatch(["SET", key, str(int(value or 0) + 1)])
+        rates.append(n / (time.perf_counter() - start))
+    return rates
+
+
+def run_network(port, n, keys):
+    """
+    클라이언트 하나로 GET+SET과 INCR을 각각 n번 실행하여 초당 증가 횟수 반환
+    """
+    rates = []
+    with MiniRedisClient(port=port) as client:
+        for mode in ("get+set", "incr"):
+            prefix = f"net:{mode}:"
+            start = time.perf_counter()
+            for i in range(n):
+                key = f"{prefix}{i % keys}"
+                if mode == "incr":
+                    client.execute("INCR", key)
+                else:
+                    value = client.execute("GET", key)
+                    client.execute("SET", key, int(value or 0) + 1)
+            rates.append(n / (time.perf_counter() - start))
+    return rates
+
+
+def run_race(port, threads, increments):
+    """
+    스레드마다 별도 연결로 같은 키를 increments번씩 올린 뒤 (GET+SET 최종 값, INCR 최종 값) 반환
+    """
+    def worker(mode):
+        with MiniRedisClient(port=port) as client:
+            for _ in range(increments):
+                if mode == "incr":
+                    client.execute("INCR", "race:incr")
+                else:
+                    value = client.execute("GET", "race:get+set")
+                    client.execute("SET", "race:get+set", int(value or 0) + 1)
+
+    results = []
+    for mode in ("get+set", "incr"):
+        workers = [threading.Thread(target=worker, args=(mode,)) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        with MiniRedisClient(port=port) as client:
+            results.append(int(client.execute("GET", f"race:{mode}")))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis counter benchmark (GET+SET vs INCR)")
+    parser.add_argument("-n", "--requests", type=int, default=100000, help="increments per mode")
+    parser.add_argument("--keys", type=int, default=1000, help="distinct counters")
+    parser.add_argument("--threads", type=int, default=4, help="race: concurrent clients")
+    parser.add_argument("--race-increments", type=int, default=2000, help="race: increments per client")
+    parser.add_argument("--skip-network", action="store_true", help="only run the in-process comparison")
+    args = parser.parse_args()
+
+    print(f"{args.requests} increments over {args.keys} counters")
+    get_set, incr = run_inproc(args.requests, args.keys)
+    print(f"{'inproc':>8}  GET+SET: {get_set:>10,.0f} incr/s   INCR: {incr:>10,.0f} incr/s  ({incr / get_set:.2f}x)")
+    if args.skip_network:
+        return
+
+    port = free_port()
+    proc = start_server(port)
+    try:
+        get_set, incr = run_network(port, args.requests, args.keys)
+        print(f"{'network':>8}  GET+SET: {get_set:>10,.0f} incr/s   INCR: {incr:>10,.0f} incr/s  ({incr / get_set:.2f}x)")
+
+        expected = args.threads * args.race_increments
+        get_set, incr = run_race(port, args.threads, args.race_increments)
+        print(f"{'race':>8}  {args.threads} clients x {args.race_increments} increments = {expected}")
+        print(f"{'':>8}  GET+SET final: {get_set} ({expected - get_set} lost)   INCR final: {incr} ({expected - incr} lost)")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+제거 정책 벤치마크 (LRU vs CLOCK vs LFU)
+
+캐시처럼 사용하는 상황(GET 미스이면 SET으로 채움)을 재현하여
+정책별 적중률(hit ratio)과 초당 처리량을 비교합니다.
+
+트레이스:
+1. zipf: Zipf 분포(소수의 키에 접근이 집중)를 따르는 GET
+2. scan: zipf 트레이스 중간중간에 한 번만 읽히는 차가운 키를 순차 스캔으로 끼워 넣음
+         (LRU는 스캔이 지나갈 때 자주 쓰이는 키까지 밀어내지만 LFU는 빈도로 버팀)
+
+적중률은 스캔 요청을 제외한 zipf 요청만으로 계산합니다.
+GET/sec는 트레이스 재생 후 채워진 캐시에 zipf 키로 GET만 보낸 처리량입니다 (읽기 경로 비용 비교).
+
+실행 방법:
+    python benchmarks/bench_eviction.py -n 300000 --keyspace 100000 --cache-ratio 0.1
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from redis_core import MiniRedis
+
+
+VALUE = "x" * 32
+
+# (이름, maxmemory-policy, lru_tracking)
+POLICIES = (
+    ("lru (list)", "allkeys-lru", "list"),
+    ("lru (indexed)", "allkeys-lru", "indexed"),
+    ("lru (clock)", "allkeys-lru", "clock"),
+    ("lru (sampled)", "allkeys-lru", "sampled"),
+    ("lfu", "allkeys-lfu", "sampled"),
+)
+
+
+def zipf_trace(count, keyspace, skew, rng):
+    """
+    Zipf 분포 키 트레이스 생성
+
+    Args:
+        count: 요청 개수
+        keyspace: 서로 다른 키 개수
+        skew: Zipf 지수 (클수록 소수 키에 집중)
+        rng: random.Random 인스턴스
+
+    Returns:
+        list: 키 리스트
+    """
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, keyspace + 1):
+        total += 1.0 / (rank ** skew)
+        cum_weights.append(total)
+
+    # 순위와 키 이름의 대응을 섞어 인기 키가 키 이름 순서와 무관하도록 함
+    names = [f"key:{i}" for i in range(keyspace)]
+    rng.shuffle(names)
+    return rng.choices(names, cum_weights=cum_weights, k=count)
+
+
+def scan_polluted_trace(base, scan_every, scan_length):
+    """
+    zipf 트레이스에 주기적인 순차 스캔(한 번만 읽히는 키)을 끼워 넣음
+
+    Args:
+        base: zipf 트레이스
+        scan_every: 이 개수의 요청마다 스캔 한 번
+        scan_length: 스캔 한 번에 읽는 차가운 키 개수
+
+    Returns:
+        list: (key, 스캔 요청 여부) 리스트
+    """
+    trace = []
+    scan_id = 0
+    for i, key in enumerate(base):
+        if i > 0 and i % scan_every == 0:
+            for _ in range(scan_length):
+                trace.append((f"scan:{scan_id}", True))
+                scan_id += 1
+        trace.append((key, False))
+    return trace
+
+
+def run(trace, policy, lru_tracking, maxmemory, get_keys):
+    """
+    트레이스 하나를 정책 하나로 재생한 뒤 GET만 보내는 읽기 처리량 측정
+
+    Returns:
+        tuple: (zipf 요청 적중률, 초당 요청 수, 초당 GET 수, 제거된 키 개수)
+    """
+    redis = MiniRedis(lru_tracking=lru_tracking)
+    redis.config_set("maxmemory-policy", policy)
+    redis.config_set_maxmemory(maxmemory)
+
+    get = redis.get
+    set_ = redis.set
+    hits = 0
+    lookups = 0
+
+    start = time.perf_counter()
+    for key, is_scan in trace:
+        value = get(key)
+        if value is None:
+            set_(key, VALUE)
+        elif not is_scan:
+            hits += 1
+        if not is_scan:
+            lookups += 1
+    elapsed = time.perf_counter() - start
+    evicted = redis.info_memory()['evicted_keys']
+
+    start = time.perf_counter()
+    for key in get_keys:
+        get(key)
+    get_elapsed = time.perf_counter() - start
+
+    return hits / lookups, len(trace) / elapsed, len(get_keys) / get_elapsed, evicted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis eviction policy benchmark")
+    parser.add_argument("-n", "--requests", type=int, default=200000, help="zipf requests per trace")
+    parser.add_argument("--keyspace", type=int, default=100000, help="distinct hot-path keys")
+    parser.add_argument("--skew", type=float, default=1.0, help="zipf exponent")
+    parser.add_argument("--cache-ratio", type=float, default=0.1,
+                        help="fraction of the keyspace that fits in maxmemory")
+    parser.add_argument("--scan-every", type=int, default=20000, help="requests between scans")
+    parser.add_argument("--scan-length", type=int, default=None,
+                        help="cold keys per scan (default: cache size)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cached_keys = max(1, int(args.keyspace * args.cache_ratio))
+    entry_size = len(f"key:{args.keyspace}") + len(VALUE)
+    maxmemory = cached_keys * entry_size
+    scan_length = args.scan_length if args.scan_length is not None else cached_keys
+
+    base = zipf_trace(args.requests, args.keyspace, args.skew, rng)
+    traces = (
+        ("zipf", [(key, False) for key in base]),
+        ("scan", scan_polluted_trace(base, args.scan_every, scan_length)),
+    )
+
+    print(f"{args.keyspace} keys, zipf s={args.skew}, cache holds ~{cached_keys} keys "
+          f"(maxmemory {maxmemory} bytes)")
+    for trace_name, trace in traces:
+        print(f"{trace_name} trace ({len(trace)} requests)")
+        for name, policy, lru_tracking in POLICIES:
+            hit_ratio, ops, gets, evicted = run(trace, policy, lru_tracking, maxmemory, base)
+            print(f"  {name:<14}: hit ratio {hit_ratio * 100:6.2f}%  "
+                  f"{ops:10.0f} ops/sec  {gets:10.0f} GET/sec  {evicted:8d} evicted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Hash 타입 벤치마크 (필드 갱신 비용, 인코딩별 메모리 / 조회 속도)
+
+여러 필드를 가진 객체(사용자 프로필 등)를 키 하나에 저장하는 두 방식을 비교합니다.
+
+    JSON blob:  객체 전체를 JSON 문자열 하나로 SET, 필드 하나를 바꿀 때도
+                GET -> json.loads -> 수정 -> json.dumps -> SET으로 객체 전체를 다시 만듦
+    Hash:       HSET key field value로 그 필드의 값만 교체
+
+1. update: CLI.dispatch로 필드 하나 갱신을 n번 실행하여 초당 갱신 횟수 비교 (--fields 개수별)
+2. memory: --keys개 키를 만들고 tracemalloc으로 잰 키 하나당 파이썬 메모리를
+           JSON 문자열 / listpack 인코딩 / hashtable 인코딩(hash-max-listpack-entries 0)으로 비교
+3. hget:   같은 해시에서 HGET 속도를 listpack / hashtable 인코딩으로 비교
+           (필드 수가 적을 때 list.index 선형 탐색이 해시 조회보다 느리지 않은지 확인)
+
+실행 방법:
+    python benchmarks/bench_hash.py
+    python benchmarks/bench_hash.py --fields 4,16,64,256 -n 50000
+    python benchmarks/bench_hash.py --keys 20000 --fields 8
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cli import CLI
+
+
+def make_object(fields):
+    """
+    필드 fields개짜리 객체 (필드 이름 / 값은 짧은 문자열)
+    """
+    return {f"field:{i}": f"value-{i:06d}" for i in range(fields)}
+
+
+def run_update(n, fields, keys):
+    """
+    JSON blob 전체 재작성과 HSET 필드 갱신을 각각 n번 실행하여 초당 갱신 횟수 반환
+    """
+    obj = make_object(fields)
+    names = list(obj)
+    rates = []
+    for mode in ("json", "hash"):
+        dispatch = CLI().dispatch
+        for k in range(keys):
+            if mode == "json":
+                dispatch(["SET", f"obj:{k}", json.dumps(obj)])
+            else:
+                dispatch(["HSET", f"obj:{k}", *[x for pair in obj.items() for x in pair]])
+        start = time.perf_counter()
+        for i in range(n):
+            key = f"obj:{i % keys}"
+            field = names[i % fields]
+            if mode == "json":
+                value = json.loads(dispatch(["GET", key]))
+                value[field] = str(i)
+                dispatch(["SET", key, json.dumps(value)])
+            else:
+                dispatch(["HSET", key, field, str(i)])
+        rates.append(n / (time.perf_counter() - start))
+    return rates
+
+
+def measure_memory(keys, fields):
+    """
+    키 keys개를 저장했을 때 키 하나당 메모리 (JSON, listpack, hashtable) 바이트 반환
+
+    값은 키마다 다른 문자열로 만들어 키 사이에 공유되지 않게 합니다.
+    """
+    names = [f"obj:{k}" for k in range(keys)]
+    expected = {"json": "raw", "listpack": "listpack", "hashtable": "hashtable"}
+    results = []
+    for mode in ("json", "listpack", "hashtable"):
+        cli = CLI()
+        dispatch = cli.dispatch
+        if mode == "hashtable":
+            dispatch(["CONFIG", "SET", "hash-max-listpack-entries", "0"])
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for k, key in enumerate(names):
+            obj = {f"field:{i}": f"{k:08d}-{i:06d}" for i in range(fields)}
+            if mode == "json":
+                dispatch(["SET", key, json.dumps(obj)])
+            else:
+                dispatch(["HSET", key, *[x for pair in obj.items() for x in pair]])
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert cli.redis.object_encoding(names[0]) == expected[mode]
+        results.append((after - before) / keys)
+    return results
+
+
+def run_hget(n, fields):
+    """
+    필드 fields개짜리 해시에서 HGET을 n번 실행하여 (listpack, hashtable) 초당 조회 횟수 반환
+    """
+    obj = make_object(fields)
+    names = list(obj)
+    rates = []
+    for entries in (fields, 0):
+        cli = CLI()
+        dispatch = cli.dispatch
+        dispatch(["CONFIG", "SET", "hash-max-listpack-entries", str(entries)])
+        dispatch(["HSET", "obj", *[x for pair in obj.items() for x in pair]])
+        start = time.perf_counter()
+        for i in range(n):
+            dispatch(["HGET", "obj", names[i % fields]])
+        rates.append(n / (time.perf_counter() - start))
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis hash benchmark (field updates, encodings)")
+    parser.add_argument("-n", "--requests", type=int, default=50000, help="operations per case")
+    parser.add_argument("--fields", default="4,16,64,128", help="fields per object (comma separated)")
+    parser.add_argument("--keys", type=int, default=5000, help="objects (update / memory)")
+    args = parser.parse_args()
+
+    field_counts = [int(part) for part in args.fields.split(",")]
+
+    print(f"update: {args.requests} single-field updates over {args.keys} objects")
+    print(f"{'fields':>8} {'JSON upd/s':>12} {'HSET upd/s':>12} {'speedup':>8}")
+    for fields in field_counts:
+        blob, hset = run_update(args.requests, fields, args.keys)
+        print(f"{fields:>8} {blob:>12,.0f} {hset:>12,.0f} {hset / blob:>7.2f}x")
+
+    print()
+    print(f"memory: bytes per key ({args.keys} keys, tracemalloc)")
+    print(f"{'fields':>8} {'JSON':>10} {'listpack':>10} {'hashtable':>10}")
+    for fields in field_counts:
+        blob, listpack, hashtable = measure_memory(args.keys, fields)
+        print(f"{fields:>8} {blob:>10,.0f} {listpack:>10,.0f} {hashtable:>10,.0f}")
+
+    print()
+    print(f"hget: {args.requests} HGET on one hash")
+    print(f"{'fields':>8} {'listpack op/s':>14} {'hashtable op/s':>15}")
+    for fields in field_counts:
+        listpack, hashtable = run_hget(args.requests, fields)
+        print(f"{fields:>8} {listpack:>14,.0f} {hashtable:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+해시맵 벤치마크 (체이닝 HashMap vs 오픈 어드레싱 OpenAddressingHashMap)
+
+키스페이스(_store)에 쓰이는 두 해시맵을 같은 키로 채운 뒤 다음을 측정합니다.
+
+1. put:      N개 키 삽입 (확장/재구성 포함)
+2. get hit:  존재하는 키 조회 (임의 순서)
+3. get miss: 존재하지 않는 키 조회
+4. memory:   tracemalloc으로 측정한 키당 바이트 (키/값 문자열 제외, 자료구조 오버헤드만)
+
+실행 방법:
+    python benchmarks/bench_hash_map.py -n 1000000
+    python benchmarks/bench_hash_map.py -n 10000000 --map open   # 메모리가 충분할 때
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_structures.hash_map import HashMap
+from data_structures.open_hash_map import OpenAddressingHashMap
+
+
+MAPS = {"chaining": HashMap, "open": OpenAddressingHashMap}
+
+VALUE = "x" * 16
+
+
+def run(name, keys, lookups, misses):
+    """
+    해시맵 하나에 대해 전체 단계 실행 후 결과 출력
+    """
+    count = len(keys)
+
+    # 키/값 문자열은 미리 만들어 두었으므로 tracemalloc에는 자료구조 할당만 잡힘
+    tracemalloc.start()
+    start = time.perf_counter()
+    table = MAPS[name]()
+    put = table.put
+    for key in keys:
+        put(key, VALUE)
+    put_elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    get = table.get
+    start = time.perf_counter()
+    for key in lookups:
+        get(key)
+    hit_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in misses:
+        get(key)
+    miss_elapsed = time.perf_counter() - start
+
+    print(f"{name}:")
+    print(f"  put      : {count / put_elapsed:12.0f} ops/sec  (tracemalloc enabled)")
+    print(f"  get hit  : {len(lookups) / hit_elapsed:12.0f} ops/sec")
+    print(f"  get miss : {len(misses) / miss_elapsed:12.0f} ops/sec")
+    print(f"  memory   : {memory / count:12.1f} bytes/key")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis hash map benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=1000000, help="keys to insert")
+    parser.add_argument("--lookups", type=int, default=1000000, help="lookups per phase")
+    parser.add_argument("--map", choices=("chaining", "open", "both"), default="both")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keys = [f"key:{i}" for i in range(args.keys)]
+    lookups = rng.choices(keys, k=args.lookups)
+    misses = [f"missing:{i}" for i in range(args.lookups)]
+
+    names = ("chaining", "open") if args.map == "both" else (args.map,)
+    print(f"{args.keys} keys, {args.lookups} lookups")
+    for name in names:
+        run(name, keys, lookups, misses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+키 해시 벤치마크 (다항식 롤링 해시 vs hash() + 엔트리 해시 캐시)
+
+키 길이(8 ~ 512바이트)별로 다음을 측정합니다.
+
+1. hash:  해시 함수 하나의 호출 시간 (ns/key)
+2. get:   HashMap 조회 처리량 (존재하는 키, 임의 순서)
+3. grow:  빈 HashMap에 N개 키 삽입 (재해싱 포함) 처리량
+
+polynomial은 해시 함수만 이전 버전(파이썬 루프로 문자마다 hash * 31 + ord(char))으로
+바꾼 HashMap이고, builtin은 현재 HashMap(hash())입니다. 두 경우 모두 엔트리에 저장된
+해시값을 재해싱에 사용하므로, 이전 버전은 grow 단계에서 이보다 더 느렸습니다.
+
+실행 방법:
+    python benchmarks/bench_hashing.py -n 200000
+    python benchmarks/bench_hashing.py --lengths 8,64,512
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_structures.hash_map import HashMap
+
+
+def polynomial_hash(key):
+    hash_value = 0
+    for char in str(key):
+        hash_value = (hash_value * 31 + ord(char)) & 0x7FFFFFFF
+    return hash_value
+
+
+class PolynomialHashMap(HashMap):
+    """이전 버전의 해시 함수를 쓰는 HashMap"""
+
+    def _hash(self, key):
+        return polynomial_hash(key)
+
+
+MAPS = {"polynomial": PolynomialHashMap, "builtin": HashMap}
+
+
+def make_keys(count, length, rng):
+    """
+    session:<uuid>:... 형태로 길이가 length인 키 생성
+    """
+    keys = []
+    for i in range(count):
+        key = f"session:{rng.getrandbits(128):032x}:{i}:"
+        if len(key) < length:
+            key += "p" * (length - len(key))
+        keys.append(key[-length:] if len(key) > length else key)
+    return keys
+
+
+def run(name, keys, lookups):
+    """
+    해시맵 종류 하나에 대해 측정 후 (hash ns, get ops/sec, grow ops/sec) 반환
+    """
+    gc.collect()
+    table_class = MAPS[name]
+    table = table_class()
+    hash_fn = table._hash
+
+    start = time.perf_counter()
+    for key in lookups:
+        hash_fn(key)
+    hash_ns = (time.perf_counter() - start) * 1e9 / len(lookups)
+
+    start = time.perf_counter()
+    put = table.put
+    for key in keys:
+        put(key, 1)
+    grow = len(keys) / (time.perf_counter() - start)
+
+    get = table.get
+    start = time.perf_counter()
+    for key in lookups:
+        get(key)
+    gets = len(lookups) / (time.perf_counter() - start)
+
+    return hash_ns, gets, grow
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis key hashing benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=100000, help="keys per key length")
+    parser.add_argument("--lookups", type=int, default=200000, help="lookups per key length")
+    parser.add_argument("--lengths", default="8,16,32,64,128,256,512", help="key lengths in bytes")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    lengths = [int(x) for x in args.lengths.split(",")]
+
+    print(f"{args.keys} keys, {args.lookups} lookups per key length")
+    print(f"{'len':>5} {'map':<11} {'hash ns':>9} {'get ops/s':>11} {'grow ops/s':>11}")
+    for length in lengths:
+        keys = make_keys(args.keys, length, rng)
+        picked = rng.choices(keys, k=args.lookups)
+        for name in MAPS:
+            # str 객체는 hash() 결과를 내부에 캐시하므로, 요청마다 새로 파싱된 키처럼 매번 새 객체 사용
+            lookups = [key.encode().decode() for key in picked]
+            hash_ns, gets, grow = run(name, keys, lookups)
+            print(f"{length:>5} {name:<11} {hash_ns:9.0f} {gets:11.0f} {grow:11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+명령어 계측 오버헤드 벤치마크
+
+CLI.dispatch는 명령어마다 perf_counter_ns로 시간을 재어 통계(INFO commandstats),
+히스토그램(LATENCY HISTOGRAM), SLOWLOG, 지연 모니터에 기록합니다.
+같은 명령어 스트림을 명령어 테이블의 핸들러 직접 호출(계측 없음)과 dispatch로 번갈아 실행하여
+명령어 하나당 추가 비용을 측정하고, 마지막에 수집된 백분위를 출력합니다.
+
+실행 방법:
+    python benchmarks/bench_instrumentation.py -n 200000
+    python benchmarks/bench_instrumentation.py --ratio 1:1 --rounds 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cli import CLI
+
+
+def make_commands(n, keyspace, sets, gets):
+    """
+    SET:GET 비율대로 섞인 토큰 리스트 n개
+    """
+    period = sets + gets
+    commands = []
+    for i in range(n):
+        key = f"key:{i * 7919 % keyspace}"
+        if i % period < sets:
+            commands.append(["SET", key, "x" * 16])
+        else:
+            commands.append(["GET", key])
+    return commands
+
+
+def run_raw(cli, commands):
+    """
+    계측 없이 핸들러만 실행하여 명령어당 마이크로초 반환
+    """
+    handlers = cli._commands
+    start = time.perf_counter()
+    for tokens in commands:
+        handlers[tokens[0]][1](tokens[1:])
+    return (time.perf_counter() - start) / len(commands) * 1e6
+
+
+def run_instrumented(cli, commands):
+    """
+    CLI.dispatch로 실행하여 명령어당 마이크로초 반환
+    """
+    dispatch = cli.dispatch
+    start = time.perf_counter()
+    for tokens in commands:
+        dispatch(tokens)
+    return (time.perf_counter() - start) / len(commands) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis command instrumentation overhead benchmark")
+    parser.add_argument("-n", "--requests", type=int, default=200000, help="commands per round")
+    parser.add_argument("-r", "--keyspace", type=int, default=10000, help="distinct keys")
+    parser.add_argument("--ratio", default="1:10", help="SET:GET ratio")
+    parser.add_argument("--rounds", type=int, default=3, help="alternating rounds (best of)")
+    args = parser.parse_args()
+
+    sets, gets = (int(part) for part in args.ratio.split(":"))
+    commands = make_commands(args.requests, args.keyspace, sets, gets)
+    cli = CLI()
+    run_raw(cli, make_commands(args.keyspace, args.keyspace, 1, 0))
+
+    raw = []
+    instrumented = []
+    for _ in range(args.rounds):
+        raw.append(run_raw(cli, commands))
+        instrumented.append(run_instrumented(cli, commands))
+
+    best_raw = min(raw)
+    best_instrumented = min(instrumented)
+    print(f"{len(commands)} commands x {args.rounds} rounds, SET:GET = {args.ratio}")
+    print(f"{'handlers only':>16}: {best_raw:.2f} us/command")
+    print(f"{'CLI.dispatch':>16}: {best_instrumented:.2f} us/command "
+          f"(+{best_instrumented - best_raw:.2f} us, {(best_instrumented / best_raw - 1) * 100:.0f}%)")
+    print()
+    for key, value in cli.redis.info_latencystats().items():
+        print(f"{key}:{value}")
+
+
+if __name__ == "__main__":
+    main()
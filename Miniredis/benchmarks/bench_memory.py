@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+키당 메모리 벤치마크 (__slots__ / 배열 기반 LRU 리스트)
+
+MiniRedis에 N개 키를 SET한 뒤 tracemalloc으로 측정한 할당량을 키 수로 나눠 출력합니다.
+키/값 문자열은 측정 전에 미리 만들어 두므로 자료구조 오버헤드만 잡힙니다.
+채운 뒤 gc.collect() 한 번에 걸리는 시간(순환 GC의 전체 수집 멈춤)도 함께 출력합니다.
+
+레이아웃:
+    dict-list:     __slots__ 도입 전 (Node/HashMapEntry가 인스턴스마다 __dict__), LRU 리스트
+    slots-list:    __slots__ Node/HashMapEntry, LRU 리스트 (lru_tracking="list")
+    slots-indexed: __slots__ HashMapEntry, array('l') 기반 LRU 리스트 (lru_tracking="indexed")
+    slots-sampled: __slots__ HashMapEntry, LRU 리스트 없음 (lru_tracking="sampled", 기본값)
+
+--hash-table open으로 키스페이스 해시맵을 오픈 어드레싱으로 바꿔 측정할 수 있습니다.
+
+실행 방법:
+    python benchmarks/bench_memory.py -n 1000000
+    python benchmarks/bench_memory.py -n 5000000 --layout slots-indexed
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_structures import doubly_linked_list, hash_map, open_hash_map
+from redis_core import MiniRedis
+
+
+VALUE = "x" * 16
+
+
+class DictNode:
+    """__slots__ 도입 전 Node (인스턴스마다 __dict__)"""
+
+    def __init__(self, data=None):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+
+class DictHashMapEntry:
+    """__slots__ 도입 전 HashMapEntry (인스턴스마다 __dict__)"""
+
+    def __init__(self, key, value, lru_node=None, hash_value=0):
+        self.key = key
+        self.value = value
+        self.lru_node = lru_node
+        self.lru = 0
+        self.lfu_counter = 0
+        self.lfu_decr_time = 0
+        self.hash_value = hash_value
+
+
+SLOTS_NODE = doubly_linked_list.Node
+SLOTS_ENTRY = hash_map.HashMapEntry
+
+# (이름, lru_tracking, __dict__ 클래스 사용 여부)
+LAYOUTS = (
+    ("dict-list", "list", True),
+    ("slots-list", "list", False),
+    ("slots-indexed", "indexed", False),
+    ("slots-sampled", "sampled", False),
+)
+
+
+def use_dict_classes(enabled):
+    """
+    자료구조 모듈이 생성하는 Node/HashMapEntry 클래스를 교체
+    """
+    doubly_linked_list.Node = DictNode if enabled else SLOTS_NODE
+    entry_class = DictHashMapEntry if enabled else SLOTS_ENTRY
+    hash_map.HashMapEntry = entry_class
+    open_hash_map.HashMapEntry = entry_class
+
+
+def run(name, lru_tracking, dict_classes, keys, hash_table):
+    """
+    레이아웃 하나로 키를 채우고 바이트/키와 SET 처리량 출력
+    """
+    use_dict_classes(dict_classes)
+    gc.collect()
+
+    tracemalloc.start()
+    redis = MiniRedis(lru_tracking=lru_tracking, hash_table=hash_table)
+    start = time.perf_counter()
+    for key in keys:
+        redis.set(key, VALUE)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # 전체 GC 수집 시간 (GC가 추적하는 객체 수에 비례, 배열 슬롯/정수는 추적 대상이 아님)
+    start = time.perf_counter()
+    gc.collect()
+    gc_ms = (time.perf_counter() - start) * 1000
+
+    use_dict_classes(False)
+    print(f"  {name:<14}: {memory / len(keys):8.1f} bytes/key  "
+          f"{len(keys) / elapsed:9.0f} SET/sec (with tracemalloc)  full gc {gc_ms:7.1f} ms")
+    return redis
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis per-key memory benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=1000000, help="keys to SET")
+    parser.add_argument("--layout", choices=[name for name, _, _ in LAYOUTS] + ["all"], default="all")
+    parser.add_argument("--hash-table", choices=("chaining", "open"), default="chaining")
+    args = parser.parse_args()
+
+    keys = [f"key:{i}" for i in range(args.keys)]
+    print(f"{args.keys} keys, {args.hash_table} hash table, value {len(VALUE)} bytes")
+    for name, lru_tracking, dict_classes in LAYOUTS:
+        if args.layout in ("all", name):
+            run(name, lru_tracking, dict_classes, keys, args.hash_table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+명령어 줄 파싱 벤치마크 (문자 단위 누적 vs split_args)
+
+REPL 입력 'SET key "<값>"'을 값 크기별로 파싱하는 시간을 비교합니다.
+
+    char loop:   문자 하나씩 검사하며 current_token += char로 토큰을 만드는 방식 (이전 CLI._parse_input)
+    split_args:  정규식으로 따옴표 / 공백 조각 단위로 잘라 한 번에 합치는 방식 (protocol.split_args)
+
+값이 큰 대량 입력에서 파싱이 저장 연산보다 오래 걸리지 않는지 확인하기 위해
+같은 줄을 CLI로 실행하는 시간(파싱 + SET)도 함께 출력합니다.
+
+실행 방법:
+    python benchmarks/bench_parse.py
+    python benchmarks/bench_parse.py --sizes 16,1024,65536 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cli import CLI
+from protocol import split_args
+
+
+def char_loop(user_input):
+    """
+    문자 단위 누적 파서 (비교 기준)
+    """
+    tokens = []
+    current_token = ""
+    in_quotes = False
+    quote_char = None
+    for char in user_input:
+        if char in ('"', "'") and not in_quotes:
+            in_quotes = True
+            quote_char = char
+        elif char == quote_char and in_quotes:
+            in_quotes = False
+            quote_char = None
+        elif char == ' ' and not in_quotes:
+            if current_token:
+                tokens.append(current_token)
+                current_token = ""
+        else:
+            current_token += char
+    if current_token:
+        tokens.append(current_token)
+    return tokens
+
+
+def timed(fn, arg, repeat):
+    """
+    fn(arg)를 repeat번 실행한 평균 마이크로초
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis command line parsing benchmark")
+    parser.add_argument("--sizes", default="16,1024,16384,131072", help="value sizes (comma separated)")
+    parser.add_argument("--repeat", type=int, default=50, help="runs per size")
+    args = parser.parse_args()
+
+    cli = CLI()
+    print(f"{'value bytes':>12} {'char loop us':>14} {'split_args us':>14} {'CLI SET us':>12}")
+    for size in (int(part) for part in args.sizes.split(",")):
+        line = f'SET key:{size} "{"x" * size}"'
+        assert char_loop(line) == split_args(line)
+        loop_us = timed(char_loop, line, args.repeat)
+        split_us = timed(split_args, line, args.repeat)
+        execute_us = timed(cli._execute_command, line, args.repeat)
+        print(f"{size:>12} {loop_us:>14.1f} {split_us:>14.1f} {execute_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
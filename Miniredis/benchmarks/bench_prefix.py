@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+접두사 인덱스 벤치마크 (인덱스 유지 비용 vs 접두사 조회 속도)
+
+tenant:<t>:user:<u> 형태의 키 N개를 채우면서 SET 처리량을 재고,
+테넌트 하나(전체의 1/tenants)에 대해 접두사 조회 시간을 비교합니다.
+
+    SET:          prefix_index 없음 / 있음 (SkipList 삽입 비용)
+    COUNTPREFIX:  키스페이스 전체 순회 vs 순위 차이 O(log n)
+    SCAN MATCH:   해시 버킷 커서로 끝까지 vs 인덱스 범위만 순회
+    DELPREFIX:    키스페이스 전체 순회 vs 인덱스 범위만 순회
+
+실행 방법:
+    python benchmarks/bench_prefix.py -n 500000 --tenants 1000
+    python benchmarks/bench_prefix.py -n 100000 --tenants 10 --count 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from redis_core import MiniRedis
+
+
+VALUE = "x" * 16
+
+
+def fill(redis, keys):
+    """
+    키를 모두 SET하고 ops/sec 반환
+    """
+    start = time.perf_counter()
+    for key in keys:
+        redis.set(key, VALUE)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def timed(fn):
+    """
+    fn() 실행 후 (결과, 밀리초) 반환
+    """
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def scan_all(redis, pattern, count):
+    """
+    SCAN MATCH pattern을 커서가 0이 될 때까지 반복하여 (키 개수, 호출 수) 반환
+    """
+    found = 0
+    calls = 0
+    cursor = 0
+    while True:
+        cursor, keys = redis.scan(cursor, pattern, count)
+        found += len(keys)
+        calls += 1
+        if cursor == 0:
+            return found, calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis prefix index benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=200000, help="keys to preload")
+    parser.add_argument("--tenants", type=int, default=100, help="key prefixes (tenant:<t>:)")
+    parser.add_argument("--count", type=int, default=100, help="SCAN COUNT")
+    args = parser.parse_args()
+
+    per_tenant = args.keys // args.tenants
+    keys = [f"tenant:{t}:user:{u}" for u in range(per_tenant) for t in range(args.tenants)]
+    prefix = "tenant:7:"
+
+    print(f"{len(keys)} keys, {args.tenants} tenants, {per_tenant} keys per prefix")
+    print(f"{'':>14} {'no index':>14} {'prefix index':>14}")
+
+    rows = {name: [] for name in ("SET ops/sec", "COUNTPREFIX ms", "SCAN MATCH ms", "SCAN calls", "DELPREFIX ms")}
+    for enabled in (False, True):
+        redis = MiniRedis(prefix_index=enabled)
+        rows["SET ops/sec"].append(f"{fill(redis, keys):.0f}")
+
+        count, ms = timed(lambda: redis.count_prefix(prefix))
+        assert count == per_tenant
+        rows["COUNTPREFIX ms"].append(f"{ms:.3f}")
+
+        (found, calls), ms = timed(lambda: scan_all(redis, prefix + "*", args.count))
+        assert found == per_tenant
+        rows["SCAN MATCH ms"].append(f"{ms:.1f}")
+        rows["SCAN calls"].append(str(calls))
+
+        deleted, ms = timed(lambda: redis.delete_prefix(prefix))
+        assert deleted == per_tenant
+        rows["DELPREFIX ms"].append(f"{ms:.1f}")
+
+    for name, values in rows.items():
+        print(f"{name:>14} {values[0]:>14} {values[1]:>14}")
+
+
+if __name__ == "__main__":
+    main()
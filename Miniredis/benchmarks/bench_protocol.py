@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+RESP 파서 / 인코더 벤치마크 (초당 파싱 명령어 수)
+
+서버 없이 protocol 모듈만 측정합니다. 파이프라인 배치(-P개 명령어)를 --chunk 바이트씩 잘라
+feed()하며 get_commands()로 꺼내는 속도를 이전 방식과 비교합니다.
+
+    bytes:      수신 버퍼가 bytes라 feed()마다 이어 붙이고(큰 값이 여러 read에 걸치면 제곱 복사),
+                파싱 후 남은 부분을 buffer[pos:]로 다시 복사하는 방식 (이전 RespParser)
+    bytearray:  bytearray 하나에 덧붙이고 다 읽은 앞부분만 잘라내며,
+                미완성 Bulk String은 필요한 길이가 모일 때까지 다시 파싱하지 않는 방식 (protocol.RespParser)
+
+응답 인코딩도 배치 하나를 응답마다 bytes를 만들어 합치는 방식과
+encode_reply_into로 bytearray 하나에 이어 쓰는 방식으로 비교합니다.
+
+측정 전에 잘못된 프레임(음수 / 부호 붙은 길이, 한도 초과, 데이터 뒤 CRLF 누락)이
+무한 루프나 가짜 명령어 없이 ProtocolError가 되는지 먼저 확인합니다.
+
+실행 방법:
+    python benchmarks/bench_protocol.py
+    python benchmarks/bench_protocol.py -P 1,16,128 -d 16,4096 --chunk 1460
+    python benchmarks/bench_protocol.py -P 1 -d 1048576 --chunk 65536 --seconds 2
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from protocol import (RespParser, ProtocolError, StatusReply, CRLF, ENCODING, ENCODING_ERRORS,
+                      PROTO_MAX_MULTIBULK_LEN, PROTO_MAX_BULK_LEN, encode_command, encode_reply_into)
+
+
+class BytesParser:
+    """
+    bytes 버퍼 기반 Multi-bulk 파서 (비교 기준, 이전 RespParser.get_commands)
+    """
+
+    def __init__(self):
+        self._buffer = b""
+
+    def feed(self, data):
+        if self._buffer:
+            self._buffer += data
+        else:
+            self._buffer = data
+
+    def get_commands(self):
+        commands = []
+        buffer = self._buffer
+        pos = 0
+        while pos < len(buffer):
+            result = self._parse_multibulk(buffer, pos)
+            if result is None:
+                break
+            tokens, pos = result
+            commands.append(tokens)
+        self._buffer = buffer[pos:]
+        return commands
+
+    def _parse_multibulk(self, buffer, pos):
+        end = buffer.find(CRLF, pos)
+        if end == -1:
+            return None
+        count = int(buffer[pos + 1:end])
+        pos = end + 2
+        tokens = []
+        for _ in range(count):
+            if pos >= len(buffer):
+                return None
+            if buffer[pos:pos + 1] != b"$":
+                raise ProtocolError("expected '$'")
+            end = buffer.find(CRLF, pos)
+            if end == -1:
+                return None
+            length = int(buffer[pos + 1:end])
+            start = end + 2
+            if start + length + 2 > len(buffer):
+                return None
+            tokens.append(buffer[start:start + length].decode(ENCODING, ENCODING_ERRORS))
+            pos = start + length + 2
+        return tokens, pos
+
+
+def encode_reply_bytes(reply):
+    """
+    응답마다 bytes를 만들어 합치는 인코더 (비교 기준, 이전 encode_reply의 str / StatusReply 경로)
+    """
+    if isinstance(reply, StatusReply):
+        return b"+" + reply.encode(ENCODING, ENCODING_ERRORS) + CRLF
+    data = reply.encode(ENCODING, ENCODING_ERRORS)
+    return b"$" + str(len(data)).encode() + CRLF + data + CRLF
+
+
+def make_chunks(pipeline, value_size, chunk):
+    """
+    SET 명령어 pipeline개를 이은 배치를 chunk 바이트씩 자른 리스트
+    """
+    value = "x" * value_size
+    batch = b"".join(encode_command(("SET", f"key:{i}", value)) for i in range(pipeline))
+    return [batch[i:i + chunk] for i in range(0, len(batch), chunk)]
+
+
+def check_malformed():
+    """
+    잘못된 Multi-bulk 프레임마다 RespParser가 ProtocolError를 내는지 확인
+    """
+    frames = (
+        b"*1\r\n$-12\r\n",                       # 음수 길이 (커서가 뒤로 돌아가 무한 루프였음)
+        b"*1\r\n$-3\r\nxx",                       # 음수 길이 (가짜 [''] 명령어였음)
+        b"*1\r\n$+3\r\nGET\r\n",                  # 부호 붙은 길이
+        b"*1\r\n$ 3\r\nGET\r\n",                  # 공백 붙은 길이
+        b"*x\r\n",                               # 정수가 아닌 개수
+        b"*%d\r\n" % (PROTO_MAX_MULTIBULK_LEN + 1),  # 개수 한도 초과
+        b"*1\r\n$%d\r\n" % (PROTO_MAX_BULK_LEN + 1),  # 길이 한도 초과
+        b"*1\r\n$3\r\nGETxx",                      # 데이터 뒤 CRLF 누락
+    )
+    for frame in frames:
+        parser = RespParser()
+        parser.feed(frame)
+        try:
+            commands = parser.get_commands()
+        except ProtocolError:
+            continue
+        raise AssertionError(f"{frame!r} parsed as {commands!r}")
+
+
+def parse_rate(parser_class, chunks, pipeline, seconds):
+    """
+    seconds 동안 배치를 반복 파싱하여 초당 명령어 수 반환
+    """
+    parser = parser_class()
+    parsed = 0
+    batches = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        for data in chunks:
+            parser.feed(data)
+            parsed += len(parser.get_commands())
+        batches += 1
+        if batches % 16 == 0 and time.perf_counter() >= deadline:
+            break
+    assert parsed == batches * pipeline
+    return parsed / (time.perf_counter() - start)
+
+
+def encode_rate(replies, seconds):
+    """
+    seconds 동안 응답 배치를 반복 인코딩하여 (bytes 합치기, bytearray 이어 쓰기) 초당 응답 수 반환
+    """
+    rates = []
+    for encode in ("bytes", "bytearray"):
+        count = 0
+        start = time.perf_counter()
+        deadline = start + seconds
+        while time.perf_counter() < deadline:
+            for _ in range(16):
+                if encode == "bytes":
+                    payload = b"".join([encode_reply_bytes(reply) for reply in replies])
+                else:
+                    payload = bytearray()
+                    for reply in replies:
+                        encode_reply_into(payload, reply)
+                count += len(replies)
+        rates.append(count / (time.perf_counter() - start))
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis RESP parser / encoder benchmark")
+    parser.add_argument("-P", "--pipeline", default="1,16,128", help="commands per batch (comma separated)")
+    parser.add_argument("-d", "--value-size", default="16,4096,262144", help="SET value sizes (comma separated)")
+    parser.add_argument("--chunk", type=int, default=65536, help="bytes per feed() (one socket read)")
+    parser.add_argument("--seconds", type=float, default=0.5, help="measurement time per case")
+    args = parser.parse_args()
+
+    check_malformed()
+
+    print(f"parse: SET batches fed {args.chunk} bytes at a time")
+    print(f"{'pipeline':>8} {'value':>8} {'bytes cmd/s':>14} {'bytearray cmd/s':>16} {'speedup':>8}")
+    for size in (int(part) for part in args.value_size.split(",")):
+        for pipeline in (int(part) for part in args.pipeline.split(",")):
+            chunks = make_chunks(pipeline, size, args.chunk)
+            baseline = parse_rate(BytesParser, chunks, pipeline, args.seconds)
+            current = parse_rate(RespParser, chunks, pipeline, args.seconds)
+            print(f"{pipeline:>8} {size:>8} {baseline:>14,.0f} {current:>16,.0f} {current / baseline:>7.2f}x")
+
+    print()
+    print("encode: one batch of replies into one payload")
+    print(f"{'pipeline':>8} {'value':>8} {'bytes rep/s':>14} {'bytearray rep/s':>16} {'speedup':>8}")
+    for size in (int(part) for part in args.value_size.split(",")):
+        for pipeline in (int(part) for part in args.pipeline.split(",")):
+            replies = [StatusReply("OK") if i % 2 else "x" * size for i in range(pipeline)]
+            baseline, current = encode_rate(replies, args.seconds)
+            print(f"{pipeline:>8} {size:>8} {baseline:>14,.0f} {current:>16,.0f} {current / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+해시맵 확장 지연 벤치마크 (점진적 재해싱)
+
+빈 MiniRedis에 키를 0개에서 N개까지 SET으로 채우며 SET 하나하나의 실행 시간을 기록하고,
+백분위 지연(p50 / p99 / p99.9 / max)을 출력합니다.
+
+    chaining-rehash: 현재 HashMap (점진적 재해싱)
+    chaining-stw:    확장 시 모든 엔트리를 한 번에 옮기는 HashMap (이전 방식, 비교용)
+    open:            OpenAddressingHashMap (재구성을 한 번에 수행)
+
+--cron을 주면 --cron-every개의 SET마다 cron()을 호출하여 유휴 시간 재해싱도 함께 진행합니다.
+Python 순환 GC의 전체 수집 멈춤이 자료구조의 지연과 섞이지 않도록 기본으로 측정 중 GC를 끕니다
+(--gc로 켤 수 있음).
+
+실행 방법:
+    python benchmarks/bench_rehash.py -n 5000000
+    python benchmarks/bench_rehash.py -n 1000000 --table chaining-rehash --cron
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_structures.hash_map import HashMap
+from redis_core import MiniRedis
+
+
+VALUE = "x" * 16
+
+
+class StopTheWorldHashMap(HashMap):
+    """확장 시 재해싱을 한 번에 끝내는 HashMap (점진적 재해싱 도입 전 동작)"""
+
+    def _start_rehash(self, capacity):
+        super()._start_rehash(capacity)
+        while self._rehash_step(self._capacity):
+            pass
+
+
+TABLES = {
+    "chaining-rehash": ("chaining", None),
+    "chaining-stw": ("chaining", StopTheWorldHashMap),
+    "open": ("open", None),
+}
+
+
+def percentile(sorted_samples, fraction):
+    """
+    정렬된 표본에서 백분위 값 반환
+    """
+    index = min(len(sorted_samples) - 1, int(len(sorted_samples) * fraction))
+    return sorted_samples[index]
+
+
+def run(name, count, cron_every, keep_gc):
+    """
+    테이블 하나에 대해 0 -> count개 SET 후 지연 분포 출력
+    """
+    if not keep_gc:
+        gc.disable()
+    hash_table, store_class = TABLES[name]
+    redis = MiniRedis(hash_table=hash_table)
+    if store_class is not None:
+        redis._store_class = store_class
+        redis._store = store_class()
+
+    set_ = redis.set
+    clock = time.perf_counter_ns
+    latencies = [0] * count
+
+    start = time.perf_counter()
+    for i in range(count):
+        key = f"key:{i}"
+        t0 = clock()
+        set_(key, VALUE)
+        latencies[i] = clock() - t0
+        if cron_every and i % cron_every == 0:
+            redis.cron()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+
+    latencies.sort()
+    us = 1000.0
+    print(f"{name}:")
+    print(f"  throughput : {count / elapsed:10.0f} SET/sec")
+    print(f"  p50        : {percentile(latencies, 0.50) / us:10.1f} us")
+    print(f"  p99        : {percentile(latencies, 0.99) / us:10.1f} us")
+    print(f"  p99.9      : {percentile(latencies, 0.999) / us:10.1f} us")
+    print(f"  max        : {latencies[-1] / us:10.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis hash map growth latency benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=5000000, help="keys to SET (growth 0 -> n)")
+    parser.add_argument("--table", choices=tuple(TABLES) + ("all",), default="all")
+    parser.add_argument("--cron", action="store_true", help="call cron() periodically (idle rehashing)")
+    parser.add_argument("--cron-every", type=int, default=1000, help="SETs between cron() calls")
+    parser.add_argument("--gc", action="store_true", help="keep the cyclic GC enabled while measuring")
+    args = parser.parse_args()
+
+    names = tuple(TABLES) if args.table == "all" else (args.table,)
+    cron_every = args.cron_every if args.cron else 0
+    print(f"SET latency while growing from 0 to {args.keys} keys")
+    for name in names:
+        run(name, args.keys, cron_every, args.gc)
+
+
+if __name__ == "__main__":
+    main()
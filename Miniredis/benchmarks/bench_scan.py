@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+키스페이스 순회 벤치마크 (KEYS vs SCAN)
+
+N개의 키를 채운 뒤 다음을 측정합니다.
+
+    KEYS *:  명령어 하나가 키스페이스 전체를 훑는 시간 (그동안 다른 요청은 대기)
+    SCAN:    커서가 0으로 돌아올 때까지의 호출 수, 호출 하나의 최대 / 평균 시간
+    resize:  SCAN 호출 사이에 키를 추가/삭제하여 해시 테이블이 확장/축소되는 동안에도
+             처음부터 끝까지 있던 키가 모두 반환되는지 확인
+
+실행 방법:
+    python benchmarks/bench_scan.py -n 1000000 --count 100
+    python benchmarks/bench_scan.py --hash-table open
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from redis_core import MiniRedis
+from protocol import encode_reply
+
+
+VALUE = "x" * 16
+
+
+def full_scan(redis, count, between=None):
+    """
+    커서 0부터 끝까지 SCAN하여 (반환된 키 집합, 호출 수, 최대 호출 시간, 전체 시간) 반환
+
+    between이 있으면 호출 사이마다 between(호출 번호)을 실행합니다.
+    """
+    seen = set()
+    calls = 0
+    worst = 0.0
+    total = 0.0
+    cursor = 0
+    while True:
+        start = time.perf_counter()
+        cursor, keys = redis.scan(cursor, count=count)
+        elapsed = time.perf_counter() - start
+        worst = max(worst, elapsed)
+        total += elapsed
+        seen.update(keys)
+        calls += 1
+        if between is not None:
+            between(calls)
+        if cursor == 0:
+            return seen, calls, worst, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis KEYS vs SCAN benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=500000, help="keys to preload")
+    parser.add_argument("--count", type=int, default=100, help="SCAN COUNT")
+    parser.add_argument("--hash-table", choices=("chaining", "open"), default="chaining")
+    args = parser.parse_args()
+
+    redis = MiniRedis(hash_table=args.hash_table)
+    for i in range(args.keys):
+        redis.set(f"key:{i}", VALUE)
+
+    start = time.perf_counter()
+    frame = encode_reply(redis.keys("*"))
+    keys_ms = (time.perf_counter() - start) * 1000
+    print(f"{args.keys} keys, {args.hash_table}")
+    print(f"KEYS *      {keys_ms:10.1f} ms in one call ({len(frame) / 1e6:.1f} MB reply)")
+
+    seen, calls, worst, total = full_scan(redis, args.count)
+    print(f"SCAN {args.count:<6} {total * 1000:10.1f} ms over {calls} calls, "
+          f"max {worst * 1e6:.0f} us, avg {total / calls * 1e6:.0f} us per call, {len(seen)} keys")
+
+    # 절반은 그대로 두고, 나머지 절반을 지운 뒤 새 키로 다시 채워 축소와 확장을 모두 일으킴
+    stable = {f"key:{i}" for i in range(0, args.keys, 2)}
+    churn = max(1, args.keys // calls * 4)
+    next_key = [args.keys]
+
+    def mutate(call):
+        base = (call - 1) * churn
+        if base < args.keys:
+            for i in range(base | 1, min(args.keys, base + churn * 2), 2):
+                redis.delete(f"key:{i}")
+        else:
+            for _ in range(churn):
+                redis.set(f"new:{next_key[0]}", VALUE)
+                next_key[0] += 1
+
+    seen, calls, worst, total = full_scan(redis, args.count, mutate)
+    missing = len(stable - seen)
+    print(f"SCAN resize {total * 1000:10.1f} ms over {calls} calls, "
+          f"max {worst * 1e6:.0f} us, missing stable keys: {missing}")
+
+
+if __name__ == "__main__":
+    main()
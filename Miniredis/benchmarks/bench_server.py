@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+네트워크 서버 처리량 벤치마크 (redis-benchmark 스타일)
+
+server.py를 별도 프로세스로 띄우고, asyncio 클라이언트 여러 개가
+파이프라이닝(-P)으로 SET/GET을 보내 초당 처리량을 측정합니다.
+측정값이 --target 미만이면 종료 코드 1을 반환합니다.
+
+실행 방법:
+    python benchmarks/bench_server.py -c 50 -n 200000 -P 16 --target 10000
+    python benchmarks/bench_server.py --unixsocket /tmp/mini-redis-bench.sock
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import os
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from protocol import RespParser, ErrorReply, encode_command
+
+
+def free_port():
+    """
+    사용 가능한 TCP 포트 하나 반환
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, unixsocket):
+    """
+    서버 프로세스 시작 후 접속 가능해질 때까지 대기
+
+    Returns:
+        subprocess.Popen: 서버 프로세스
+    """
+    cmd = [sys.executable, os.path.join(ROOT, "server.py"), "--port", str(port)]
+    if unixsocket:
+        cmd += ["--unixsocket", unixsocket]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            if unixsocket:
+                with socket.socket(socket.AF_UNIX) as sock:
+                    sock.connect(unixsocket)
+            else:
+                socket.create_connection(("127.0.0.1", port)).close()
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+async def run_client(port, unixsocket, command, requests, pipeline, keyspace, client_id):
+    """
+    클라이언트 하나: requests개 명령어를 pipeline개씩 묶어 전송
+
+    Returns:
+        int: 에러 응답 개수
+    """
+    if unixsocket:
+        reader, writer = await asyncio.open_unix_connection(unixsocket)
+    else:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    parser = RespParser()
+    errors = 0
+    sent = 0
+    value = "x" * 3
+
+    while sent < requests:
+        batch = min(pipeline, requests - sent)
+        frames = []
+        for i in range(batch):
+            key = f"key:{(client_id * requests + sent + i) % keyspace}"
+            if command == "SET":
+                frames.append(encode_command(("SET", key, value)))
+            elif command == "GET":
+                frames.append(encode_command(("GET", key)))
+            else:
+                frames.append(encode_command(("PING",)))
+        writer.write(b"".join(frames))
+
+        received = 0
+        while received < batch:
+            data = await reader.read(65536)
+            if not data:
+                raise ConnectionError("server closed connection")
+            parser.feed(data)
+            for reply in parser.get_replies():
+                if isinstance(reply, ErrorReply):
+                    errors += 1
+                received += 1
+        sent += batch
+
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+
+async def run_test(args, command):
+    """
+    한 가지 명령어에 대한 처리량 측정
+
+    Returns:
+        float: 초당 처리 명령어 수
+    """
+    per_client = args.requests // args.clients
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        run_client(args.port, args.unixsocket, command, per_client,
+                   args.pipeline, args.keyspace, cid)
+        for cid in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - start
+    total = per_client * args.clients
+    if sum(results):
+        print(f"  warning: {sum(results)} error replies")
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis server throughput benchmark")
+    parser.add_argument("-c", "--clients", type=int, default=50)
+    parser.add_argument("-n", "--requests", type=int, default=200000)
+    parser.add_argument("-P", "--pipeline", type=int, default=16)
+    parser.add_argument("-t", "--tests", default="ping,set,get")
+    parser.add_argument("--keyspace", type=int, default=100000)
+    parser.add_argument("--unixsocket", default=None)
+    parser.add_argument("--target", type=float, default=10000,
+                        help="minimum acceptable ops/sec for every test")
+    args = parser.parse_args()
+
+    args.port = free_port()
+    proc = start_server(args.port, args.unixsocket)
+    failed = False
+    try:
+        transport = f"unix:{args.unixsocket}" if args.unixsocket else f"tcp:{args.port}"
+        print(f"clients={args.clients} requests={args.requests} pipeline={args.pipeline} ({transport})")
+        for name in args.tests.split(","):
+            ops = asyncio.run(run_test(args, name.strip().upper()))
+            status = "ok" if ops >= args.target else "BELOW TARGET"
+            if ops < args.target:
+                failed = True
+            print(f"{name.strip().upper():>5}: {ops:12.0f} ops/sec  [{status}]")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+멀티스레드 처리량 벤치마크 (전역 락 vs 샤드별 락)
+
+스레드 풀의 스레드 T개가 미리 채운 키스페이스에 GET/SET을 섞어 실행하고
+전체 처리량(ops/sec)을 스레드 수별로 출력합니다.
+
+    global-lock: MiniRedis 하나 + 모든 호출을 감싸는 threading.Lock 하나
+    sharded:     ShardedMiniRedis (--shards개 샤드, 샤드마다 락)
+
+GIL이 있는 CPython에서는 한 번에 한 스레드만 바이트코드를 실행하므로 샤딩해도 처리량이
+늘지 않습니다 (락 경합만 줄어듦). free-threaded 빌드(python3.13t 등, PYTHON_GIL=0)에서
+실행하면 샤드별 락의 효과를 코어 수만큼 확인할 수 있습니다. 첫 줄에 GIL 상태를 출력합니다.
+
+실행 방법:
+    python benchmarks/bench_sharded.py -n 100000 --ops 200000 --threads 1,2,4,8
+    PYTHON_GIL=0 python3.13t benchmarks/bench_sharded.py --shards 64
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from redis_core import MiniRedis
+from sharded import ShardedMiniRedis
+
+
+VALUE = "x" * 16
+
+
+class GlobalLockRedis:
+    """모든 호출을 락 하나로 감싼 MiniRedis (샤딩 전 방식, 비교용)"""
+
+    def __init__(self):
+        self._redis = MiniRedis()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._redis.get(key)
+
+    def set(self, key, value):
+        with self._lock:
+            return self._redis.set(key, value)
+
+
+def gil_status():
+    """
+    현재 인터프리터의 GIL 상태 문자열
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return "GIL enabled (standard build)"
+    return "GIL enabled" if is_gil_enabled() else "GIL disabled (free-threaded)"
+
+
+def make_ops(count, keys, write_ratio, seed):
+    """
+    스레드 하나가 실행할 (is_write, key) 리스트 생성
+    """
+    rng = random.Random(seed)
+    return [(rng.random() < write_ratio, rng.choice(keys)) for _ in range(count)]
+
+
+def worker(store, ops, barrier):
+    """
+    모든 스레드가 준비되면 동시에 시작하여 ops를 실행
+    """
+    get = store.get
+    set_ = store.set
+    barrier.wait()
+    for is_write, key in ops:
+        if is_write:
+            set_(key, VALUE)
+        else:
+            get(key)
+
+
+def run(store, threads, ops_per_thread, keys, write_ratio):
+    """
+    스레드 threads개로 실행 후 전체 ops/sec 반환
+    """
+    op_lists = [make_ops(ops_per_thread, keys, write_ratio, seed) for seed in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(worker, store, ops, barrier) for ops in op_lists]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis multi-threaded sharding benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=100000, help="keys to preload")
+    parser.add_argument("--ops", type=int, default=200000, help="operations per thread")
+    parser.add_argument("--threads", default="1,2,4,8", help="thread counts")
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="fraction of SETs")
+    args = parser.parse_args()
+
+    keys = [f"key:{i}" for i in range(args.keys)]
+    thread_counts = [int(x) for x in args.threads.split(",")]
+
+    print(f"{gil_status()}, {os.cpu_count()} CPUs")
+    print(f"{args.keys} keys, {args.ops} ops/thread, {args.write_ratio:.0%} SET, {args.shards} shards")
+    print(f"{'threads':>7} {'global-lock':>12} {'sharded':>12}")
+    for threads in thread_counts:
+        results = []
+        for store in (GlobalLockRedis(), ShardedMiniRedis(shards=args.shards)):
+            for key in keys:
+                store.set(key, VALUE)
+            results.append(run(store, threads, args.ops, keys, args.write_ratio))
+        print(f"{threads:>7} {results[0]:12.0f} {results[1]:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+TTL 인덱스 벤치마크 (최소 힙 vs 인덱스 최소 힙 vs 계층형 타이밍 휠)
+
+MiniRedis가 TTL 키를 다루는 방식(TTL 맵 + 인덱스)을 그대로 재현하되,
+실제 시계 대신 가상 시계(밀리초)를 사용하여 다음 단계를 측정합니다.
+
+1. schedule: N개 키에 TTL 등록 (PEXPIRE)
+2. refresh:  모든 키의 TTL을 --refresh번 다시 등록 (세션 갱신 패턴)
+3. cancel:   10% 키 삭제 (DEL)
+4. drain:    가상 시계를 100ms씩 진행하며 만료된 키를 모두 꺼냄 (cron 주기)
+
+minheap은 이전 버전의 방식(갱신/삭제된 항목을 힙에 남겨 두었다가 꺼낼 때 버림)으로,
+인덱스 항목 수가 살아 있는 TTL 키 수보다 커집니다. heap(인덱스 최소 힙)과 wheel은
+기존 항목을 그 자리에서 갱신/삭제하므로 항목 수가 살아 있는 TTL 키 수와 같습니다.
+
+실행 방법:
+    python benchmarks/bench_ttl.py -n 1000000
+    python benchmarks/bench_ttl.py -n 10000000 --index wheel   # 메모리가 충분할 때
+    python benchmarks/bench_ttl.py -n 200000 --memory          # tracemalloc으로 바이트/키 측정
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_structures.hash_map import HashMap
+from data_structures.heap import MinHeap, IndexedMinHeap
+from data_structures.timing_wheel import TimingWheel
+
+
+START_MS = 1_700_000_000_000
+CRON_STEP_MS = 100
+
+
+class LazyHeapIndex:
+    """인덱스 힙 도입 전의 방식 (무효 항목은 꺼낼 때 TTL 맵과 비교해 버림)"""
+
+    def __init__(self, now):
+        self.ttl_map = HashMap()
+        self.heap = MinHeap()
+
+    def schedule(self, key, expire_ms):
+        self.ttl_map.put(key, expire_ms)
+        self.heap.push((expire_ms, key))
+
+    def cancel(self, key):
+        self.ttl_map.remove(key)
+
+    def drain(self, now):
+        heap = self.heap
+        ttl_map = self.ttl_map
+        expired = 0
+        while not heap.is_empty():
+            expire_ms, key = heap.peek()
+            if expire_ms >= now:
+                break
+            heap.pop()
+            entry = ttl_map.get(key)
+            if entry is not None and entry.value < now:
+                ttl_map.remove(key)
+                expired += 1
+        return expired
+
+    def entries(self):
+        return self.heap.size()
+
+
+class HeapIndex:
+    """MiniRedis(ttl_index="heap")의 TTL 처리 방식"""
+
+    def __init__(self, now):
+        self.ttl_map = HashMap()
+        self.handles = HashMap()
+        self.heap = IndexedMinHeap()
+
+    def schedule(self, key, expire_ms):
+        self.ttl_map.put(key, expire_ms)
+        entry = self.handles.get(key)
+        if entry is not None:
+            self.heap.update(entry.value, expire_ms)
+        else:
+            self.handles.put(key, self.heap.push(expire_ms, key))
+
+    def cancel(self, key):
+        self.ttl_map.remove(key)
+        entry = self.handles.remove(key)
+        if entry is not None:
+            self.heap.remove(entry.value)
+
+    def drain(self, now):
+        heap = self.heap
+        expired = 0
+        while not heap.is_empty():
+            handle = heap.peek()
+            if handle.priority >= now:
+                break
+            heap.pop()
+            self.handles.remove(handle.item)
+            self.ttl_map.remove(handle.item)
+            expired += 1
+        return expired
+
+    def entries(self):
+        return self.heap.size()
+
+
+class WheelIndex:
+    """MiniRedis(ttl_index="wheel")의 TTL 처리 방식"""
+
+    def __init__(self, now):
+        self.ttl_map = HashMap()
+        self.wheel = TimingWheel(now)
+
+    def schedule(self, key, expire_ms):
+        self.ttl_map.put(key, expire_ms)
+        self.wheel.schedule(key, expire_ms)
+
+    def cancel(self, key):
+        self.ttl_map.remove(key)
+        self.wheel.cancel(key)
+
+    def drain(self, now):
+        keys = self.wheel.advance(now - 1)
+        for key in keys:
+            self.ttl_map.remove(key)
+        return len(keys)
+
+    def entries(self):
+        return self.wheel.size()
+
+
+INDEXES = {"minheap": LazyHeapIndex, "heap": HeapIndex, "wheel": WheelIndex}
+
+
+def run(name, count, refresh, max_ttl_ms, seed, measure_memory):
+    """
+    인덱스 하나에 대해 전체 단계 실행 후 결과 출력
+    """
+    rng = random.Random(seed)
+    keys = [f"session:{i}" for i in range(count)]
+    now = START_MS
+
+    if measure_memory:
+        tracemalloc.start()
+
+    index = INDEXES[name](now)
+
+    start = time.perf_counter()
+    for key in keys:
+        index.schedule(key, now + rng.randint(1000, max_ttl_ms))
+    schedule_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(refresh):
+        now += 1000
+        for key in keys:
+            index.schedule(key, now + rng.randint(1000, max_ttl_ms))
+    refresh_elapsed = time.perf_counter() - start
+    entries_after_refresh = index.entries()
+
+    memory = None
+    if measure_memory:
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    start = time.perf_counter()
+    for key in keys[:count // 10]:
+        index.cancel(key)
+    cancel_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expired = 0
+    end = now + max_ttl_ms + CRON_STEP_MS
+    while now <= end:
+        now += CRON_STEP_MS
+        expired += index.drain(now)
+    drain_elapsed = time.perf_counter() - start
+
+    print(f"{name}:")
+    print(f"  schedule : {count / schedule_elapsed:12.0f} ops/sec")
+    if refresh:
+        print(f"  refresh  : {count * refresh / refresh_elapsed:12.0f} ops/sec  "
+              f"(index entries {entries_after_refresh} for {count} live TTL keys)")
+    print(f"  cancel   : {count // 10 / cancel_elapsed:12.0f} ops/sec")
+    print(f"  drain    : {expired / drain_elapsed:12.0f} keys/sec  ({expired} expired, "
+          f"{drain_elapsed:.2f}s for {(end - START_MS) // CRON_STEP_MS} cron steps)")
+    if memory is not None:
+        print(f"  memory   : {memory / count:12.1f} bytes/key (TTL map + index)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini Redis TTL index benchmark")
+    parser.add_argument("-n", "--keys", type=int, default=1000000, help="TTL keys")
+    parser.add_argument("--refresh", type=int, default=2, help="TTL refresh rounds")
+    parser.add_argument("--max-ttl", type=int, default=3600 * 1000, help="max TTL in milliseconds")
+    parser.add_argument("--index", choices=("minheap", "heap", "wheel", "all"), default="all")
+    parser.add_argument("--memory", action="store_true", help="measure bytes/key with tracemalloc")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    names = tuple(INDEXES) if args.index == "all" else (args.index,)
+    print(f"{args.keys} TTL keys, TTL 1s..{args.max_ttl}ms, {args.refresh} refresh rounds")
+    for name in names:
+        run(name, args.keys, args.refresh, args.max_ttl, args.seed, args.memory)
+
+
+if __name__ == "__main__":
+    main()
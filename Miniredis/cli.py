@@ -7,11 +7,18 @@ REPL(Read-Eval-Print Loop) 환경을 제공합니다.
 
 import sys
 import os
+import threading
+import time
+from collections.abc import Iterator
+from types import GeneratorType
 
 # 현재 디렉토리를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from redis_core import MiniRedis
+from redis_core import MiniRedis, OutOfMemoryError, WrongTypeError, SCAN_DEFAULT_COUNT
+from protocol import (StatusReply, ErrorReply, RawReply, ProtocolError, split_args,
+                      string_to_int64, string_to_float)
+from commands import COMMAND_TABLE, lookup_command
 
 
 class CLI:
@@ -19,17 +26,29 @@ class CLI:
     Mini Redis CLI 클래스
     
     사용자 입력을 읽고 명령어를 파싱하여 MiniRedis 인스턴스에서 실행합니다.
-    결과는 Redis 형식으로 출력됩니다.
+    명령어 핸들러는 응답 객체(protocol 모듈 참고)를 반환하며,
+    REPL은 이를 Redis CLI 형식으로, 네트워크 서버는 RESP로 변환합니다.
     
     Attributes:
         redis: MiniRedis 인스턴스
+        _commands: 대문자 명령어 이름 -> (CommandSpec, 바인딩된 핸들러)
+        _lock: REPL 명령어 실행과 백그라운드 cron 스레드 사이의 잠금
     """
     
-    def __init__(self):
+    def __init__(self, redis=None):
         """
         CLI 초기화
+        
+        Args:
+            redis: 사용할 MiniRedis 인스턴스 (기본값: 새 인스턴스)
         """
-        self.redis = MiniRedis()
+        self.redis = redis if redis is not None else MiniRedis()
+        self._commands = {
+            command: (spec, getattr(self, spec.handler) if spec.handler else self._cmd_cluster_only)
+            for command, spec in COMMAND_TABLE.items()
+        }
+        self._lock = threading.Lock()
+        self._cron_stop = threading.Event()
     
     def run(self):
         """
@@ -42,6 +61,10 @@ class CLI:
         print("=" * 50)
         print("Type 'help' for available commands, 'exit' to quit.\n")
         
+        # 입력을 기다리는 동안에도 능동 만료/AOF fsync가 돌도록 cron을 별도 스레드에서 실행
+        cron_thread = threading.Thread(target=self._cron_loop, name="mini-redis-cron", daemon=True)
+        cron_thread.start()
+        
         while True:
             try:
                 # 프롬프트 출력 및 입력 받기
@@ -55,8 +78,10 @@ class CLI:
                     print("Bye!")
                     break
                 
-                # 명령어 파싱 및 실행
-                result = self._execute_command(user_input)
+                # 명령어 파싱 및 실행 (cron 스레드와 동시에 키스페이스를 건드리지 않도록 잠금)
+                with self._lock:
+                    result = self._execute_command(user_input)
+                    self.redis.flush_aof()
                 
                 # 결과 출력
                 if result is not None:
@@ -70,51 +95,37 @@ class CLI:
                 break
             except Exception as e:
                 print(f"(error) {str(e)}")
+        
+        self._cron_stop.set()
+        cron_thread.join()
+        self.redis.shutdown()
+    
+    def _cron_loop(self):
+        """
+        hz 주기로 MiniRedis.cron() 실행 (REPL 백그라운드 스레드)
+        
+        능동 만료, AOF fsync, BGSAVE 완료 확인 등을 사용자 입력과 관계없이 수행합니다.
+        """
+        while not self._cron_stop.wait(self.redis.cron_interval()):
+            with self._lock:
+                self.redis.cron()
     
     def _parse_input(self, user_input):
         """
         사용자 입력 파싱
         
-        따옴표로 묶인 문자열을 올바르게 처리합니다.
+        따옴표로 묶인 문자열과 이스케이프(\\n, \\xHH 등)를 redis-cli와 같은 규칙으로 처리합니다.
         
         Args:
             user_input: 사용자 입력 문자열
             
         Returns:
             list: 파싱된 토큰 리스트
-        """
-        tokens = []
-        current_token = ""
-        in_quotes = False
-        quote_char = None
-        
-        i = 0
-        while i < len(user_input):
-            char = user_input[i]
-            
-            if char in ('"', "'") and not in_quotes:
-                # 따옴표 시작
-                in_quotes = True
-                quote_char = char
-            elif char == quote_char and in_quotes:
-                # 따옴표 종료
-                in_quotes = False
-                quote_char = None
-            elif char == ' ' and not in_quotes:
-                # 공백 (토큰 구분)
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-            else:
-                current_token += char
             
-            i += 1
-        
-        # 마지막 토큰 추가
-        if current_token:
-            tokens.append(current_token)
-        
-        return tokens
+        Raises:
+            ProtocolError: 따옴표가 닫히지 않은 경우
+        """
+        return split_args(user_input)
     
     def _execute_command(self, user_input):
         """
@@ -124,201 +135,645 @@ class CLI:
             user_input: 사용자 입력
             
         Returns:
-            str: 실행 결과
+            str: 실행 결과 (Redis CLI 형식)
         """
-        tokens = self._parse_input(user_input)
+        try:
+            tokens = self._parse_input(user_input)
+        except ProtocolError as e:
+            return self._format_reply(ErrorReply(f"ERR {e}"))
         
         if not tokens:
             return None
         
-        command = tokens[0].upper()
-        args = tokens[1:]
-        
-        # 명령어별 처리
-        if command == "SET":
-            return self._cmd_set(args)
-        elif command == "GET":
-            return self._cmd_get(args)
-        elif command == "DEL":
-            return self._cmd_del(args)
-        elif command == "EXISTS":
-            return self._cmd_exists(args)
-        elif command == "DBSIZE":
-            return self._cmd_dbsize(args)
-        elif command == "CONFIG":
-            return self._cmd_config(args)
-        elif command == "INFO":
-            return self._cmd_info(args)
-        elif command == "EXPIRE":
-            return self._cmd_expire(args)
-        elif command == "TTL":
-            return self._cmd_ttl(args)
-        elif command == "HELP":
-            return self._cmd_help()
-        elif command == "KEYS":
-            return self._cmd_keys(args)
-        else:
-            return f"(error) ERR unknown command '{command}'"
+        return self._format_reply(self.dispatch(tokens))
+    
+    def dispatch(self, tokens):
+        """
+        파싱된 명령어를 실행하고 응답 객체 반환
+        
+        REPL과 네트워크 서버(server.py)가 공유하는 진입점입니다.
+        명령어 테이블(commands.COMMAND_TABLE)에서 핸들러를 찾고 인자 개수(arity)를 검사한 뒤 실행하며,
+        명령어마다 실행 시간을 재어 MiniRedis.record_command로 기록합니다
+        (INFO commandstats, LATENCY HISTOGRAM, SLOWLOG).
+        
+        Args:
+            tokens: 명령어 토큰 리스트 (예: ["SET", "key", "value"])
+            
+        Returns:
+            응답 객체 (StatusReply, ErrorReply, RawReply, str, int, list, None)
+        """
+        entry = self._commands.get(tokens[0].upper())
+        if entry is None:
+            return ErrorReply(f"ERR unknown command '{tokens[0]}'")
+        spec, handler = entry
+        name = spec.name
+        if not spec.check_arity(len(tokens)):
+            self.redis.record_command(name, tokens, 0, rejected=True)
+            return ErrorReply(f"ERR wrong number of arguments for '{name}' command")
+        
+        start = time.perf_counter_ns()
+        try:
+            reply = handler(tokens[1:])
+        except OutOfMemoryError as e:
+            self.redis.record_command(name, tokens, 0, rejected=True)
+            return ErrorReply(f"OOM {e}")
+        except WrongTypeError as e:
+            self.redis.record_command(name, tokens, time.perf_counter_ns() - start, failed=True)
+            return ErrorReply(f"WRONGTYPE {e}")
+        except Exception:
+            self.redis.record_command(name, tokens, time.perf_counter_ns() - start, failed=True)
+            raise
+        
+        if isinstance(reply, GeneratorType):
+            # 스트리밍 응답(KEYS)은 다 내보낸 시점까지를 실행 시간으로 기록
+            return self._timed_iterator(name, tokens, reply, start)
+        self.redis.record_command(name, tokens, time.perf_counter_ns() - start,
+                                  failed=isinstance(reply, ErrorReply))
+        return reply
+    
+    def _timed_iterator(self, name, tokens, reply, start):
+        """
+        이터레이터 응답을 그대로 내보내고, 끝나면 실행 시간 기록
+        
+        Args:
+            name: 소문자 명령어 이름
+            tokens: 명령어 토큰 리스트
+            reply: 이터레이터 응답
+            start: 명령어 시작 시각 (time.perf_counter_ns)
+            
+        Yields:
+            응답 항목
+        """
+        try:
+            yield from reply
+        finally:
+            self.redis.record_command(name, tokens, time.perf_counter_ns() - start)
+    
+    def _format_reply(self, reply, indent=""):
+        """
+        응답 객체를 Redis CLI 출력 형식으로 변환
+        
+        Args:
+            reply: 응답 객체
+            indent: 중첩 배열 출력 시 들여쓰기
+            
+        Returns:
+            str: 출력 문자열
+        """
+        if reply is None:
+            return "(nil)"
+        if isinstance(reply, ErrorReply):
+            return f"(error) {reply}"
+        if isinstance(reply, (StatusReply, RawReply)):
+            return str(reply)
+        if isinstance(reply, int):
+            return f"(integer) {reply}"
+        if isinstance(reply, Iterator):
+            reply = list(reply)
+        if isinstance(reply, list):
+            if not reply:
+                return "(empty list or set)"
+            lines = []
+            for idx, item in enumerate(reply, 1):
+                prefix = f"{idx}) "
+                item_text = self._format_reply(item, indent + " " * len(prefix))
+                lines.append(f"{indent if idx > 1 else ''}{prefix}{item_text}")
+            return "\n".join(lines)
+        if isinstance(reply, dict):
+            if not reply:
+                return "(empty hash)"
+            lines = []
+            for idx, (key, value) in enumerate(reply.items(), 1):
+                prefix = f"{idx}# {self._format_reply(key)} => "
+                item_text = self._format_reply(value, indent + " " * len(prefix))
+                lines.append(f"{indent if idx > 1 else ''}{prefix}{item_text}")
+            return "\n".join(lines)
+        return f'"{reply}"'
     
     # ==================== 명령어 핸들러 ====================
     
     def _cmd_set(self, args):
-        """SET key value"""
-        if len(args) < 2:
-            return "(error) ERR wrong number of arguments for 'set' command"
-        
+        """SET key value [EX seconds | PX milliseconds | KEEPTTL]"""
         key = args[0]
         value = args[1]
+        px = None
+        keepttl = False
         
-        result = self.redis.set(key, value)
-        return result
+        i = 2
+        while i < len(args):
+            option = args[i].upper()
+            if option in ("EX", "PX") and i + 1 < len(args) and px is None and not keepttl:
+                amount = string_to_int64(args[i + 1])
+                if amount is None:
+                    return ErrorReply("ERR value is not an integer or out of range")
+                if amount <= 0:
+                    return ErrorReply("ERR invalid expire time in 'set' command")
+                px = amount * 1000 if option == "EX" else amount
+                i += 2
+            elif option == "KEEPTTL" and px is None:
+                keepttl = True
+                i += 1
+            else:
+                return ErrorReply("ERR syntax error")
+        
+        result = self.redis.set(key, value, px=px, keepttl=keepttl)
+        return StatusReply(result)
     
     def _cmd_get(self, args):
         """GET key"""
-        if len(args) < 1:
-            return "(error) ERR wrong number of arguments for 'get' command"
-        
         key = args[0]
-        result = self.redis.get(key)
-        
-        if result is None:
-            return "(nil)"
-        else:
-            return f'"{result}"'
+        return self.redis.get(key)
     
     def _cmd_del(self, args):
         """DEL key [key ...]"""
-        if len(args) < 1:
-            return "(error) ERR wrong number of arguments for 'del' command"
-        
-        deleted = 0
-        for key in args:
-            deleted += self.redis.delete(key)
-        
-        return f"(integer) {deleted}"
+        if len(args) == 1:
+            return self.redis.delete(args[0])
+        return self.redis.delete_many(args)
     
     def _cmd_exists(self, args):
-        """EXISTS key"""
-        if len(args) < 1:
-            return "(error) ERR wrong number of arguments for 'exists' command"
+        """EXISTS key [key ...]"""
+        if len(args) == 1:
+            return self.redis.exists(args[0])
+        return self.redis.exists_many(args)
+    
+    def _cmd_mset(self, args):
+        """MSET key value [key value ...]"""
+        if len(args) % 2 != 0:
+            return ErrorReply("ERR wrong number of arguments for 'mset' command")
         
-        key = args[0]
-        result = self.redis.exists(key)
-        return f"(integer) {result}"
+        pairs = []
+        for i in range(0, len(args), 2):
+            pairs.append((args[i], args[i + 1]))
+        return StatusReply(self.redis.mset(pairs))
+    
+    def _cmd_mget(self, args):
+        """MGET key [key ...]"""
+        return self.redis.mget(args)
     
     def _cmd_dbsize(self, args):
         """DBSIZE"""
-        result = self.redis.dbsize()
-        return f"(integer) {result}"
+        return self.redis.dbsize()
     
-    def _cmd_config(self, args):
-        """CONFIG SET maxmemory <bytes>"""
-        if len(args) < 3:
-            return "(error) ERR wrong number of arguments for 'config' command"
+    def _cmd_incr(self, args):
+        """INCR key"""
+        return self._incrby(args[0], 1)
+    
+    def _cmd_decr(self, args):
+        """DECR key"""
+        return self._incrby(args[0], -1)
+    
+    def _cmd_incrby(self, args):
+        """INCRBY key increment"""
+        increment = string_to_int64(args[1])
+        if increment is None:
+            return ErrorReply("ERR value is not an integer or out of range")
+        return self._incrby(args[0], increment)
+    
+    def _cmd_decrby(self, args):
+        """DECRBY key decrement"""
+        decrement = string_to_int64(args[1])
+        if decrement is None:
+            return ErrorReply("ERR value is not an integer or out of range")
+        return self._incrby(args[0], -decrement)
+    
+    def _cmd_incrbyfloat(self, args):
+        """INCRBYFLOAT key increment"""
+        increment = string_to_float(args[1])
+        if increment is None:
+            return ErrorReply("ERR value is not a valid float")
+        try:
+            return self.redis.incrbyfloat(args[0], increment)
+        except ValueError as e:
+            return ErrorReply(f"ERR {e}")
+    
+    def _incrby(self, key, increment):
+        """INCR / DECR / INCRBY / DECRBY 공용"""
+        try:
+            return self.redis.incrby(key, increment)
+        except ValueError as e:
+            return ErrorReply(f"ERR {e}")
+    
+    def _cmd_hset(self, args):
+        """HSET key field value [field value ...]"""
+        if len(args) % 2 != 1:
+            return ErrorReply("ERR wrong number of arguments for 'hset' command")
         
+        pairs = []
+        for i in range(1, len(args), 2):
+            pairs.append((args[i], args[i + 1]))
+        return self.redis.hset(args[0], pairs)
+    
+    def _cmd_hget(self, args):
+        """HGET key field"""
+        return self.redis.hget(args[0], args[1])
+    
+    def _cmd_hmget(self, args):
+        """HMGET key field [field ...]"""
+        return self.redis.hmget(args[0], args[1:])
+    
+    def _cmd_hgetall(self, args):
+        """HGETALL key"""
+        return self.redis.hgetall(args[0])
+    
+    def _cmd_hdel(self, args):
+        """HDEL key field [field ...]"""
+        return self.redis.hdel(args[0], args[1:])
+    
+    def _cmd_hlen(self, args):
+        """HLEN key"""
+        return self.redis.hlen(args[0])
+    
+    def _cmd_hexists(self, args):
+        """HEXISTS key field"""
+        return self.redis.hexists(args[0], args[1])
+    
+    def _cmd_hincrby(self, args):
+        """HINCRBY key field increment"""
+        increment = string_to_int64(args[2])
+        if increment is None:
+            return ErrorReply("ERR value is not an integer or out of range")
+        try:
+            return self.redis.hincrby(args[0], args[1], increment)
+        except ValueError as e:
+            return ErrorReply(f"ERR {e}")
+    
+    def _cmd_type(self, args):
+        """TYPE key"""
+        return StatusReply(self.redis.type_of(args[0]))
+    
+    def _cmd_config(self, args):
+        """CONFIG SET parameter value / CONFIG GET parameter / CONFIG RESETSTAT"""
         subcommand = args[0].upper()
         
+        if subcommand == "RESETSTAT":
+            self.redis.reset_stats()
+            return StatusReply("OK")
+        if len(args) < 2:
+            return ErrorReply("ERR wrong number of arguments for 'config' command")
+        
         if subcommand == "SET":
+            if len(args) < 3:
+                return ErrorReply("ERR wrong number of arguments for 'config' command")
             param = args[1].lower()
             value = args[2]
             
-            if param == "maxmemory":
-                try:
-                    result = self.redis.config_set_maxmemory(int(value))
-                    return result
-                except ValueError:
-                    return "(error) ERR value is not an integer"
-            else:
-                return f"(error) ERR unknown config parameter '{param}'"
+            try:
+                return StatusReply(self.redis.config_set(param, value))
+            except ValueError as e:
+                return ErrorReply(f"ERR {e}")
         elif subcommand == "GET":
             param = args[1].lower()
-            if param == "maxmemory":
-                info = self.redis.info_memory()
-                return f"1) \"maxmemory\"\n2) \"{info['maxmemory']}\""
-            else:
-                return f"(error) ERR unknown config parameter '{param}'"
+            try:
+                return [param, self.redis.config_get(param)]
+            except ValueError as e:
+                return ErrorReply(f"ERR {e}")
         else:
-            return f"(error) ERR unknown subcommand '{subcommand}'"
+            return ErrorReply(f"ERR unknown subcommand '{subcommand}'")
     
     def _cmd_info(self, args):
-        """INFO memory"""
+        """INFO [memory|persistence|stats|commandstats|latencystats]"""
         if len(args) < 1:
-            # 전체 정보 출력
-            info = self.redis.info_memory()
-            return self._format_info(info)
+            # 전체 정보 출력 (섹션별 헤더 포함)
+            sections = [
+                ("Memory", self.redis.info_memory()),
+                ("Persistence", self.redis.info_persistence()),
+                ("Stats", self.redis.info_stats()),
+            ]
+            blocks = []
+            for name, info in sections:
+                blocks.append(f"# {name}\n{self._format_info(info)}")
+            return RawReply("\n\n".join(blocks))
         
         section = args[0].lower()
         
         if section == "memory":
             info = self.redis.info_memory()
             return self._format_info(info)
+        elif section == "persistence":
+            info = self.redis.info_persistence()
+            return self._format_info(info)
+        elif section == "stats":
+            info = self.redis.info_stats()
+            return self._format_info(info)
+        elif section == "commandstats":
+            info = self.redis.info_commandstats()
+            return self._format_info(info)
+        elif section == "latencystats":
+            info = self.redis.info_latencystats()
+            return self._format_info(info)
         else:
-            return f"(error) ERR unknown info section '{section}'"
+            return ErrorReply(f"ERR unknown info section '{section}'")
     
     def _format_info(self, info):
         """INFO 출력 포맷팅"""
         lines = []
         for key, value in info.items():
             lines.append(f"{key}:{value}")
-        return "\n".join(lines)
+        return RawReply("\n".join(lines))
     
     def _cmd_expire(self, args):
         """EXPIRE key seconds"""
-        if len(args) < 2:
-            return "(error) ERR wrong number of arguments for 'expire' command"
-        
         key = args[0]
-        try:
-            seconds = int(args[1])
-        except ValueError:
-            return "(error) ERR value is not an integer"
+        seconds = string_to_int64(args[1])
+        if seconds is None:
+            return ErrorReply("ERR value is not an integer or out of range")
         
-        result = self.redis.expire(key, seconds)
-        return f"(integer) {result}"
+        return self.redis.expire(key, seconds)
     
     def _cmd_ttl(self, args):
         """TTL key"""
-        if len(args) < 1:
-            return "(error) ERR wrong number of arguments for 'ttl' command"
-        
         key = args[0]
-        result = self.redis.ttl(key)
-        return f"(integer) {result}"
+        return self.redis.ttl(key)
+    
+    def _cmd_pexpire(self, args):
+        """PEXPIRE key milliseconds"""
+        milliseconds = string_to_int64(args[1])
+        if milliseconds is None:
+            return ErrorReply("ERR value is not an integer or out of range")
+        
+        return self.redis.pexpire(args[0], milliseconds)
+    
+    def _cmd_pexpireat(self, args):
+        """PEXPIREAT key timestamp_ms"""
+        timestamp_ms = string_to_int64(args[1])
+        if timestamp_ms is None:
+            return ErrorReply("ERR value is not an integer or out of range")
+        
+        return self.redis.pexpireat(args[0], timestamp_ms)
+    
+    def _cmd_pttl(self, args):
+        """PTTL key"""
+        return self.redis.pttl(args[0])
+    
+    def _cmd_persist(self, args):
+        """PERSIST key"""
+        return self.redis.persist(args[0])
+    
+    def _cmd_object(self, args):
+        """OBJECT FREQ key / OBJECT ENCODING key"""
+        if len(args) < 2:
+            return ErrorReply("ERR wrong number of arguments for 'object' command")
+        
+        subcommand = args[0].upper()
+        
+        if subcommand == "FREQ":
+            try:
+                return self.redis.object_freq(args[1])
+            except RuntimeError as e:
+                return ErrorReply(f"ERR {e}")
+        elif subcommand == "ENCODING":
+            return self.redis.object_encoding(args[1])
+        else:
+            return ErrorReply(f"ERR unknown subcommand '{subcommand}'")
     
     def _cmd_keys(self, args):
-        """KEYS pattern (간단 구현: 모든 키 출력)"""
-        keys = []
-        idx = 1
-        for key in self.redis._store.keys():
-            keys.append(f"{idx}) \"{key}\"")
-            idx += 1
-        
-        if not keys:
-            return "(empty list or set)"
-        return "\n".join(keys)
-    
-    def _cmd_help(self):
+        """KEYS pattern (키를 리스트로 모으지 않고 제너레이터로 반환)"""
+        return self.redis.keys(args[0])
+    
+    def _cmd_scan(self, args):
+        """SCAN cursor [MATCH pattern] [COUNT count]"""
+        try:
+            cursor = int(args[0])
+        except ValueError:
+            return ErrorReply("ERR invalid cursor")
+        if cursor < 0:
+            return ErrorReply("ERR invalid cursor")
+        
+        match = None
+        count = SCAN_DEFAULT_COUNT
+        i = 1
+        while i < len(args):
+            option = args[i].upper()
+            if i + 1 >= len(args):
+                return ErrorReply("ERR syntax error")
+            if option == "MATCH":
+                match = args[i + 1]
+            elif option == "COUNT":
+                try:
+                    count = int(args[i + 1])
+                except ValueError:
+                    return ErrorReply("ERR value is not an integer or out of range")
+                if count < 1:
+                    return ErrorReply("ERR syntax error")
+            else:
+                return ErrorReply("ERR syntax error")
+            i += 2
+        
+        try:
+            cursor, keys = self.redis.scan(cursor, match, count)
+        except ValueError as e:
+            return ErrorReply(f"ERR {e}")
+        return [str(cursor), keys]
+    
+    def _cmd_countprefix(self, args):
+        """COUNTPREFIX prefix"""
+        return self.redis.count_prefix(args[0])
+    
+    def _cmd_delprefix(self, args):
+        """DELPREFIX prefix"""
+        return self.redis.delete_prefix(args[0])
+    
+    def _cmd_unlinkprefix(self, args):
+        """UNLINKPREFIX prefix"""
+        return self.redis.unlink_prefix(args[0])
+    
+    def _cmd_slowlog(self, args):
+        """SLOWLOG GET [count] / SLOWLOG LEN / SLOWLOG RESET"""
+        subcommand = args[0].upper()
+        
+        if subcommand == "GET" and len(args) <= 2:
+            count = 10
+            if len(args) == 2:
+                try:
+                    count = int(args[1])
+                except ValueError:
+                    return ErrorReply("ERR value is not an integer or out of range")
+                if count < -1:
+                    return ErrorReply("ERR count should be greater than or equal to -1")
+            return self.redis.slowlog_get(count)
+        elif subcommand == "LEN" and len(args) == 1:
+            return self.redis.slowlog_len()
+        elif subcommand == "RESET" and len(args) == 1:
+            self.redis.slowlog_reset()
+            return StatusReply("OK")
+        else:
+            return ErrorReply(f"ERR unknown subcommand or wrong number of arguments for '{subcommand}'")
+    
+    def _cmd_latency(self, args):
+        """LATENCY HISTOGRAM [command ...] / LATEST / HISTORY event / RESET [event ...]"""
+        subcommand = args[0].upper()
+        
+        if subcommand == "HISTOGRAM":
+            return self.redis.latency_histogram(args[1:])
+        elif subcommand == "LATEST" and len(args) == 1:
+            return self.redis.latency_latest()
+        elif subcommand == "HISTORY" and len(args) == 2:
+            return self.redis.latency_history(args[1].lower())
+        elif subcommand == "RESET":
+            return self.redis.latency_reset([event.lower() for event in args[1:]])
+        else:
+            return ErrorReply(f"ERR unknown subcommand or wrong number of arguments for '{subcommand}'")
+    
+    def _cmd_command(self, args):
+        """COMMAND / COMMAND COUNT / COMMAND INFO [command ...] / COMMAND GETKEYS command [arg ...]"""
+        if not args:
+            return [spec.info() for spec in COMMAND_TABLE.values()]
+        
+        subcommand = args[0].upper()
+        
+        if subcommand == "COUNT" and len(args) == 1:
+            return len(COMMAND_TABLE)
+        elif subcommand == "INFO":
+            if len(args) == 1:
+                return [spec.info() for spec in COMMAND_TABLE.values()]
+            result = []
+            for name in args[1:]:
+                spec = lookup_command(name)
+                result.append(spec.info() if spec is not None else None)
+            return result
+        elif subcommand == "GETKEYS" and len(args) >= 2:
+            spec = lookup_command(args[1])
+            if spec is None:
+                return ErrorReply("ERR Invalid command specified")
+            if not spec.check_arity(len(args) - 1):
+                return ErrorReply("ERR Invalid number of arguments specified for command")
+            keys = spec.keys(args[1:])
+            if not keys:
+                return ErrorReply("ERR The command has no key arguments")
+            return keys
+        else:
+            return ErrorReply(f"ERR unknown subcommand or wrong number of arguments for '{subcommand}'")
+    
+    def _cmd_cluster_only(self, args):
+        """CLUSTER / MIGRATE / ASKING (클러스터 워커에서는 ClusterNode.route가 먼저 처리)"""
+        return ErrorReply("ERR This instance has cluster support disabled")
+    
+    def _cmd_save(self, args):
+        """SAVE"""
+        try:
+            return StatusReply(self.redis.save())
+        except (RuntimeError, OSError) as e:
+            return ErrorReply(f"ERR {e}")
+    
+    def _cmd_bgsave(self, args):
+        """BGSAVE"""
+        try:
+            return StatusReply(self.redis.bgsave())
+        except (RuntimeError, OSError) as e:
+            return ErrorReply(f"ERR {e}")
+    
+    def _cmd_lastsave(self, args):
+        """LASTSAVE"""
+        return self.redis.lastsave()
+    
+    def _cmd_bgrewriteaof(self, args):
+        """BGREWRITEAOF"""
+        try:
+            return StatusReply(self.redis.bgrewriteaof())
+        except RuntimeError as e:
+            return ErrorReply(f"ERR {e}")
+    
+    def _cmd_ping(self, args):
+        """PING [message]"""
+        if args:
+            return args[0]
+        return StatusReply("PONG")
+    
+    def _cmd_echo(self, args):
+        """ECHO message"""
+        return args[0]
+    
+    def _cmd_hello(self, args):
+        """HELLO [protover] (RESP3 전환은 네트워크 서버가 연결 단위로 적용)"""
+        protover = 2
+        if args:
+            try:
+                protover = int(args[0])
+            except ValueError:
+                return ErrorReply("ERR Protocol version is not an integer or out of range")
+            if len(args) > 1:
+                return ErrorReply("ERR syntax error")
+            if protover not in (2, 3):
+                return ErrorReply("NOPROTO unsupported protocol version")
+        return {"server": "mini-redis", "proto": protover, "mode": "standalone", "role": "master"}
+    
+    def _cmd_help(self, args):
         """HELP - 사용 가능한 명령어 출력"""
         help_text = """
 Available commands:
-  SET key value         - Set key to hold the string value
+  SET key value [EX s|PX ms|KEEPTTL] - Set key to hold the string value
   GET key               - Get the value of key
-  DEL key [key ...]     - Delete a key
-  EXISTS key            - Check if key exists
+  DEL key [key ...]     - Delete one or more keys
+  EXISTS key [key ...]  - Count how many of the given keys exist
+  MSET key value [key value ...] - Set multiple keys in one batch
+  MGET key [key ...]    - Get the values of multiple keys
   DBSIZE                - Return the number of keys in the database
+  INCR key / DECR key   - Increment / decrement the integer value of key by one
+  INCRBY key n / DECRBY key n   - Increment / decrement the integer value of key by n
+  INCRBYFLOAT key n     - Increment the value of key by a floating point number
+  TYPE key              - Type of the value stored at key (string, hash, none)
+  
+  HSET key field value [field value ...] - Set hash fields
+  HGET key field / HMGET key field [field ...] - Get hash field values
+  HGETALL key           - Get all fields and values of a hash
+  HDEL key field [field ...]    - Delete hash fields (the key goes away with the last field)
+  HLEN key / HEXISTS key field  - Number of fields / whether a field exists
+  HINCRBY key field n   - Increment the integer value of a hash field by n
+  CONFIG SET hash-max-listpack-entries <n> - Max fields kept in the compact encoding (default 128)
+  CONFIG SET hash-max-listpack-value <n>   - Max field/value length in the compact encoding (default 64)
   
   CONFIG SET maxmemory <bytes>  - Set maximum memory limit
   CONFIG GET maxmemory          - Get maximum memory limit
+  CONFIG SET maxmemory-policy <policy>  - noeviction, allkeys-lru, volatile-lru,
+                                          allkeys-lfu, volatile-lfu,
+                                          allkeys-random, volatile-random, volatile-ttl
+  CONFIG SET maxmemory-samples <n>      - Keys sampled per approximate eviction
+  CONFIG SET lfu-log-factor <n>         - LFU counter growth factor (default 10)
+  CONFIG SET lfu-decay-time <minutes>   - LFU counter decay period (default 1)
+  OBJECT FREQ key               - LFU access frequency of key (LFU policies only)
+  OBJECT ENCODING key           - Internal encoding of the value (int, embstr, raw, listpack, hashtable)
   INFO memory                   - Get memory usage information
   
+  CONFIG SET appendonly yes|no              - Enable/disable AOF persistence
+  CONFIG SET appendfsync always|everysec|no - Set AOF fsync policy
+  BGREWRITEAOF                  - Compact the AOF in the background
+  SAVE / BGSAVE                 - Write a snapshot (blocking / forked child)
+  LASTSAVE                      - Unix time of the last successful save
+  INFO persistence              - Get persistence information
+  
   EXPIRE key seconds    - Set a timeout on key
-  TTL key               - Get the time to live for a key
+  PEXPIRE key ms        - Set a timeout on key in milliseconds
+  PEXPIREAT key unix-ms - Set the expiration as a Unix timestamp in milliseconds
+  TTL key / PTTL key    - Get the time to live for a key (seconds / milliseconds)
+  PERSIST key           - Remove the timeout on key
+  CONFIG SET hz <n>                     - Background task frequency (default 10)
+  CONFIG SET active-expire-max-ms <ms>  - Time budget per active expire cycle
+  CONFIG SET activerehashing yes|no     - Incremental hash table rehashing in cron
+  INFO stats            - Expired keys and active expire cycle statistics
+  
+  INFO commandstats     - Calls, total and average time per command
+  INFO latencystats     - p50/p99/p99.9 latency per command
+  CONFIG RESETSTAT      - Reset command statistics
+  SLOWLOG GET [n] / LEN / RESET         - Commands slower than slowlog-log-slower-than (us)
+  LATENCY HISTOGRAM [command ...]       - Per-command latency distribution (power-of-2 us buckets)
+  LATENCY LATEST / HISTORY event / RESET [event ...]
+                        - Spikes above latency-monitor-threshold (ms): command, expire-cycle,
+                          expire-cleanup, eviction-cycle, hash-resize
   
-  KEYS *                - List all keys
+  KEYS pattern          - List keys matching a glob pattern (*, ?, [abc], \\x)
+  SCAN cursor [MATCH pattern] [COUNT n] - Incrementally iterate keys
+  COUNTPREFIX prefix    - Count keys starting with prefix
+  DELPREFIX prefix      - Delete all keys starting with prefix
+  UNLINKPREFIX prefix   - Like DELPREFIX, but free large batches in the background
+  COMMAND [COUNT | INFO command ... | GETKEYS command arg ...]
+                        - Command table: arity, flags and key positions
+  PING [message]        - Ping the server
+  ECHO message          - Echo the given string
+  HELLO [protover]      - Show server info / switch connection to RESP3 (2 or 3)
   HELP                  - Show this help message
   EXIT / QUIT           - Exit the program
 """
-        return help_text.strip()
+        return RawReply(help_text.strip())
 
 
 def main():
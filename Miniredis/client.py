@@ -0,0 +1,150 @@
+"""
+Mini Redis 클라이언트
+
+RESP2 / RESP3로 Mini Redis 서버(server.py)에 접속하는 동기식 클라이언트입니다.
+여러 명령어를 한 번에 보내고 응답을 모아 받는 파이프라이닝을 지원합니다.
+송신 프레임은 재사용하는 bytearray 하나에 인코딩하여 sendall 한 번으로 보내고,
+수신은 고정 버퍼에 recv_into로 읽어 파서 버퍼에 바로 덧붙입니다.
+
+사용 예시:
+    client = MiniRedisClient(port=6379)
+    client.execute("SET", "user:1", "Alice")
+    client.pipeline([("GET", "user:1"), ("DBSIZE",)])
+    MiniRedisClient(port=6379, protocol=3)   # HELLO 3으로 RESP3 응답 사용
+"""
+
+import socket
+import sys
+import os
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from protocol import RespParser, ErrorReply, encode_command_into
+
+
+class ResponseError(Exception):
+    """서버가 에러 응답을 반환했을 때 발생하는 예외"""
+
+
+class MiniRedisClient:
+    """
+    동기식 RESP2 / RESP3 클라이언트
+
+    Attributes:
+        _sock: 서버 소켓
+        _parser: 응답 파서
+        _out: 송신 프레임 버퍼 (파이프라인마다 비우고 재사용)
+        _recv_buffer: recv_into 수신 버퍼
+        hello: protocol=3으로 접속했을 때 서버의 HELLO 응답 (dict)
+    """
+
+    RECV_SIZE = 65536
+
+    def __init__(self, host="127.0.0.1", port=6379, unixsocket=None, timeout=None, protocol=2):
+        """
+        서버에 접속
+
+        Args:
+            host: 서버 주소
+            port: 서버 포트
+            unixsocket: Unix 소켓 경로 (지정 시 host/port 대신 사용)
+            timeout: 소켓 타임아웃 (초)
+            protocol: 2 (RESP2) 또는 3 (접속 직후 HELLO 3 전송)
+        """
+        if unixsocket is not None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(timeout)
+            self._sock.connect(unixsocket)
+        else:
+            self._sock = socket.create_connection((host, port), timeout=timeout)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._parser = RespParser()
+        self._out = bytearray()
+        self._recv_buffer = memoryview(bytearray(self.RECV_SIZE))
+        self.hello = None
+        if protocol != 2:
+            self.hello = self.execute("HELLO", protocol)
+
+    def execute(self, *tokens):
+        """
+        명령어 하나 실행
+
+        Args:
+            tokens: 명령어 토큰 (예: "SET", "key", "value")
+
+        Returns:
+            응답 객체
+
+        Raises:
+            ResponseError: 서버가 에러 응답을 반환한 경우
+        """
+        reply = self.pipeline([tokens])[0]
+        if isinstance(reply, ErrorReply):
+            raise ResponseError(str(reply))
+        return reply
+
+    def pipeline(self, commands):
+        """
+        여러 명령어를 한 번에 전송하고 응답을 순서대로 수신
+
+        에러 응답은 예외 대신 ErrorReply 객체로 결과 리스트에 포함됩니다.
+
+        Args:
+            commands: 명령어 토큰 시퀀스의 리스트
+
+        Returns:
+            list: 명령어 순서와 같은 순서의 응답 리스트
+        """
+        self.send_commands(commands)
+        return self.read_replies(len(commands))
+
+    def send_commands(self, commands):
+        """
+        여러 명령어를 응답을 기다리지 않고 전송 (read_replies()로 응답 수신)
+
+        여러 서버에 파이프라인을 먼저 모두 보낸 뒤 응답을 모을 때 사용합니다 (클러스터 클라이언트).
+
+        Args:
+            commands: 명령어 토큰 시퀀스의 리스트
+        """
+        out = self._out
+        for tokens in commands:
+            encode_command_into(out, tokens)
+        try:
+            self._sock.sendall(out)
+        finally:
+            out.clear()
+
+    def read_replies(self, count):
+        """
+        응답 count개를 모두 받을 때까지 수신
+
+        Args:
+            count: 기대하는 응답 개수
+
+        Returns:
+            list: 응답 리스트
+        """
+        replies = []
+        while len(replies) < count:
+            replies.extend(self._parser.get_replies())
+            if len(replies) >= count:
+                break
+            received = self._sock.recv_into(self._recv_buffer)
+            if not received:
+                raise ConnectionError("connection closed by server")
+            self._parser.feed(self._recv_buffer[:received])
+        return replies
+
+    def close(self):
+        """
+        연결 종료
+        """
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,482 @@
+"""
+Mini Redis 클러스터 모드 (해시 슬롯)
+
+키 공간을 16384개의 해시 슬롯으로 나누고, 워커 프로세스마다 슬롯 범위 하나를 맡깁니다.
+키의 슬롯은 Redis Cluster와 같은 CRC16(XMODEM) % 16384이며, 키에 {태그}가 있으면
+중괄호 안의 문자열만 해시하여 여러 키를 같은 슬롯에 모을 수 있습니다.
+
+워커(ClusterNode)는 명령어를 실행하기 전에 키의 슬롯 소유자를 확인합니다.
+- 다른 워커의 슬롯: -MOVED <slot> <host>:<port> (클라이언트는 슬롯 표를 갱신하고 다시 보냄)
+- 이전(migrating) 중인 슬롯에서 이미 옮겨진 키: -ASK <slot> <host>:<port>
+  (클라이언트는 ASKING 후 대상 워커에 그 명령어 하나만 보냄)
+- 여러 키가 서로 다른 슬롯: -CROSSSLOT
+
+슬롯 이전(resharding)은 redis-cli --cluster reshard와 같은 순서로 진행합니다.
+    1. 대상: CLUSTER SETSLOT <slot> IMPORTING <source-id>
+    2. 원본: CLUSTER SETSLOT <slot> MIGRATING <target-id>
+    3. 원본: CLUSTER GETKEYSINSLOT + MIGRATE ... KEYS ... 를 키가 없을 때까지 반복
+    4. 모든 워커: CLUSTER SETSLOT <slot> NODE <target-id>
+이전 중에도 두 워커 모두 요청을 계속 처리합니다 (cluster_client.ClusterClient.reshard 참고).
+
+워커 실행은 server.py --cluster-workers N 을 사용합니다.
+"""
+
+import binascii
+import os
+import sys
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from protocol import ErrorReply, StatusReply, RawReply, ENCODING, ENCODING_ERRORS
+from client import MiniRedisClient
+from commands import command_keys
+from data_structures.hash_object import HashObject
+
+
+# 해시 슬롯 개수 (Redis Cluster와 동일)
+CLUSTER_SLOTS = 16384
+
+
+def key_hash_slot(key):
+    """
+    키의 해시 슬롯 계산 (CRC16 XMODEM % 16384, {태그} 지원)
+
+    Args:
+        key: 키 문자열
+
+    Returns:
+        int: 0 ~ 16383
+    """
+    start = key.find("{")
+    if start != -1:
+        end = key.find("}", start + 1)
+        # "{}"처럼 태그가 비어 있으면 키 전체를 해시
+        if end > start + 1:
+            key = key[start + 1:end]
+    return binascii.crc_hqx(key.encode(ENCODING, ENCODING_ERRORS), 0) & (CLUSTER_SLOTS - 1)
+
+
+def even_slot_ranges(count):
+    """
+    슬롯을 count개의 연속 구간으로 고르게 나눔
+
+    Args:
+        count: 워커 수
+
+    Returns:
+        list: (시작 슬롯, 끝 슬롯) 튜플 리스트 (끝 포함)
+    """
+    ranges = []
+    for index in range(count):
+        start = index * CLUSTER_SLOTS // count
+        end = (index + 1) * CLUSTER_SLOTS // count - 1
+        ranges.append((start, end))
+    return ranges
+
+
+def new_node_id():
+    """
+    워커 ID 생성 (Redis와 같은 40자리 16진수)
+
+    Returns:
+        str: 노드 ID
+    """
+    return os.urandom(20).hex()
+
+
+class ClusterNode:
+    """
+    워커 하나의 클러스터 상태 (슬롯 소유자 표, 이전 상태)와 리다이렉트 판단
+
+    MiniRedisServer가 명령어마다 route()를 먼저 호출합니다.
+
+    Attributes:
+        redis: 이 워커의 MiniRedis (cluster_enabled=True)
+        myid: 이 워커의 노드 ID
+        nodes: 노드 ID -> (host, port)
+        _slots: 슬롯별 소유 노드 ID
+        _migrating: 슬롯 -> 대상 노드 ID (이 워커에서 내보내는 중)
+        _importing: 슬롯 -> 원본 노드 ID (이 워커로 들여오는 중)
+        _connections: (host, port) -> MIGRATE용 MiniRedisClient
+    """
+
+    def __init__(self, redis, myid, nodes):
+        """
+        클러스터 상태 초기화 (모든 슬롯 미할당)
+
+        Args:
+            redis: MiniRedis 인스턴스 (cluster_enabled=True로 생성)
+            myid: 이 워커의 노드 ID
+            nodes: 노드 ID -> (host, port) 딕셔너리 (이 워커 포함)
+        """
+        self.redis = redis
+        self.myid = myid
+        self.nodes = nodes
+        self._slots = [None] * CLUSTER_SLOTS
+        self._migrating = {}
+        self._importing = {}
+        self._connections = {}
+
+    def assign_slots(self, start, end, node_id):
+        """
+        슬롯 구간의 소유자 지정 (시작 시 초기 배치용)
+
+        Args:
+            start: 시작 슬롯
+            end: 끝 슬롯 (포함)
+            node_id: 소유 노드 ID
+        """
+        for slot in range(start, end + 1):
+            self._slots[slot] = node_id
+
+    def slot_owner(self, slot):
+        """
+        슬롯 소유 노드 ID 반환
+
+        Args:
+            slot: 해시 슬롯 번호
+
+        Returns:
+            str: 노드 ID, 미할당이면 None
+        """
+        return self._slots[slot]
+
+    def _address(self, node_id):
+        """노드 ID -> "host:port" 문자열"""
+        host, port = self.nodes[node_id]
+        return f"{host}:{port}"
+
+    # ==================== 라우팅 ====================
+
+    def route(self, tokens, asking=False):
+        """
+        명령어를 이 워커에서 실행할지 판단
+
+        Args:
+            tokens: 명령어 토큰 리스트
+            asking: 직전에 ASKING을 받았는지 여부 (이번 명령어 하나에만 적용)
+
+        Returns:
+            응답 객체 (CLUSTER / MIGRATE 결과 또는 MOVED / ASK / CROSSSLOT 에러),
+            이 워커에서 그대로 실행해야 하면 None
+        """
+        command = tokens[0].upper()
+        if command == "CLUSTER":
+            return self._cmd_cluster(tokens[1:])
+        if command == "MIGRATE":
+            return self._cmd_migrate(tokens[1:])
+
+        keys = command_keys(tokens)
+        if not keys:
+            return None
+
+        slot = key_hash_slot(keys[0])
+        for key in keys[1:]:
+            if key_hash_slot(key) != slot:
+                return ErrorReply("CROSSSLOT Keys in request don't hash to the same slot")
+
+        owner = self._slots[slot]
+        if owner is None:
+            return ErrorReply(f"CLUSTERDOWN Hash slot {slot} not served")
+
+        if owner == self.myid:
+            target = self._migrating.get(slot)
+            if target is not None:
+                # 이미 옮겨진(여기 없는) 키는 대상 워커에서 처리하도록 안내
+                store = self.redis._store
+                for key in keys:
+                    if not store.contains(key):
+                        return ErrorReply(f"ASK {slot} {self._address(target)}")
+            return None
+
+        if asking and slot in self._importing:
+            return None
+        return ErrorReply(f"MOVED {slot} {self._address(owner)}")
+
+    # ==================== CLUSTER 명령어 ====================
+
+    def _cmd_cluster(self, args):
+        """CLUSTER subcommand [args ...]"""
+        if not args:
+            return ErrorReply("ERR wrong number of arguments for 'cluster' command")
+
+        subcommand = args[0].upper()
+        if subcommand == "KEYSLOT" and len(args) == 2:
+            return key_hash_slot(args[1])
+        elif subcommand == "MYID":
+            return self.myid
+        elif subcommand == "SLOTS":
+            return self._cluster_slots()
+        elif subcommand == "NODES":
+            return self._cluster_nodes()
+        elif subcommand == "INFO":
+            return self._cluster_info()
+        elif subcommand == "COUNTKEYSINSLOT" and len(args) == 2:
+            slot = self._parse_slot(args[1])
+            if slot is None:
+                return ErrorReply("ERR Invalid slot")
+            return self.redis.count_keys_in_slot(slot)
+        elif subcommand == "GETKEYSINSLOT" and len(args) == 3:
+            slot = self._parse_slot(args[1])
+            if slot is None:
+                return ErrorReply("ERR Invalid slot")
+            try:
+                count = int(args[2])
+            except ValueError:
+                return ErrorReply("ERR Invalid number of keys")
+            return self.redis.get_keys_in_slot(slot, count)
+        elif subcommand == "SETSLOT" and len(args) >= 3:
+            return self._cluster_setslot(args[1:])
+        else:
+            return ErrorReply(f"ERR unknown subcommand or wrong number of arguments for '{args[0]}'")
+
+    def _parse_slot(self, value):
+        """
+        슬롯 번호 파싱
+
+        Returns:
+            int: 슬롯 번호, 올바르지 않으면 None
+        """
+        try:
+            slot = int(value)
+        except ValueError:
+            return None
+        if not 0 <= slot < CLUSTER_SLOTS:
+            return None
+        return slot
+
+    def _cluster_setslot(self, args):
+        """
+        CLUSTER SETSLOT slot IMPORTING node-id | MIGRATING node-id | NODE node-id | STABLE
+        """
+        slot = self._parse_slot(args[0])
+        if slot is None:
+            return ErrorReply("ERR Invalid or out of range slot")
+
+        action = args[1].upper()
+        if action == "STABLE":
+            self._migrating.pop(slot, None)
+            self._importing.pop(slot, None)
+            return StatusReply("OK")
+
+        if len(args) != 3:
+            return ErrorReply("ERR wrong number of arguments for 'cluster setslot' command")
+        node_id = args[2]
+        if node_id not in self.nodes:
+            return ErrorReply(f"ERR I don't know about node {node_id}")
+
+        if action == "MIGRATING":
+            if self._slots[slot] != self.myid:
+                return ErrorReply(f"ERR I'm not the owner of hash slot {slot}")
+            self._migrating[slot] = node_id
+        elif action == "IMPORTING":
+            if self._slots[slot] == self.myid:
+                return ErrorReply(f"ERR I'm already the owner of hash slot {slot}")
+            self._importing[slot] = node_id
+        elif action == "NODE":
+            if self._slots[slot] == self.myid and node_id != self.myid:
+                if self.redis.count_keys_in_slot(slot) > 0:
+                    return ErrorReply(f"ERR Can't assign hashslot {slot} to a different node "
+                                      f"while I still hold keys for this hash slot.")
+            self._slots[slot] = node_id
+            self._migrating.pop(slot, None)
+            self._importing.pop(slot, None)
+        else:
+            return ErrorReply("ERR Invalid CLUSTER SETSLOT action or number of arguments")
+        return StatusReply("OK")
+
+    def _slot_ranges(self):
+        """
+        연속된 슬롯을 소유자별 구간으로 묶음
+
+        Returns:
+            list: (시작 슬롯, 끝 슬롯, 노드 ID) 튜플 리스트
+        """
+        ranges = []
+        start = 0
+        for slot in range(1, CLUSTER_SLOTS + 1):
+            if slot == CLUSTER_SLOTS or self._slots[slot] != self._slots[start]:
+                if self._slots[start] is not None:
+                    ranges.append((start, slot - 1, self._slots[start]))
+                start = slot
+        return ranges
+
+    def _cluster_slots(self):
+        """
+        CLUSTER SLOTS - [[시작, 끝, [host, port, id]], ...]
+        """
+        reply = []
+        for start, end, node_id in self._slot_ranges():
+            host, port = self.nodes[node_id]
+            reply.append([start, end, [host, port, node_id]])
+        return reply
+
+    def _cluster_nodes(self):
+        """
+        CLUSTER NODES - 노드별 한 줄 (id host:port@cport flags master - 0 0 0 connected 슬롯 구간...)
+        """
+        node_ranges = {node_id: [] for node_id in self.nodes}
+        for start, end, node_id in self._slot_ranges():
+            node_ranges[node_id].append(str(start) if start == end else f"{start}-{end}")
+        for slot, node_id in self._migrating.items():
+            node_ranges[self.myid].append(f"[{slot}->-{node_id}]")
+        for slot, node_id in self._importing.items():
+            node_ranges[self.myid].append(f"[{slot}-<-{node_id}]")
+
+        lines = []
+        for node_id, (host, port) in self.nodes.items():
+            flags = "myself,master" if node_id == self.myid else "master"
+            slots = " ".join(node_ranges[node_id])
+            lines.append(f"{node_id} {host}:{port}@{port + 10000} {flags} - 0 0 0 connected {slots}".rstrip())
+        return RawReply("\n".join(lines))
+
+    def _cluster_info(self):
+        """
+        CLUSTER INFO - 클러스터 상태 요약
+        """
+        assigned = 0
+        for owner in self._slots:
+            if owner is not None:
+                assigned += 1
+        state = "ok" if assigned == CLUSTER_SLOTS else "fail"
+        lines = [
+            "cluster_enabled:1",
+            f"cluster_state:{state}",
+            f"cluster_slots_assigned:{assigned}",
+            f"cluster_known_nodes:{len(self.nodes)}",
+            f"cluster_size:{len(set(owner for owner in self._slots if owner is not None))}",
+            f"cluster_migrating_slots:{len(self._migrating)}",
+            f"cluster_importing_slots:{len(self._importing)}",
+        ]
+        return RawReply("\n".join(lines))
+
+    # ==================== MIGRATE ====================
+
+    def _cmd_migrate(self, args):
+        """
+        MIGRATE host port key|"" destination-db timeout [COPY] [REPLACE] [KEYS key [key ...]]
+
+        대상 워커에 ASKING + SET (Hash는 ASKING + DEL, ASKING + HSET) (+ ASKING + PEXPIREAT)
+        파이프라인 한 번으로 키를 보내고, 모두 성공하면 이 워커에서 삭제합니다 (COPY면 유지).
+        REPLACE가 없으면 먼저 ASKING + EXISTS 파이프라인으로 대상에 이미 있는 키를 찾아,
+        그 키는 보내지도 지우지도 않고 나머지만 옮긴 뒤 Redis처럼 BUSYKEY 에러를 반환합니다.
+        만료된 키는 보내지 않습니다.
+        """
+        if len(args) < 5:
+            return ErrorReply("ERR wrong number of arguments for 'migrate' command")
+        host = args[0]
+        try:
+            port = int(args[1])
+            timeout_ms = int(args[4])
+        except ValueError:
+            return ErrorReply("ERR value is not an integer or out of range")
+
+        copy = False
+        replace = False
+        keys = [args[2]]
+        i = 5
+        while i < len(args):
+            option = args[i].upper()
+            if option == "COPY":
+                copy = True
+            elif option == "REPLACE":
+                replace = True
+            elif option == "KEYS" and args[2] == "":
+                keys = args[i + 1:]
+                break
+            else:
+                return ErrorReply("ERR syntax error")
+            i += 1
+
+        redis = self.redis
+        moved = []
+        for key in keys:
+            if not redis._expire_if_needed(key) and redis._store.get(key) is not None:
+                moved.append(key)
+
+        if not moved:
+            return StatusReply("NOKEY")
+
+        busy = False
+        try:
+            client = self._connection(host, port, timeout_ms)
+            if not replace:
+                probes = []
+                for key in moved:
+                    probes.append(("ASKING",))
+                    probes.append(("EXISTS", key))
+                replies = client.pipeline(probes)
+                for reply in replies:
+                    if isinstance(reply, ErrorReply):
+                        return ErrorReply(f"ERR Target instance replied with error: {reply}")
+                kept = [key for key, exists in zip(moved, replies[1::2]) if not exists]
+                busy = len(kept) < len(moved)
+                moved = kept
+            replies = client.pipeline(self._migrate_commands(moved)) if moved else []
+        except OSError as e:
+            self._drop_connection(host, port)
+            return ErrorReply(f"IOERR error or timeout writing to target instance: {e}")
+
+        for reply in replies:
+            if isinstance(reply, ErrorReply):
+                return ErrorReply(f"ERR Target instance replied with error: {reply}")
+
+        if not copy:
+            redis.delete_many(moved)
+        if busy:
+            return ErrorReply("ERR Target instance replied with error: BUSYKEY Target key name already exists.")
+        return StatusReply("OK")
+
+    def _migrate_commands(self, keys):
+        """
+        MIGRATE로 보낼 키들의 복원 명령어 목록
+
+        Args:
+            keys: 이 워커에 있는 (만료되지 않은) 키 리스트
+
+        Returns:
+            list: 대상 워커에 파이프라인으로 보낼 명령어 토큰 리스트
+        """
+        redis = self.redis
+        commands = []
+        for key in keys:
+            entry = redis._store.get(key)
+            if type(entry.value) is HashObject:
+                # 대상에 남아 있을 수 있는 같은 키를 지운 뒤 필드 전체를 HSET 하나로 전송
+                commands.append(("ASKING",))
+                commands.append(("DEL", key))
+                commands.append(("ASKING",))
+                commands.append(["HSET", key, *entry.value.flat()])
+            else:
+                commands.append(("ASKING",))
+                commands.append(("SET", key, entry.value))
+            ttl_entry = redis._ttl_map.get(key)
+            if ttl_entry is not None:
+                commands.append(("ASKING",))
+                commands.append(("PEXPIREAT", key, ttl_entry.value))
+        return commands
+
+    def _connection(self, host, port, timeout_ms):
+        """
+        MIGRATE 대상 워커 연결 (재사용)
+
+        연결은 (host, port)마다 하나를 재사용하고, 소켓 타임아웃은 호출마다 이번 MIGRATE의 값으로 바꿉니다.
+
+        Returns:
+            MiniRedisClient: 연결된 클라이언트
+        """
+        timeout = timeout_ms / 1000 if timeout_ms > 0 else None
+        client = self._connections.get((host, port))
+        if client is None:
+            client = MiniRedisClient(host=host, port=port, timeout=timeout)
+            self._connections[(host, port)] = client
+        else:
+            client._sock.settimeout(timeout)
+        return client
+
+    def _drop_connection(self, host, port):
+        """실패한 MIGRATE 연결 닫기"""
+        client = self._connections.pop((host, port), None)
+        if client is not None:
+            client.close()
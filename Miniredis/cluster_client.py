@@ -0,0 +1,313 @@
+"""
+Mini Redis 클러스터 클라이언트
+
+키의 해시 슬롯으로 담당 워커를 골라 명령어를 보내는 동기식 클라이언트입니다.
+시작할 때 CLUSTER SLOTS로 슬롯 표를 받아 두고, 워커가 -MOVED를 돌려주면 슬롯 표를 고친 뒤
+다시 보내며, -ASK면 ASKING과 함께 안내받은 워커에 그 명령어 하나만 보냅니다.
+그래서 슬롯 이전(reshard) 중에도 호출자는 리다이렉트를 신경 쓰지 않아도 됩니다.
+
+사용 예시:
+    client = ClusterClient([("127.0.0.1", 7000)])
+    client.execute("SET", "user:1", "Alice")
+    client.pipeline([("GET", "user:1"), ("GET", "user:2")])  # 워커별로 묶어 한 번씩 왕복
+    client.reshard(range(0, 100), target_id)                # 슬롯 0~99를 target_id 워커로 이전
+"""
+
+import sys
+import os
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from protocol import ErrorReply
+from client import MiniRedisClient, ResponseError
+from cluster import CLUSTER_SLOTS, key_hash_slot
+from commands import command_keys
+
+
+class ClusterClient:
+    """
+    슬롯 표를 캐시하는 클러스터 클라이언트
+
+    Attributes:
+        _startup_nodes: 처음 접속할 (host, port) 리스트
+        _slots: 슬롯별 담당 워커 (host, port)
+        _connections: (host, port) -> MiniRedisClient
+    """
+
+    MAX_REDIRECTS = 16
+
+    def __init__(self, startup_nodes=(("127.0.0.1", 7000),), timeout=None):
+        """
+        클러스터에 접속하여 슬롯 표 로드
+
+        Args:
+            startup_nodes: 처음 접속할 (host, port) 시퀀스 (워커 하나만 있어도 됨)
+            timeout: 소켓 타임아웃 (초)
+
+        Raises:
+            ConnectionError: 접속 가능한 워커가 없는 경우
+        """
+        self._startup_nodes = [(host, int(port)) for host, port in startup_nodes]
+        self._timeout = timeout
+        self._slots = [None] * CLUSTER_SLOTS
+        self._connections = {}
+        self.refresh_slots()
+
+    # ==================== 슬롯 표 ====================
+
+    def refresh_slots(self):
+        """
+        CLUSTER SLOTS로 슬롯 표 다시 로드
+
+        Raises:
+            ConnectionError: 접속 가능한 워커가 없는 경우
+        """
+        addresses = list(self._connections) + self._startup_nodes
+        for address in addresses:
+            try:
+                ranges = self._connection(address).execute("CLUSTER", "SLOTS")
+            except OSError:
+                self._drop_connection(address)
+                continue
+            for start, end, node in ranges:
+                owner = (node[0], int(node[1]))
+                for slot in range(start, end + 1):
+                    self._slots[slot] = owner
+            return
+        raise ConnectionError("no reachable cluster node")
+
+    def _connection(self, address):
+        """
+        워커 연결 반환 (없으면 새로 접속)
+
+        Args:
+            address: (host, port)
+
+        Returns:
+            MiniRedisClient: 연결
+        """
+        client = self._connections.get(address)
+        if client is None:
+            client = MiniRedisClient(host=address[0], port=address[1], timeout=self._timeout)
+            self._connections[address] = client
+        return client
+
+    def _drop_connection(self, address):
+        """끊어진 연결 제거"""
+        client = self._connections.pop(address, None)
+        if client is not None:
+            client.close()
+
+    def _address_for(self, tokens):
+        """
+        명령어를 보낼 워커 주소
+
+        키가 없는 명령어는 첫 시작 노드로 보냅니다.
+
+        Args:
+            tokens: 명령어 토큰
+
+        Returns:
+            tuple: (host, port)
+        """
+        keys = command_keys(tokens)
+        if not keys:
+            return self._startup_nodes[0]
+        address = self._slots[key_hash_slot(keys[0])]
+        if address is None:
+            self.refresh_slots()
+            address = self._slots[key_hash_slot(keys[0])]
+        return address if address is not None else self._startup_nodes[0]
+
+    def _parse_redirect(self, reply):
+        """
+        -MOVED / -ASK 에러 파싱
+
+        Args:
+            reply: ErrorReply
+
+        Returns:
+            tuple: (종류, 슬롯, (host, port)), 리다이렉트가 아니면 None
+        """
+        parts = reply.split(" ")
+        if len(parts) != 3 or parts[0] not in ("MOVED", "ASK"):
+            return None
+        host, _, port = parts[2].rpartition(":")
+        return parts[0], int(parts[1]), (host, int(port))
+
+    # ==================== 명령어 실행 ====================
+
+    def execute(self, *tokens):
+        """
+        명령어 하나 실행 (리다이렉트는 내부에서 처리)
+
+        Args:
+            tokens: 명령어 토큰 (예: "SET", "key", "value")
+
+        Returns:
+            응답 객체
+
+        Raises:
+            ResponseError: 워커가 리다이렉트가 아닌 에러를 반환했거나 리다이렉트가 너무 많은 경우
+        """
+        reply = self._execute(tokens, self._address_for(tokens))
+        if isinstance(reply, ErrorReply):
+            raise ResponseError(str(reply))
+        return reply
+
+    def _execute(self, tokens, address, asking=False):
+        """
+        명령어 하나를 address부터 보내며 리다이렉트를 따라감
+
+        Args:
+            tokens: 명령어 토큰
+            address: 처음 보낼 워커 (host, port)
+            asking: 처음 보낼 때 ASKING을 앞에 붙일지 여부
+
+        Returns:
+            응답 객체 (에러는 ErrorReply)
+        """
+        for _ in range(self.MAX_REDIRECTS):
+            connection = self._connection(address)
+            if asking:
+                reply = connection.pipeline([("ASKING",), tokens])[1]
+            else:
+                reply = connection.pipeline([tokens])[0]
+
+            if not isinstance(reply, ErrorReply):
+                return reply
+            redirect = self._parse_redirect(reply)
+            if redirect is None:
+                return reply
+
+            kind, slot, address = redirect
+            if kind == "MOVED":
+                self._slots[slot] = address
+                asking = False
+            else:
+                asking = True
+        return ErrorReply("ERR too many cluster redirections")
+
+    def pipeline(self, commands):
+        """
+        여러 명령어를 워커별로 묶어 전송하고 응답을 원래 순서대로 반환
+
+        모든 워커에 파이프라인을 먼저 보낸 뒤 응답을 모으므로 워커들이 동시에 처리합니다.
+        리다이렉트된 명령어는 그 명령어만 다시 보냅니다. 에러 응답은 ErrorReply로 포함됩니다.
+
+        Args:
+            commands: 명령어 토큰 시퀀스의 리스트
+
+        Returns:
+            list: 명령어 순서와 같은 순서의 응답 리스트
+        """
+        groups = {}
+        for position, tokens in enumerate(commands):
+            groups.setdefault(self._address_for(tokens), []).append(position)
+
+        for address, positions in groups.items():
+            self._connection(address).send_commands([commands[position] for position in positions])
+
+        replies = [None] * len(commands)
+        retries = []
+        for address, positions in groups.items():
+            for position, reply in zip(positions, self._connection(address).read_replies(len(positions))):
+                replies[position] = reply
+                if isinstance(reply, ErrorReply) and self._parse_redirect(reply) is not None:
+                    retries.append(position)
+
+        for position in retries:
+            kind, slot, address = self._parse_redirect(replies[position])
+            if kind == "MOVED":
+                self._slots[slot] = address
+            replies[position] = self._execute(commands[position], address, asking=(kind == "ASK"))
+        return replies
+
+    # ==================== 리샤딩 ====================
+
+    def cluster_nodes(self):
+        """
+        CLUSTER NODES를 파싱하여 노드 주소와 슬롯 소유자 반환
+
+        Returns:
+            tuple: (노드 ID -> (host, port) 딕셔너리, 슬롯별 소유 노드 ID 리스트)
+        """
+        text = self.execute("CLUSTER", "NODES")
+        nodes = {}
+        owners = [None] * CLUSTER_SLOTS
+        for line in text.splitlines():
+            fields = line.split(" ")
+            node_id = fields[0]
+            host, _, port = fields[1].split("@")[0].rpartition(":")
+            nodes[node_id] = (host, int(port))
+            for field in fields[8:]:
+                if field.startswith("["):
+                    continue  # 이전 중인 슬롯 표시
+                start, _, end = field.partition("-")
+                for slot in range(int(start), int(end or start) + 1):
+                    owners[slot] = node_id
+        return nodes, owners
+
+    def reshard(self, slots, target_id, batch=100, timeout_ms=5000):
+        """
+        슬롯을 target_id 워커로 이전 (이전 중에도 클러스터는 요청을 계속 처리)
+
+        슬롯마다 IMPORTING / MIGRATING 표시 -> 키를 batch개씩 MIGRATE -> 모든 워커에 SETSLOT NODE 순서입니다.
+
+        Args:
+            slots: 이전할 슬롯 번호 이터러블
+            target_id: 받을 워커의 노드 ID
+            batch: MIGRATE 한 번에 옮길 키 개수
+            timeout_ms: MIGRATE 타임아웃 (밀리초)
+
+        Returns:
+            int: 옮긴 키 개수
+
+        Raises:
+            ValueError: 알 수 없는 노드 ID인 경우
+            ResponseError: 워커가 에러를 반환한 경우
+        """
+        nodes, owners = self.cluster_nodes()
+        if target_id not in nodes:
+            raise ValueError(f"unknown node id '{target_id}'")
+        target_host, target_port = nodes[target_id]
+        target = self._connection(nodes[target_id])
+
+        moved = 0
+        for slot in slots:
+            source_id = owners[slot]
+            if source_id is None or source_id == target_id:
+                continue
+            source = self._connection(nodes[source_id])
+            target.execute("CLUSTER", "SETSLOT", slot, "IMPORTING", source_id)
+            source.execute("CLUSTER", "SETSLOT", slot, "MIGRATING", target_id)
+
+            while True:
+                keys = source.execute("CLUSTER", "GETKEYSINSLOT", slot, batch)
+                if not keys:
+                    break
+                source.execute("MIGRATE", target_host, target_port, "", 0, timeout_ms, "KEYS", *keys)
+                moved += len(keys)
+
+            # 대상 -> 원본 -> 나머지 순서로 새 소유자 전파
+            order = [target_id, source_id] + [node_id for node_id in nodes if node_id not in (target_id, source_id)]
+            for node_id in order:
+                self._connection(nodes[node_id]).execute("CLUSTER", "SETSLOT", slot, "NODE", target_id)
+            owners[slot] = target_id
+            self._slots[slot] = (target_host, target_port)
+        return moved
+
+    def close(self):
+        """
+        모든 연결 종료
+        """
+        for client in self._connections.values():
+            client.close()
+        self._connections = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
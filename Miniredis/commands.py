@@ -0,0 +1,176 @@
+"""
+Mini Redis 명령어 테이블
+
+명령어 이름마다 핸들러, 인자 개수(arity), 플래그, 키 위치를 한 곳에 정의합니다.
+REPL과 네트워크 서버가 공유하는 CLI.dispatch는 이 테이블로 핸들러를 O(1)에 찾고 인자 개수를 검사하며,
+클러스터 라우팅(키의 해시 슬롯 계산)과 COMMAND INFO / COUNT / GETKEYS도 같은 테이블을 사용합니다.
+
+arity는 Redis와 같이 명령어 이름을 포함한 토큰 개수입니다.
+    양수 N: 정확히 N개      (GET key -> 2)
+    음수 -N: N개 이상        (SET key value [옵션 ...] -> -3)
+
+키 위치는 (첫 키 인덱스, 마지막 키 인덱스 (-1 = 끝까지), 간격)이며 키가 없으면 (0, 0, 0)입니다.
+"""
+
+
+# 명령어 플래그 (COMMAND INFO에 그대로 출력)
+# - write:    키스페이스를 변경
+# - readonly: 키스페이스를 읽기만 함
+# - denyoom:  새 데이터를 추가하므로 maxmemory를 넘으면 거부될 수 있음
+# - fast:     키 개수와 관계없이 O(1) / O(log n)
+# - admin:    설정, 영속성, 진단용 서버 관리 명령어
+
+
+class CommandSpec:
+    """
+    명령어 하나의 메타데이터
+
+    Attributes:
+        name: 소문자 명령어 이름
+        handler: CLI 핸들러 메서드 이름 (None이면 클러스터 워커(ClusterNode)가 CLI보다 먼저 처리)
+        arity: 명령어 이름을 포함한 인자 개수 (음수면 최소 개수)
+        flags: 플래그 튜플
+        first_key: 첫 키 인덱스 (키가 없으면 0)
+        last_key: 마지막 키 인덱스 (-1 = 마지막 토큰까지)
+        step: 키 사이 간격 (MSET은 2)
+    """
+
+    __slots__ = ("name", "handler", "arity", "flags", "first_key", "last_key", "step")
+
+    def __init__(self, name, handler, arity, flags=(), first_key=0, last_key=0, step=0):
+        self.name = name
+        self.handler = handler
+        self.arity = arity
+        self.flags = flags
+        self.first_key = first_key
+        self.last_key = last_key
+        self.step = step
+
+    def check_arity(self, argc):
+        """
+        인자 개수 검사
+
+        Args:
+            argc: 명령어 이름을 포함한 토큰 개수
+
+        Returns:
+            bool: 올바르면 True
+        """
+        arity = self.arity
+        return argc == arity if arity >= 0 else argc >= -arity
+
+    def keys(self, tokens):
+        """
+        명령어 토큰에서 키 목록 추출
+
+        Args:
+            tokens: 명령어 토큰 리스트 (인자 개수는 검사된 것으로 가정)
+
+        Returns:
+            list: 키 리스트 (키가 없는 명령어면 빈 리스트)
+        """
+        if self.first_key == 0:
+            return []
+        last = self.last_key
+        if last < 0:
+            last = len(tokens) + last
+        return tokens[self.first_key:last + 1:self.step]
+
+    def info(self):
+        """
+        COMMAND INFO 응답 항목
+
+        Returns:
+            list: [이름, arity, [플래그 ...], 첫 키, 마지막 키, 간격]
+        """
+        return [self.name, self.arity, list(self.flags), self.first_key, self.last_key, self.step]
+
+
+COMMAND_TABLE = {spec.name.upper(): spec for spec in (
+    # String 타입 / 다중 키
+    CommandSpec("set", "_cmd_set", -3, ("write", "denyoom"), 1, 1, 1),
+    CommandSpec("get", "_cmd_get", 2, ("readonly", "fast"), 1, 1, 1),
+    CommandSpec("del", "_cmd_del", -2, ("write",), 1, -1, 1),
+    CommandSpec("exists", "_cmd_exists", -2, ("readonly", "fast"), 1, -1, 1),
+    CommandSpec("mset", "_cmd_mset", -3, ("write", "denyoom"), 1, -1, 2),
+    CommandSpec("mget", "_cmd_mget", -2, ("readonly", "fast"), 1, -1, 1),
+    CommandSpec("dbsize", "_cmd_dbsize", 1, ("readonly", "fast")),
+    # 카운터
+    CommandSpec("incr", "_cmd_incr", 2, ("write", "denyoom", "fast"), 1, 1, 1),
+    CommandSpec("decr", "_cmd_decr", 2, ("write", "denyoom", "fast"), 1, 1, 1),
+    CommandSpec("incrby", "_cmd_incrby", 3, ("write", "denyoom", "fast"), 1, 1, 1),
+    CommandSpec("decrby", "_cmd_decrby", 3, ("write", "denyoom", "fast"), 1, 1, 1),
+    CommandSpec("incrbyfloat", "_cmd_incrbyfloat", 3, ("write", "denyoom", "fast"), 1, 1, 1),
+    CommandSpec("type", "_cmd_type", 2, ("readonly", "fast"), 1, 1, 1),
+    # Hash 타입
+    CommandSpec("hset", "_cmd_hset", -4, ("write", "denyoom", "fast"), 1, 1, 1),
+    CommandSpec("hget", "_cmd_hget", 3, ("readonly", "fast"), 1, 1, 1),
+    CommandSpec("hmget", "_cmd_hmget", -3, ("readonly", "fast"), 1, 1, 1),
+    CommandSpec("hgetall", "_cmd_hgetall", 2, ("readonly",), 1, 1, 1),
+    CommandSpec("hdel", "_cmd_hdel", -3, ("write", "fast"), 1, 1, 1),
+    CommandSpec("hlen", "_cmd_hlen", 2, ("readonly", "fast"), 1, 1, 1),
+    CommandSpec("hexists", "_cmd_hexists", 3, ("readonly", "fast"), 1, 1, 1),
+    CommandSpec("hincrby", "_cmd_hincrby", 4, ("write", "denyoom", "fast"), 1, 1, 1),
+    # TTL
+    CommandSpec("expire", "_cmd_expire", 3, ("write", "fast"), 1, 1, 1),
+    CommandSpec("pexpire", "_cmd_pexpire", 3, ("write", "fast"), 1, 1, 1),
+    CommandSpec("pexpireat", "_cmd_pexpireat", 3, ("write", "fast"), 1, 1, 1),
+    CommandSpec("ttl", "_cmd_ttl", 2, ("readonly", "fast"), 1, 1, 1),
+    CommandSpec("pttl", "_cmd_pttl", 2, ("readonly", "fast"), 1, 1, 1),
+    CommandSpec("persist", "_cmd_persist", 2, ("write", "fast"), 1, 1, 1),
+    CommandSpec("object", "_cmd_object", -2, ("readonly",), 2, 2, 1),
+    # 키스페이스 순회 / 접두사 인덱스
+    CommandSpec("keys", "_cmd_keys", 2, ("readonly",)),
+    CommandSpec("scan", "_cmd_scan", -2, ("readonly",)),
+    CommandSpec("countprefix", "_cmd_countprefix", 2, ("readonly",)),
+    CommandSpec("delprefix", "_cmd_delprefix", 2, ("write",)),
+    CommandSpec("unlinkprefix", "_cmd_unlinkprefix", 2, ("write",)),
+    # 설정 / 영속성 / 진단
+    CommandSpec("config", "_cmd_config", -2, ("admin",)),
+    CommandSpec("info", "_cmd_info", -1, ()),
+    CommandSpec("save", "_cmd_save", 1, ("admin",)),
+    CommandSpec("bgsave", "_cmd_bgsave", 1, ("admin",)),
+    CommandSpec("lastsave", "_cmd_lastsave", 1, ("fast",)),
+    CommandSpec("bgrewriteaof", "_cmd_bgrewriteaof", 1, ("admin",)),
+    CommandSpec("slowlog", "_cmd_slowlog", -2, ("admin",)),
+    CommandSpec("latency", "_cmd_latency", -2, ("admin",)),
+    CommandSpec("command", "_cmd_command", -1, ()),
+    # 연결
+    CommandSpec("ping", "_cmd_ping", -1, ("fast",)),
+    CommandSpec("echo", "_cmd_echo", 2, ("fast",)),
+    CommandSpec("hello", "_cmd_hello", -1, ("fast",)),
+    CommandSpec("help", "_cmd_help", 1, ()),
+    # 클러스터 (server.py --cluster-workers의 워커에서 ClusterNode.route가 처리)
+    CommandSpec("cluster", None, -2, ("admin",)),
+    CommandSpec("migrate", None, -6, ("write",)),
+    CommandSpec("asking", None, 1, ("fast",)),
+)}
+
+
+def lookup_command(name):
+    """
+    명령어 이름으로 CommandSpec 조회 (대소문자 무시)
+
+    Args:
+        name: 명령어 이름
+
+    Returns:
+        CommandSpec: 없으면 None
+    """
+    return COMMAND_TABLE.get(name.upper())
+
+
+def command_keys(tokens):
+    """
+    명령어 토큰에서 키 목록 추출
+
+    Args:
+        tokens: 명령어 토큰 리스트
+
+    Returns:
+        list: 키 리스트 (알 수 없는 명령어, 키가 없는 명령어, 인자 개수가 틀린 명령어면 빈 리스트)
+    """
+    spec = COMMAND_TABLE.get(tokens[0].upper())
+    if spec is None or not spec.check_arity(len(tokens)):
+        return []
+    return spec.keys(tokens)
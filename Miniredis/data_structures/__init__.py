@@ -3,18 +3,42 @@ data_structures 패키지
 
 Mini Redis에서 사용하는 기본 자료구조들을 포함합니다.
 - DoublyLinkedList: 이중 연결 리스트 (LRU 추적)
+- IndexLinkedList: array 슬롯 번호로 연결한 이중 연결 리스트 (LRU 추적)
+- ClockRing: 참조 비트 기반 CLOCK 근사 LRU (LRU 추적)
 - HashMap: 체이닝 방식 해시맵 (키-값 저장)
-- MinHeap: 최소 힙 (TTL 관리)
+- OpenAddressingHashMap: 선형 탐사 오픈 어드레싱 해시맵 (키-값 저장)
+- MinHeap: 최소 힙
+- IndexedMinHeap: 핸들로 갱신/삭제를 지원하는 인덱스 최소 힙 (TTL 관리)
+- EvictionPool: 근사 제거 후보 풀 (maxmemory-policy)
+- TimingWheel: 계층형 타이밍 휠 (TTL 관리)
+- SkipList: 정렬된 키 스킵 리스트 (접두사 인덱스)
+- HashObject: listpack / hashtable 이중 인코딩 Hash 값 (Hash 타입)
 """
 
 from data_structures.doubly_linked_list import DoublyLinkedList, Node
+from data_structures.index_linked_list import IndexLinkedList
+from data_structures.clock import ClockRing
 from data_structures.hash_map import HashMap, HashMapEntry
-from data_structures.heap import MinHeap
+from data_structures.open_hash_map import OpenAddressingHashMap
+from data_structures.heap import MinHeap, IndexedMinHeap, HeapHandle
+from data_structures.eviction_pool import EvictionPool
+from data_structures.timing_wheel import TimingWheel
+from data_structures.skiplist import SkipList
+from data_structures.hash_object import HashObject
 
 __all__ = [
     'DoublyLinkedList',
     'Node',
+    'IndexLinkedList',
+    'ClockRing',
     'HashMap',
     'HashMapEntry',
-    'MinHeap'
+    'OpenAddressingHashMap',
+    'MinHeap',
+    'IndexedMinHeap',
+    'HeapHandle',
+    'EvictionPool',
+    'TimingWheel',
+    'SkipList',
+    'HashObject'
 ]
@@ -0,0 +1,182 @@
+"""
+CLOCK (second-chance) 근사 LRU 구현
+
+이 모듈은 키마다 참조 비트 1바이트만 두는 CLOCK 알고리즘을 구현합니다.
+키는 원형 배열의 슬롯에 들어가고, 접근하면 참조 비트를 1로 세웁니다 (바이트 쓰기 한 번).
+제거할 때는 시계 바늘(hand)이 슬롯을 돌면서 참조 비트가 1인 키는 0으로 내리고(두 번째 기회)
+넘어가며, 참조 비트가 0인 첫 키를 희생자로 고릅니다.
+
+    _bits: bytearray   슬롯별 참조 비트
+    _keys: list        슬롯별 키 (빈 슬롯은 None)
+    _free: array('l')  빈 슬롯 free list 연결
+
+LRU 리스트(DoublyLinkedList / IndexLinkedList)와 같은 API를 제공하므로
+MiniRedis(lru_tracking="clock")에서 LRU 리스트 자리에 그대로 사용됩니다.
+슬롯 0은 사용하지 않으므로 엔트리의 lru_node(슬롯 번호) 진리값 검사를 그대로 쓸 수 있습니다.
+"""
+
+from array import array
+
+
+class ClockRing:
+    """
+    CLOCK 근사 LRU 클래스
+
+    Attributes:
+        _bits: 슬롯별 참조 비트 (0 또는 1)
+        _keys: 슬롯별 키
+        _free: 슬롯별 다음 빈 슬롯 번호 (free list, 0 = 끝)
+        _free_head: 첫 빈 슬롯 번호 (없으면 0)
+        _hand: 시계 바늘 위치 (다음에 검사할 슬롯)
+        _capacity: 할당된 슬롯 개수 (사용하지 않는 슬롯 0 포함)
+        _size: 저장된 키 개수
+    """
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, capacity=None):
+        """
+        CLOCK 초기화
+
+        Args:
+            capacity: 미리 할당할 슬롯 개수 (기본값: 16)
+        """
+        self._bits = bytearray(1)
+        self._keys = [None]
+        self._free = array('l', [0])
+        self._free_head = 0
+        self._hand = 1
+        self._capacity = 1
+        self._size = 0
+        self._grow(capacity if capacity else self.INITIAL_CAPACITY)
+
+    def _grow(self, count):
+        """
+        슬롯 count개를 추가 할당하여 free list에 연결
+
+        Args:
+            count: 추가할 슬롯 개수
+        """
+        start = self._capacity
+        end = start + count
+        self._bits.extend(bytes(count))
+        self._keys.extend([None] * count)
+        self._free.extend(array('l', range(start + 1, end + 1)))
+        self._free[end - 1] = self._free_head
+        self._free_head = start
+        self._capacity = end
+
+    def insert_front(self, key):
+        """
+        키를 빈 슬롯에 넣고 참조 비트를 세움 (LRU 리스트의 맨 앞 삽입에 해당)
+
+        시간 복잡도: O(1) (확장 시 분할 상환 O(1))
+
+        Args:
+            key: 추가할 키
+
+        Returns:
+            int: 슬롯 번호
+        """
+        if self._free_head == 0:
+            self._grow(self._capacity)
+        slot = self._free_head
+        self._free_head = self._free[slot]
+        self._keys[slot] = key
+        self._bits[slot] = 1
+        self._size += 1
+        return slot
+
+    def move_to_front(self, slot):
+        """
+        키 접근 기록 (참조 비트를 1로 세움, LRU 리스트의 맨 앞 이동에 해당)
+
+        시간 복잡도: O(1)
+
+        Args:
+            slot: 접근한 키의 슬롯 번호
+        """
+        self._bits[slot] = 1
+
+    def remove_node(self, slot):
+        """
+        슬롯의 키를 제거하고 슬롯을 free list에 반환
+
+        Args:
+            slot: 제거할 슬롯 번호
+
+        Returns:
+            제거된 키, 빈 슬롯이면 None
+        """
+        if not slot:
+            return None
+
+        key = self._keys[slot]
+        self._keys[slot] = None
+        self._bits[slot] = 0
+        self._free[slot] = self._free_head
+        self._free_head = slot
+        self._size -= 1
+        return key
+
+    def peek_back(self):
+        """
+        다음 희생자 키 반환 (LRU 리스트의 맨 뒤 키에 해당, 제거는 호출자가 remove_node로)
+
+        시계 바늘을 돌리며 참조 비트가 1인 키는 0으로 내리고 넘어갑니다.
+        모든 키의 비트가 1이어도 한 바퀴 돌면 비트가 모두 0이 되므로 최대 두 바퀴 안에 끝납니다.
+        바늘은 고른 슬롯에 머물러 있다가 다음 호출에서 그 다음 슬롯부터 검사합니다.
+
+        Returns:
+            희생자 키, 비어 있으면 None
+        """
+        if self._size == 0:
+            return None
+
+        bits = self._bits
+        keys = self._keys
+        capacity = self._capacity
+        hand = self._hand
+
+        while True:
+            if hand >= capacity:
+                hand = 1
+            if keys[hand] is not None:
+                if not bits[hand]:
+                    self._hand = hand
+                    return keys[hand]
+                bits[hand] = 0
+            hand += 1
+
+    def is_empty(self):
+        """
+        비어 있는지 확인
+
+        Returns:
+            bool: 비어 있으면 True
+        """
+        return self._size == 0
+
+    def size(self):
+        """
+        저장된 키 개수 반환
+
+        Returns:
+            int: 키 개수
+        """
+        return self._size
+
+    def __len__(self):
+        """len() 함수 지원"""
+        return self._size
+
+    def __iter__(self):
+        """
+        이터레이터 지원 (슬롯 순서)
+
+        Yields:
+            저장된 키
+        """
+        for key in self._keys:
+            if key is not None:
+                yield key
@@ -16,6 +16,9 @@ class Node:
         next: 다음 노드에 대한 참조
     """
     
+    # 인스턴스마다 __dict__를 만들지 않도록 속성 고정 (키마다 노드가 생기므로 메모리 절약)
+    __slots__ = ("data", "prev", "next")
+    
     def __init__(self, data=None):
         """
         노드 초기화
@@ -206,6 +209,19 @@ class DoublyLinkedList:
         self.head.next.prev = node
         self.head.next = node
     
+    def peek_back(self):
+        """
+        리스트의 맨 뒤 데이터 반환 (제거하지 않음)
+        
+        시간 복잡도: O(1)
+        
+        Returns:
+            data: 맨 뒤 노드의 데이터, 리스트가 비어있으면 None
+        """
+        if self.is_empty():
+            return None
+        return self.tail.prev.data
+    
     def get_back_node(self):
         """
         리스트의 맨 뒤 노드 반환 (제거하지 않음)
@@ -0,0 +1,129 @@
+"""
+제거 후보 풀 (Eviction Pool) 구현
+
+이 모듈은 근사 LRU/TTL 제거에서 사용하는 고정 크기 후보 풀을 구현합니다.
+매번 표본(sample)으로 뽑힌 키 중 점수(유휴 시간 등)가 높은 키만 풀에 남겨두므로,
+표본 크기가 작아도 여러 번의 제거에 걸쳐 점점 더 좋은 후보를 고르게 됩니다.
+"""
+
+
+class EvictionPool:
+    """
+    점수 오름차순으로 정렬된 고정 크기 후보 풀
+
+    가장 점수가 높은(제거하기 가장 좋은) 후보는 항상 배열의 끝에 있습니다.
+    풀이 가득 찬 상태에서 더 높은 점수의 후보가 들어오면 가장 낮은 점수의 후보를 밀어냅니다.
+
+    Attributes:
+        _scores: 후보 점수 배열 (오름차순)
+        _keys: 후보 키 배열 (_scores와 같은 인덱스)
+        _count: 현재 후보 개수
+        _capacity: 최대 후보 개수
+    """
+
+    DEFAULT_SIZE = 16
+
+    def __init__(self, capacity=DEFAULT_SIZE):
+        """
+        후보 풀 초기화
+
+        Args:
+            capacity: 최대 후보 개수 (기본값: 16)
+        """
+        self._capacity = capacity
+        self._scores = [None] * capacity
+        self._keys = [None] * capacity
+        self._count = 0
+
+    def insert(self, score, key):
+        """
+        후보 삽입 (정렬 유지)
+
+        이미 풀에 있는 키는 점수만 갱신합니다.
+        시간 복잡도: O(풀 크기)
+
+        Args:
+            score: 제거 우선순위 점수 (클수록 먼저 제거)
+            key: 후보 키
+
+        Returns:
+            bool: 풀에 들어갔으면 True
+        """
+        scores = self._scores
+        keys = self._keys
+
+        # 이미 있는 키면 제거 후 다시 삽입
+        for i in range(self._count):
+            if keys[i] == key:
+                self._remove_at(i)
+                break
+
+        # 가득 찼고 가장 나쁜 후보보다도 점수가 낮으면 무시
+        if self._count == self._capacity:
+            if score <= scores[0]:
+                return False
+            self._remove_at(0)
+
+        # 삽입 위치 탐색 (오름차순)
+        pos = self._count
+        while pos > 0 and scores[pos - 1] > score:
+            scores[pos] = scores[pos - 1]
+            keys[pos] = keys[pos - 1]
+            pos -= 1
+
+        scores[pos] = score
+        keys[pos] = key
+        self._count += 1
+        return True
+
+    def pop_best(self):
+        """
+        점수가 가장 높은 후보를 꺼내 반환
+
+        Returns:
+            후보 키, 비어 있으면 None
+        """
+        if self._count == 0:
+            return None
+
+        self._count -= 1
+        key = self._keys[self._count]
+        self._keys[self._count] = None
+        self._scores[self._count] = None
+        return key
+
+    def clear(self):
+        """
+        모든 후보 제거 (제거 정책이 바뀌어 점수 기준이 달라졌을 때)
+        """
+        for i in range(self._count):
+            self._keys[i] = None
+            self._scores[i] = None
+        self._count = 0
+
+    def _remove_at(self, index):
+        """
+        index 위치의 후보 제거 (뒤쪽 후보를 한 칸씩 당김)
+
+        Args:
+            index: 제거할 위치
+        """
+        for i in range(index, self._count - 1):
+            self._scores[i] = self._scores[i + 1]
+            self._keys[i] = self._keys[i + 1]
+        self._count -= 1
+        self._scores[self._count] = None
+        self._keys[self._count] = None
+
+    def size(self):
+        """
+        현재 후보 개수 반환
+
+        Returns:
+            int: 후보 개수
+        """
+        return self._count
+
+    def __len__(self):
+        """len() 함수 지원"""
+        return self._count
@@ -3,11 +3,47 @@
 
 이 모듈은 체이닝 방식의 충돌 해결을 사용하는 해시맵을 구현합니다.
 Python의 dict 사용 없이 직접 구현되었습니다.
+확장/축소는 두 버킷 배열을 함께 두고 연산마다 조금씩 옮기는 점진적 재해싱으로 처리합니다.
+버킷 배열 크기는 항상 2의 거듭제곱이므로, SCAN 커서(역방향 비트 증가)가 크기 변경 전후에도
+같은 키를 빠뜨리지 않습니다.
+
+키 해시는 인터프리터의 hash()를 사용합니다. 문자열 해시는 C로 구현된 SipHash이고
+프로세스마다 임의의 시드(PYTHONHASHSEED)를 쓰므로, 충돌하는 키를 미리 골라 보내는
+해시 충돌 공격(hash flooding)이 어렵습니다. 해시값은 엔트리에 저장해 두어
+재해싱과 체인 비교 시 다시 계산하지 않습니다.
 """
 
+import random
+import time
+
 from data_structures.doubly_linked_list import DoublyLinkedList, Node
 
 
+# 해시값을 0 이상의 63비트 정수로 맞추는 마스크 (hash()는 음수일 수 있음)
+HASH_MASK = 0x7FFFFFFFFFFFFFFF
+
+
+def _reverse_increment(cursor, mask):
+    """
+    커서의 mask 비트를 상위 비트부터 1 증가 (비트를 뒤집어 1 더한 뒤 다시 뒤집은 값)
+    
+    mask보다 높은 비트는 버리며, mask 비트가 모두 1이면 0을 반환합니다 (순회 완료).
+    
+    Args:
+        cursor: 현재 커서
+        mask: 버킷 배열 크기 - 1
+        
+    Returns:
+        int: 다음 커서
+    """
+    cursor &= mask
+    bit = (mask + 1) >> 1
+    while bit and cursor & bit:
+        cursor ^= bit
+        bit >>= 1
+    return cursor | bit
+
+
 class HashMapEntry:
     """
     해시맵 엔트리 클래스
@@ -16,9 +52,16 @@ class HashMapEntry:
         key: 키 값
         value: 저장된 값
         lru_node: LRU 리스트에서의 노드 참조 (옵션)
+        lru: 마지막 접근 시점의 LRU 클럭 값 (근사 LRU 제거용)
+        lfu_counter: 8비트 로그 접근 빈도 카운터 (LFU 제거용)
+        lfu_decr_time: LFU 카운터를 마지막으로 감쇠/갱신한 시각 (분)
+        hash_value: 키의 해시값 (재해싱/비교 시 재계산하지 않도록 저장)
     """
     
-    def __init__(self, key, value, lru_node=None):
+    # 인스턴스마다 __dict__를 만들지 않도록 속성 고정 (키마다 엔트리가 생기므로 메모리 절약)
+    __slots__ = ("key", "value", "lru_node", "lru", "lfu_counter", "lfu_decr_time", "hash_value")
+    
+    def __init__(self, key, value, lru_node=None, hash_value=0):
         """
         엔트리 초기화
         
@@ -26,10 +69,15 @@ class HashMapEntry:
             key: 키 값
             value: 저장할 값
             lru_node: LRU 리스트의 노드 참조
+            hash_value: 키의 해시값
         """
         self.key = key
         self.value = value
         self.lru_node = lru_node
+        self.lru = 0
+        self.lfu_counter = 0
+        self.lfu_decr_time = 0
+        self.hash_value = hash_value
 
 
 class HashMap:
@@ -37,78 +85,141 @@ class HashMap:
     체이닝 방식 해시맵 클래스
     
     충돌 해결: 체이닝 (각 버킷에 연결 리스트 사용)
-    로드 팩터 0.75 초과 시 버킷 2배 확장
+    로드 팩터 0.75 초과 시 버킷 2배 확장, 0.1 미만 시 축소 (크기는 항상 2의 거듭제곱)
+    
+    확장/축소는 한 번에 하지 않고 Redis처럼 점진적으로 재해싱(progressive rehashing)합니다.
+    새 버킷 배열을 만든 뒤 두 배열이 함께 존재하는 동안, 조회/삽입/삭제마다
+    REHASH_STEP_BUCKETS개의 버킷을 새 배열로 옮기고 (유휴 시간에는 rehash_milliseconds로 이어서 옮김)
+    모두 옮기면 새 배열이 주 배열이 됩니다. 재해싱 중 조회/삭제는 두 배열을 모두 확인하고,
+    삽입은 새 배열에만 합니다.
     
     Attributes:
-        _capacity: 버킷 배열의 크기
-        _size: 저장된 키-값 쌍의 개수
-        _buckets: 버킷 배열 (각 버킷은 DoublyLinkedList)
-        _load_factor_threshold: 리사이징 임계값
+        _capacity: 주 버킷 배열의 크기
+        _size: 저장된 키-값 쌍의 개수 (두 배열 합계)
+        _buckets: 주 버킷 배열 (각 버킷은 DoublyLinkedList, 빈 버킷은 None)
+        _rehash_buckets: 재해싱 대상 버킷 배열 (재해싱 중이 아니면 None)
+        _rehash_capacity: 재해싱 대상 버킷 배열의 크기
+        _rehash_index: 다음에 옮길 주 배열 버킷 번호 (재해싱 중이 아니면 -1)
+        _iterators: 진행 중인 순회 개수 (순회 중에는 버킷을 옮기지 않음)
+        resize_listener: 재해싱 시작 시 버킷 배열 할당 시간(ns)을 받는 콜백 (기본값: None)
     """
     
     INITIAL_CAPACITY = 16
     LOAD_FACTOR_THRESHOLD = 0.75
+    SHRINK_LOAD_FACTOR = 0.1
+    REHASH_STEP_BUCKETS = 1       # 연산 하나마다 옮길 버킷 수
+    REHASH_EMPTY_VISITS = 10      # 옮길 버킷 하나당 건너뛸 수 있는 빈 버킷 수
+    REHASH_BATCH_BUCKETS = 100    # rehash_milliseconds에서 시간 확인 사이에 옮길 버킷 수
     
     def __init__(self, capacity=None):
         """
         해시맵 초기화
         
         Args:
-            capacity: 초기 버킷 크기 (기본값: 16)
+            capacity: 초기 버킷 크기 (2의 거듭제곱으로 올림, 기본값: 16)
         """
-        self._capacity = capacity if capacity else self.INITIAL_CAPACITY
+        self._capacity = self._round_capacity(capacity if capacity else self.INITIAL_CAPACITY)
         self._size = 0
         self._buckets = self._create_buckets(self._capacity)
+        self._rehash_buckets = None
+        self._rehash_capacity = 0
+        self._rehash_index = -1
+        self._iterators = 0
+        self.resize_listener = None
+    
+    def _round_capacity(self, capacity):
+        """
+        capacity 이상인 가장 작은 2의 거듭제곱 반환 (최소 INITIAL_CAPACITY)
+        
+        Args:
+            capacity: 요청 크기
+            
+        Returns:
+            int: 실제 버킷 배열 크기
+        """
+        result = self.INITIAL_CAPACITY
+        while result < capacity:
+            result *= 2
+        return result
     
     def _create_buckets(self, capacity):
         """
         버킷 배열 생성
         
-        Python list 대신 고정 크기 배열 시뮬레이션
-        (실제로는 Python의 기본 배열 메커니즘 사용)
+        버킷 리스트는 처음 키가 들어올 때 만듭니다. 새 배열 할당이 버킷 수에 비례하는
+        객체 생성 없이 끝나므로 재해싱을 시작할 때 멈춤이 생기지 않습니다.
         
         Args:
             capacity: 버킷 개수
             
         Returns:
-            list: 빈 DoublyLinkedList로 초기화된 버킷 배열
+            list: None으로 초기화된 버킷 배열
         """
-        buckets = [None] * capacity
-        for i in range(capacity):
-            buckets[i] = DoublyLinkedList()
-        return buckets
+        return [None] * capacity
     
     def _hash(self, key):
         """
-        해시 함수 - 키를 버킷 인덱스로 변환
+        해시 함수 - 키를 해시값으로 변환 (버킷 인덱스는 % capacity)
         
-        다항식 롤링 해시 방식 사용
+        인터프리터의 hash() (문자열은 시드가 있는 SipHash) 사용
         
         Args:
             key: 해시할 키 (문자열)
             
         Returns:
-            int: 버킷 인덱스 (0 ~ capacity-1)
+            int: 0 이상의 해시값
         """
-        if key is None:
-            return 0
+        return hash(key) & HASH_MASK
+    
+    def _find_node(self, buckets, capacity, key, hash_value):
+        """
+        버킷 배열 하나에서 키의 노드 탐색
         
-        # 문자열을 해시값으로 변환 (다항식 롤링 해시)
-        hash_value = 0
-        prime = 31  # 소수 사용
+        Args:
+            buckets: 버킷 배열
+            capacity: 버킷 배열의 크기
+            key: 찾을 키
+            hash_value: 키의 해시값
+            
+        Returns:
+            tuple: (버킷, 노드), 없으면 (버킷 또는 None, None)
+        """
+        bucket = buckets[hash_value % capacity]
+        if bucket is None:
+            return None, None
         
-        key_str = str(key)
-        for char in key_str:
-            hash_value = (hash_value * prime + ord(char)) & 0x7FFFFFFF
+        # 저장된 해시값을 먼저 비교하여 긴 키의 문자열 비교를 줄임
+        current = bucket.head.next
+        while current != bucket.tail:
+            entry = current.data
+            if entry.hash_value == hash_value and entry.key == key:
+                return bucket, current
+            current = current.next
         
-        return hash_value % self._capacity
+        return bucket, None
+    
+    def _lookup(self, key, hash_value):
+        """
+        주 배열과 (재해싱 중이면) 재해싱 대상 배열에서 키의 노드 탐색
+        
+        Args:
+            key: 찾을 키
+            hash_value: 키의 해시값
+            
+        Returns:
+            tuple: (버킷, 노드), 없으면 (None, None)
+        """
+        bucket, node = self._find_node(self._buckets, self._capacity, key, hash_value)
+        if node is None and self._rehash_buckets is not None:
+            bucket, node = self._find_node(self._rehash_buckets, self._rehash_capacity, key, hash_value)
+        return bucket, node
     
     def put(self, key, value, lru_node=None):
         """
         키-값 쌍 저장
         
         이미 존재하는 키면 값을 업데이트합니다.
-        시간 복잡도: 평균 O(1), 최악 O(n)
+        시간 복잡도: 평균 O(1), 최악 O(n) (확장도 여러 연산에 나누어 처리)
         
         Args:
             key: 키
@@ -118,28 +229,30 @@ class HashMap:
         Returns:
             HashMapEntry: 저장/업데이트된 엔트리
         """
-        # 로드 팩터 확인 및 리사이징
-        if self._size / self._capacity > self.LOAD_FACTOR_THRESHOLD:
-            self._resize()
+        if self._rehash_index >= 0:
+            self._rehash_step(self.REHASH_STEP_BUCKETS)
+        elif self._size / self._capacity > self.LOAD_FACTOR_THRESHOLD:
+            # 로드 팩터 초과 시 2배 크기로 점진적 재해싱 시작
+            self._start_rehash(self._capacity * 2)
         
-        index = self._hash(key)
-        bucket = self._buckets[index]
+        hash_value = self._hash(key)
         
         # 이미 존재하는 키인지 확인
-        current = bucket.head.next
-        while current != bucket.tail:
-            entry = current.data
-            if entry.key == key:
-                # 값 업데이트
-                entry.value = value
-                if lru_node is not None:
-                    entry.lru_node = lru_node
-                return entry
-            current = current.next
+        _, node = self._lookup(key, hash_value)
+        if node is not None:
+            # 값 업데이트
+            entry = node.data
+            entry.value = value
+            if lru_node is not None:
+                entry.lru_node = lru_node
+            return entry
         
-        # 새 엔트리 추가
-        new_entry = HashMapEntry(key, value, lru_node)
-        bucket.insert_back(new_entry)
+        # 새 엔트리 추가 (재해싱 중이면 새 배열에)
+        new_entry = HashMapEntry(key, value, lru_node, hash_value)
+        if self._rehash_buckets is not None:
+            self._bucket_for(self._rehash_buckets, self._rehash_capacity, hash_value).insert_back(new_entry)
+        else:
+            self._bucket_for(self._buckets, self._capacity, hash_value).insert_back(new_entry)
         self._size += 1
         
         return new_entry
@@ -156,17 +269,11 @@ class HashMap:
         Returns:
             HashMapEntry: 찾은 엔트리, 없으면 None
         """
-        index = self._hash(key)
-        bucket = self._buckets[index]
-        
-        current = bucket.head.next
-        while current != bucket.tail:
-            entry = current.data
-            if entry.key == key:
-                return entry
-            current = current.next
+        if self._rehash_index >= 0:
+            self._rehash_step(self.REHASH_STEP_BUCKETS)
         
-        return None
+        _, node = self._lookup(key, self._hash(key))
+        return node.data if node is not None else None
     
     def remove(self, key):
         """
@@ -180,19 +287,20 @@ class HashMap:
         Returns:
             HashMapEntry: 삭제된 엔트리, 없으면 None
         """
-        index = self._hash(key)
-        bucket = self._buckets[index]
+        if self._rehash_index >= 0:
+            self._rehash_step(self.REHASH_STEP_BUCKETS)
         
-        current = bucket.head.next
-        while current != bucket.tail:
-            entry = current.data
-            if entry.key == key:
-                bucket.remove_node(current)
-                self._size -= 1
-                return entry
-            current = current.next
+        bucket, node = self._lookup(key, self._hash(key))
+        if node is None:
+            return None
+        
+        bucket.remove_node(node)
+        self._size -= 1
         
-        return None
+        # 로드 팩터가 크게 낮아지면 축소 재해싱 시작
+        self._shrink_if_needed()
+        
+        return node.data
     
     def contains(self, key):
         """
@@ -213,9 +321,8 @@ class HashMap:
         Returns:
             generator: 모든 키를 yield
         """
-        for bucket in self._buckets:
-            for entry in bucket:
-                yield entry.key
+        for entry in self.entries():
+            yield entry.key
     
     def values(self):
         """
@@ -224,20 +331,171 @@ class HashMap:
         Returns:
             generator: 모든 값을 yield
         """
-        for bucket in self._buckets:
-            for entry in bucket:
-                yield entry.value
+        for entry in self.entries():
+            yield entry.value
     
     def entries(self):
         """
         모든 엔트리 반환
         
+        순회가 끝나거나 중단될 때까지 버킷을 옮기지 않으므로
+        재해싱 중에도 엔트리가 빠지거나 두 번 나오지 않습니다.
+        
         Returns:
             generator: 모든 엔트리를 yield
         """
-        for bucket in self._buckets:
+        self._iterators += 1
+        try:
+            for bucket in self._buckets:
+                if bucket is not None:
+                    for entry in bucket:
+                        yield entry
+            if self._rehash_buckets is not None:
+                for bucket in self._rehash_buckets:
+                    if bucket is not None:
+                        for entry in bucket:
+                            yield entry
+        finally:
+            self._iterators -= 1
+    
+    def _bucket_at(self, index):
+        """
+        두 버킷 배열을 이어 붙인 위치 index의 버킷 반환 (표본 추출용)
+        
+        Args:
+            index: 0 ~ (주 배열 크기 + 재해싱 대상 배열 크기 - 1)
+            
+        Returns:
+            DoublyLinkedList: 버킷, 비어 있으면 None
+        """
+        if index < self._capacity:
+            return self._buckets[index]
+        return self._rehash_buckets[index - self._capacity]
+    
+    def random_entry(self):
+        """
+        임의의 엔트리 하나 반환
+        
+        비어 있지 않은 버킷을 만날 때까지 임의의 버킷을 고른 뒤,
+        그 버킷의 체인에서 임의의 엔트리를 선택합니다.
+        재해싱 중에는 두 버킷 배열 전체에서 고릅니다.
+        
+        Returns:
+            HashMapEntry: 임의의 엔트리, 비어 있으면 None
+        """
+        if self._size == 0:
+            return None
+        
+        total = self._capacity + self._rehash_capacity
+        while True:
+            bucket = self._bucket_at(random.randrange(total))
+            if bucket is None or bucket.is_empty():
+                continue
+            
+            # 체인 안에서 임의의 위치 선택
+            steps = random.randrange(bucket.size())
+            current = bucket.head.next
+            while steps > 0:
+                current = current.next
+                steps -= 1
+            return current.data
+    
+    def sample_entries(self, count):
+        """
+        임의의 위치에서 시작해 연속된 버킷의 엔트리를 최대 count개 수집
+        
+        Redis의 dictGetSomeKeys와 같은 방식으로, 전체를 순회하지 않고
+        근사 제거(eviction)나 능동 만료에 쓸 표본을 빠르게 얻습니다.
+        빈 버킷이 많을 때를 대비해 탐색 버킷 수는 count * 10으로 제한합니다.
+        재해싱 중에는 두 버킷 배열을 이어 붙인 것처럼 탐색합니다.
+        
+        Args:
+            count: 최대 표본 개수
+            
+        Returns:
+            list: 표본 엔트리 리스트 (중복 없음)
+        """
+        samples = []
+        if self._size == 0:
+            return samples
+        
+        if count > self._size:
+            count = self._size
+        
+        total = self._capacity + self._rehash_capacity
+        index = random.randrange(total)
+        max_steps = count * 10
+        while len(samples) < count and max_steps > 0:
+            bucket = self._bucket_at(index)
+            if bucket is not None:
+                for entry in bucket:
+                    samples.append(entry)
+                    if len(samples) == count:
+                        break
+            index = (index + 1) % total
+            max_steps -= 1
+        
+        return samples
+    
+    def scan(self, cursor, count=10):
+        """
+        커서 기반 순회 - 버킷 몇 개의 엔트리와 다음 커서 반환 (Redis dictScan)
+        
+        커서는 버킷 번호의 비트를 뒤집은 순서(상위 비트부터 증가)로 진행합니다.
+        크기가 2의 거듭제곱이라 확장/축소 후에도 크기 n의 버킷 i는 크기 2n의 버킷 i, i+n으로
+        (또는 그 반대로) 나뉘고 합쳐지므로, 커서 0에서 시작해 0이 돌아올 때까지 호출하면
+        처음부터 끝까지 있던 키는 크기 변경과 관계없이 최소 한 번 반환됩니다 (중복은 있을 수 있음).
+        재해싱 중에는 작은 배열의 버킷 하나와, 그 버킷이 펼쳐지는 큰 배열의 버킷들을 함께 반환합니다.
+        
+        한 번에 최대 count * 10개의 버킷만 방문하므로 호출 하나의 작업량이 제한됩니다.
+        
+        Args:
+            cursor: 이전 호출이 반환한 커서 (처음은 0)
+            count: 모을 엔트리 개수 목표 (근사값)
+            
+        Returns:
+            tuple: (다음 커서, 엔트리 리스트), 다음 커서가 0이면 순회 완료
+        """
+        entries = []
+        if self._size == 0:
+            return 0, entries
+        
+        visits = count * 10
+        while True:
+            if self._rehash_buckets is None:
+                mask = self._capacity - 1
+                self._scan_bucket(self._buckets[cursor & mask], entries)
+                cursor = _reverse_increment(cursor, mask)
+            else:
+                # 작은 배열(t0)의 버킷 하나 + 그 버킷에 대응하는 큰 배열(t1)의 버킷 모두
+                if self._capacity <= self._rehash_capacity:
+                    t0, t1 = self._buckets, self._rehash_buckets
+                else:
+                    t0, t1 = self._rehash_buckets, self._buckets
+                m0 = len(t0) - 1
+                m1 = len(t1) - 1
+                self._scan_bucket(t0[cursor & m0], entries)
+                while True:
+                    self._scan_bucket(t1[cursor & m1], entries)
+                    cursor = _reverse_increment(cursor, m1)
+                    if not cursor & (m0 ^ m1):
+                        break
+            
+            visits -= 1
+            if cursor == 0 or len(entries) >= count or visits <= 0:
+                return cursor, entries
+    
+    def _scan_bucket(self, bucket, entries):
+        """
+        버킷의 엔트리를 entries에 추가 (scan 보조)
+        
+        Args:
+            bucket: DoublyLinkedList 버킷 또는 None
+            entries: 결과 리스트
+        """
+        if bucket is not None:
             for entry in bucket:
-                yield entry
+                entries.append(entry)
     
     def size(self):
         """
@@ -248,21 +506,137 @@ class HashMap:
         """
         return self._size
     
-    def _resize(self):
+    def is_rehashing(self):
         """
-        버킷 배열 2배 확장
+        점진적 재해싱 진행 여부
         
-        모든 엔트리를 새 버킷 배열로 재배치합니다.
+        Returns:
+            bool: 재해싱 중이면 True
         """
-        old_buckets = self._buckets
-        self._capacity *= 2
-        self._buckets = self._create_buckets(self._capacity)
-        self._size = 0
+        return self._rehash_index >= 0
+    
+    def rehash_milliseconds(self, ms):
+        """
+        유휴 시간에 최대 ms 밀리초 동안 재해싱 진행 (cron에서 호출)
+        
+        REHASH_BATCH_BUCKETS개의 버킷을 옮길 때마다 시간을 확인합니다.
+        재해싱 중이 아니면 축소가 필요한지 먼저 확인합니다 (축소 재해싱 도중 더 줄어든 경우).
+        순회 중이라 버킷을 옮길 수 없으면 시간을 쓰지 않고 바로 반환합니다.
         
-        # 모든 엔트리 재삽입
-        for bucket in old_buckets:
+        Args:
+            ms: 최대 실행 시간 (밀리초)
+            
+        Returns:
+            int: 옮긴 버킷 수
+        """
+        self._shrink_if_needed()
+        if self._rehash_index < 0 or self._iterators > 0:
+            return 0
+        
+        deadline = time.perf_counter() + ms / 1000
+        moved = 0
+        while self._rehash_step(self.REHASH_BATCH_BUCKETS):
+            moved += self.REHASH_BATCH_BUCKETS
+            if time.perf_counter() >= deadline:
+                break
+        return moved
+    
+    def _bucket_for(self, buckets, capacity, hash_value):
+        """
+        해시값에 해당하는 버킷 반환 (없으면 생성)
+        
+        Args:
+            buckets: 버킷 배열
+            capacity: 버킷 배열의 크기
+            hash_value: 해시값
+            
+        Returns:
+            DoublyLinkedList: 버킷
+        """
+        index = hash_value % capacity
+        bucket = buckets[index]
+        if bucket is None:
+            bucket = DoublyLinkedList()
+            buckets[index] = bucket
+        return bucket
+    
+    def _shrink_if_needed(self):
+        """
+        로드 팩터가 SHRINK_LOAD_FACTOR 미만이면 축소 재해싱 시작 (키 개수의 2배 크기로)
+        """
+        if (self._rehash_index < 0 and self._capacity > self.INITIAL_CAPACITY
+                and self._size / self._capacity < self.SHRINK_LOAD_FACTOR):
+            self._start_rehash(self._round_capacity(self._size * 2))
+    
+    def _start_rehash(self, capacity):
+        """
+        새 크기의 버킷 배열을 만들고 점진적 재해싱 시작
+        
+        Args:
+            capacity: 새 버킷 배열의 크기
+        """
+        if capacity == self._capacity:
+            return
+        listener = self.resize_listener
+        start = time.perf_counter_ns() if listener is not None else 0
+        self._rehash_buckets = self._create_buckets(capacity)
+        self._rehash_capacity = capacity
+        self._rehash_index = 0
+        if listener is not None:
+            listener(time.perf_counter_ns() - start)
+    
+    def _rehash_step(self, count):
+        """
+        주 배열의 버킷을 최대 count개 새 배열로 옮김
+        
+        빈 버킷은 count * REHASH_EMPTY_VISITS개까지만 건너뛰어 한 번의 호출 시간이 제한됩니다.
+        엔트리 객체와 저장된 해시값을 그대로 사용하므로 해시를 다시 계산하지 않고,
+        외부에서 들고 있는 HashMapEntry 참조도 유효합니다.
+        
+        Args:
+            count: 옮길 (비어 있지 않은) 버킷 수
+            
+        Returns:
+            bool: 아직 옮길 버킷이 남아 있으면 True
+        """
+        if self._rehash_index < 0:
+            return False
+        if self._iterators > 0:
+            return True
+        
+        buckets = self._buckets
+        new_buckets = self._rehash_buckets
+        new_capacity = self._rehash_capacity
+        empty_visits = count * self.REHASH_EMPTY_VISITS
+        index = self._rehash_index
+        
+        while count > 0 and index < self._capacity:
+            bucket = buckets[index]
+            if bucket is None or bucket.is_empty():
+                buckets[index] = None
+                index += 1
+                empty_visits -= 1
+                if empty_visits == 0:
+                    break
+                continue
+            
             for entry in bucket:
-                self.put(entry.key, entry.value, entry.lru_node)
+                self._bucket_for(new_buckets, new_capacity, entry.hash_value).insert_back(entry)
+            buckets[index] = None
+            index += 1
+            count -= 1
+        
+        if index < self._capacity:
+            self._rehash_index = index
+            return True
+        
+        # 모두 옮겼으면 새 배열을 주 배열로 교체
+        self._buckets = new_buckets
+        self._capacity = new_capacity
+        self._rehash_buckets = None
+        self._rehash_capacity = 0
+        self._rehash_index = -1
+        return False
     
     def __len__(self):
         """len() 함수 지원"""
@@ -0,0 +1,208 @@
+"""
+Hash 값 객체 (작은 해시는 listpack, 큰 해시는 HashMap)
+
+Redis Hash처럼 필드 개수가 적고 필드/값이 짧은 동안에는 필드와 값을 번갈아 담은
+평평한 리스트 하나(listpack 인코딩)에 저장합니다.
+
+    [필드1, 값1, 필드2, 값2, ...]
+
+필드마다 엔트리 객체와 버킷 노드를 만들지 않으므로 키 하나당 메모리가 작고,
+필드 수가 작을 때는 list.index의 C 수준 선형 탐색이 해시 계산 + 체인 탐색보다 빠릅니다.
+필드 개수가 max_entries를 넘거나 필드/값 길이가 max_value를 넘으면 HashMap(hashtable 인코딩)으로
+한 번 변환하며, 필드를 지워 다시 작아져도 listpack으로 되돌리지 않습니다.
+
+필드 하나를 바꾸면 그 필드의 값만 교체하고 해시 전체를 다시 만들거나 복사하지 않으며,
+필드와 값 길이의 합(memory)도 증분으로 유지하여 MiniRedis가 키 하나의 값 크기로 사용합니다.
+"""
+
+from data_structures.hash_map import HashMap
+
+
+ENCODING_LISTPACK = "listpack"
+ENCODING_HASHTABLE = "hashtable"
+
+
+class HashObject:
+    """
+    Hash 타입 값
+
+    Attributes:
+        _listpack: [필드, 값, ...] 리스트 (hashtable 인코딩이면 None)
+        _table: 필드 -> 값 HashMap (listpack 인코딩이면 None)
+        memory: 필드와 값 문자열 길이의 합 (바이트 근사)
+    """
+
+    __slots__ = ("_listpack", "_table", "memory")
+
+    def __init__(self):
+        """
+        빈 해시 생성 (listpack 인코딩으로 시작)
+        """
+        self._listpack = []
+        self._table = None
+        self.memory = 0
+
+    def encoding(self):
+        """
+        내부 인코딩 (OBJECT ENCODING)
+
+        Returns:
+            str: "listpack" 또는 "hashtable"
+        """
+        return ENCODING_LISTPACK if self._table is None else ENCODING_HASHTABLE
+
+    def get(self, field):
+        """
+        필드 값 조회
+
+        Args:
+            field: 필드 이름
+
+        Returns:
+            str: 값, 필드가 없으면 None
+        """
+        if self._table is not None:
+            entry = self._table.get(field)
+            return entry.value if entry is not None else None
+        index = self._find(field)
+        return self._listpack[index + 1] if index >= 0 else None
+
+    def set(self, field, value, max_entries, max_value):
+        """
+        필드 값 저장 (있으면 값만 교체)
+
+        listpack 인코딩에서 필드 개수가 max_entries를 넘거나
+        필드 / 값 길이가 max_value를 넘게 되면 먼저 hashtable로 변환합니다.
+
+        Args:
+            field: 필드 이름
+            value: 값 문자열
+            max_entries: listpack으로 유지할 최대 필드 개수
+            max_value: listpack으로 유지할 최대 필드 / 값 길이
+
+        Returns:
+            bool: 새 필드면 True, 기존 필드를 갱신했으면 False
+        """
+        table = self._table
+        if table is None:
+            listpack = self._listpack
+            index = self._find(field)
+            if index >= 0:
+                if len(value) <= max_value:
+                    self.memory += len(value) - len(listpack[index + 1])
+                    listpack[index + 1] = value
+                    return False
+            elif len(listpack) < max_entries * 2 and len(field) <= max_value and len(value) <= max_value:
+                listpack.append(field)
+                listpack.append(value)
+                self.memory += len(field) + len(value)
+                return True
+            table = self._convert()
+
+        entry = table.get(field)
+        if entry is not None:
+            self.memory += len(value) - len(entry.value)
+            entry.value = value
+            return False
+        table.put(field, value)
+        self.memory += len(field) + len(value)
+        return True
+
+    def delete(self, field):
+        """
+        필드 삭제
+
+        Args:
+            field: 필드 이름
+
+        Returns:
+            bool: 삭제했으면 True, 필드가 없으면 False
+        """
+        if self._table is not None:
+            entry = self._table.remove(field)
+            if entry is None:
+                return False
+            self.memory -= len(entry.key) + len(entry.value)
+            return True
+
+        listpack = self._listpack
+        index = self._find(field)
+        if index < 0:
+            return False
+        self.memory -= len(field) + len(listpack[index + 1])
+        del listpack[index:index + 2]
+        return True
+
+    def items(self):
+        """
+        (필드, 값) 쌍 순회
+
+        Yields:
+            tuple: (필드, 값)
+        """
+        if self._table is not None:
+            for entry in self._table.entries():
+                yield entry.key, entry.value
+            return
+        fields = iter(self._listpack)
+        for field in fields:
+            yield field, next(fields)
+
+    def flat(self):
+        """
+        [필드, 값, ...] 리스트 (HGETALL, AOF 재작성, 스냅샷)
+
+        Returns:
+            list: 필드와 값을 번갈아 담은 새 리스트
+        """
+        if self._table is None:
+            return list(self._listpack)
+        result = []
+        for entry in self._table.entries():
+            result.append(entry.key)
+            result.append(entry.value)
+        return result
+
+    def _find(self, field):
+        """
+        listpack에서 필드 위치 찾기
+
+        list.index로 C 수준 탐색을 하되, 값 자리(홀수 인덱스)에서 일치하면 그다음부터 다시 찾습니다.
+
+        Args:
+            field: 필드 이름
+
+        Returns:
+            int: 필드의 인덱스 (짝수), 없으면 -1
+        """
+        listpack = self._listpack
+        start = 0
+        while True:
+            try:
+                index = listpack.index(field, start)
+            except ValueError:
+                return -1
+            if not index & 1:
+                return index
+            start = index + 1
+
+    def _convert(self):
+        """
+        listpack -> hashtable 변환
+
+        Returns:
+            HashMap: 새 필드 테이블
+        """
+        listpack = self._listpack
+        table = HashMap(len(listpack))
+        for i in range(0, len(listpack), 2):
+            table.put(listpack[i], listpack[i + 1])
+        self._table = table
+        self._listpack = None
+        return table
+
+    def __len__(self):
+        """len() 함수 지원 (필드 개수)"""
+        if self._table is not None:
+            return self._table.size()
+        return len(self._listpack) >> 1
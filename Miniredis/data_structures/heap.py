@@ -3,6 +3,9 @@
 
 이 모듈은 TTL 만료 시간 관리를 위한 최소 힙을 구현합니다.
 완전 이진 트리를 배열로 표현하며, 가장 작은 값(가장 빠른 만료 시간)이 항상 루트에 위치합니다.
+
+- MinHeap: 값만 저장하는 기본 최소 힙 (삽입/최소값 제거만 지원)
+- IndexedMinHeap: 핸들로 임의 요소의 우선순위 변경/삭제를 지원하는 인덱스 힙
 """
 
 
@@ -241,3 +244,233 @@ class MinHeap:
     def __len__(self):
         """len() 함수 지원"""
         return self._size
+
+
+class HeapHandle:
+    """
+    IndexedMinHeap 요소 핸들
+    
+    요소가 힙 배열의 몇 번째 위치에 있는지 기억하므로,
+    탐색 없이 바로 그 위치에서 우선순위를 바꾸거나 삭제할 수 있습니다.
+    
+    Attributes:
+        priority: 우선순위 (작을수록 루트에 가까움, 예: 만료 시각)
+        item: 저장된 데이터 (예: 키)
+        index: 힙 배열에서의 현재 위치 (힙에 없으면 -1)
+    """
+    
+    __slots__ = ("priority", "item", "index")
+    
+    def __init__(self, priority, item):
+        """
+        핸들 초기화
+        
+        Args:
+            priority: 우선순위
+            item: 저장할 데이터
+        """
+        self.priority = priority
+        self.item = item
+        self.index = -1
+
+
+class IndexedMinHeap:
+    """
+    인덱스 최소 힙 클래스 (배열 기반)
+    
+    push()가 반환한 핸들로 update()/remove()를 O(log n)에 수행합니다.
+    TTL 갱신/삭제 시 이전 항목을 힙에 남겨두지 않으므로 힙 크기가 항상 살아 있는 요소 수와 같습니다.
+    
+    Attributes:
+        _data: HeapHandle 배열
+        _size: 현재 힙에 저장된 요소 개수
+        _capacity: 배열의 현재 용량
+    """
+    
+    INITIAL_CAPACITY = 16
+    
+    def __init__(self):
+        """
+        인덱스 최소 힙 초기화
+        """
+        self._capacity = self.INITIAL_CAPACITY
+        self._data = [None] * self._capacity
+        self._size = 0
+    
+    def push(self, priority, item):
+        """
+        요소 삽입
+        
+        시간 복잡도: O(log n)
+        
+        Args:
+            priority: 우선순위
+            item: 저장할 데이터
+        
+        Returns:
+            HeapHandle: 이후 update/remove에 사용할 핸들
+        """
+        if self._size >= self._capacity:
+            self._resize()
+        
+        handle = HeapHandle(priority, item)
+        handle.index = self._size
+        self._data[self._size] = handle
+        self._size += 1
+        self._sift_up(handle.index)
+        return handle
+    
+    def update(self, handle, priority):
+        """
+        요소의 우선순위 변경 (decrease-key / increase-key)
+        
+        시간 복잡도: O(log n)
+        
+        Args:
+            handle: push()가 반환한 핸들
+            priority: 새 우선순위
+        """
+        old_priority = handle.priority
+        handle.priority = priority
+        if priority < old_priority:
+            self._sift_up(handle.index)
+        elif priority > old_priority:
+            self._sift_down(handle.index)
+    
+    def remove(self, handle):
+        """
+        임의 요소 삭제
+        
+        마지막 요소를 삭제 위치로 옮긴 뒤 위 또는 아래로 자리를 찾아 줍니다.
+        시간 복잡도: O(log n)
+        
+        Args:
+            handle: push()가 반환한 핸들
+        
+        Returns:
+            bool: 삭제했으면 True (이미 힙에 없는 핸들이면 False)
+        """
+        index = handle.index
+        if index < 0:
+            return False
+        
+        self._size -= 1
+        last = self._data[self._size]
+        self._data[self._size] = None  # 참조 해제
+        handle.index = -1
+        
+        if index < self._size:
+            self._data[index] = last
+            last.index = index
+            if index > 0 and last.priority < self._data[(index - 1) // 2].priority:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        return True
+    
+    def pop(self):
+        """
+        최소 우선순위 요소 제거 및 반환
+        
+        시간 복잡도: O(log n)
+        
+        Returns:
+            HeapHandle: 최소 요소 핸들, 힙이 비어있으면 None
+        """
+        if self._size == 0:
+            return None
+        handle = self._data[0]
+        self.remove(handle)
+        return handle
+    
+    def peek(self):
+        """
+        최소 우선순위 요소 조회 (제거하지 않음)
+        
+        시간 복잡도: O(1)
+        
+        Returns:
+            HeapHandle: 최소 요소 핸들, 힙이 비어있으면 None
+        """
+        if self._size == 0:
+            return None
+        return self._data[0]
+    
+    def size(self):
+        """
+        힙의 요소 개수 반환
+        
+        Returns:
+            int: 요소 개수
+        """
+        return self._size
+    
+    def is_empty(self):
+        """
+        힙이 비어있는지 확인
+        
+        Returns:
+            bool: 비어있으면 True
+        """
+        return self._size == 0
+    
+    def __len__(self):
+        """len() 함수 지원"""
+        return self._size
+    
+    def _resize(self):
+        """
+        배열 용량 2배 확장
+        """
+        self._capacity *= 2
+        new_data = [None] * self._capacity
+        for i in range(self._size):
+            new_data[i] = self._data[i]
+        self._data = new_data
+    
+    def _sift_up(self, index):
+        """
+        상향 힙화 (핸들의 index 필드를 함께 갱신)
+        
+        Args:
+            index: 시작 인덱스
+        """
+        data = self._data
+        handle = data[index]
+        priority = handle.priority
+        while index > 0:
+            parent_idx = (index - 1) // 2
+            parent = data[parent_idx]
+            if priority >= parent.priority:
+                break
+            data[index] = parent
+            parent.index = index
+            index = parent_idx
+        data[index] = handle
+        handle.index = index
+    
+    def _sift_down(self, index):
+        """
+        하향 힙화 (핸들의 index 필드를 함께 갱신)
+        
+        Args:
+            index: 시작 인덱스
+        """
+        data = self._data
+        size = self._size
+        handle = data[index]
+        priority = handle.priority
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and data[right].priority < data[child].priority:
+                child = right
+            if data[child].priority >= priority:
+                break
+            data[index] = data[child]
+            data[index].index = index
+            index = child
+        data[index] = handle
+        handle.index = index
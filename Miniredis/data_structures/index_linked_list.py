@@ -0,0 +1,243 @@
+"""
+인덱스 연결 리스트 (Index-Linked List) 구현 - 배열 기반
+
+이 모듈은 LRU 추적용 이중 연결 리스트를 노드 객체 없이 구현합니다.
+prev/next 포인터 대신 미리 할당한 array('l') 버퍼의 정수 슬롯 번호로 연결하며,
+노드 참조 자리에는 슬롯 번호(int)를 돌려줍니다.
+
+    _prev: array('l')  슬롯별 이전 슬롯 번호
+    _next: array('l')  슬롯별 다음 슬롯 번호 (빈 슬롯은 free list 연결에 사용)
+    _data: list        슬롯별 데이터 (키)
+
+슬롯 0은 head/tail을 겸하는 더미(원형 리스트)이므로 실제 노드 번호는 1 이상이고,
+엔트리의 lru_node 진리값 검사(if entry.lru_node:)를 DoublyLinkedList와 똑같이 쓸 수 있습니다.
+삭제된 슬롯은 free list에 넣었다가 다음 삽입에서 재사용합니다.
+"""
+
+from array import array
+
+
+class IndexLinkedList:
+    """
+    배열 기반 이중 연결 리스트 클래스 (DoublyLinkedList와 같은 LRU API)
+
+    맨 앞(_next[0])은 가장 최근에 접근한 항목, 맨 뒤(_prev[0])는 가장 오래된 항목입니다.
+
+    Attributes:
+        _prev: 이전 슬롯 번호 배열
+        _next: 다음 슬롯 번호 배열
+        _data: 슬롯별 데이터 배열
+        _free: free list의 첫 슬롯 번호 (없으면 0)
+        _capacity: 할당된 슬롯 개수 (더미 슬롯 포함)
+        _size: 리스트에 저장된 실제 노드 개수
+    """
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, capacity=None):
+        """
+        인덱스 연결 리스트 초기화
+
+        Args:
+            capacity: 미리 할당할 노드 개수 (기본값: 16)
+        """
+        self._prev = array('l', [0])
+        self._next = array('l', [0])
+        self._data = [None]
+        self._free = 0
+        self._capacity = 1
+        self._size = 0
+        self._grow(capacity if capacity else self.INITIAL_CAPACITY)
+
+    def _grow(self, count):
+        """
+        슬롯 count개를 추가 할당하여 free list에 연결
+
+        Args:
+            count: 추가할 슬롯 개수
+        """
+        start = self._capacity
+        end = start + count
+        self._prev.extend(array('l', [0]) * count)
+        # 새 슬롯끼리 next로 연결하고 마지막 슬롯이 기존 free list를 가리키도록 함
+        self._next.extend(array('l', range(start + 1, end + 1)))
+        self._next[end - 1] = self._free
+        self._data.extend([None] * count)
+        self._free = start
+        self._capacity = end
+
+    def _alloc(self, data):
+        """
+        free list에서 슬롯 하나를 꺼내 데이터 저장 (없으면 2배로 확장)
+
+        Args:
+            data: 저장할 데이터
+
+        Returns:
+            int: 슬롯 번호
+        """
+        if self._free == 0:
+            self._grow(self._capacity)
+        slot = self._free
+        self._free = self._next[slot]
+        self._data[slot] = data
+        return slot
+
+    def _link_after(self, slot, after):
+        """
+        slot을 after 바로 뒤에 연결
+
+        Args:
+            slot: 연결할 슬롯
+            after: 기준 슬롯 (0이면 맨 앞)
+        """
+        prev = self._prev
+        nxt = self._next
+        following = nxt[after]
+        prev[slot] = after
+        nxt[slot] = following
+        prev[following] = slot
+        nxt[after] = slot
+
+    def _unlink(self, slot):
+        """
+        slot을 리스트에서 분리 (슬롯은 해제하지 않음)
+
+        Args:
+            slot: 분리할 슬롯
+        """
+        prev = self._prev
+        nxt = self._next
+        before = prev[slot]
+        after = nxt[slot]
+        nxt[before] = after
+        prev[after] = before
+
+    def insert_front(self, data):
+        """
+        리스트의 맨 앞에 새 노드 삽입
+
+        시간 복잡도: O(1) (확장 시 분할 상환 O(1))
+
+        Args:
+            data: 삽입할 데이터
+
+        Returns:
+            int: 새 노드의 슬롯 번호
+        """
+        slot = self._alloc(data)
+        self._link_after(slot, 0)
+        self._size += 1
+        return slot
+
+    def insert_back(self, data):
+        """
+        리스트의 맨 뒤에 새 노드 삽입
+
+        시간 복잡도: O(1) (확장 시 분할 상환 O(1))
+
+        Args:
+            data: 삽입할 데이터
+
+        Returns:
+            int: 새 노드의 슬롯 번호
+        """
+        slot = self._alloc(data)
+        self._link_after(slot, self._prev[0])
+        self._size += 1
+        return slot
+
+    def remove_node(self, slot):
+        """
+        특정 노드를 리스트에서 제거하고 슬롯을 free list에 반환
+
+        시간 복잡도: O(1)
+
+        Args:
+            slot: 제거할 노드의 슬롯 번호
+
+        Returns:
+            data: 제거된 노드의 데이터
+        """
+        if not slot:
+            return None
+
+        self._unlink(slot)
+        data = self._data[slot]
+        self._data[slot] = None
+        self._prev[slot] = 0
+        self._next[slot] = self._free
+        self._free = slot
+        self._size -= 1
+        return data
+
+    def remove_back(self):
+        """
+        리스트의 맨 뒤 노드 제거
+
+        Returns:
+            data: 제거된 노드의 데이터, 리스트가 비어있으면 None
+        """
+        if self._size == 0:
+            return None
+        return self.remove_node(self._prev[0])
+
+    def move_to_front(self, slot):
+        """
+        특정 노드를 리스트의 맨 앞으로 이동
+
+        시간 복잡도: O(1)
+
+        Args:
+            slot: 이동할 노드의 슬롯 번호
+        """
+        if not slot or self._next[0] == slot:
+            return
+        self._unlink(slot)
+        self._link_after(slot, 0)
+
+    def peek_back(self):
+        """
+        리스트의 맨 뒤 데이터 반환 (제거하지 않음)
+
+        Returns:
+            data: 맨 뒤 노드의 데이터, 리스트가 비어있으면 None
+        """
+        if self._size == 0:
+            return None
+        return self._data[self._prev[0]]
+
+    def is_empty(self):
+        """
+        리스트가 비어있는지 확인
+
+        Returns:
+            bool: 비어있으면 True
+        """
+        return self._size == 0
+
+    def size(self):
+        """
+        리스트의 노드 개수 반환
+
+        Returns:
+            int: 노드 개수
+        """
+        return self._size
+
+    def __len__(self):
+        """len() 함수 지원"""
+        return self._size
+
+    def __iter__(self):
+        """
+        이터레이터 지원 (맨 앞에서 맨 뒤 방향)
+
+        Yields:
+            data: 각 노드의 데이터
+        """
+        nxt = self._next
+        slot = nxt[0]
+        while slot != 0:
+            yield self._data[slot]
+            slot = nxt[slot]
@@ -0,0 +1,470 @@
+"""
+해시맵 (HashMap) 구현 - 오픈 어드레싱 방식
+
+이 모듈은 선형 탐사(linear probing)와 삭제 표시(tombstone)를 사용하는 해시맵을 구현합니다.
+체이닝 방식 HashMap과 같은 API(put/get/remove/entries/sample_entries ...)를 제공하며,
+버킷마다 연결 리스트와 노드를 만드는 대신 슬롯 배열 세 개에 나란히 저장합니다.
+
+    _hashes:  array('q')  슬롯별 해시값 (EMPTY / DELETED 표시 포함)
+    _keys:    list        슬롯별 키
+    _entries: list        슬롯별 HashMapEntry (값 + LRU/LFU 메타데이터)
+
+키 하나당 추가 객체는 HashMapEntry 하나뿐이며, 조회는 포인터를 따라가지 않고
+연속된 슬롯을 해시값부터 비교하며 훑습니다.
+"""
+
+import random
+import time
+from array import array
+
+from data_structures.hash_map import HashMapEntry, HASH_MASK, _reverse_increment
+
+
+class OpenAddressingHashMap:
+    """
+    오픈 어드레싱(선형 탐사) 해시맵 클래스
+
+    용량은 항상 2의 거듭제곱이며 슬롯 번호는 hash & (capacity - 1)입니다.
+    삭제된 슬롯은 DELETED로 표시해 탐사가 끊기지 않도록 하고, 새 키는 탐사 중 처음 만난 삭제 표시 슬롯을 재사용합니다.
+    새 키가 빈 슬롯을 차지해 (키 개수 + 삭제 표시) 비율이 0.75를 넘게 되면 재구성합니다.
+    삭제 표시가 용량의 1/4 이상이면 같은 용량으로 표시만 정리하고, 아니면 2배로 확장합니다.
+    기존 키의 값 갱신과 삭제 표시 슬롯 재사용은 재구성을 일으키지 않습니다.
+    키 개수가 용량의 1/8 아래로 줄면 절반으로 축소합니다.
+
+    Attributes:
+        _capacity: 슬롯 개수 (2의 거듭제곱)
+        _mask: capacity - 1
+        _size: 저장된 키-값 쌍의 개수
+        _deleted: 삭제 표시된 슬롯 개수
+        _hashes: 슬롯별 해시값 배열
+        _keys: 슬롯별 키 배열
+        _entries: 슬롯별 엔트리 배열
+        resize_listener: 재구성 시간(ns)을 받는 콜백 (기본값: None)
+    """
+
+    INITIAL_CAPACITY = 16
+    LOAD_FACTOR_THRESHOLD = 0.75
+    MIN_FILL_RATIO = 8   # size * 8 < capacity 이면 축소
+    COMPACT_RATIO = 4    # deleted * 4 >= capacity 이면 확장 대신 같은 용량으로 정리
+
+    EMPTY = -1
+    DELETED = -2
+
+    def __init__(self, capacity=None):
+        """
+        해시맵 초기화
+
+        Args:
+            capacity: 초기 슬롯 개수 (2의 거듭제곱으로 올림, 기본값: 16)
+        """
+        self._size = 0
+        self._deleted = 0
+        self._allocate(self._round_capacity(capacity or self.INITIAL_CAPACITY))
+        self.resize_listener = None
+
+    def _round_capacity(self, capacity):
+        """
+        capacity 이상인 가장 작은 2의 거듭제곱 반환 (최소 INITIAL_CAPACITY)
+
+        Args:
+            capacity: 요청 용량
+
+        Returns:
+            int: 실제 용량
+        """
+        result = self.INITIAL_CAPACITY
+        while result < capacity:
+            result *= 2
+        return result
+
+    def _allocate(self, capacity):
+        """
+        빈 슬롯 배열 할당
+
+        Args:
+            capacity: 슬롯 개수
+        """
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._hashes = array('q', [self.EMPTY]) * capacity
+        self._keys = [None] * capacity
+        self._entries = [None] * capacity
+
+    def _hash(self, key):
+        """
+        해시 함수 - 키를 63비트 해시값으로 변환 (슬롯 번호는 & mask)
+
+        체이닝 HashMap과 같이 인터프리터의 hash() (문자열은 시드가 있는 SipHash)를 사용합니다.
+        해시값은 슬롯에 저장해 두므로 재구성 시 다시 계산하지 않습니다.
+
+        Args:
+            key: 해시할 키 (문자열)
+
+        Returns:
+            int: 0 이상의 해시값
+        """
+        return hash(key) & HASH_MASK
+
+    def _find_slot(self, key, hash_value):
+        """
+        키가 들어 있는 슬롯 탐색
+
+        Args:
+            key: 찾을 키
+            hash_value: 키의 해시값
+
+        Returns:
+            int: 슬롯 번호, 없으면 -1
+        """
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._mask
+        index = hash_value & mask
+
+        while True:
+            stored = hashes[index]
+            if stored == self.EMPTY:
+                return -1
+            if stored == hash_value and keys[index] == key:
+                return index
+            index = (index + 1) & mask
+
+    def put(self, key, value, lru_node=None):
+        """
+        키-값 쌍 저장
+
+        이미 존재하는 키면 값을 업데이트합니다.
+        키를 먼저 탐사하므로 갱신과 삭제 표시 슬롯 재사용은 재구성 없이 끝나고,
+        빈 슬롯을 새로 차지할 때만 로드 팩터를 확인합니다.
+        시간 복잡도: 평균 O(1), 최악 O(n)
+
+        Args:
+            key: 키
+            value: 값
+            lru_node: LRU 리스트 노드 참조 (옵션)
+
+        Returns:
+            HashMapEntry: 저장/업데이트된 엔트리
+        """
+        hash_value = self._hash(key)
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._mask
+        index = hash_value & mask
+        free = -1
+
+        while True:
+            stored = hashes[index]
+            if stored == self.EMPTY:
+                break
+            if stored == self.DELETED:
+                if free < 0:
+                    free = index
+            elif stored == hash_value and keys[index] == key:
+                entry = self._entries[index]
+                entry.value = value
+                if lru_node is not None:
+                    entry.lru_node = lru_node
+                return entry
+            index = (index + 1) & mask
+
+        # 새 엔트리 추가 (지나온 삭제 표시 슬롯이 있으면 재사용)
+        if free >= 0:
+            index = free
+            self._deleted -= 1
+        elif (self._size + self._deleted + 1) > self._capacity * self.LOAD_FACTOR_THRESHOLD:
+            # 재구성된 배열에는 삭제 표시가 없으므로 홈 슬롯부터 첫 빈 슬롯에 넣음
+            self._rebuild_for(self._size + 1)
+            hashes = self._hashes
+            keys = self._keys
+            mask = self._mask
+            index = hash_value & mask
+            while hashes[index] != self.EMPTY:
+                index = (index + 1) & mask
+
+        entry = HashMapEntry(key, value, lru_node, hash_value)
+        hashes[index] = hash_value
+        keys[index] = key
+        self._entries[index] = entry
+        self._size += 1
+
+        return entry
+
+    def get(self, key):
+        """
+        키로 값 조회
+
+        시간 복잡도: 평균 O(1), 최악 O(n)
+
+        Args:
+            key: 조회할 키
+
+        Returns:
+            HashMapEntry: 찾은 엔트리, 없으면 None
+        """
+        index = self._find_slot(key, self._hash(key))
+        if index < 0:
+            return None
+        return self._entries[index]
+
+    def remove(self, key):
+        """
+        키-값 쌍 삭제 (슬롯은 삭제 표시로 남김)
+
+        시간 복잡도: 평균 O(1), 최악 O(n)
+
+        Args:
+            key: 삭제할 키
+
+        Returns:
+            HashMapEntry: 삭제된 엔트리, 없으면 None
+        """
+        index = self._find_slot(key, self._hash(key))
+        if index < 0:
+            return None
+
+        entry = self._entries[index]
+        self._hashes[index] = self.DELETED
+        self._keys[index] = None
+        self._entries[index] = None
+        self._size -= 1
+        self._deleted += 1
+
+        # 키가 크게 줄었으면 축소 (삭제 표시도 함께 정리됨)
+        if self._capacity > self.INITIAL_CAPACITY and self._size * self.MIN_FILL_RATIO < self._capacity:
+            self._rebuild(self._capacity // 2)
+
+        return entry
+
+    def contains(self, key):
+        """
+        키 존재 여부 확인
+
+        Args:
+            key: 확인할 키
+
+        Returns:
+            bool: 존재하면 True
+        """
+        return self._find_slot(key, self._hash(key)) >= 0
+
+    def keys(self):
+        """
+        모든 키 반환
+
+        Returns:
+            generator: 모든 키를 yield
+        """
+        for entry in self._entries:
+            if entry is not None:
+                yield entry.key
+
+    def values(self):
+        """
+        모든 값 반환
+
+        Returns:
+            generator: 모든 값을 yield
+        """
+        for entry in self._entries:
+            if entry is not None:
+                yield entry.value
+
+    def entries(self):
+        """
+        모든 엔트리 반환
+
+        Returns:
+            generator: 모든 엔트리를 yield
+        """
+        for entry in self._entries:
+            if entry is not None:
+                yield entry
+
+    def random_entry(self):
+        """
+        임의의 엔트리 하나 반환
+
+        채워진 슬롯을 만날 때까지 임의의 슬롯을 고릅니다.
+        축소 규칙 덕분에 채워진 슬롯 비율은 1/8 이상으로 유지됩니다.
+
+        Returns:
+            HashMapEntry: 임의의 엔트리, 비어 있으면 None
+        """
+        if self._size == 0:
+            return None
+
+        entries = self._entries
+        while True:
+            entry = entries[random.randrange(self._capacity)]
+            if entry is not None:
+                return entry
+
+    def sample_entries(self, count):
+        """
+        임의의 위치에서 시작해 연속된 슬롯의 엔트리를 최대 count개 수집
+
+        체이닝 HashMap.sample_entries와 같이 탐색 슬롯 수를 count * 10으로 제한합니다.
+
+        Args:
+            count: 최대 표본 개수
+
+        Returns:
+            list: 표본 엔트리 리스트 (중복 없음)
+        """
+        samples = []
+        if self._size == 0:
+            return samples
+
+        if count > self._size:
+            count = self._size
+
+        entries = self._entries
+        mask = self._mask
+        index = random.randrange(self._capacity)
+        max_steps = count * 10
+        while len(samples) < count and max_steps > 0:
+            entry = entries[index]
+            if entry is not None:
+                samples.append(entry)
+            index = (index + 1) & mask
+            max_steps -= 1
+
+        return samples
+
+    def scan(self, cursor, count=10):
+        """
+        커서 기반 순회 - HashMap.scan과 같은 역방향 비트 커서
+
+        슬롯 번호 대신 홈 슬롯(hash & mask)을 논리적인 버킷으로 봅니다.
+        선형 탐사에서는 홈 슬롯이 c인 엔트리가 모두 c부터 다음 EMPTY 슬롯 사이에 있으므로
+        (삭제는 DELETED 표시라 구간이 끊기지 않음), 그 구간에서 홈 슬롯이 c인 엔트리만 모읍니다.
+        용량이 2의 거듭제곱이라 재구성으로 용량이 바뀌어도 체이닝 방식과 같이 빠짐없이 순회됩니다.
+
+        Args:
+            cursor: 이전 호출이 반환한 커서 (처음은 0)
+            count: 모을 엔트리 개수 목표 (근사값)
+
+        Returns:
+            tuple: (다음 커서, 엔트리 리스트), 다음 커서가 0이면 순회 완료
+        """
+        entries = []
+        if self._size == 0:
+            return 0, entries
+
+        hashes = self._hashes
+        slots = self._entries
+        mask = self._mask
+        visits = count * 10
+        while True:
+            home = cursor & mask
+            index = home
+            while hashes[index] != self.EMPTY:
+                if slots[index] is not None and hashes[index] & mask == home:
+                    entries.append(slots[index])
+                index = (index + 1) & mask
+            cursor = _reverse_increment(cursor, mask)
+
+            visits -= 1
+            if cursor == 0 or len(entries) >= count or visits <= 0:
+                return cursor, entries
+
+    def size(self):
+        """
+        저장된 키-값 쌍 개수 반환
+
+        Returns:
+            int: 개수
+        """
+        return self._size
+
+    def capacity(self):
+        """
+        슬롯 개수 반환
+
+        Returns:
+            int: 슬롯 개수
+        """
+        return self._capacity
+
+    def is_rehashing(self):
+        """
+        점진적 재해싱 진행 여부 (HashMap과 같은 API, 재구성은 한 번에 끝나므로 항상 False)
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    def rehash_milliseconds(self, ms):
+        """
+        유휴 시간 재해싱 (HashMap과 같은 API, 옮길 버킷이 없으므로 아무 일도 하지 않음)
+
+        Args:
+            ms: 최대 실행 시간 (밀리초)
+
+        Returns:
+            int: 0
+        """
+        return 0
+
+    def _rebuild_for(self, size):
+        """
+        size개의 키가 임계값 아래로 들어가도록 재구성
+
+        삭제 표시가 용량의 1/COMPACT_RATIO 이상이면 같은 용량으로 다시 채워 표시만 정리하고
+        (다음 재구성까지 최소 capacity / 4번의 삽입이 남음), 아니면 2배씩 확장합니다.
+        그래서 삭제와 삽입이 반복되는 상태에서도 재구성 비용이 삽입마다 분할 상환 O(1)입니다.
+
+        Args:
+            size: 재구성 후 담을 키 개수
+        """
+        capacity = self._capacity
+        if self._deleted * self.COMPACT_RATIO < capacity or size > capacity * self.LOAD_FACTOR_THRESHOLD:
+            capacity *= 2
+            while size > capacity * self.LOAD_FACTOR_THRESHOLD:
+                capacity *= 2
+        self._rebuild(capacity)
+
+    def _rebuild(self, capacity):
+        """
+        새 용량의 슬롯 배열로 모든 엔트리 재배치
+
+        저장된 해시값과 엔트리 객체를 그대로 옮기므로 해시를 다시 계산하지 않고,
+        외부에서 들고 있는 HashMapEntry 참조도 유효하게 유지됩니다.
+
+        Args:
+            capacity: 새 슬롯 개수 (2의 거듭제곱)
+        """
+        listener = self.resize_listener
+        start = time.perf_counter_ns() if listener is not None else 0
+        old_hashes = self._hashes
+        old_entries = self._entries
+        self._allocate(capacity)
+        self._deleted = 0
+
+        hashes = self._hashes
+        keys = self._keys
+        entries = self._entries
+        mask = self._mask
+        for i in range(len(old_entries)):
+            entry = old_entries[i]
+            if entry is None:
+                continue
+            hash_value = old_hashes[i]
+            index = hash_value & mask
+            while hashes[index] != self.EMPTY:
+                index = (index + 1) & mask
+            hashes[index] = hash_value
+            keys[index] = entry.key
+            entries[index] = entry
+        if listener is not None:
+            listener(time.perf_counter_ns() - start)
+
+    def __len__(self):
+        """len() 함수 지원"""
+        return self._size
+
+    def __contains__(self, key):
+        """in 연산자 지원"""
+        return self.contains(key)
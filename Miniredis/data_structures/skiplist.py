@@ -0,0 +1,279 @@
+"""
+정렬된 키 스킵 리스트 (Skip List) 구현
+
+이 모듈은 문자열 키를 정렬된 순서로 유지하는 스킵 리스트를 구현합니다.
+Redis Sorted Set(zskiplist)과 같이 노드마다 임의의 높이를 주고, 포인터마다 건너뛰는
+노드 수(span)를 함께 저장하여 키의 순위(rank)를 O(log n)에 계산합니다.
+
+    접두사가 prefix인 키 = [prefix, prefix의 다음 문자열) 범위의 키
+
+이므로 접두사 조회는 범위 시작 위치를 찾는 O(log n) + 결과 개수 k에 비례하는 순회이고,
+접두사 개수는 두 경계의 순위 차이로 O(log n)에 구합니다.
+MiniRedis(prefix_index=True)가 키스페이스의 보조 인덱스로 사용합니다 (SCAN MATCH prefix*, DELPREFIX ...).
+"""
+
+import random
+
+
+SKIPLIST_MAXLEVEL = 32
+SKIPLIST_P = 0.25
+
+# 파이썬 문자열에서 가장 큰 코드 포인트
+MAX_CODE_POINT = 0x10FFFF
+
+
+class SkipListNode:
+    """
+    스킵 리스트 노드
+
+    Attributes:
+        key: 키 (헤더 노드는 None)
+        forward: 레벨별 다음 노드
+        span: 레벨별 forward 포인터가 건너뛰는 노드 수 (순위 계산용)
+    """
+
+    __slots__ = ("key", "forward", "span")
+
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * level
+        self.span = [0] * level
+
+
+class SkipList:
+    """
+    정렬된 키 집합 (중복 없음)
+
+    Attributes:
+        _header: 키가 없는 시작 노드 (최대 레벨)
+        _level: 현재 가장 높은 노드의 레벨
+        _size: 저장된 키 개수
+    """
+
+    def __init__(self):
+        """
+        빈 스킵 리스트 생성
+        """
+        self._header = SkipListNode(None, SKIPLIST_MAXLEVEL)
+        self._level = 1
+        self._size = 0
+
+    def _random_level(self):
+        """
+        새 노드의 레벨 (레벨 k 이상일 확률 P^(k-1))
+
+        Returns:
+            int: 1 ~ SKIPLIST_MAXLEVEL
+        """
+        level = 1
+        while level < SKIPLIST_MAXLEVEL and random.random() < SKIPLIST_P:
+            level += 1
+        return level
+
+    def insert(self, key):
+        """
+        키 추가 (이미 있는 키는 호출자가 거름)
+
+        시간 복잡도: 평균 O(log n)
+
+        Args:
+            key: 추가할 키
+        """
+        # 레벨별로 새 노드 바로 앞에 올 노드(update)와 그 노드의 순위(rank)
+        level = self._random_level()
+        top = max(level, self._level)
+        header = self._header
+        update = [header] * top
+        rank = [0] * top
+        x = header
+        r = 0
+        for i in range(self._level - 1, -1, -1):
+            forward = x.forward[i]
+            while forward is not None and forward.key < key:
+                r += x.span[i]
+                x = forward
+                forward = x.forward[i]
+            update[i] = x
+            rank[i] = r
+
+        if level > self._level:
+            for i in range(self._level, level):
+                header.span[i] = self._size
+            self._level = level
+
+        node = SkipListNode(key, level)
+        forward = node.forward
+        span = node.span
+        for i in range(level):
+            prev = update[i]
+            forward[i] = prev.forward[i]
+            prev.forward[i] = node
+            span[i] = prev.span[i] - (r - rank[i])
+            prev.span[i] = r - rank[i] + 1
+
+        # 새 노드보다 높은 레벨의 포인터는 새 노드 하나를 더 건너뜀
+        for i in range(level, top):
+            update[i].span[i] += 1
+        self._size += 1
+
+    def remove(self, key):
+        """
+        키 제거
+
+        시간 복잡도: 평균 O(log n)
+
+        Args:
+            key: 제거할 키
+
+        Returns:
+            bool: 제거했으면 True, 없으면 False
+        """
+        update = [None] * SKIPLIST_MAXLEVEL
+        x = self._header
+        for i in range(self._level - 1, -1, -1):
+            while x.forward[i] is not None and x.forward[i].key < key:
+                x = x.forward[i]
+            update[i] = x
+
+        x = x.forward[0]
+        if x is None or x.key != key:
+            return False
+
+        for i in range(self._level):
+            if update[i].forward[i] is x:
+                update[i].span[i] += x.span[i] - 1
+                update[i].forward[i] = x.forward[i]
+            else:
+                update[i].span[i] -= 1
+        while self._level > 1 and self._header.forward[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        return True
+
+    def rank(self, key):
+        """
+        key보다 작은 키의 개수 (key 이상인 첫 키의 0부터 시작하는 순위)
+
+        시간 복잡도: 평균 O(log n)
+
+        Args:
+            key: 기준 키
+
+        Returns:
+            int: 순위
+        """
+        x = self._header
+        rank = 0
+        for i in range(self._level - 1, -1, -1):
+            while x.forward[i] is not None and x.forward[i].key < key:
+                rank += x.span[i]
+                x = x.forward[i]
+        return rank
+
+    def _first_node(self, start, inclusive):
+        """
+        start 이상(inclusive) 또는 초과인 첫 노드
+
+        Args:
+            start: 기준 키 (None이면 첫 노드)
+            inclusive: start와 같은 키를 포함할지 여부
+
+        Returns:
+            SkipListNode: 노드, 없으면 None
+        """
+        x = self._header
+        if start is None:
+            return x.forward[0]
+        for i in range(self._level - 1, -1, -1):
+            while x.forward[i] is not None and (x.forward[i].key < start
+                                                or (not inclusive and x.forward[i].key == start)):
+                x = x.forward[i]
+        return x.forward[0]
+
+    def iter_range(self, start=None, end=None, inclusive=True):
+        """
+        [start, end) 범위의 키를 정렬 순서로 반환
+
+        시간 복잡도: O(log n + k) (k = 반환한 키 개수)
+        순회 중에는 키를 추가/제거하지 마세요.
+
+        Args:
+            start: 시작 키 (None이면 처음부터)
+            end: 끝 키, 포함하지 않음 (None이면 끝까지)
+            inclusive: False이면 start와 같은 키를 제외 (start 다음부터 이어서 순회할 때)
+
+        Yields:
+            str: 키
+        """
+        x = self._first_node(start, inclusive)
+        while x is not None and (end is None or x.key < end):
+            yield x.key
+            x = x.forward[0]
+
+    def iter_prefix(self, prefix, after=None):
+        """
+        prefix로 시작하는 키를 정렬 순서로 반환
+
+        Args:
+            prefix: 접두사
+            after: 이 키 다음부터 반환 (이전 순회를 이어갈 때, None이면 처음부터)
+
+        Yields:
+            str: 키
+        """
+        if after is not None and after >= prefix:
+            return self.iter_range(after, prefix_end(prefix), inclusive=False)
+        return self.iter_range(prefix, prefix_end(prefix))
+
+    def count_prefix(self, prefix):
+        """
+        prefix로 시작하는 키의 개수
+
+        시간 복잡도: 평균 O(log n) (키를 순회하지 않고 두 경계의 순위 차이로 계산)
+
+        Args:
+            prefix: 접두사
+
+        Returns:
+            int: 키 개수
+        """
+        end = prefix_end(prefix)
+        upper = self._size if end is None else self.rank(end)
+        return upper - self.rank(prefix)
+
+    def size(self):
+        """
+        저장된 키 개수 반환
+
+        Returns:
+            int: 개수
+        """
+        return self._size
+
+    def __len__(self):
+        """len() 함수 지원"""
+        return self._size
+
+    def __iter__(self):
+        """모든 키를 정렬 순서로 순회"""
+        return self.iter_range()
+
+
+def prefix_end(prefix):
+    """
+    prefix로 시작하는 모든 문자열보다 큰 가장 작은 문자열
+
+    마지막 문자의 코드 포인트를 1 올립니다 (최대 코드 포인트면 그 문자를 버리고 앞 문자에서 반복).
+
+    Args:
+        prefix: 접두사
+
+    Returns:
+        str: 범위의 끝 (포함하지 않음), 상한이 없으면 None
+    """
+    while prefix:
+        last = ord(prefix[-1])
+        if last < MAX_CODE_POINT:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
@@ -0,0 +1,302 @@
+"""
+계층형 타이밍 휠 (Hierarchical Timing Wheel) 구현
+
+이 모듈은 TTL 만료 시각을 관리하는 계층형 타이밍 휠을 구현합니다.
+1틱 = 1밀리초이며, 레벨마다 64개의 슬롯(6비트)을 가집니다.
+
+    레벨 0: 1ms   슬롯 x 64 (64ms 범위)
+    레벨 1: 64ms  슬롯 x 64 (약 4초 범위)
+    레벨 2: 4초   슬롯 x 64 (약 4분 범위)
+    ...
+    레벨 7: 최대 약 8900년
+
+타이머는 남은 시간에 맞는 레벨의 슬롯(이중 연결 리스트)에 들어가고,
+상위 레벨 슬롯은 시간이 그 구간에 도달하면 하위 레벨로 다시 나뉘어(cascade) 들어갑니다.
+등록/취소는 슬롯 리스트에 노드를 넣고 빼는 O(1) 연산이며,
+휠이 차지하는 메모리는 등록된 타이머 수에 비례합니다 (취소된 타이머는 즉시 사라짐).
+"""
+
+from data_structures.doubly_linked_list import DoublyLinkedList
+from data_structures.hash_map import HashMap
+
+
+class Timer:
+    """
+    타이머 하나 (슬롯 리스트 노드의 data)
+
+    Attributes:
+        key: 만료될 키
+        expire: 만료 시각 (틱 = Unix epoch 밀리초)
+        level: 현재 들어 있는 레벨
+        slot: 현재 들어 있는 슬롯 번호
+        node: 슬롯 리스트에서의 노드 참조
+    """
+
+    __slots__ = ("key", "expire", "level", "slot", "node")
+
+    def __init__(self, key, expire):
+        """
+        타이머 초기화
+
+        Args:
+            key: 만료될 키
+            expire: 만료 시각 (밀리초)
+        """
+        self.key = key
+        self.expire = expire
+        self.level = 0
+        self.slot = 0
+        self.node = None
+
+
+class TimingWheel:
+    """
+    계층형 타이밍 휠 클래스
+
+    Attributes:
+        _current: 다음에 처리할 틱 (이전 틱은 모두 처리됨)
+        _slots: 레벨별 슬롯 배열 (빈 슬롯은 None, 필요할 때 리스트 생성)
+        _occupied: 레벨별 비어 있지 않은 슬롯 비트마스크
+        _overdue: 이미 처리한 틱 이전으로 등록된 타이머 리스트 (다음 advance에서 바로 꺼냄)
+        _timers: key -> Timer 해시맵 (취소/재등록용)
+    """
+
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    SLOT_MASK = SLOTS - 1
+    LEVELS = 8
+    OVERDUE = -1  # Timer.level 값: _overdue 리스트에 있음
+
+    def __init__(self, start_tick=0):
+        """
+        타이밍 휠 초기화
+
+        Args:
+            start_tick: 시작 틱 (보통 현재 시각 ms)
+        """
+        self._current = start_tick
+        self._slots = [[None] * self.SLOTS for _ in range(self.LEVELS)]
+        self._occupied = [0] * self.LEVELS
+        self._overdue = DoublyLinkedList()
+        self._timers = HashMap()
+
+    # ==================== 등록 / 취소 ====================
+
+    def schedule(self, key, expire):
+        """
+        키의 만료 타이머 등록 (이미 있으면 기존 타이머를 취소하고 다시 등록)
+
+        시간 복잡도: O(1)
+
+        Args:
+            key: 만료될 키
+            expire: 만료 시각 (밀리초)
+        """
+        entry = self._timers.get(key)
+        if entry is not None:
+            timer = entry.value
+            self._unlink(timer)
+            timer.expire = expire
+        else:
+            timer = Timer(key, expire)
+            self._timers.put(key, timer)
+        self._place(timer)
+
+    def cancel(self, key):
+        """
+        키의 만료 타이머 취소
+
+        시간 복잡도: O(1)
+
+        Args:
+            key: 대상 키
+
+        Returns:
+            bool: 취소한 타이머가 있었으면 True
+        """
+        entry = self._timers.get(key)
+        if entry is None:
+            return False
+        self._unlink(entry.value)
+        self._timers.remove(key)
+        return True
+
+    def contains(self, key):
+        """
+        타이머 등록 여부 확인
+
+        Args:
+            key: 대상 키
+
+        Returns:
+            bool: 등록되어 있으면 True
+        """
+        return self._timers.contains(key)
+
+    # ==================== 시간 진행 ====================
+
+    def advance(self, now, limit=None):
+        """
+        now 틱까지 시간을 진행하며 만료된 타이머의 키를 꺼냄
+
+        빈 구간은 슬롯 비트마스크로 건너뛰므로 틱마다 반복하지 않습니다.
+        limit개를 꺼내면 멈추고, 남은 타이머는 다음 호출에서 이어서 꺼냅니다.
+
+        Args:
+            now: 현재 틱 (이 틱 이하로 만료되는 타이머를 꺼냄)
+            limit: 최대로 꺼낼 타이머 개수 (None이면 제한 없음)
+
+        Returns:
+            list: 만료된 키 리스트 (휠에서 제거됨)
+        """
+        expired = []
+        slots0 = self._slots[0]
+
+        overdue = self._overdue
+        while overdue.size() > 0:
+            if limit is not None and len(expired) >= limit:
+                return expired
+            timer = overdue.remove_front()
+            self._timers.remove(timer.key)
+            expired.append(timer.key)
+
+        while True:
+            tick = self._next_event_tick()
+            if tick is None or tick > now:
+                if now >= self._current:
+                    self._current = now + 1
+                return expired
+
+            self._current = tick
+            self._cascade(tick)
+
+            index = tick & self.SLOT_MASK
+            slot = slots0[index]
+            while slot is not None and slot.size() > 0:
+                if limit is not None and len(expired) >= limit:
+                    return expired  # _current = tick 유지: 다음 호출에서 같은 슬롯부터
+                timer = slot.remove_front()
+                self._timers.remove(timer.key)
+                expired.append(timer.key)
+            if slot is not None:
+                slots0[index] = None
+                self._occupied[0] &= ~(1 << index)
+
+            self._current = tick + 1
+
+    def size(self):
+        """
+        등록된 타이머 개수
+
+        Returns:
+            int: 타이머 개수
+        """
+        return self._timers.size()
+
+    def __len__(self):
+        """len() 함수 지원"""
+        return self._timers.size()
+
+    # ==================== 내부 메서드 ====================
+
+    def _place(self, timer):
+        """
+        현재 틱 기준 남은 시간에 맞는 레벨/슬롯에 타이머 삽입
+
+        남은 시간이 64^(L+1) 미만인 가장 낮은 레벨 L의 (expire >> 6L) & 63 슬롯에 넣습니다.
+        이미 처리한 틱 이전으로 등록된 타이머는 _overdue 리스트에 넣어 다음 advance에서 바로 꺼냅니다.
+
+        Args:
+            timer: 삽입할 Timer
+        """
+        current = self._current
+        expire = timer.expire
+        if expire < current:
+            timer.level = self.OVERDUE
+            timer.node = self._overdue.insert_back(timer)
+            return
+        delta = expire - current
+
+        level = 0
+        bits = self.SLOT_BITS
+        while level < self.LEVELS - 1 and delta >> (bits * (level + 1)):
+            level += 1
+        index = (expire >> (bits * level)) & self.SLOT_MASK
+
+        slot = self._slots[level][index]
+        if slot is None:
+            slot = DoublyLinkedList()
+            self._slots[level][index] = slot
+            self._occupied[level] |= 1 << index
+        timer.level = level
+        timer.slot = index
+        timer.node = slot.insert_back(timer)
+
+    def _unlink(self, timer):
+        """
+        타이머를 슬롯 리스트에서 분리 (비면 슬롯 해제)
+
+        Args:
+            timer: 분리할 Timer
+        """
+        if timer.level == self.OVERDUE:
+            self._overdue.remove_node(timer.node)
+            timer.node = None
+            return
+        slot = self._slots[timer.level][timer.slot]
+        slot.remove_node(timer.node)
+        timer.node = None
+        if slot.size() == 0:
+            self._slots[timer.level][timer.slot] = None
+            self._occupied[timer.level] &= ~(1 << timer.slot)
+
+    def _cascade(self, tick):
+        """
+        tick이 상위 레벨 구간의 시작이면 해당 슬롯의 타이머를 하위 레벨로 재배치
+
+        Args:
+            tick: 처리 중인 틱
+        """
+        bits = self.SLOT_BITS
+        for level in range(1, self.LEVELS):
+            if tick & ((1 << (bits * level)) - 1):
+                break  # 이 레벨 구간의 시작이 아님 (상위 레벨도 마찬가지)
+            index = (tick >> (bits * level)) & self.SLOT_MASK
+            slot = self._slots[level][index]
+            if slot is None:
+                continue
+            self._slots[level][index] = None
+            self._occupied[level] &= ~(1 << index)
+            for timer in list(slot):
+                self._place(timer)
+
+    def _next_event_tick(self):
+        """
+        현재 틱 이후 처음으로 무언가 일어나는 틱 계산
+
+        레벨 0은 비어 있지 않은 슬롯이 돌아오는 틱, 상위 레벨은 비어 있지 않은 슬롯의
+        구간이 시작되는(cascade) 틱을 비트마스크 회전으로 찾고 그중 가장 이른 틱을 반환합니다.
+
+        Returns:
+            int: 틱, 타이머가 없으면 None
+        """
+        current = self._current
+        bits = self.SLOT_BITS
+        full = (1 << self.SLOTS) - 1
+        best = None
+
+        for level in range(self.LEVELS):
+            occupied = self._occupied[level]
+            if not occupied:
+                continue
+            shift = bits * level
+            # 현재 틱 이후 처음 돌아오는 이 레벨의 구간 번호
+            block = (current + (1 << shift) - 1) >> shift
+            start = block & self.SLOT_MASK
+            rotated = ((occupied >> start) | (occupied << (self.SLOTS - start))) & full
+            offset = (rotated & -rotated).bit_length() - 1
+            tick = (block + offset) << shift
+            if best is None or tick < best:
+                best = tick
+
+        return best
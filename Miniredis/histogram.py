@@ -0,0 +1,203 @@
+"""
+HDR 스타일 지연 시간 히스토그램
+
+HdrHistogram과 같은 로그-선형(log-linear) 버킷으로 값을 셉니다.
+2의 거듭제곱 구간마다 같은 개수의 선형 하위 버킷을 두므로, 1마이크로초든 10초든
+상대 오차가 일정하게(기본 1/128 미만) 유지되면서 카운터는 수천 개면 충분합니다.
+값을 저장하지 않으므로 기록은 O(1), 백분위 조회는 카운터 개수에 비례합니다.
+
+    구간 0:  0 ~ 255          (값 그대로, 하위 버킷 256개)
+    구간 b:  2^(b+7) ~ 2^(b+8)-1  (폭 2^b인 하위 버킷 128개)
+
+사용 예시:
+    hist = HdrHistogram()
+    hist.record(elapsed_ns)
+    hist.value_at_percentile(99.9)
+"""
+
+from array import array
+
+
+class HdrHistogram:
+    """
+    로그-선형 버킷 히스토그램 (0 이상의 정수 값)
+
+    Attributes:
+        _sub_bucket_bits: 구간 0의 하위 버킷 개수의 log2
+        _highest: 기록 가능한 최댓값 (넘는 값은 이 값으로 기록)
+        _counts: 버킷별 개수
+        _total: 기록한 값 개수
+        _min / _max / _sum: 최솟값, 최댓값, 합계
+    """
+
+    def __init__(self, highest=3600 * 10 ** 9, significant_bits=8):
+        """
+        히스토그램 생성
+
+        Args:
+            highest: 기록 가능한 최댓값 (기본값: 1시간을 나노초로)
+            significant_bits: 하위 버킷 비트 수 (8이면 상대 오차 1/128 미만)
+        """
+        self._sub_bucket_bits = significant_bits
+        self._sub_bucket_count = 1 << significant_bits
+        self._sub_bucket_half = self._sub_bucket_count >> 1
+        self._highest = highest
+        self._counts = array('Q', bytes(8 * (self._index_of(highest) + 1)))
+        self._total = 0
+        self._min = 0
+        self._max = 0
+        self._sum = 0
+
+    def _index_of(self, value):
+        """
+        값이 들어갈 카운터 번호
+
+        Args:
+            value: 0 이상의 정수
+
+        Returns:
+            int: 카운터 번호
+        """
+        bucket = value.bit_length() - self._sub_bucket_bits
+        if bucket <= 0:
+            return value
+        return self._sub_bucket_count + (bucket - 1) * self._sub_bucket_half + (value >> bucket) - self._sub_bucket_half
+
+    def _highest_equivalent(self, index):
+        """
+        카운터 번호가 나타내는 범위의 가장 큰 값 (백분위 결과로 사용, HdrHistogram과 같음)
+
+        Args:
+            index: 카운터 번호
+
+        Returns:
+            int: 값
+        """
+        if index < self._sub_bucket_count:
+            return index
+        bucket, offset = divmod(index - self._sub_bucket_count, self._sub_bucket_half)
+        bucket += 1
+        return ((self._sub_bucket_half + offset + 1) << bucket) - 1
+
+    def record(self, value, count=1):
+        """
+        값 기록
+
+        Args:
+            value: 0 이상의 정수 (음수는 0, highest 초과는 highest로 기록)
+            count: 같은 값을 기록할 횟수
+        """
+        if value < 0:
+            value = 0
+        elif value > self._highest:
+            value = self._highest
+        self._counts[self._index_of(value)] += count
+        if self._total == 0 or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        self._total += count
+        self._sum += value * count
+
+    def merge(self, other):
+        """
+        다른 히스토그램의 기록을 더함 (같은 설정으로 만든 히스토그램)
+
+        Args:
+            other: HdrHistogram
+        """
+        if other._total == 0:
+            return
+        counts = self._counts
+        for index, count in enumerate(other._counts):
+            if count:
+                counts[index] += count
+        if self._total == 0 or other._min < self._min:
+            self._min = other._min
+        self._max = max(self._max, other._max)
+        self._total += other._total
+        self._sum += other._sum
+
+    def reset(self):
+        """
+        모든 기록 삭제
+        """
+        self._counts = array('Q', bytes(8 * len(self._counts)))
+        self._total = 0
+        self._min = 0
+        self._max = 0
+        self._sum = 0
+
+    def value_at_percentile(self, percentile):
+        """
+        백분위 값 (기록한 값의 percentile%가 이 값 이하)
+
+        Args:
+            percentile: 0 ~ 100
+
+        Returns:
+            int: 값 (기록이 없으면 0)
+        """
+        if self._total == 0:
+            return 0
+        target = max(1, -(-self._total * percentile // 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_equivalent(index), self._max)
+        return self._max
+
+    def percentiles(self, percentiles=(50, 99, 99.9)):
+        """
+        여러 백분위 값을 한 번의 순회로 계산
+
+        Args:
+            percentiles: 오름차순 백분위 시퀀스
+
+        Returns:
+            dict: 백분위 -> 값
+        """
+        result = {}
+        if self._total == 0:
+            return {p: 0 for p in percentiles}
+        pending = list(percentiles)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if not count:
+                continue
+            seen += count
+            while pending and seen >= max(1, -(-self._total * pending[0] // 100)):
+                result[pending.pop(0)] = min(self._highest_equivalent(index), self._max)
+            if not pending:
+                break
+        for p in pending:
+            result[p] = self._max
+        return result
+
+    def buckets(self):
+        """
+        기록이 있는 카운터를 (범위의 가장 큰 값, 개수)로 순서대로 반환
+
+        Yields:
+            tuple: (값, 개수)
+        """
+        for index, count in enumerate(self._counts):
+            if count:
+                yield self._highest_equivalent(index), count
+
+    def count(self):
+        """기록한 값 개수"""
+        return self._total
+
+    def min(self):
+        """최솟값 (기록이 없으면 0)"""
+        return self._min
+
+    def max(self):
+        """최댓값 (기록이 없으면 0)"""
+        return self._max
+
+    def mean(self):
+        """평균 (기록이 없으면 0.0)"""
+        return self._sum / self._total if self._total else 0.0
@@ -0,0 +1,363 @@
+"""
+명령어 통계 / SLOWLOG / 지연 모니터
+
+MiniRedis가 명령어 실행 시간과 내부 작업(만료, 제거, 해시 테이블 확장)의 지연을 기록하는 데 쓰는 자료구조입니다.
+
+- CommandStat:    명령어 하나의 호출 수, 누적 시간, 실패/거부 수, 지연 히스토그램
+                  (INFO commandstats, INFO latencystats, LATENCY HISTOGRAM)
+- SlowLog:        임계값보다 오래 걸린 명령어를 최근 max_len개까지 담는 링 버퍼 (SLOWLOG GET / LEN / RESET)
+- LatencyMonitor: 이름 붙은 이벤트("command", "expire-cycle", "eviction-cycle" ...) 중
+                  임계값(ms)을 넘은 것만 이벤트별로 초 단위 이력을 남김 (LATENCY LATEST / HISTORY / RESET)
+
+명령어마다 하는 일은 카운터 몇 개와 히스토그램 카운터 하나를 올리는 것뿐이고,
+SLOWLOG와 지연 모니터는 임계값을 넘은 경우에만 기록하므로 항상 켜 두어도 됩니다.
+"""
+
+import sys
+import time
+
+from histogram import HdrHistogram
+
+
+# SLOWLOG 항목에 남기는 인자 개수 / 인자 길이 (Redis와 같음)
+SLOWLOG_ENTRY_MAX_ARGC = 32
+SLOWLOG_ENTRY_MAX_STRING = 128
+
+# 이벤트별로 남기는 초 단위 이력 개수 (Redis LATENCY_TS_LEN)
+LATENCY_TS_LEN = 160
+
+
+class CommandStat:
+    """
+    명령어 하나의 실행 통계
+
+    Attributes:
+        calls: 실행 횟수 (거부된 호출 제외)
+        duration_ns: 누적 실행 시간 (나노초)
+        failed_calls: 에러 응답을 반환한 횟수
+        rejected_calls: 실행 전에 거부된 횟수 (OOM 등)
+        histogram: 실행 시간 히스토그램 (나노초)
+    """
+
+    __slots__ = ("calls", "duration_ns", "failed_calls", "rejected_calls", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.duration_ns = 0
+        self.failed_calls = 0
+        self.rejected_calls = 0
+        self.histogram = HdrHistogram()
+
+    def info(self):
+        """
+        INFO commandstats 값 문자열 (usec 단위)
+
+        Returns:
+            str: "calls=...,usec=...,usec_per_call=...,rejected_calls=...,failed_calls=..."
+        """
+        usec = self.duration_ns // 1000
+        per_call = usec / self.calls if self.calls else 0.0
+        return (f"calls={self.calls},usec={usec},usec_per_call={per_call:.2f},"
+                f"rejected_calls={self.rejected_calls},failed_calls={self.failed_calls}")
+
+    def percentiles_usec(self, percentiles=(50, 99, 99.9)):
+        """
+        INFO latencystats 값 문자열
+
+        Args:
+            percentiles: 백분위 시퀀스
+
+        Returns:
+            str: "p50=...,p99=...,p99.9=..." (마이크로초)
+        """
+        values = self.histogram.percentiles(percentiles)
+        return ",".join(f"p{p:g}={values[p] / 1000:.3f}" for p in percentiles)
+
+    def histogram_usec(self):
+        """
+        LATENCY HISTOGRAM용 2의 거듭제곱 마이크로초 구간별 누적 개수
+
+        Returns:
+            list: [구간 상한(usec), 누적 개수, ...] (개수가 늘어나는 구간만)
+        """
+        result = []
+        cumulative = 0
+        boundary = 1
+        for value, count in self.histogram.buckets():
+            usec = value // 1000
+            while boundary < usec:
+                boundary <<= 1
+            cumulative += count
+            if result and result[-2] == boundary:
+                result[-1] = cumulative
+            else:
+                result.extend((boundary, cumulative))
+        return result
+
+
+class SlowLog:
+    """
+    느린 명령어 링 버퍼
+
+    Attributes:
+        _entries: 고정 크기 리스트 (오래된 항목부터 덮어씀)
+        _next: 다음에 쓸 위치
+        _count: 저장된 항목 개수
+        _next_id: 다음 항목 ID (RESET 후에도 계속 증가)
+    """
+
+    def __init__(self, max_len=128):
+        """
+        Args:
+            max_len: 최대 항목 개수
+        """
+        self._entries = [None] * max_len
+        self._next = 0
+        self._count = 0
+        self._next_id = 0
+
+    def add(self, args, duration_us):
+        """
+        항목 추가 (가득 차면 가장 오래된 항목을 덮어씀)
+
+        Args:
+            args: 명령어 토큰 리스트
+            duration_us: 실행 시간 (마이크로초)
+        """
+        max_len = len(self._entries)
+        if max_len == 0:
+            return
+        self._entries[self._next] = (self._next_id, int(time.time()), duration_us, _slowlog_args(args))
+        self._next_id += 1
+        self._next = (self._next + 1) % max_len
+        if self._count < max_len:
+            self._count += 1
+
+    def get(self, count=10):
+        """
+        최근 항목부터 최대 count개
+
+        Args:
+            count: 개수 (음수면 전부)
+
+        Returns:
+            list: [id, unix 시각, 실행 시간(usec), [인자 ...]] 리스트
+        """
+        if count < 0 or count > self._count:
+            count = self._count
+        max_len = len(self._entries)
+        result = []
+        for i in range(1, count + 1):
+            entry_id, timestamp, duration_us, args = self._entries[(self._next - i) % max_len]
+            result.append([entry_id, timestamp, duration_us, list(args)])
+        return result
+
+    def resize(self, max_len):
+        """
+        최대 항목 개수 변경 (최근 항목부터 유지)
+
+        Args:
+            max_len: 새 최대 개수
+        """
+        old_len = len(self._entries)
+        keep = min(self._count, max_len)
+        newest_first = [self._entries[(self._next - i) % old_len] for i in range(1, keep + 1)] if old_len else []
+        self._entries = [None] * max_len
+        for i, entry in enumerate(reversed(newest_first)):
+            self._entries[i] = entry
+        self._count = keep
+        self._next = keep % max_len if max_len else 0
+
+    def reset(self):
+        """
+        모든 항목 삭제
+        """
+        self._entries = [None] * len(self._entries)
+        self._next = 0
+        self._count = 0
+
+    def max_len(self):
+        """최대 항목 개수"""
+        return len(self._entries)
+
+    def __len__(self):
+        """저장된 항목 개수"""
+        return self._count
+
+
+def _slowlog_args(args):
+    """
+    SLOWLOG에 남길 인자 (개수와 길이를 잘라 메모리 사용을 제한)
+
+    Args:
+        args: 명령어 토큰 리스트
+
+    Returns:
+        tuple: 잘라낸 인자
+    """
+    argc = len(args)
+    if argc > SLOWLOG_ENTRY_MAX_ARGC:
+        shown = list(args[:SLOWLOG_ENTRY_MAX_ARGC - 1])
+        shown.append(f"... ({argc - SLOWLOG_ENTRY_MAX_ARGC + 1} more arguments)")
+    else:
+        shown = list(args)
+    for i, arg in enumerate(shown):
+        arg = str(arg)
+        if len(arg) > SLOWLOG_ENTRY_MAX_STRING:
+            arg = f"{arg[:SLOWLOG_ENTRY_MAX_STRING]}... ({len(arg) - SLOWLOG_ENTRY_MAX_STRING} more bytes)"
+        shown[i] = arg
+    return tuple(shown)
+
+
+class LatencyEvent:
+    """
+    이벤트 하나의 초 단위 지연 이력
+
+    Attributes:
+        samples: (unix 시각, 지연 ms) 링 버퍼 (같은 초의 샘플은 최댓값 하나로 합침)
+        next: 다음에 쓸 위치
+        max_ms: 기록된 가장 큰 지연
+    """
+
+    __slots__ = ("samples", "next", "max_ms")
+
+    def __init__(self):
+        self.samples = [None] * LATENCY_TS_LEN
+        self.next = 0
+        self.max_ms = 0
+
+    def add(self, timestamp, ms):
+        """
+        샘플 추가
+
+        Args:
+            timestamp: unix 시각 (초)
+            ms: 지연 (밀리초)
+        """
+        last = self.samples[(self.next - 1) % LATENCY_TS_LEN]
+        if last is not None and last[0] == timestamp:
+            if ms > last[1]:
+                self.samples[(self.next - 1) % LATENCY_TS_LEN] = (timestamp, ms)
+        else:
+            self.samples[self.next] = (timestamp, ms)
+            self.next = (self.next + 1) % LATENCY_TS_LEN
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def history(self):
+        """
+        오래된 샘플부터 반환
+
+        Returns:
+            list: [unix 시각, 지연 ms] 리스트
+        """
+        result = []
+        for i in range(LATENCY_TS_LEN):
+            sample = self.samples[(self.next + i) % LATENCY_TS_LEN]
+            if sample is not None:
+                result.append(list(sample))
+        return result
+
+    def latest(self):
+        """
+        가장 최근 샘플
+
+        Returns:
+            tuple: (unix 시각, 지연 ms)
+        """
+        return self.samples[(self.next - 1) % LATENCY_TS_LEN]
+
+
+class LatencyMonitor:
+    """
+    이름 붙은 지연 이벤트 기록기 (Redis LATENCY 명령어)
+
+    Attributes:
+        threshold_ns: 이 값 이상인 샘플만 기록 (임계값 0 = 비활성이면 sys.maxsize)
+        _threshold_ms: 설정된 임계값 (밀리초)
+        _events: 이벤트 이름 -> LatencyEvent
+    """
+
+    def __init__(self, threshold_ms=0):
+        """
+        Args:
+            threshold_ms: 기록 임계값 (밀리초, 0 = 비활성)
+        """
+        self._events = {}
+        self.set_threshold(threshold_ms)
+
+    def set_threshold(self, threshold_ms):
+        """
+        기록 임계값 변경
+
+        Args:
+            threshold_ms: 밀리초 (0 = 비활성)
+        """
+        self._threshold_ms = threshold_ms
+        self.threshold_ns = threshold_ms * 1000000 if threshold_ms > 0 else sys.maxsize
+
+    def threshold_ms(self):
+        """설정된 임계값 (밀리초)"""
+        return self._threshold_ms
+
+    def add_sample(self, event, duration_ns):
+        """
+        샘플 기록 (임계값 미만이면 무시)
+
+        Args:
+            event: 이벤트 이름
+            duration_ns: 지연 (나노초)
+        """
+        if duration_ns < self.threshold_ns:
+            return
+        entry = self._events.get(event)
+        if entry is None:
+            entry = self._events[event] = LatencyEvent()
+        entry.add(int(time.time()), duration_ns // 1000000)
+
+    def latest(self):
+        """
+        LATENCY LATEST - 이벤트별 최근 샘플과 최댓값
+
+        Returns:
+            list: [이벤트, unix 시각, 최근 지연 ms, 최대 지연 ms] 리스트 (이벤트 이름순)
+        """
+        result = []
+        for event, entry in self._events.items():
+            timestamp, ms = entry.latest()
+            result.append([event, timestamp, ms, entry.max_ms])
+        result.sort()
+        return result
+
+    def history(self, event):
+        """
+        LATENCY HISTORY event - 이벤트의 초 단위 이력
+
+        Args:
+            event: 이벤트 이름
+
+        Returns:
+            list: [unix 시각, 지연 ms] 리스트 (없는 이벤트면 빈 리스트)
+        """
+        entry = self._events.get(event)
+        return entry.history() if entry is not None else []
+
+    def reset(self, events=None):
+        """
+        LATENCY RESET [event ...] - 이벤트 이력 삭제
+
+        Args:
+            events: 삭제할 이벤트 이름 시퀀스 (None이나 빈 시퀀스면 전부)
+
+        Returns:
+            int: 삭제한 이벤트 개수
+        """
+        if not events:
+            count = len(self._events)
+            self._events = {}
+            return count
+        count = 0
+        for event in events:
+            if self._events.pop(event, None) is not None:
+                count += 1
+        return count
@@ -0,0 +1,575 @@
+"""
+RESP2 / RESP3 프로토콜 구현
+
+이 모듈은 Redis 직렬화 프로토콜(RESP)의 응답 타입, 증분 파서, 인코더를 제공합니다.
+CLI(REPL)와 네트워크 서버가 같은 응답 객체를 공유하며,
+REPL은 사람이 읽는 형식으로, 서버는 RESP 바이트로 변환합니다.
+
+응답 타입 매핑 (RESP2 / RESP3가 다른 경우 RESP3는 HELLO 3 이후):
+- StatusReply  -> +OK\\r\\n
+- ErrorReply   -> -ERR message\\r\\n
+- int          -> :1\\r\\n
+- str          -> $5\\r\\nAlice\\r\\n
+- RawReply     -> $n\\r\\n...\\r\\n (REPL에서는 따옴표 없이 그대로 출력)
+- None         -> $-1\\r\\n / _\\r\\n
+- bool         -> :1\\r\\n / #t\\r\\n
+- float        -> $3\\r\\n1.5\\r\\n / ,1.5\\r\\n
+- list         -> *n\\r\\n... (각 요소를 재귀적으로 인코딩)
+- dict         -> *2n\\r\\n키 값 ... / %n\\r\\n키 값 ...
+- iterator     -> *n\\r\\n... (요소를 바로 인코딩하고 개수 n은 다 센 뒤에 앞에 붙임)
+
+split_args()는 사람이 입력한 명령어 한 줄(REPL, 인라인 명령어)을 redis-cli와 같은 규칙으로 토큰으로 나눕니다.
+string_to_int64() / string_to_float()는 명령어 인자의 숫자를 Redis와 같은 엄격한 규칙으로 변환합니다.
+"""
+
+import math
+import re
+from collections.abc import Iterator
+
+
+class StatusReply(str):
+    """
+    상태 응답 (Simple String)
+
+    "OK", "PONG"처럼 따옴표 없이 출력되는 짧은 응답입니다.
+    """
+
+
+class ErrorReply(str):
+    """
+    에러 응답 (Error)
+
+    "ERR unknown command" 형태의 메시지를 담습니다.
+    """
+
+
+class RawReply(str):
+    """
+    원문 응답 (Bulk String)
+
+    INFO, HELP처럼 여러 줄로 된 텍스트 응답입니다.
+    네트워크에서는 Bulk String으로, REPL에서는 원문 그대로 출력됩니다.
+    """
+
+
+# 네트워크 바이트 <-> 문자열 변환 (바이너리 안전)
+ENCODING = "utf-8"
+ENCODING_ERRORS = "surrogateescape"
+
+CRLF = b"\r\n"
+
+# 명령어 프레임 한도 (Redis: Multi-bulk 개수 1024 * 1024, proto-max-bulk-len 512MB)
+# 잘못되었거나 악의적인 길이 필드로 버퍼와 명령어 리스트가 끝없이 커지지 않게 함
+PROTO_MAX_MULTIBULK_LEN = 1024 * 1024
+PROTO_MAX_BULK_LEN = 512 * 1024 * 1024
+
+# 부호 있는 64비트 정수 범위 (Redis long long)
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def string_to_int64(text):
+    """
+    정규형 10진 정수 문자열을 int로 변환 (Redis string2ll과 같은 규칙)
+
+    앞뒤 공백, "+" 부호, 선행 0, 밑줄 구분자는 파이썬 int()와 달리 거부합니다.
+
+    Args:
+        text: 문자열
+
+    Returns:
+        int: 변환한 값, 정수가 아니거나 64비트 범위를 벗어나면 None
+    """
+    if not 0 < len(text) <= 20:
+        return None
+    digits = text[1:] if text[0] == "-" else text
+    if not (digits.isascii() and digits.isdigit()) or (digits[0] == "0" and len(text) > 1):
+        return None
+    value = int(text)
+    return value if INT64_MIN <= value <= INT64_MAX else None
+
+
+def string_to_float(text):
+    """
+    실수 문자열 변환 (앞뒤 공백, 밑줄 구분자, NaN 거부)
+
+    Args:
+        text: 문자열
+
+    Returns:
+        float: 변환한 값, 실수가 아니면 None
+    """
+    if not text or text != text.strip() or "_" in text:
+        return None
+    try:
+        value = float(text)
+    except ValueError:
+        return None
+    return None if math.isnan(value) else value
+
+
+class ProtocolError(Exception):
+    """잘못된 RESP 프레임을 받았을 때 발생하는 예외"""
+
+
+class RespParser:
+    """
+    RESP2 / RESP3 증분 파서
+
+    소켓에서 읽은 바이트를 feed()로 하나의 bytearray 수신 버퍼에 이어 붙이고, 완성된 프레임만 반환합니다.
+    프레임이 여러 번의 read에 걸쳐 나뉘어 도착해도 다음 feed()에서 이어서 파싱합니다.
+
+    - feed()는 버퍼 끝에 덧붙이기만 하고(분할 상환 O(1)), 다 읽은 앞부분은 get_*() 호출마다 한 번만 잘라냄
+      (CPython bytearray는 앞부분을 지워도 남은 바이트를 복사하지 않고 시작 위치만 옮김)
+    - 바이트 단위 루프 없음: 줄 끝은 find(), 길이 필드는 isdigit() 검사 후 int(), 토큰은 슬라이스를 한 번 decode
+    - 큰 Bulk String이 여러 read에 걸쳐 도착하면 필요한 길이(_need)가 모일 때까지 다시 파싱하지 않음
+
+    Attributes:
+        _buffer: 아직 처리되지 않은 수신 바이트 (bytearray)
+        _need: 미완성 프레임을 마저 파싱하는 데 필요한 최소 버퍼 길이 (0이면 다음 feed() 후 바로 파싱)
+    """
+
+    def __init__(self):
+        """
+        파서 초기화
+        """
+        self._buffer = bytearray()
+        self._need = 0
+
+    def feed(self, data):
+        """
+        수신 데이터 추가
+
+        Args:
+            data: 소켓에서 읽은 바이트 (bytes, bytearray, memoryview)
+        """
+        self._buffer += data
+
+    def get_commands(self):
+        """
+        완성된 명령어 프레임 모두 반환 (서버용)
+
+        Multi-bulk(*n) 형식과 인라인 명령어(PING\\r\\n) 형식을 모두 지원합니다.
+        파이프라이닝으로 여러 명령어가 한 번에 도착하면 도착 순서대로 반환합니다.
+        개수 / 길이 필드는 부호, 공백, 선행 0 없는 10진수여야 하고 PROTO_MAX_* 한도를 넘을 수 없으며,
+        Bulk String 데이터 바로 뒤에는 \\r\\n이 와야 합니다 (Redis processMultibulkBuffer와 같은 검사).
+
+        Returns:
+            list: 명령어 토큰 리스트(문자열 리스트)의 리스트
+
+        Raises:
+            ProtocolError: 잘못된 프레임
+        """
+        buffer = self._buffer
+        size = len(buffer)
+        if size < self._need:
+            return []
+        self._need = 0
+
+        commands = []
+        find = buffer.find
+        pos = 0
+        while pos < size:
+            if buffer[pos] != 42:  # "*"가 아니면 인라인 명령어
+                result = self._parse_inline(buffer, pos)
+                if result is None:
+                    break
+                tokens, pos = result
+                if tokens:
+                    commands.append(tokens)
+                continue
+
+            # Multi-bulk: *<개수>\r\n 뒤에 $<길이>\r\n<데이터>\r\n이 개수만큼 (개수 <= 0이면 빈 명령어)
+            frame = pos
+            end = find(CRLF, pos)
+            if end == -1:
+                break
+            field = buffer[pos + 1:end]
+            if field.isdigit() and (field[0] != 48 or len(field) == 1):
+                count = int(field)
+            else:
+                count = string_to_int64(field.decode(ENCODING, ENCODING_ERRORS))  # "*-1" 등 드문 형식
+            if count is None or count > PROTO_MAX_MULTIBULK_LEN:
+                raise ProtocolError("invalid multibulk length")
+            pos = end + 2
+            tokens = []
+            for _ in range(count):
+                if pos >= size:
+                    break
+                if buffer[pos] != 36:  # "$"
+                    raise ProtocolError(
+                        f"expected '$', got '{buffer[pos:pos + 1].decode(ENCODING, ENCODING_ERRORS)}'"
+                    )
+                end = find(CRLF, pos)
+                if end == -1:
+                    break
+                # 길이는 ASCII 숫자만 (bytearray.isdigit), 음수 / 부호 / 공백 / 선행 0 거부
+                field = buffer[pos + 1:end]
+                if not field.isdigit() or (field[0] == 48 and len(field) > 1):
+                    raise ProtocolError("invalid bulk length")
+                length = int(field)
+                if length > PROTO_MAX_BULK_LEN:
+                    raise ProtocolError("invalid bulk length")
+                start = end + 2
+                pos = start + length
+                if pos + 2 > size:
+                    self._need = pos + 2
+                    break
+                if buffer[pos] != 13 or buffer[pos + 1] != 10:  # "\r\n"
+                    raise ProtocolError("expected CRLF after bulk data")
+                tokens.append(buffer[start:pos].decode(ENCODING, ENCODING_ERRORS))
+                pos += 2
+            else:
+                if tokens:
+                    commands.append(tokens)
+                continue
+            pos = frame  # 프레임 미완성 - 다음 feed()까지 대기
+            break
+
+        self._consume(pos)
+        return commands
+
+    def get_replies(self):
+        """
+        완성된 응답 프레임 모두 반환 (클라이언트용)
+
+        RESP2 응답과 RESP3 응답(HELLO 3 이후)을 모두 디코딩합니다.
+
+        Returns:
+            list: 디코딩된 응답 객체 리스트
+
+        Raises:
+            ProtocolError: 잘못된 프레임
+        """
+        buffer = self._buffer
+        size = len(buffer)
+        if size < self._need:
+            return []
+        self._need = 0
+
+        replies = []
+        pos = 0
+        while pos < size:
+            result = self._parse_reply(buffer, pos)
+            if result is None:
+                break  # 프레임 미완성 - 다음 feed()까지 대기
+            reply, pos = result
+            replies.append(reply)
+
+        self._consume(pos)
+        return replies
+
+    def _consume(self, pos):
+        """
+        파싱이 끝난 앞부분 pos바이트를 버퍼에서 제거
+
+        _need는 버퍼 절대 위치로 기록되므로 남은 버퍼 기준으로 옮깁니다.
+        """
+        if pos:
+            del self._buffer[:pos]
+            if self._need:
+                self._need -= pos
+
+    def _parse_inline(self, buffer, pos):
+        """
+        인라인 명령어 파싱 (예: "PING\\r\\n", telnet 입력)
+
+        Returns:
+            tuple: (토큰 리스트, 다음 위치), 미완성이면 None
+        """
+        end = buffer.find(b"\n", pos)
+        if end == -1:
+            return None
+        line = buffer[pos:end].rstrip(b"\r")
+        return split_args(line.decode(ENCODING, ENCODING_ERRORS)), end + 1
+
+    def _parse_reply(self, buffer, pos):
+        """
+        단일 응답 프레임 파싱 (재귀적으로 배열 / 맵 처리)
+
+        RESP2: + - : $ *
+        RESP3: _ (null) # (boolean) , (double) ( (big number) ! (blob error) = (verbatim string)
+               % (map -> dict) ~ (set -> list) > (push -> list) | (attribute, 건너뛰고 뒤의 값을 반환)
+
+        Returns:
+            tuple: (응답 객체, 다음 위치), 미완성이면 None
+        """
+        end = buffer.find(CRLF, pos)
+        if end == -1:
+            return None
+        prefix = buffer[pos]
+        line = buffer[pos + 1:end]
+        pos = end + 2
+
+        if prefix == 36 or prefix == 33 or prefix == 61:  # "$" "!" "="
+            length = self._parse_int(line)
+            if length < 0:
+                return None, pos
+            end = pos + length
+            if end + 2 > len(buffer):
+                self._need = end + 2
+                return None
+            data = buffer[pos:end].decode(ENCODING, ENCODING_ERRORS)
+            if prefix == 33:
+                data = ErrorReply(data)
+            elif prefix == 61:
+                data = data[4:]  # "txt:" 같은 형식 접두사 제거
+            return data, end + 2
+        if prefix == 43:  # "+"
+            return StatusReply(line.decode(ENCODING, ENCODING_ERRORS)), pos
+        if prefix == 58 or prefix == 40:  # ":" "("
+            return self._parse_int(line), pos
+        if prefix == 45:  # "-"
+            return ErrorReply(line.decode(ENCODING, ENCODING_ERRORS)), pos
+        if prefix == 42 or prefix == 126 or prefix == 62:  # "*" "~" ">"
+            count = self._parse_int(line)
+            if count < 0:
+                return None, pos
+            return self._parse_items(buffer, pos, count)
+        if prefix == 37 or prefix == 124:  # "%" "|"
+            result = self._parse_items(buffer, pos, self._parse_int(line) * 2)
+            if result is None:
+                return None
+            items, pos = result
+            if prefix == 124:
+                return self._parse_reply(buffer, pos)
+            return dict(zip(items[::2], items[1::2])), pos
+        if prefix == 95:  # "_"
+            return None, pos
+        if prefix == 35:  # "#"
+            return line == b"t", pos
+        if prefix == 44:  # ","
+            try:
+                return float(line), pos
+            except ValueError:
+                raise ProtocolError("invalid double") from None
+
+        raise ProtocolError(f"unknown reply type '{chr(prefix)}'")
+
+    def _parse_items(self, buffer, pos, count):
+        """
+        응답 count개를 연속으로 파싱 (배열 / 집합 / 푸시 / 맵 본문)
+
+        Returns:
+            tuple: (응답 리스트, 다음 위치), 미완성이면 None
+        """
+        items = []
+        for _ in range(count):
+            result = self._parse_reply(buffer, pos)
+            if result is None:
+                return None
+            item, pos = result
+            items.append(item)
+        return items, pos
+
+    def _parse_int(self, data):
+        """
+        길이/정수 필드 파싱
+
+        Raises:
+            ProtocolError: 정수가 아닌 경우
+        """
+        try:
+            return int(data)
+        except ValueError:
+            raise ProtocolError("invalid length") from None
+
+
+# 명령어 한 줄의 조각: 공백 / "큰따옴표" / '작은따옴표' / 따옴표 없는 문자열
+# 따옴표가 짝이 맞지 않으면 어느 것과도 맞지 않아 match가 None이 됨
+_ARG_PIECE = re.compile(r"""
+    (\s+)
+  | "([^"\\]*(?:\\.[^"\\]*)*)"
+  | '([^'\\]*(?:\\.[^'\\]*)*)'
+  | ([^\s"']+)
+""", re.VERBOSE | re.DOTALL)
+
+# 큰따옴표 안의 이스케이프 (\xHH가 이어지면 한 번에 바이트로 모아 디코딩)
+_ESCAPE = re.compile(r"((?:\\x[0-9a-fA-F]{2})+)|\\(.)", re.DOTALL)
+_ESCAPE_CHARS = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "a": "\a"}
+
+
+def _unescape(match):
+    """_ESCAPE 치환 함수"""
+    hex_run = match.group(1)
+    if hex_run is not None:
+        return bytes.fromhex(hex_run.replace("\\x", "")).decode(ENCODING, ENCODING_ERRORS)
+    char = match.group(2)
+    return _ESCAPE_CHARS.get(char, char)
+
+
+def split_args(line):
+    """
+    명령어 한 줄을 토큰으로 분리 (redis-cli sdssplitargs와 같은 규칙)
+
+    - 공백으로 토큰을 나누고, 따옴표 안의 공백은 토큰에 포함
+    - "큰따옴표": \\n \\r \\t \\b \\a \\xHH 이스케이프 지원 (\\xHH로 임의의 바이트 입력, 바이너리 안전)
+    - '작은따옴표': \\' 만 이스케이프
+    - 붙어 있는 조각은 한 토큰 (a"b c"d -> "ab cd"), 빈 따옴표("")는 빈 토큰
+
+    토큰 조각을 리스트에 모아 한 번에 합치므로 줄 길이에 비례하는 시간에 끝납니다.
+
+    Args:
+        line: 입력 문자열
+
+    Returns:
+        list: 토큰 리스트
+
+    Raises:
+        ProtocolError: 따옴표가 닫히지 않은 경우
+    """
+    if '"' not in line and "'" not in line:
+        return line.split()
+
+    tokens = []
+    parts = None
+    pos = 0
+    end = len(line)
+    match = _ARG_PIECE.match
+    while pos < end:
+        piece = match(line, pos)
+        if piece is None:
+            raise ProtocolError("unbalanced quotes in request")
+        pos = piece.end()
+        kind = piece.lastindex
+        if kind == 1:
+            if parts is not None:
+                tokens.append("".join(parts))
+                parts = None
+            continue
+        if parts is None:
+            parts = []
+        if kind == 2:
+            text = piece.group(2)
+            parts.append(_ESCAPE.sub(_unescape, text) if "\\" in text else text)
+        elif kind == 3:
+            parts.append(piece.group(3).replace("\\'", "'"))
+        else:
+            parts.append(piece.group(4))
+    if parts is not None:
+        tokens.append("".join(parts))
+    return tokens
+
+
+def encode_reply_into(out, reply, protocol=2):
+    """
+    응답 객체를 RESP 바이트로 인코딩하여 out 버퍼 끝에 덧붙임
+
+    서버는 한 번의 read로 도착한 명령어들의 응답을 모두 하나의 bytearray에 이어 쓴 뒤
+    write 한 번으로 보냅니다 (응답마다 bytes 조각을 만들어 합치지 않음).
+    흔한 응답 타입(str, int, None)은 type()으로 바로 분기하고 하위 클래스만 isinstance로 확인합니다.
+
+    제너레이터 같은 이터레이터는 요소를 리스트로 모으지 않고 하나씩 인코딩하며,
+    배열 길이는 끝까지 센 뒤 헤더로 끼워 넣습니다 (Redis의 deferred length 응답).
+
+    Args:
+        out: 출력 bytearray
+        reply: 응답 객체 (StatusReply, ErrorReply, int, bool, float, str, RawReply, None, list, dict, iterator)
+        protocol: 2 (RESP2) 또는 3 (RESP3 - None / bool / float / dict를 전용 타입으로 인코딩)
+    """
+    cls = type(reply)
+    if cls is str or cls is RawReply:
+        data = reply.encode(ENCODING, ENCODING_ERRORS)
+        out += b"$%d\r\n" % len(data)
+        out += data
+        out += CRLF
+    elif cls is int:
+        out += b":%d\r\n" % reply
+    elif reply is None:
+        out += b"_\r\n" if protocol == 3 else b"$-1\r\n"
+    elif cls is StatusReply:
+        out += b"+"
+        out += reply.encode(ENCODING, ENCODING_ERRORS)
+        out += CRLF
+    elif cls is ErrorReply:
+        out += b"-"
+        out += reply.encode(ENCODING, ENCODING_ERRORS)
+        out += CRLF
+    elif cls is list or cls is tuple:
+        out += b"*%d\r\n" % len(reply)
+        for item in reply:
+            encode_reply_into(out, item, protocol)
+    elif cls is bool:
+        if protocol == 3:
+            out += b"#t\r\n" if reply else b"#f\r\n"
+        else:
+            out += b":1\r\n" if reply else b":0\r\n"
+    elif cls is float:
+        if protocol == 3:
+            out += b",%s\r\n" % repr(reply).encode()
+        else:
+            encode_reply_into(out, repr(reply), protocol)
+    elif cls is dict:
+        # RESP2에는 맵이 없으므로 [키, 값, 키, 값, ...] 배열로 보냄
+        out += b"%%%d\r\n" % len(reply) if protocol == 3 else b"*%d\r\n" % (len(reply) * 2)
+        for key, value in reply.items():
+            encode_reply_into(out, key, protocol)
+            encode_reply_into(out, value, protocol)
+    elif isinstance(reply, Iterator):
+        start = len(out)
+        count = 0
+        for item in reply:
+            encode_reply_into(out, item, protocol)
+            count += 1
+        out[start:start] = b"*%d\r\n" % count
+    else:
+        # 하위 클래스는 기반 타입으로, 그 외 타입은 문자열로 변환하여 Bulk String 처리
+        for base in _REPLY_BASES:
+            if isinstance(reply, base):
+                encode_reply_into(out, base(reply), protocol)
+                return
+        encode_reply_into(out, str(reply), protocol)
+
+
+# encode_reply_into가 하위 클래스를 변환할 기반 타입 (확인 순서대로)
+_REPLY_BASES = (ErrorReply, StatusReply, RawReply, int, float, str, list, tuple, dict)
+
+
+def encode_reply(reply, protocol=2):
+    """
+    응답 객체를 RESP 바이트로 인코딩
+
+    Args:
+        reply: 응답 객체 (encode_reply_into 참고)
+        protocol: 2 (RESP2) 또는 3 (RESP3)
+
+    Returns:
+        bytes: RESP 프레임
+    """
+    out = bytearray()
+    encode_reply_into(out, reply, protocol)
+    return bytes(out)
+
+
+def encode_command_into(out, tokens):
+    """
+    명령어 토큰을 RESP Multi-bulk 프레임으로 인코딩하여 out 버퍼 끝에 덧붙임 (클라이언트용)
+
+    Args:
+        out: 출력 bytearray
+        tokens: 명령어 토큰 (예: ["SET", "key", "value"], bytes 토큰은 그대로 전송)
+    """
+    out += b"*%d\r\n" % len(tokens)
+    for token in tokens:
+        if isinstance(token, bytes):
+            data = token
+        else:
+            data = str(token).encode(ENCODING, ENCODING_ERRORS)
+        out += b"$%d\r\n" % len(data)
+        out += data
+        out += CRLF
+
+
+def encode_command(tokens):
+    """
+    명령어 토큰을 RESP Multi-bulk 프레임으로 인코딩 (클라이언트용)
+
+    Args:
+        tokens: 명령어 토큰 (예: ["SET", "key", "value"])
+
+    Returns:
+        bytes: RESP 프레임
+    """
+    out = bytearray()
+    encode_command_into(out, tokens)
+    return bytes(out)
@@ -3,12 +3,29 @@ Mini Redis 핵심 로직 구현
 
 이 모듈은 Redis의 핵심 기능을 구현합니다:
 - String 타입 기본 명령어 (SET, GET, DEL, EXISTS, DBSIZE)
+- 정수 인코딩 값과 카운터 (INCR/DECR/INCRBY/DECRBY/INCRBYFLOAT, OBJECT ENCODING)
+- Hash 타입 (HSET/HGET/HMGET/HGETALL/HDEL/HLEN/HEXISTS/HINCRBY, 작은 해시는 listpack 인코딩)
+- 키스페이스 순회 (SCAN 커서 + MATCH/COUNT, KEYS 글롭 패턴)
+- 정렬된 접두사 인덱스 (SCAN MATCH prefix*, COUNTPREFIX, DELPREFIX / UNLINKPREFIX)
 - 메모리 관리 (CONFIG SET maxmemory, INFO memory)
-- TTL 관리 (EXPIRE, TTL)
+- TTL 관리 (EXPIRE/PEXPIRE/PEXPIREAT, TTL/PTTL, PERSIST, SET EX/PX, 밀리초 정밀도)
+- TTL 인덱스 선택 (최소 힙 또는 계층형 타이밍 휠)
+- 시간 예산 안에서 동작하는 능동 만료 주기
 - LRU 추적 시스템
+- maxmemory-policy (noeviction, allkeys/volatile-lru, allkeys/volatile-lfu,
+  allkeys/volatile-random, volatile-ttl)
+- LFU 접근 빈도 추적 (로그 확률 카운터 + 시간 감쇠, OBJECT FREQ)
+- AOF 영속성 (CONFIG SET appendonly, BGREWRITEAOF)
+- 스냅샷 영속성 (SAVE, BGSAVE)
+- 클러스터 모드용 해시 슬롯별 키 인덱스 (CLUSTER COUNTKEYSINSLOT / GETKEYSINSLOT)
+- 명령어 통계와 지연 모니터 (INFO commandstats / latencystats, SLOWLOG, LATENCY)
 """
 
+import math
+import queue
+import random
 import time
+import threading
 import sys
 import os
 
@@ -16,8 +33,238 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from data_structures.doubly_linked_list import DoublyLinkedList
+from data_structures.index_linked_list import IndexLinkedList
+from data_structures.clock import ClockRing
 from data_structures.hash_map import HashMap
-from data_structures.heap import MinHeap
+from data_structures.open_hash_map import OpenAddressingHashMap
+from data_structures.heap import IndexedMinHeap
+from data_structures.eviction_pool import EvictionPool
+from data_structures.timing_wheel import TimingWheel
+from data_structures.skiplist import SkipList
+from data_structures.hash_object import HashObject
+from aof import AppendOnlyFile, load_aof, FSYNC_POLICIES, FSYNC_EVERYSEC
+from snapshot import SnapshotManager
+from cluster import CLUSTER_SLOTS, key_hash_slot
+from stringmatch import compile_glob, matches_all, literal_prefix
+from protocol import ENCODING, ENCODING_ERRORS, INT64_MIN, INT64_MAX, string_to_int64, string_to_float
+from latency import CommandStat, SlowLog, LatencyMonitor
+
+
+# maxmemory 초과 시 제거 정책
+MAXMEMORY_POLICIES = (
+    "noeviction",       # 제거하지 않고 쓰기를 거부
+    "allkeys-lru",      # 전체 키 중 가장 오래 접근되지 않은 키
+    "volatile-lru",     # TTL 있는 키 중 가장 오래 접근되지 않은 키
+    "allkeys-lfu",      # 전체 키 중 접근 빈도가 가장 낮은 키
+    "volatile-lfu",     # TTL 있는 키 중 접근 빈도가 가장 낮은 키
+    "allkeys-random",   # 전체 키 중 임의의 키
+    "volatile-random",  # TTL 있는 키 중 임의의 키
+    "volatile-ttl",     # TTL 있는 키 중 만료가 가장 임박한 키
+)
+
+# LRU 추적 방식
+# - sampled: 키마다 LRU 클럭만 기록하고 제거 시 표본 + 후보 풀로 근사 (GET에서 포인터 이동 없음)
+# - list:    이중 연결 리스트로 정확한 LRU 순서 유지 (GET마다 move_to_front)
+# - indexed: list와 같은 정확한 LRU이지만 노드 객체 대신 array('l') 슬롯 번호로 연결 (키당 메모리 절약)
+# - clock:   CLOCK(second-chance) 근사 LRU, 키마다 참조 비트 1바이트 (GET은 바이트 쓰기 한 번)
+LRU_TRACKING_MODES = ("sampled", "list", "indexed", "clock")
+
+# TTL 인덱스 (만료 시각 순서로 키를 꺼내는 자료구조)
+# - heap:  인덱스 최소 힙, 등록/갱신/삭제 O(log n) (키별 핸들로 기존 항목을 바로 수정)
+# - wheel: 계층형 타이밍 휠, 등록/취소 O(1), 살아 있는 TTL 키 수만큼만 메모리 사용
+TTL_INDEX_TYPES = ("heap", "wheel")
+
+# 키스페이스 해시 테이블 (_store에만 적용, 내부 보조 맵은 항상 체이닝 HashMap)
+# - chaining: 버킷마다 이중 연결 리스트 (키당 HashMapEntry + 리스트 노드)
+# - open:     선형 탐사 오픈 어드레싱, 해시/키/엔트리 병렬 배열 (키당 HashMapEntry 하나)
+HASH_TABLE_TYPES = ("chaining", "open")
+
+# LFU 카운터 (8비트, Morris 카운터처럼 로그 확률로 증가)
+# 새 키는 LFU_INIT_VAL에서 시작하여 한 번 접근되기 전에 곧바로 제거되지 않도록 합니다.
+LFU_INIT_VAL = 5
+LFU_COUNTER_MAX = 255
+
+# SCAN 기본 COUNT (한 번에 방문할 키 개수 목표)
+SCAN_DEFAULT_COUNT = 10
+
+# UNLINKPREFIX로 한 번에 지운 키가 이 개수 이상이면 값 해제를 백그라운드 스레드로 넘김
+LAZYFREE_THRESHOLD = 64
+
+# 지연 해제(lazyfree) 작업 큐 (프로세스당 하나, 처음 쓸 때 워커 스레드 하나와 함께 생성)
+_lazyfree_jobs = None
+_lazyfree_lock = threading.Lock()
+
+# 능동 만료 (Active Expire)
+# - 한 번에 TTL 키를 ACTIVE_EXPIRE_KEYS_PER_LOOP개씩 표본 추출하여 만료된 키를 삭제
+# - 표본 중 만료 비율이 ACTIVE_EXPIRE_ACCEPTABLE_STALE(%)를 넘으면 시간 예산 안에서 반복
+ACTIVE_EXPIRE_KEYS_PER_LOOP = 20
+ACTIVE_EXPIRE_ACCEPTABLE_STALE = 10
+
+# 지연 기록 기본값
+# - SLOWLOG: 10ms(10000us) 이상 걸린 명령어를 최근 128개까지 (음수 = 비활성, 0 = 모든 명령어)
+# - 지연 모니터: 1ms 이상 걸린 명령어와 내부 작업(만료/제거 주기, 해시 테이블 확장)을 이벤트별로 기록 (0 = 비활성)
+SLOWLOG_LOG_SLOWER_THAN = 10000
+SLOWLOG_MAX_LEN = 128
+LATENCY_MONITOR_THRESHOLD = 1
+
+# 값 인코딩 (Redis OBJECT ENCODING)
+# - int:    부호 있는 64비트 범위의 정규형 10진 정수 문자열("0", "-12" / 선행 0, +, 공백 없음)은
+#           문자열 대신 int로 저장 (INCR 계열은 이 int를 그대로 읽고 갱신)
+# - embstr: EMBSTR_SIZE_LIMIT 바이트 이하 문자열
+# - raw:    그보다 긴 문자열
+INT64_MAX_DIGITS = len(str(INT64_MIN))  # 부호 포함 최대 문자열 길이 (20)
+EMBSTR_SIZE_LIMIT = 44
+_DIGITS = frozenset("0123456789")
+
+# int 인코딩 값의 메모리 크기 (Redis처럼 객체의 포인터 자리에 정수를 바로 담는다고 계산)
+INT_ENCODED_SIZE = 8
+
+# Hash 인코딩 (Redis hash-max-listpack-entries / hash-max-listpack-value)
+# 필드 개수와 필드/값 길이가 둘 다 기준 이하인 해시는 [필드, 값, ...] 리스트(listpack) 하나에 저장하고,
+# 하나라도 넘으면 HashMap(hashtable)으로 변환
+HASH_MAX_LISTPACK_ENTRIES = 128
+HASH_MAX_LISTPACK_VALUE = 64
+
+
+def mstime():
+    """
+    현재 Unix 시각 (밀리초)
+    
+    Returns:
+        int: Unix epoch 밀리초
+    """
+    return int(time.time() * 1000)
+
+
+def _key_cursor(key):
+    """
+    접두사 SCAN 커서: 키의 바이트 앞에 0x01을 붙인 빅엔디언 정수 (0과 구분)
+    
+    Args:
+        key: 마지막으로 방문한 키
+        
+    Returns:
+        int: 커서
+    """
+    return int.from_bytes(b"\x01" + key.encode(ENCODING, ENCODING_ERRORS), "big")
+
+
+def _cursor_key(cursor):
+    """
+    _key_cursor의 역변환
+    
+    Args:
+        cursor: 커서
+        
+    Returns:
+        str: 키
+        
+    Raises:
+        ValueError: 접두사 SCAN 커서가 아닌 경우
+    """
+    data = cursor.to_bytes((cursor.bit_length() + 7) // 8, "big")
+    if not data.startswith(b"\x01"):
+        raise ValueError("invalid cursor")
+    return data[1:].decode(ENCODING, ENCODING_ERRORS)
+
+
+def _format_float(value):
+    """
+    INCRBYFLOAT 결과 문자열 (가장 짧은 왕복 표현, 정수이면 소수점 없이)
+    
+    Args:
+        value: 유한한 실수
+        
+    Returns:
+        str: "10.5", "3", "1e+20" 형태
+    """
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _encode_value(value):
+    """
+    저장할 값의 인코딩 선택 (정규형 64비트 정수 문자열이면 int, 아니면 그대로)
+    
+    Args:
+        value: SET / MSET / 적재로 들어온 값
+        
+    Returns:
+        int 또는 원래 값
+    """
+    if type(value) is str:
+        # 숫자로 끝나지 않는 값은 변환을 시도하지 않음 (대부분의 문자열 값)
+        if value[-1:] in _DIGITS:
+            number = string_to_int64(value)
+            if number is not None:
+                return number
+        return value
+    if type(value) is int and not INT64_MIN <= value <= INT64_MAX:
+        return str(value)
+    return value
+
+
+def _decode_value(value):
+    """
+    저장된 값을 응답용 문자열로 (int 인코딩 값만 변환)
+    
+    Args:
+        value: 엔트리에 저장된 값
+        
+    Returns:
+        str: 문자열 값
+    """
+    return str(value) if type(value) is int else value
+
+
+def _lazyfree(objects):
+    """
+    리스트에 담긴 객체들의 참조 해제를 lazyfree 워커 스레드에 넘김
+    
+    Redis의 bio 스레드처럼 프로세스에 오래 사는 워커 하나만 두고 queue.Queue로 작업을 넘기므로,
+    호출 횟수와 관계없이 스레드가 늘어나지 않습니다.
+    
+    CPython(GIL)에서는 객체 해제도 GIL을 잡고 실행되므로 전체 CPU 시간은 줄지 않고,
+    해제 시점을 명령어 응답 뒤로 미루는 정도의 이점만 있습니다 (free-threaded 빌드에서는 병렬로 해제).
+    
+    Args:
+        objects: 해제할 객체 리스트 (워커가 비움, 호출 후 재사용 금지)
+    """
+    global _lazyfree_jobs
+    if _lazyfree_jobs is None:
+        with _lazyfree_lock:
+            if _lazyfree_jobs is None:
+                jobs = queue.Queue()
+                threading.Thread(target=_lazyfree_worker, args=(jobs,), name="lazyfree", daemon=True).start()
+                _lazyfree_jobs = jobs
+    _lazyfree_jobs.put(objects)
+
+
+def _lazyfree_worker(jobs):
+    """
+    lazyfree 워커 스레드 본체: 넘겨받은 리스트를 차례로 비움
+    
+    Args:
+        jobs: 해제할 리스트가 들어오는 queue.Queue
+    """
+    while True:
+        objects = jobs.get()
+        objects.clear()
+        objects = None
+
+
+class OutOfMemoryError(Exception):
+    """maxmemory를 넘어 쓰기를 거부할 때 발생하는 예외"""
+    
+    def __init__(self):
+        super().__init__("command not allowed when used memory > 'maxmemory'.")
+
+
+class WrongTypeError(Exception):
+    """키에 저장된 값의 타입이 명령어와 맞지 않을 때 발생하는 예외 (예: Hash 키에 GET)"""
+    
+    def __init__(self):
+        super().__init__("Operation against a key holding the wrong kind of value")
 
 
 class MiniRedis:
@@ -27,79 +274,215 @@ class MiniRedis:
     LRU 캐시와 TTL 관리 기능을 갖춘 In-Memory Key-Value 저장소입니다.
     
     Attributes:
-        _store: 키-값 저장을 위한 해시맵
-        _lru_list: LRU 추적을 위한 이중 연결 리스트
-        _ttl_heap: TTL 관리를 위한 최소 힙
-        _ttl_map: 키별 만료 시간 저장 해시맵
+        _store: 키-값 저장을 위한 해시맵 (hash_table에 따라 HashMap 또는 OpenAddressingHashMap)
+        _lru_list: LRU 추적을 위한 이중 연결 리스트 (lru_tracking="indexed"이면 배열 기반 IndexLinkedList,
+                   "clock"이면 참조 비트 기반 ClockRing)
+        _ttl_heap: TTL 관리를 위한 인덱스 최소 힙 (ttl_index="heap")
+        _ttl_handles: key -> HeapHandle 해시맵 (힙 항목 갱신/삭제용)
+        _ttl_wheel: TTL 관리를 위한 계층형 타이밍 휠 (ttl_index="wheel")
+        _ttl_map: 키별 만료 시각 저장 해시맵 (Unix epoch 밀리초)
         _maxmemory: 최대 메모리 제한 (바이트)
+        _used_memory: 현재 메모리 사용량 (바이트, 증분 관리)
         _evicted_keys: 제거된 키 개수
+        _debug_memory: 메모리 카운터 검증 모드 여부
+        _maxmemory_policy: 제거 정책
+        _maxmemory_samples: 근사 제거 시 한 번에 뽑는 표본 개수
+        _hash_max_listpack_entries: listpack 인코딩으로 유지할 해시의 최대 필드 개수
+        _hash_max_listpack_value: listpack 인코딩으로 유지할 해시의 최대 필드 / 값 길이
+        _eviction_pool: 근사 제거 후보 풀
+        _lru_clock: 접근마다 증가하는 논리 LRU 클럭
+        _lfu_log_factor: LFU 카운터 증가 확률 계수 (클수록 천천히 증가)
+        _lfu_decay_time: LFU 카운터를 1 감소시키는 유휴 시간 (분, 0 = 감쇠 없음)
+        _hz: 초당 cron 실행 횟수
+        _active_expire_max_ms: 능동 만료 주기 1회의 최대 실행 시간 (밀리초, 0 = 비활성)
+        _active_rehashing: cron에서 해시맵 점진적 재해싱을 진행할지 여부
+        _aof: AOF 기록기 (비활성 시 None)
+        _snapshot: 스냅샷(SAVE/BGSAVE) 관리자
+        _dirty: 마지막 스냅샷 이후 변경 횟수
+        _slot_keys: 해시 슬롯별 키 HashMap 리스트 (cluster_enabled일 때만, 아니면 None)
+        _prefix_index: 정렬된 키 SkipList (prefix_index일 때만, 아니면 None)
+        _command_stats: 명령어 이름 -> CommandStat 딕셔너리 (INFO commandstats, 명령어마다 조회하므로 내장 dict)
+        _slowlog: 느린 명령어 링 버퍼
+        _slowlog_log_slower_than: SLOWLOG 기록 임계값 (마이크로초, 음수 = 비활성)
+        _latency_monitor: 이벤트별 지연 기록기 (LATENCY)
     """
     
-    def __init__(self):
+    def __init__(self, debug_memory=False, lru_tracking="sampled", ttl_index="heap", hash_table="chaining",
+                 cluster_enabled=False, prefix_index=False):
         """
         Mini Redis 초기화
+        
+        Args:
+            debug_memory: True이면 변경 연산마다 메모리 카운터를
+                          전체 재계산 결과와 비교 검증 (기본값: False)
+            lru_tracking: LRU 추적 방식 ("sampled", "list", "indexed", "clock", 기본값: "sampled")
+            ttl_index: TTL 인덱스 ("heap" 또는 "wheel", 기본값: "heap")
+            hash_table: 키스페이스 해시 테이블 ("chaining" 또는 "open", 기본값: "chaining")
+            cluster_enabled: True이면 해시 슬롯별 키 인덱스를 유지 (클러스터 워커용, 기본값: False)
+            prefix_index: True이면 정렬된 키 인덱스를 유지하여 접두사 조회를
+                          일치하는 키 개수에 비례하는 시간에 처리 (기본값: False)
         """
-        # 키-값 저장소 (HashMap)
+        if lru_tracking not in LRU_TRACKING_MODES:
+            raise ValueError(f"invalid lru tracking mode '{lru_tracking}'")
+        if ttl_index not in TTL_INDEX_TYPES:
+            raise ValueError(f"invalid ttl index '{ttl_index}'")
+        if hash_table not in HASH_TABLE_TYPES:
+            raise ValueError(f"invalid hash table '{hash_table}'")
+        
+        # 키-값 저장소 (HashMap 또는 OpenAddressingHashMap)
         # key -> HashMapEntry(key, value, lru_node)
-        self._store = HashMap()
+        self._hash_table = hash_table
+        self._store_class = OpenAddressingHashMap if hash_table == "open" else HashMap
+        self._store = self._new_store()
         
-        # LRU 추적용 이중 연결 리스트
+        # LRU 추적용 이중 연결 리스트 또는 CLOCK (lru_tracking이 "sampled"가 아닐 때만 사용)
         # head 쪽: 최근 접근, tail 쪽: 오래된 접근
-        self._lru_list = DoublyLinkedList()
+        self._lru_tracking = lru_tracking
+        self._use_lru_list = lru_tracking != "sampled"
+        self._lru_list = self._new_lru_list()
         
-        # TTL 관리용 최소 힙
-        # (만료시간, key) 튜플 저장
-        self._ttl_heap = MinHeap()
+        # 근사 LRU용 논리 클럭 (접근마다 1 증가, 엔트리의 lru 필드에 기록)
+        self._lru_clock = 0
         
-        # 키별 만료 시간 저장
-        # key -> expire_timestamp
+        # TTL 인덱스 (둘 중 ttl_index로 선택한 하나만 사용)
+        # heap: 키별 핸들(우선순위 = 만료시각 ms) / wheel: 키별 타이머
+        self._ttl_index = ttl_index
+        self._use_ttl_wheel = ttl_index == "wheel"
+        self._ttl_heap = IndexedMinHeap()
+        self._ttl_handles = HashMap()
+        self._ttl_wheel = TimingWheel(mstime()) if self._use_ttl_wheel else None
+        
+        # 키별 만료 시각 저장
+        # key -> expire_ms (Unix epoch 밀리초)
         self._ttl_map = HashMap()
         
         # 메모리 제한 (0 = 무제한)
         self._maxmemory = 0
         
+        # 현재 메모리 사용량 (키-값 추가/삭제/갱신 시 증분 갱신)
+        self._used_memory = 0
+        
         # 제거된 키 개수
         self._evicted_keys = 0
+        
+        # 제거 정책
+        self._maxmemory_policy = "allkeys-lru"
+        self._maxmemory_samples = 5
+        self._eviction_pool = EvictionPool()
+        
+        # LFU 접근 빈도 추적 (LFU 정책일 때만 접근마다 카운터 갱신)
+        self._use_lfu = False
+        self._lfu_log_factor = 10
+        self._lfu_decay_time = 1
+        
+        # Hash 인코딩 기준 (이후 변환되는 해시에만 적용)
+        self._hash_max_listpack_entries = HASH_MAX_LISTPACK_ENTRIES
+        self._hash_max_listpack_value = HASH_MAX_LISTPACK_VALUE
+        
+        # 주기 작업 / 능동 만료
+        # 기본값: hz 10 (100ms마다 cron), 주기마다 최대 25ms (CPU 25%)
+        self._hz = 10
+        self._active_expire_max_ms = 25
+        
+        # 유휴 시간 재해싱 (cron마다 해시맵별로 최대 1ms씩 점진적 재해싱 진행)
+        self._active_rehashing = True
+        
+        # 만료 통계 (INFO stats)
+        self._stat_expired_keys = 0
+        self._stat_expired_stale_perc = 0.0
+        self._stat_expire_cycles = 0
+        self._stat_expire_cycle_time_cap_reached = 0
+        self._stat_expire_cycle_cpu_ms = 0.0
+        self._stat_expire_cycle_last_ms = 0.0
+        self._stat_expire_cycle_max_ms = 0.0
+        self._expired_per_sec = 0.0
+        self._expire_rate_time = time.monotonic()
+        self._expire_rate_count = 0
+        
+        # 메모리 카운터 검증 모드 (디버그용, O(n))
+        self._debug_memory = debug_memory
+        
+        # AOF 영속성 (appendonly no = None)
+        self._aof = None
+        self._aof_filename = "appendonly.aof"
+        self._aof_fsync = FSYNC_EVERYSEC
+        self._aof_loaded_commands = 0
+        self._auto_aof_rewrite_percentage = 100
+        self._auto_aof_rewrite_min_size = 64 * 1024 * 1024
+        
+        # 스냅샷 영속성
+        self._snapshot = SnapshotManager()
+        self._dbfilename = "dump.rdb"
+        self._dirty = 0
+        self._dirty_before_bgsave = 0
+        
+        # 클러스터 모드: 슬롯별 키 집합 (슬롯 이전 시 슬롯의 키를 키스페이스 전체 순회 없이 나열)
+        # 슬롯마다 처음 키가 들어올 때 HashMap(key -> None)을 만듦
+        self._slot_keys = [None] * CLUSTER_SLOTS if cluster_enabled else None
+        
+        # 접두사 인덱스: 모든 키를 정렬된 순서로 유지 (접두사 범위 조회, 순위로 개수 계산)
+        self._prefix_index = SkipList() if prefix_index else None
+        
+        # 명령어 통계 / SLOWLOG / 지연 모니터 (CLI.dispatch가 명령어마다 record_command 호출)
+        self._command_stats = {}
+        self._slowlog = SlowLog(SLOWLOG_MAX_LEN)
+        self._slowlog_log_slower_than = SLOWLOG_LOG_SLOWER_THAN
+        self._latency_monitor = LatencyMonitor(LATENCY_MONITOR_THRESHOLD)
     
     # ==================== String 타입 기본 명령어 ====================
     
-    def set(self, key, value):
+    def set(self, key, value, px=None, keepttl=False):
         """
-        SET key value - 키에 값 저장
+        SET key value [EX seconds | PX milliseconds | KEEPTTL] - 키에 값 저장
         
-        1. 메모리 초과 시 LRU 정책으로 가장 오래된 키 제거
+        1. 메모리 초과 시 LRU 정책으로 가장 오래된 키 제거 (기존 키는 값이 커지는 만큼)
         2. 키가 이미 존재하면 값 업데이트
         3. LRU 리스트에서 해당 키를 최신으로 갱신
+        4. px가 있으면 만료 시간 설정, 없으면 기존 TTL 제거 (keepttl이면 유지)
         
         Args:
             key: 저장할 키
             value: 저장할 값
+            px: 만료 시간 (밀리초, 기본값: None)
+            keepttl: True이면 기존 TTL 유지
             
         Returns:
             str: "OK"
         """
         # 만료된 키 정리
         self._cleanup_expired()
+        self._expire_if_needed(key)
+        
+        # 정수 문자열은 int로 저장
+        value = _encode_value(value)
         
         # 기존 키 존재 여부 확인
         existing_entry = self._store.get(key)
+        if existing_entry:
+            # 값이 커지면 늘어나는 만큼 먼저 메모리 제한 적용 (이 키가 제거되면 새 키로 추가)
+            existing_entry = self._enforce_memory_limit_for_update(key, existing_entry, value)
         
         if existing_entry:
             # 기존 키 업데이트
-            existing_entry.value = value
-            # LRU 순서 갱신
-            if existing_entry.lru_node:
-                self._lru_list.move_to_front(existing_entry.lru_node)
+            self._update_entry(existing_entry, value)
         else:
             # 메모리 초과 확인 및 LRU 제거
             self._enforce_memory_limit(key, value)
             
             # 새 키 추가
-            # LRU 리스트에 추가 (맨 앞 = 최근)
-            lru_node = self._lru_list.insert_front(key)
-            
-            # 해시맵에 저장
-            self._store.put(key, value, lru_node)
+            self._insert_entry(key, value)
+        
+        self._dirty += 1
+        if self._aof is not None:
+            self._aof.feed(("SET", key, value, "KEEPTTL") if keepttl else ("SET", key, value))
+        
+        if px is not None:
+            self._set_expire_time(key, mstime() + int(px))
+        elif not keepttl:
+            self._remove_expire(key)
+        
+        if self._debug_memory:
+            self._verify_memory_usage()
         
         return "OK"
     
@@ -115,24 +498,29 @@ class MiniRedis:
             
         Returns:
             str: 값 또는 None (키가 없거나 만료됨)
+            
+        Raises:
+            WrongTypeError: 키가 Hash인 경우
         """
         # 만료된 키 정리
         self._cleanup_expired()
         
         # TTL 확인
-        if self._is_expired(key):
-            self._delete_key_internal(key)
+        if self._expire_if_needed(key):
             return None
         
         entry = self._store.get(key)
         if entry is None:
             return None
         
-        # LRU 순서 갱신 (최신으로)
-        if entry.lru_node:
-            self._lru_list.move_to_front(entry.lru_node)
+        value = entry.value
+        if type(value) is HashObject:
+            raise WrongTypeError()
         
-        return entry.value
+        # LRU/LFU 갱신 (sampled: 클럭 기록만, list: 맨 앞으로 이동)
+        self._touch_entry(entry)
+        
+        return _decode_value(value)
     
     def delete(self, key):
         """
@@ -142,8 +530,10 @@ class MiniRedis:
             key: 삭제할 키
             
         Returns:
-            int: 삭제된 키 개수 (0 또는 1)
+            int: 삭제된 키 개수 (0 또는 1, 이미 만료된 키는 0)
         """
+        if self._expire_if_needed(key):
+            return 0
         return self._delete_key_internal(key)
     
     def exists(self, key):
@@ -157,8 +547,7 @@ class MiniRedis:
             int: 1 (존재) 또는 0 (없음)
         """
         # 만료 확인
-        if self._is_expired(key):
-            self._delete_key_internal(key)
+        if self._expire_if_needed(key):
             return 0
         
         return 1 if self._store.contains(key) else 0
@@ -167,6 +556,8 @@ class MiniRedis:
         """
         DBSIZE - 전체 키 개수 반환
         
+        Redis와 같이 만료되었지만 아직 회수되지 않은 키도 포함될 수 있습니다.
+        
         Returns:
             int: 키 개수
         """
@@ -174,218 +565,2495 @@ class MiniRedis:
         self._cleanup_expired()
         return self._store.size()
     
-    # ==================== 메모리 관리 명령어 ====================
+    # ==================== 카운터 (INCR 계열) ====================
     
-    def config_set_maxmemory(self, bytes_limit):
+    def incrby(self, key, increment):
         """
-        CONFIG SET maxmemory - 최대 메모리 제한 설정
+        INCRBY key increment - 정수 값에 increment를 더함 (INCR / DECR / DECRBY 공용)
+        
+        int 인코딩된 값은 엔트리의 int를 바로 갱신하므로 문자열 파싱과 변환이 없고,
+        읽기-수정-쓰기가 명령어 하나 안에서 끝나 클라이언트의 GET + SET 사이 경합이 없습니다.
+        키가 없으면 0에서 시작하며, 기존 TTL은 유지됩니다.
         
         Args:
-            bytes_limit: 바이트 단위 메모리 제한 (0 = 무제한)
+            key: 대상 키
+            increment: 더할 정수 (음수면 감소)
             
         Returns:
-            str: "OK"
+            int: 증가 후 값
+            
+        Raises:
+            ValueError: 값이나 increment가 64비트 정수가 아니거나, 결과가 범위를 벗어나는 경우
+            WrongTypeError: 키가 Hash인 경우
+            OutOfMemoryError: noeviction 정책에서 새 키를 만들거나 값을 키울 수 없는 경우
         """
-        self._maxmemory = int(bytes_limit)
+        if not INT64_MIN <= increment <= INT64_MAX:
+            raise ValueError("value is not an integer or out of range")
         
-        # 현재 메모리가 제한을 초과하면 제거
-        while self._maxmemory > 0 and self._get_memory_usage() > self._maxmemory:
-            if not self._evict_lru():
-                break
+        self._cleanup_expired()
+        self._expire_if_needed(key)
         
-        return "OK"
+        entry = self._store.get(key)
+        if entry is not None:
+            # 결과는 항상 int 인코딩이므로 increment로 크기를 계산
+            entry = self._enforce_memory_limit_for_update(key, entry, increment)
+        if entry is None:
+            self._enforce_memory_limit(key, increment)
+        value = self._apply_incrby(key, entry, increment)
+        
+        self._dirty += 1
+        if self._aof is not None:
+            self._aof.feed(("INCRBY", key, increment))
+        
+        if self._debug_memory:
+            self._verify_memory_usage()
+        
+        return value
     
-    def info_memory(self):
+    def incrbyfloat(self, key, increment):
         """
-        INFO memory - 메모리 정보 반환
+        INCRBYFLOAT key increment - 값에 실수 increment를 더함
+        
+        결과는 문자열(embstr)로 저장됩니다. AOF에는 Redis처럼 결과 값을 SET ... KEEPTTL로 기록하여
+        재생 시 부동소수점 연산을 다시 하지 않습니다.
         
+        Args:
+            key: 대상 키
+            increment: 더할 실수
+            
         Returns:
-            dict: 메모리 사용 정보
+            str: 증가 후 값 문자열
+            
+        Raises:
+            ValueError: 값이 실수가 아니거나 결과가 NaN / 무한대인 경우
+            WrongTypeError: 키가 Hash인 경우
+            OutOfMemoryError: noeviction 정책에서 새 키를 만들거나 값을 키울 수 없는 경우
         """
-        return {
-            'used_memory': self._get_memory_usage(),
-            'maxmemory': self._maxmemory,
-            'evicted_keys': self._evicted_keys
-        }
+        if math.isnan(increment) or math.isinf(increment):
+            raise ValueError("value is not a valid float")
+        
+        self._cleanup_expired()
+        self._expire_if_needed(key)
+        
+        entry = self._store.get(key)
+        value = self._incrbyfloat_result(entry, increment)
+        if entry is not None:
+            entry = self._enforce_memory_limit_for_update(key, entry, value)
+            if entry is None:
+                # 제거 과정에서 이 키가 지워졌으면 0에서 다시 계산
+                value = self._incrbyfloat_result(None, increment)
+        if entry is None:
+            self._enforce_memory_limit(key, value)
+            self._insert_entry(key, value)
+        else:
+            self._update_entry(entry, value)
+        
+        self._dirty += 1
+        if self._aof is not None:
+            self._aof.feed(("SET", key, value, "KEEPTTL"))
+        
+        if self._debug_memory:
+            self._verify_memory_usage()
+        
+        return value
     
-    # ==================== TTL 관리 명령어 ====================
+    # ==================== Hash 타입 ====================
     
-    def expire(self, key, seconds):
+    def hset(self, key, pairs):
         """
-        EXPIRE key seconds - 키의 만료 시간 설정
+        HSET key field value [field value ...] - 해시 필드 값 저장
+        
+        키가 없으면 빈 해시를 만들고, 있으면 바뀐 필드의 값만 교체합니다 (해시 전체를 복사하지 않음).
+        메모리 카운터도 바뀐 필드 크기만큼만 갱신되며, 해시는 키 하나로 LRU/LFU 추적과 제거 대상이 됩니다.
+        메모리 제한은 필드를 쓰기 전에 적용하므로 방금 수정한 해시가 같은 명령어에서 제거되지 않습니다.
         
         Args:
             key: 대상 키
-            seconds: 만료 시간 (초)
+            pairs: (field, value) 튜플의 시퀀스
             
         Returns:
-            int: 1 (성공) 또는 0 (키 없음)
+            int: 새로 추가된 필드 개수
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
+            OutOfMemoryError: noeviction 정책에서 메모리 제한을 넘는 경우
         """
-        if not self._store.contains(key):
-            return 0
+        self._cleanup_expired()
+        self._expire_if_needed(key)
         
-        expire_time = time.time() + int(seconds)
+        incoming = 0
+        for field, value in pairs:
+            incoming += len(field) + len(value)
+        hash_object = self._hash_for_write(key, incoming)
         
-        # TTL 맵에 저장
-        self._ttl_map.put(key, expire_time)
+        added = 0
+        aof_tokens = ["HSET", key] if self._aof is not None else None
+        for field, value in pairs:
+            if self._hash_set(hash_object, field, value):
+                added += 1
+            if aof_tokens is not None:
+                aof_tokens.append(field)
+                aof_tokens.append(value)
         
-        # TTL 힙에 추가
-        self._ttl_heap.push((expire_time, key))
+        self._dirty += len(pairs)
+        if aof_tokens is not None:
+            self._aof.feed(aof_tokens)
         
-        return 1
+        if self._debug_memory:
+            self._verify_memory_usage()
+        
+        return added
     
-    def ttl(self, key):
+    def hget(self, key, field):
         """
-        TTL key - 키의 남은 만료 시간 조회
+        HGET key field - 해시 필드 값 조회
         
         Args:
             key: 대상 키
+            field: 필드 이름
             
         Returns:
-            int: 남은 시간(초), -1(만료 없음), -2(키 없음)
+            str: 값, 키나 필드가 없으면 None
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
         """
-        # 키 존재 확인
-        if not self._store.contains(key):
-            return -2
-        
-        # TTL 확인
-        ttl_entry = self._ttl_map.get(key)
-        if ttl_entry is None:
-            return -1  # 만료 시간 설정 안됨
-        
-        remaining = int(ttl_entry.value - time.time())
-        
-        if remaining <= 0:
-            # 만료됨
-            self._delete_key_internal(key)
-            return -2
+        self._cleanup_expired()
+        hash_object = self._hash_for_read(key)
+        if hash_object is None:
+            return None
+        return hash_object.get(field)
+    
+    def hmget(self, key, fields):
+        """
+        HMGET key field [field ...] - 여러 해시 필드 값 조회
         
-        return remaining
+        Args:
+            key: 대상 키
+            fields: 필드 이름 시퀀스
+            
+        Returns:
+            list: 필드 순서와 같은 순서의 값 리스트 (없는 필드는 None)
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
+        """
+        self._cleanup_expired()
+        hash_object = self._hash_for_read(key)
+        if hash_object is None:
+            return [None] * len(fields)
+        get = hash_object.get
+        return [get(field) for field in fields]
     
-    # ==================== 내부 메서드 ====================
+    def hgetall(self, key):
+        """
+        HGETALL key - 해시의 모든 필드와 값
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            dict: 필드 -> 값 (키가 없으면 빈 딕셔너리, RESP2에서는 [필드, 값, ...] 배열로 응답)
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
+        """
+        self._cleanup_expired()
+        hash_object = self._hash_for_read(key)
+        if hash_object is None:
+            return {}
+        return dict(hash_object.items())
     
-    def _delete_key_internal(self, key):
+    def hdel(self, key, fields):
         """
-        내부 키 삭제 로직
+        HDEL key field [field ...] - 해시 필드 삭제
         
-        해시맵, LRU 리스트, TTL 맵에서 모두 제거합니다.
+        마지막 필드가 삭제되면 키도 삭제됩니다.
         
         Args:
-            key: 삭제할 키
+            key: 대상 키
+            fields: 삭제할 필드 이름 시퀀스
             
         Returns:
-            int: 삭제된 키 개수
+            int: 삭제된 필드 개수
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
         """
+        self._cleanup_expired()
+        if self._expire_if_needed(key):
+            return 0
+        
         entry = self._store.get(key)
         if entry is None:
             return 0
+        if type(entry.value) is not HashObject:
+            raise WrongTypeError()
         
-        # LRU 리스트에서 제거
-        if entry.lru_node:
-            self._lru_list.remove_node(entry.lru_node)
-        
-        # 해시맵에서 제거
-        self._store.remove(key)
+        removed = self._hash_delete(key, entry.value, fields)
+        if removed:
+            self._dirty += removed
+            if self._aof is not None:
+                self._aof.feed(["HDEL", key, *fields])
         
-        # TTL 맵에서 제거
-        self._ttl_map.remove(key)
+        if self._debug_memory:
+            self._verify_memory_usage()
         
-        return 1
+        return removed
     
-    def _is_expired(self, key):
+    def hlen(self, key):
         """
-        키의 만료 여부 확인
+        HLEN key - 해시 필드 개수
         
         Args:
-            key: 확인할 키
+            key: 대상 키
             
         Returns:
-            bool: 만료되었으면 True
+            int: 필드 개수 (키가 없으면 0)
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
         """
-        ttl_entry = self._ttl_map.get(key)
-        if ttl_entry is None:
-            return False
-        
-        return time.time() > ttl_entry.value
+        self._cleanup_expired()
+        hash_object = self._hash_for_read(key)
+        return len(hash_object) if hash_object is not None else 0
     
-    def _cleanup_expired(self):
-        """
-        만료된 키 정리 (Lazy Expiration)
-        
-        TTL 힙에서 만료된 키들을 확인하고 삭제합니다.
+    def hexists(self, key, field):
         """
-        current_time = time.time()
+        HEXISTS key field - 해시 필드 존재 여부
         
-        while not self._ttl_heap.is_empty():
-            top = self._ttl_heap.peek()
-            if top is None:
-                break
-            
-            expire_time, key = top
-            
-            if expire_time > current_time:
-                # 아직 만료 안됨
-                break
+        Args:
+            key: 대상 키
+            field: 필드 이름
             
-            # 힙에서 제거
-            self._ttl_heap.pop()
+        Returns:
+            int: 1 (존재) 또는 0 (없음)
             
-            # 실제로 이 키가 아직 유효한지 확인
-            # (이미 삭제되었거나 TTL이 갱신되었을 수 있음)
-            ttl_entry = self._ttl_map.get(key)
-            if ttl_entry and ttl_entry.value <= current_time:
-                self._delete_key_internal(key)
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
+        """
+        self._cleanup_expired()
+        hash_object = self._hash_for_read(key)
+        if hash_object is None:
+            return 0
+        return 1 if hash_object.get(field) is not None else 0
     
-    def _get_memory_usage(self):
+    def hincrby(self, key, field, increment):
         """
-        현재 메모리 사용량 계산
+        HINCRBY key field increment - 해시 필드의 정수 값에 increment를 더함
         
-        간소화된 계산: 각 키-값 쌍의 문자열 길이 합
+        필드가 없으면 0에서 시작합니다. AOF에는 결과 값을 HSET으로 기록합니다.
         
+        Args:
+            key: 대상 키
+            field: 필드 이름
+            increment: 더할 정수 (음수면 감소)
+            
         Returns:
-            int: 예상 메모리 사용량 (바이트)
+            int: 증가 후 값
+            
+        Raises:
+            ValueError: 필드 값이나 increment가 64비트 정수가 아니거나, 결과가 범위를 벗어나는 경우
+            WrongTypeError: 키가 Hash가 아닌 경우
+            OutOfMemoryError: noeviction 정책에서 메모리 제한을 넘는 경우
         """
-        total = 0
-        for entry in self._store.entries():
-            # 키와 값의 문자열 길이를 바이트로 계산
-            total += len(str(entry.key))
-            total += len(str(entry.value))
-        return total
+        if not INT64_MIN <= increment <= INT64_MAX:
+            raise ValueError("value is not an integer or out of range")
+        
+        self._cleanup_expired()
+        self._expire_if_needed(key)
+        
+        # 제거가 먼저 끝나야 이 키가 지워진 경우에도 현재 값을 올바르게 읽음 (결과는 최대 20자)
+        hash_object = self._hash_for_write(key, len(field) + INT64_MAX_DIGITS)
+        current = hash_object.get(field)
+        if current is None:
+            value = increment
+        else:
+            value = string_to_int64(current)
+            if value is None:
+                raise ValueError("hash value is not an integer")
+            value += increment
+            if not INT64_MIN <= value <= INT64_MAX:
+                raise ValueError("increment or decrement would overflow")
+        
+        text = str(value)
+        self._hash_set(hash_object, field, text)
+        
+        self._dirty += 1
+        if self._aof is not None:
+            self._aof.feed(("HSET", key, field, text))
+        
+        if self._debug_memory:
+            self._verify_memory_usage()
+        
+        return value
     
-    def _enforce_memory_limit(self, new_key, new_value):
+    # ==================== 다중 키 (배치) 명령어 ====================
+    
+    def mset(self, pairs):
         """
-        메모리 제한 적용
+        MSET key value [key value ...] - 여러 키-값 쌍을 한 번에 저장
         
-        새 키-값을 추가해도 메모리 제한을 초과하지 않도록
-        필요한 만큼 LRU 정책으로 오래된 키를 제거합니다.
+        키마다 만료 정리와 메모리 제한 확인을 반복하지 않고,
+        만료 정리 1회 -> 모든 쓰기 적용 -> 메모리 제한 조정 1회 순서로 처리합니다.
+        SET과 마찬가지로 덮어쓴 키의 TTL은 제거됩니다.
         
         Args:
-            new_key: 추가할 키
+            pairs: (key, value) 튜플의 시퀀스
+            
+        Returns:
+            str: "OK"
+        """
+        # 만료된 키 정리 (배치 전체에 대해 1회)
+        self._cleanup_expired()
+        
+        pairs = [(key, _encode_value(value)) for key, value in pairs]
+        
+        # noeviction: 배치 전체 크기로 한 번만 확인하고 초과 시 거부
+        if self._maxmemory > 0 and self._maxmemory_policy == "noeviction":
+            incoming = 0
+            for key, value in pairs:
+                incoming += self._entry_size(key, value)
+            if self._get_memory_usage() + incoming > self._maxmemory:
+                raise OutOfMemoryError()
+        
+        store = self._store
+        aof_tokens = ["MSET"] if self._aof is not None else None
+        for key, value in pairs:
+            self._expire_if_needed(key)
+            existing_entry = store.get(key)
+            if existing_entry:
+                self._update_entry(existing_entry, value)
+                self._remove_expire(key)
+            else:
+                self._insert_entry(key, value)
+            if aof_tokens is not None:
+                aof_tokens.append(key)
+                aof_tokens.append(value)
+        
+        self._dirty += len(pairs)
+        if aof_tokens is not None:
+            self._aof.feed(aof_tokens)
+        
+        # 메모리 제한 조정 (배치 전체에 대해 1회)
+        self._evict_until_within_limit()
+        
+        if self._debug_memory:
+            self._verify_memory_usage()
+        
+        return "OK"
+    
+    def mget(self, keys):
+        """
+        MGET key [key ...] - 여러 키의 값을 한 번에 조회
+        
+        만료 정리를 1회만 수행한 뒤 모든 키를 조회합니다.
+        만료 정리는 한 번에 처리하는 개수가 제한되므로 키마다 만료 여부도 확인합니다.
+        
+        Args:
+            keys: 조회할 키 시퀀스
+            
+        Returns:
+            list: 키 순서와 같은 순서의 값 리스트 (없는 키와 Hash 키는 None)
+        """
+        # 만료된 키 정리
+        self._cleanup_expired()
+        
+        store = self._store
+        touch = self._touch_entry
+        expire_if_needed = self._expire_if_needed
+        values = []
+        for key in keys:
+            if expire_if_needed(key):
+                values.append(None)
+                continue
+            entry = store.get(key)
+            if entry is None or type(entry.value) is HashObject:
+                values.append(None)
+                continue
+            touch(entry)
+            values.append(_decode_value(entry.value))
+        return values
+    
+    def delete_many(self, keys):
+        """
+        DEL key [key ...] - 여러 키를 한 번에 삭제
+        
+        Args:
+            keys: 삭제할 키 시퀀스
+            
+        Returns:
+            int: 실제로 삭제된 키 개수 (이미 만료된 키는 제외)
+        """
+        self._cleanup_expired()
+        
+        deleted = 0
+        for key in keys:
+            if not self._expire_if_needed(key):
+                deleted += self._delete_key_internal(key)
+        return deleted
+    
+    def exists_many(self, keys):
+        """
+        EXISTS key [key ...] - 존재하는 키 개수 반환
+        
+        같은 키를 여러 번 지정하면 그만큼 중복해서 셉니다 (Redis와 동일).
+        
+        Args:
+            keys: 확인할 키 시퀀스
+            
+        Returns:
+            int: 존재하는 키 개수
+        """
+        self._cleanup_expired()
+        
+        store = self._store
+        count = 0
+        for key in keys:
+            if not self._expire_if_needed(key) and store.contains(key):
+                count += 1
+        return count
+    
+    # ==================== 키스페이스 순회 ====================
+    
+    def scan(self, cursor, match=None, count=SCAN_DEFAULT_COUNT):
+        """
+        SCAN cursor [MATCH pattern] [COUNT count] - 커서 기반 키 순회
+        
+        해시 테이블 버킷을 역방향 비트 커서 순서로 count개 남짓만 방문하므로 호출 하나의 작업량이
+        제한되고, 호출 사이에 테이블이 확장/축소되어도 순회 내내 있던 키는 한 번 이상 반환됩니다.
+        MATCH는 버킷에서 꺼낸 뒤에 거르므로 빈 결과와 0이 아닌 커서가 함께 올 수 있습니다.
+        방문한 키 중 만료된 키는 삭제하고 반환하지 않습니다.
+        
+        접두사 인덱스가 있고 패턴이 와일드카드 없는 접두사로 시작하면(예: tenant:42:*)
+        인덱스에서 그 범위만 정렬 순서로 훑습니다 (_scan_prefix).
+        
+        Args:
+            cursor: 이전 호출이 반환한 커서 (처음은 0)
+            match: 글롭 패턴 (None이면 모든 키)
+            count: 한 번에 방문할 키 개수 목표
+            
+        Returns:
+            tuple: (다음 커서, 키 리스트), 다음 커서가 0이면 순회 완료
+            
+        Raises:
+            ValueError: 커서가 음수이거나 count가 1 미만인 경우
+        """
+        if cursor < 0:
+            raise ValueError("invalid cursor")
+        if count < 1:
+            raise ValueError("syntax error")
+        
+        regex = None if matches_all(match) else compile_glob(match)
+        if self._prefix_index is not None and regex is not None:
+            prefix = literal_prefix(match)
+            if prefix:
+                return self._scan_prefix(cursor, prefix, regex, count)
+        
+        cursor, entries = self._store.scan(cursor, count)
+        keys = []
+        for entry in entries:
+            key = entry.key
+            if regex is not None and regex.fullmatch(key) is None:
+                continue
+            if self._expire_if_needed(key):
+                continue
+            keys.append(key)
+        return cursor, keys
+    
+    def keys(self, pattern="*"):
+        """
+        KEYS pattern - 패턴과 일치하는 모든 키
+        
+        리스트를 만들지 않고 키를 하나씩 yield하므로 응답 인코딩이 키를 바로 소비할 수 있습니다.
+        순회 중에는 테이블을 바꿀 수 없으므로 만료된 키는 삭제하지 않고 건너뛰기만 합니다.
+        모든 키를 훑으므로 큰 키스페이스에서는 SCAN을 사용하세요
+        (접두사 인덱스가 있으면 패턴의 접두사 범위만 훑음).
+        
+        Args:
+            pattern: 글롭 패턴
+            
+        Yields:
+            str: 일치하는 키
+        """
+        regex = None if matches_all(pattern) else compile_glob(pattern)
+        if self._prefix_index is not None and regex is not None and literal_prefix(pattern):
+            candidates = self._prefix_index.iter_prefix(literal_prefix(pattern))
+        else:
+            candidates = (entry.key for entry in self._store.entries())
+        
+        ttl_map = self._ttl_map
+        now = mstime()
+        for key in candidates:
+            if regex is not None and regex.fullmatch(key) is None:
+                continue
+            ttl_entry = ttl_map.get(key)
+            if ttl_entry is not None and now > ttl_entry.value:
+                continue
+            yield key
+    
+    def count_prefix(self, prefix):
+        """
+        COUNTPREFIX prefix - prefix로 시작하는 키 개수
+        
+        접두사 인덱스가 있으면 순위 차이로 O(log n)에 계산하고, 없으면 키스페이스 전체를 훑습니다.
+        DBSIZE와 같이 만료되었지만 아직 회수되지 않은 키도 포함될 수 있습니다.
+        
+        Args:
+            prefix: 접두사
+            
+        Returns:
+            int: 키 개수
+        """
+        if self._prefix_index is not None:
+            return self._prefix_index.count_prefix(prefix)
+        count = 0
+        for entry in self._store.entries():
+            if entry.key.startswith(prefix):
+                count += 1
+        return count
+    
+    def delete_prefix(self, prefix):
+        """
+        DELPREFIX prefix - prefix로 시작하는 키를 모두 삭제
+        
+        Args:
+            prefix: 접두사
+            
+        Returns:
+            int: 삭제된 키 개수 (이미 만료된 키는 제외)
+        """
+        deleted = 0
+        for key in self._prefix_keys(prefix):
+            if not self._expire_if_needed(key):
+                deleted += self._delete_key_internal(key)
+        return deleted
+    
+    def unlink_prefix(self, prefix):
+        """
+        UNLINKPREFIX prefix - prefix로 시작하는 키를 키스페이스에서 떼어내고 값 해제는 미룸
+        
+        키는 DELPREFIX와 같이 바로 사라지지만, 지운 키가 LAZYFREE_THRESHOLD개 이상이면
+        엔트리(값)의 참조를 lazyfree 워커 스레드가 놓도록 넘깁니다 (Redis의 lazyfree).
+        GIL 아래에서는 해제 비용이 없어지지 않고 응답 뒤로 밀릴 뿐이므로 이점은 제한적입니다.
+        
+        Args:
+            prefix: 접두사
+            
+        Returns:
+            int: 삭제된 키 개수 (이미 만료된 키는 제외)
+        """
+        unlinked = []
+        for key in self._prefix_keys(prefix):
+            if self._expire_if_needed(key):
+                continue
+            entry = self._store.get(key)
+            if entry is not None and self._delete_key_internal(key):
+                unlinked.append(entry)
+        
+        count = len(unlinked)
+        if count >= LAZYFREE_THRESHOLD:
+            _lazyfree(unlinked)
+        return count
+    
+    # ==================== 메모리 관리 명령어 ====================
+    
+    def config_set_maxmemory(self, bytes_limit):
+        """
+        CONFIG SET maxmemory - 최대 메모리 제한 설정
+        
+        Args:
+            bytes_limit: 바이트 단위 메모리 제한 (0 = 무제한)
+            
+        Returns:
+            str: "OK"
+        """
+        self._maxmemory = int(bytes_limit)
+        
+        # 현재 메모리가 제한을 초과하면 제거
+        self._evict_until_within_limit()
+        
+        return "OK"
+    
+    def config_set(self, param, value):
+        """
+        CONFIG SET parameter value - 설정 변경
+        
+        Args:
+            param: 설정 이름 (대소문자 무시)
+            value: 설정 값 (문자열)
+            
+        Returns:
+            str: "OK"
+            
+        Raises:
+            ValueError: 알 수 없는 설정이거나 값이 올바르지 않은 경우
+        """
+        param = param.lower()
+        
+        if param == "maxmemory":
+            return self.config_set_maxmemory(self._parse_int_config(value))
+        elif param == "maxmemory-policy":
+            policy = str(value).lower()
+            if policy not in MAXMEMORY_POLICIES:
+                raise ValueError(f"invalid maxmemory-policy '{value}'")
+            if policy != self._maxmemory_policy:
+                # 점수 기준이 달라지므로 후보 풀 초기화
+                self._eviction_pool.clear()
+            self._maxmemory_policy = policy
+            self._use_lfu = policy in ("allkeys-lfu", "volatile-lfu")
+            return "OK"
+        elif param == "maxmemory-samples":
+            samples = self._parse_int_config(value)
+            if samples < 1:
+                raise ValueError("maxmemory-samples must be positive")
+            self._maxmemory_samples = samples
+            return "OK"
+        elif param == "lfu-log-factor":
+            factor = self._parse_int_config(value)
+            if factor < 0:
+                raise ValueError("lfu-log-factor must be non-negative")
+            self._lfu_log_factor = factor
+            return "OK"
+        elif param == "lfu-decay-time":
+            decay_time = self._parse_int_config(value)
+            if decay_time < 0:
+                raise ValueError("lfu-decay-time must be non-negative")
+            self._lfu_decay_time = decay_time
+            return "OK"
+        elif param == "hash-max-listpack-entries":
+            entries = self._parse_int_config(value)
+            if entries < 0:
+                raise ValueError("hash-max-listpack-entries must be non-negative")
+            self._hash_max_listpack_entries = entries
+            return "OK"
+        elif param == "hash-max-listpack-value":
+            max_value = self._parse_int_config(value)
+            if max_value < 0:
+                raise ValueError("hash-max-listpack-value must be non-negative")
+            self._hash_max_listpack_value = max_value
+            return "OK"
+        elif param == "hz":
+            hz = self._parse_int_config(value)
+            if hz < 1 or hz > 500:
+                raise ValueError("hz must be between 1 and 500")
+            self._hz = hz
+            return "OK"
+        elif param == "active-expire-max-ms":
+            max_ms = self._parse_int_config(value)
+            if max_ms < 0:
+                raise ValueError("active-expire-max-ms must be non-negative")
+            self._active_expire_max_ms = max_ms
+            return "OK"
+        elif param == "activerehashing":
+            self._active_rehashing = self._parse_bool_config(value)
+            return "OK"
+        elif param == "appendonly":
+            enabled = self._parse_bool_config(value)
+            if enabled and self._aof is None:
+                self.enable_aof(self._aof_filename, self._aof_fsync)
+            elif not enabled and self._aof is not None:
+                self.disable_aof()
+            return "OK"
+        elif param == "appendfsync":
+            policy = str(value).lower()
+            if policy not in FSYNC_POLICIES:
+                raise ValueError(f"invalid appendfsync policy '{value}'")
+            self._aof_fsync = policy
+            if self._aof is not None:
+                self._aof.fsync_policy = policy
+            return "OK"
+        elif param == "auto-aof-rewrite-percentage":
+            self._auto_aof_rewrite_percentage = self._parse_int_config(value)
+            return "OK"
+        elif param == "auto-aof-rewrite-min-size":
+            self._auto_aof_rewrite_min_size = self._parse_int_config(value)
+            return "OK"
+        elif param == "dbfilename":
+            self._dbfilename = str(value)
+            return "OK"
+        elif param == "slowlog-log-slower-than":
+            self._slowlog_log_slower_than = self._parse_int_config(value)
+            return "OK"
+        elif param == "slowlog-max-len":
+            max_len = self._parse_int_config(value)
+            if max_len < 0:
+                raise ValueError("slowlog-max-len must be non-negative")
+            self._slowlog.resize(max_len)
+            return "OK"
+        elif param == "latency-monitor-threshold":
+            threshold = self._parse_int_config(value)
+            if threshold < 0:
+                raise ValueError("latency-monitor-threshold must be non-negative")
+            self._latency_monitor.set_threshold(threshold)
+            return "OK"
+        else:
+            raise ValueError(f"unknown config parameter '{param}'")
+    
+    def config_get(self, param):
+        """
+        CONFIG GET parameter - 설정 조회
+        
+        Args:
+            param: 설정 이름 (대소문자 무시)
+            
+        Returns:
+            str: 설정 값
+            
+        Raises:
+            ValueError: 알 수 없는 설정인 경우
+        """
+        param = param.lower()
+        
+        if param == "maxmemory":
+            return str(self._maxmemory)
+        elif param == "maxmemory-policy":
+            return self._maxmemory_policy
+        elif param == "maxmemory-samples":
+            return str(self._maxmemory_samples)
+        elif param == "lru-tracking":
+            return self._lru_tracking
+        elif param == "ttl-index":
+            return self._ttl_index
+        elif param == "hash-table":
+            return self._hash_table
+        elif param == "cluster-enabled":
+            return "yes" if self._slot_keys is not None else "no"
+        elif param == "prefix-index":
+            return "yes" if self._prefix_index is not None else "no"
+        elif param == "lfu-log-factor":
+            return str(self._lfu_log_factor)
+        elif param == "lfu-decay-time":
+            return str(self._lfu_decay_time)
+        elif param == "hash-max-listpack-entries":
+            return str(self._hash_max_listpack_entries)
+        elif param == "hash-max-listpack-value":
+            return str(self._hash_max_listpack_value)
+        elif param == "hz":
+            return str(self._hz)
+        elif param == "active-expire-max-ms":
+            return str(self._active_expire_max_ms)
+        elif param == "activerehashing":
+            return "yes" if self._active_rehashing else "no"
+        elif param == "appendonly":
+            return "yes" if self._aof is not None else "no"
+        elif param == "appendfsync":
+            return self._aof_fsync
+        elif param == "appendfilename":
+            return self._aof_filename
+        elif param == "dbfilename":
+            return self._dbfilename
+        elif param == "auto-aof-rewrite-percentage":
+            return str(self._auto_aof_rewrite_percentage)
+        elif param == "auto-aof-rewrite-min-size":
+            return str(self._auto_aof_rewrite_min_size)
+        elif param == "slowlog-log-slower-than":
+            return str(self._slowlog_log_slower_than)
+        elif param == "slowlog-max-len":
+            return str(self._slowlog.max_len())
+        elif param == "latency-monitor-threshold":
+            return str(self._latency_monitor.threshold_ms())
+        else:
+            raise ValueError(f"unknown config parameter '{param}'")
+    
+    def info_memory(self):
+        """
+        INFO memory - 메모리 정보 반환
+        
+        Returns:
+            dict: 메모리 사용 정보
+        """
+        return {
+            'used_memory': self._get_memory_usage(),
+            'maxmemory': self._maxmemory,
+            'maxmemory_policy': self._maxmemory_policy,
+            'evicted_keys': self._evicted_keys,
+            'ttl_index': self._ttl_index,
+            'ttl_index_entries': self._ttl_index_size(),
+            'hash_table': self._hash_table,
+        }
+    
+    def object_encoding(self, key):
+        """
+        OBJECT ENCODING key - 값의 내부 인코딩
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            str: "int", "embstr", "raw" (String) 또는 "listpack", "hashtable" (Hash), 키가 없으면 None
+        """
+        if self._expire_if_needed(key):
+            return None
+        
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value = entry.value
+        if type(value) is int:
+            return "int"
+        if type(value) is HashObject:
+            return value.encoding()
+        if len(str(value).encode(ENCODING, ENCODING_ERRORS)) <= EMBSTR_SIZE_LIMIT:
+            return "embstr"
+        return "raw"
+    
+    def type_of(self, key):
+        """
+        TYPE key - 키에 저장된 값의 타입
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            str: "string", "hash", 키가 없으면 "none"
+        """
+        if self._expire_if_needed(key):
+            return "none"
+        
+        entry = self._store.get(key)
+        if entry is None:
+            return "none"
+        return "hash" if type(entry.value) is HashObject else "string"
+    
+    def object_freq(self, key):
+        """
+        OBJECT FREQ key - 키의 LFU 접근 빈도 카운터 조회
+        
+        감쇠를 반영한 값을 반환하며, 조회 자체는 접근으로 세지 않습니다.
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 0~255 카운터, 키가 없으면 None
+            
+        Raises:
+            RuntimeError: LFU 정책이 아니어서 빈도를 추적하지 않는 경우
+        """
+        if not self._use_lfu:
+            raise RuntimeError(
+                "An LFU maxmemory policy is not selected, access frequency not tracked."
+            )
+        
+        if self._expire_if_needed(key):
+            return None
+        
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        return self._lfu_decr_and_return(entry, self._lfu_minutes())
+    
+    def info_stats(self):
+        """
+        INFO stats - 만료 통계 반환
+        
+        Returns:
+            dict: 만료된 키 수, 초당 만료 수, 능동 만료 주기 실행 시간 등
+        """
+        return {
+            'expired_keys': self._stat_expired_keys,
+            'instantaneous_expired_per_sec': round(self._expired_per_sec, 2),
+            'expired_stale_perc': round(self._stat_expired_stale_perc, 2),
+            'expired_time_cap_reached_count': self._stat_expire_cycle_time_cap_reached,
+            'expire_cycles': self._stat_expire_cycles,
+            'expire_cycle_cpu_milliseconds': int(self._stat_expire_cycle_cpu_ms),
+            'expire_cycle_last_ms': round(self._stat_expire_cycle_last_ms, 3),
+            'expire_cycle_max_ms': round(self._stat_expire_cycle_max_ms, 3),
+            'evicted_keys': self._evicted_keys,
+        }
+    
+    # ==================== 영속성 (AOF) ====================
+    
+    def enable_aof(self, path, fsync_policy=FSYNC_EVERYSEC):
+        """
+        AOF 활성화
+        
+        키스페이스가 비어 있고 파일이 이미 있으면 먼저 파일을 재생하여 복원합니다 (서버 시작 시).
+        키스페이스에 데이터가 있으면 현재 데이터로 파일을 새로 작성합니다 (실행 중 활성화 시).
+        
+        Args:
+            path: AOF 파일 경로
+            fsync_policy: fsync 정책 (always / everysec / no)
+            
+        Returns:
+            int: 시작 시 재생한 명령어 개수
+        """
+        if self._aof is not None:
+            self.disable_aof()
+        
+        loaded = 0
+        if self._store.size() == 0 and os.path.exists(path):
+            loaded = self.load_aof(path)
+        
+        self._aof_filename = path
+        self._aof_fsync = fsync_policy
+        self._aof = AppendOnlyFile(path, fsync_policy)
+        
+        if self._store.size() > 0 and loaded == 0:
+            self._aof.rewrite(self)
+        
+        return loaded
+    
+    def disable_aof(self):
+        """
+        AOF 비활성화 (버퍼 기록 후 파일 닫기)
+        """
+        if self._aof is not None:
+            self._aof.close()
+            self._aof = None
+    
+    def load_aof(self, path):
+        """
+        AOF 파일 재생
+        
+        명령어마다 만료 정리/메모리 제한 확인을 하지 않고 적재한 뒤,
+        마지막에 한 번 만료 정리와 메모리 제한 조정을 수행합니다.
+        
+        Args:
+            path: AOF 파일 경로
+            
+        Returns:
+            int: 재생한 명령어 개수
+        """
+        count = load_aof(path, self)
+        self._cleanup_expired(limit=None)
+        self._evict_until_within_limit()
+        self._aof_loaded_commands = count
+        return count
+    
+    def bgrewriteaof(self):
+        """
+        BGREWRITEAOF - 백그라운드 AOF 재작성 시작
+        
+        Returns:
+            str: 상태 메시지
+            
+        Raises:
+            RuntimeError: AOF 비활성 상태이거나 이미 재작성 중인 경우
+        """
+        if self._aof is None:
+            raise RuntimeError("AOF is disabled (CONFIG SET appendonly yes first)")
+        if self._snapshot.in_progress():
+            raise RuntimeError("Background save in progress, try again later")
+        self._aof.rewrite_background(self)
+        return "Background append only file rewriting started"
+    
+    def flush_aof(self):
+        """
+        AOF 버퍼를 파일에 write
+        
+        서버가 파이프라인 배치 하나를 처리한 뒤 응답 전에 호출하여
+        여러 명령어의 기록을 write 한 번으로 묶습니다.
+        """
+        if self._aof is not None:
+            self._aof.flush()
+    
+    # ==================== 영속성 (스냅샷) ====================
+    
+    def save(self, path=None):
+        """
+        SAVE - 현재 키스페이스를 스냅샷 파일로 동기 저장
+        
+        Args:
+            path: 저장 경로 (기본값: dbfilename 설정)
+            
+        Returns:
+            str: "OK"
+            
+        Raises:
+            RuntimeError: BGSAVE가 진행 중인 경우
+        """
+        if self._snapshot.in_progress():
+            raise RuntimeError("Background save already in progress")
+        self._snapshot.save(self, path or self._dbfilename)
+        self._dirty = 0
+        return "OK"
+    
+    def bgsave(self, path=None):
+        """
+        BGSAVE - fork된 자식 프로세스에서 스냅샷 저장
+        
+        자식은 fork 시점의 메모리를 copy-on-write로 공유하므로
+        부모는 저장이 끝나기를 기다리지 않고 명령어를 계속 처리합니다.
+        
+        Args:
+            path: 저장 경로 (기본값: dbfilename 설정)
+            
+        Returns:
+            str: 상태 메시지
+            
+        Raises:
+            RuntimeError: 이미 저장 중이거나 AOF 재작성 중인 경우
+        """
+        if self._aof is not None and self._aof.rewrite_in_progress():
+            raise RuntimeError("Background append only file rewriting in progress, try again later")
+        self._dirty_before_bgsave = self._dirty
+        self._snapshot.bgsave(self, path or self._dbfilename)
+        if not self._snapshot.in_progress():
+            # fork 미지원 플랫폼: 동기 저장 완료
+            self._dirty = 0
+        return "Background saving started"
+    
+    def lastsave(self):
+        """
+        LASTSAVE - 마지막 저장 성공 시각
+        
+        Returns:
+            int: Unix epoch 초
+        """
+        return self._snapshot.last_save_time
+    
+    def load_snapshot(self, path=None):
+        """
+        스냅샷 파일을 읽어 키스페이스 교체
+        
+        Args:
+            path: 스냅샷 경로 (기본값: dbfilename 설정)
+            
+        Returns:
+            int: 로드한 키 개수
+        """
+        return self._snapshot.load(self, path or self._dbfilename)
+    
+    def info_persistence(self):
+        """
+        INFO persistence - 영속성 정보 반환
+        
+        Returns:
+            dict: 영속성 정보
+        """
+        info = {'rdb_changes_since_last_save': self._dirty}
+        info.update(self._snapshot.info())
+        if self._aof is None:
+            info['aof_enabled'] = 0
+        else:
+            info.update(self._aof.info())
+        info['aof_loaded_commands'] = self._aof_loaded_commands
+        return info
+    
+    # ==================== 클러스터 (해시 슬롯) ====================
+    
+    def count_keys_in_slot(self, slot):
+        """
+        CLUSTER COUNTKEYSINSLOT slot - 슬롯에 속한 키 개수
+        
+        Args:
+            slot: 해시 슬롯 번호 (0 ~ 16383)
+            
+        Returns:
+            int: 키 개수
+            
+        Raises:
+            RuntimeError: cluster_enabled가 아닌 경우
+        """
+        keys = self._slot_key_map(slot)
+        return keys.size() if keys is not None else 0
+    
+    def get_keys_in_slot(self, slot, count):
+        """
+        CLUSTER GETKEYSINSLOT slot count - 슬롯에 속한 키를 최대 count개 반환
+        
+        Args:
+            slot: 해시 슬롯 번호 (0 ~ 16383)
+            count: 최대 개수
+            
+        Returns:
+            list: 키 리스트
+            
+        Raises:
+            RuntimeError: cluster_enabled가 아닌 경우
+        """
+        keys = self._slot_key_map(slot)
+        result = []
+        if keys is None or count <= 0:
+            return result
+        for key in keys.keys():
+            result.append(key)
+            if len(result) >= count:
+                break
+        return result
+    
+    # ==================== 명령어 통계 / 지연 모니터 ====================
+    
+    def record_command(self, name, args, duration_ns, failed=False, rejected=False):
+        """
+        명령어 하나의 실행 결과 기록 (CLI.dispatch가 명령어마다 호출)
+        
+        통계와 히스토그램은 항상 갱신하고, SLOWLOG와 지연 모니터는 임계값을 넘은 경우에만 기록합니다.
+        
+        Args:
+            name: 명령어 이름 (소문자)
+            args: 명령어 토큰 리스트 (SLOWLOG용)
+            duration_ns: 실행 시간 (나노초)
+            failed: 에러 응답을 반환했으면 True
+            rejected: 실행 전에 거부되었으면 True (OOM, 호출 수와 시간에는 포함하지 않음)
+        """
+        stat = self._command_stats.get(name)
+        if stat is None:
+            stat = self._command_stats[name] = CommandStat()
+        if rejected:
+            stat.rejected_calls += 1
+            return
+        stat.calls += 1
+        stat.duration_ns += duration_ns
+        stat.histogram.record(duration_ns)
+        if failed:
+            stat.failed_calls += 1
+        
+        if 0 <= self._slowlog_log_slower_than <= duration_ns // 1000:
+            self._slowlog.add(args, duration_ns // 1000)
+        if duration_ns >= self._latency_monitor.threshold_ns:
+            self._latency_monitor.add_sample("command", duration_ns)
+    
+    def info_commandstats(self):
+        """
+        INFO commandstats - 명령어별 호출 수와 실행 시간
+        
+        Returns:
+            dict: "cmdstat_<명령어>" -> "calls=...,usec=...,usec_per_call=...,rejected_calls=...,failed_calls=..."
+        """
+        return {f"cmdstat_{name}": stat.info() for name, stat in self._sorted_command_stats()}
+    
+    def info_latencystats(self):
+        """
+        INFO latencystats - 명령어별 지연 백분위
+        
+        Returns:
+            dict: "latency_percentiles_usec_<명령어>" -> "p50=...,p99=...,p99.9=..."
+        """
+        return {f"latency_percentiles_usec_{name}": stat.percentiles_usec()
+                for name, stat in self._sorted_command_stats() if stat.calls}
+    
+    def latency_histogram(self, commands=None):
+        """
+        LATENCY HISTOGRAM [command ...] - 명령어별 지연 분포
+        
+        Args:
+            commands: 명령어 이름 시퀀스 (None이나 빈 시퀀스면 실행된 모든 명령어)
+            
+        Returns:
+            list: [명령어, ["calls", 호출 수, "histogram_usec", [구간 상한, 누적 개수, ...]], ...]
+        """
+        wanted = {command.lower() for command in commands} if commands else None
+        result = []
+        for name, stat in self._sorted_command_stats():
+            if stat.calls and (wanted is None or name in wanted):
+                result.extend((name, ["calls", stat.calls, "histogram_usec", stat.histogram_usec()]))
+        return result
+    
+    def reset_stats(self):
+        """
+        CONFIG RESETSTAT - 명령어 통계 초기화
+        """
+        self._command_stats = {}
+    
+    def slowlog_get(self, count=10):
+        """
+        SLOWLOG GET [count] - 최근 느린 명령어
+        
+        Args:
+            count: 개수 (음수면 전부)
+            
+        Returns:
+            list: [id, unix 시각, 실행 시간(usec), [인자 ...]] 리스트 (최근 항목부터)
+        """
+        return self._slowlog.get(count)
+    
+    def slowlog_len(self):
+        """
+        SLOWLOG LEN - 저장된 느린 명령어 개수
+        
+        Returns:
+            int: 개수
+        """
+        return len(self._slowlog)
+    
+    def slowlog_reset(self):
+        """
+        SLOWLOG RESET - 느린 명령어 기록 삭제
+        """
+        self._slowlog.reset()
+    
+    def latency_latest(self):
+        """
+        LATENCY LATEST - 이벤트별 최근 지연과 최대 지연
+        
+        Returns:
+            list: [이벤트, unix 시각, 최근 지연 ms, 최대 지연 ms] 리스트
+        """
+        return self._latency_monitor.latest()
+    
+    def latency_history(self, event):
+        """
+        LATENCY HISTORY event - 이벤트의 초 단위 지연 이력
+        
+        Args:
+            event: 이벤트 이름 (command, expire-cycle, expire-cleanup, eviction-cycle, hash-resize)
+            
+        Returns:
+            list: [unix 시각, 지연 ms] 리스트
+        """
+        return self._latency_monitor.history(event)
+    
+    def latency_reset(self, events=None):
+        """
+        LATENCY RESET [event ...] - 이벤트 지연 기록 삭제
+        
+        Args:
+            events: 이벤트 이름 시퀀스 (None이나 빈 시퀀스면 전부)
+            
+        Returns:
+            int: 삭제한 이벤트 개수
+        """
+        return self._latency_monitor.reset(events)
+    
+    # ==================== 서버 주기 작업 ====================
+    
+    def cron_interval(self):
+        """
+        cron 호출 간격 (hz 설정의 역수)
+        
+        Returns:
+            float: 초 단위 간격
+        """
+        return 1.0 / self._hz
+    
+    def cron(self):
+        """
+        주기 작업 (서버 이벤트 루프 또는 REPL 백그라운드 스레드에서 hz 주기로 호출)
+        
+        - 능동 만료 주기 (시간 예산 안에서 만료된 키 회수)
+        - 키스페이스 / TTL 맵 점진적 재해싱 (activerehashing, 해시맵별 최대 1ms)
+        - BGSAVE 자식 프로세스 완료 확인
+        - AOF 버퍼 flush / everysec fsync / 재작성 완료 확인
+        - AOF 자동 재작성 (파일이 마지막 재작성 대비 일정 비율 이상 커졌을 때)
+        """
+        if self._active_expire_max_ms > 0:
+            self.active_expire_cycle()
+        self._update_expire_rate()
+        
+        if self._active_rehashing:
+            self._store.rehash_milliseconds(1)
+            self._ttl_map.rehash_milliseconds(1)
+        
+        if self._snapshot.cron():
+            # fork 이후의 변경분만 남김
+            self._dirty -= self._dirty_before_bgsave
+        
+        aof = self._aof
+        if aof is None:
+            return
+        
+        aof.cron()
+        
+        if (self._auto_aof_rewrite_percentage > 0 and not aof.rewrite_in_progress()
+                and not self._snapshot.in_progress()
+                and aof.current_size >= self._auto_aof_rewrite_min_size):
+            base = aof.base_size if aof.base_size > 0 else 1
+            growth = (aof.current_size - base) * 100 // base
+            if growth >= self._auto_aof_rewrite_percentage:
+                aof.rewrite_background(self)
+    
+    def active_expire_cycle(self):
+        """
+        능동 만료 주기 (Active Expire Cycle)
+        
+        요청이 없어도 만료된 키가 메모리를 차지하지 않도록 cron에서 호출됩니다.
+        TTL 키 중 ACTIVE_EXPIRE_KEYS_PER_LOOP개를 표본으로 뽑아 만료된 키를 삭제하고,
+        표본 중 만료 비율이 ACTIVE_EXPIRE_ACCEPTABLE_STALE%를 넘으면 다시 반복합니다.
+        만료된 키가 적으면 한두 번 만에 끝나고, 많으면 active-expire-max-ms까지 계속합니다.
+        
+        Returns:
+            int: 이번 주기에 회수한 키 개수
+        """
+        start = time.perf_counter()
+        deadline = start + self._active_expire_max_ms / 1000
+        ttl_map = self._ttl_map
+        sampled_total = 0
+        expired_total = 0
+        
+        while ttl_map.size() > 0:
+            now = mstime()
+            sampled = 0
+            expired = 0
+            for entry in ttl_map.sample_entries(ACTIVE_EXPIRE_KEYS_PER_LOOP):
+                sampled += 1
+                if now > entry.value:
+                    self._expire_key(entry.key)
+                    expired += 1
+            sampled_total += sampled
+            expired_total += expired
+            
+            if time.perf_counter() >= deadline:
+                self._stat_expire_cycle_time_cap_reached += 1
+                break
+            if expired * 100 <= sampled * ACTIVE_EXPIRE_ACCEPTABLE_STALE:
+                break
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._latency_monitor.add_sample("expire-cycle", int(elapsed_ms * 1000000))
+        self._stat_expire_cycles += 1
+        self._stat_expire_cycle_cpu_ms += elapsed_ms
+        self._stat_expire_cycle_last_ms = elapsed_ms
+        if elapsed_ms > self._stat_expire_cycle_max_ms:
+            self._stat_expire_cycle_max_ms = elapsed_ms
+        if sampled_total > 0:
+            self._stat_expired_stale_perc = expired_total * 100 / sampled_total
+        return expired_total
+    
+    def shutdown(self):
+        """
+        종료 처리 (진행 중인 BGSAVE 대기, AOF 버퍼 기록 및 fsync)
+        """
+        self._snapshot.wait()
+        self.disable_aof()
+    
+    # ==================== TTL 관리 명령어 ====================
+    
+    def expire(self, key, seconds):
+        """
+        EXPIRE key seconds - 키의 만료 시간 설정
+        
+        Args:
+            key: 대상 키
+            seconds: 만료 시간 (초)
+            
+        Returns:
+            int: 1 (성공) 또는 0 (키 없음)
+        """
+        return self.pexpireat(key, mstime() + int(seconds) * 1000)
+    
+    def pexpire(self, key, milliseconds):
+        """
+        PEXPIRE key milliseconds - 키의 만료 시간을 밀리초 단위로 설정
+        
+        Args:
+            key: 대상 키
+            milliseconds: 만료 시간 (밀리초)
+            
+        Returns:
+            int: 1 (성공) 또는 0 (키 없음)
+        """
+        return self.pexpireat(key, mstime() + int(milliseconds))
+    
+    def pexpireat(self, key, timestamp_ms):
+        """
+        PEXPIREAT key timestamp_ms - 절대 시각(밀리초)으로 만료 시간 설정
+        
+        AOF에는 상대 시간 대신 이 형식으로 기록되어, 재생 시점과 관계없이
+        원래의 만료 시각이 유지됩니다.
+        
+        Args:
+            key: 대상 키
+            timestamp_ms: 만료 시각 (Unix epoch 밀리초)
+            
+        Returns:
+            int: 1 (성공) 또는 0 (키 없음)
+        """
+        if self._expire_if_needed(key) or not self._store.contains(key):
+            return 0
+        
+        self._set_expire_time(key, int(timestamp_ms))
+        self._dirty += 1
+        return 1
+    
+    def persist(self, key):
+        """
+        PERSIST key - 키의 만료 시간 제거
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 1 (TTL 제거됨) 또는 0 (키가 없거나 TTL 없음)
+        """
+        if self._expire_if_needed(key) or not self._remove_expire(key):
+            return 0
+        
+        self._dirty += 1
+        if self._aof is not None:
+            self._aof.feed(("PERSIST", key))
+        return 1
+    
+    def ttl(self, key):
+        """
+        TTL key - 키의 남은 만료 시간 조회 (초, 반올림)
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 남은 시간(초), -1(만료 없음), -2(키 없음)
+        """
+        remaining = self.pttl(key)
+        if remaining < 0:
+            return remaining
+        return (remaining + 500) // 1000
+    
+    def pttl(self, key):
+        """
+        PTTL key - 키의 남은 만료 시간 조회 (밀리초)
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 남은 시간(밀리초), -1(만료 없음), -2(키 없음)
+        """
+        if self._expire_if_needed(key) or not self._store.contains(key):
+            return -2
+        
+        ttl_entry = self._ttl_map.get(key)
+        if ttl_entry is None:
+            return -1  # 만료 시간 설정 안됨
+        
+        remaining = ttl_entry.value - mstime()
+        return remaining if remaining > 0 else 0
+    
+    # ==================== 내부 메서드 ====================
+    
+    def _set_expire_time(self, key, expire_ms):
+        """
+        키의 만료 시각 등록 (TTL 맵 + TTL 인덱스) 및 AOF 기록
+        
+        Args:
+            key: 대상 키
+            expire_ms: 만료 시각 (Unix epoch 밀리초)
+        """
+        self._schedule_expire(key, expire_ms)
+        
+        if self._aof is not None:
+            self._aof.feed(("PEXPIREAT", key, expire_ms))
+    
+    def _schedule_expire(self, key, expire_ms):
+        """
+        TTL 맵과 TTL 인덱스(힙 또는 타이밍 휠)에 만료 시각 등록
+        
+        Args:
+            key: 대상 키
+            expire_ms: 만료 시각 (Unix epoch 밀리초)
+        """
+        # TTL 맵에 저장
+        self._ttl_map.put(key, expire_ms)
+        
+        # TTL 인덱스에 추가 (기존 항목이 있으면 새 항목을 만들지 않고 그 자리에서 갱신)
+        if self._use_ttl_wheel:
+            self._ttl_wheel.schedule(key, expire_ms)
+            return
+        
+        handle_entry = self._ttl_handles.get(key)
+        if handle_entry is not None:
+            self._ttl_heap.update(handle_entry.value, expire_ms)
+        else:
+            self._ttl_handles.put(key, self._ttl_heap.push(expire_ms, key))
+    
+    def _remove_expire(self, key):
+        """
+        키의 만료 시각 제거 (TTL 맵 + 힙 항목 또는 타이밍 휠 타이머)
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            bool: 제거할 TTL이 있었으면 True
+        """
+        if self._ttl_map.remove(key) is None:
+            return False
+        if self._use_ttl_wheel:
+            self._ttl_wheel.cancel(key)
+        else:
+            handle_entry = self._ttl_handles.remove(key)
+            if handle_entry is not None:
+                self._ttl_heap.remove(handle_entry.value)
+        return True
+    
+    def _ttl_index_size(self):
+        """
+        TTL 인덱스 항목 수 (살아 있는 TTL 키 수와 같음)
+        
+        Returns:
+            int: 항목 개수
+        """
+        if self._use_ttl_wheel:
+            return self._ttl_wheel.size()
+        return self._ttl_heap.size()
+    
+    def _load_snapshot_records(self, count, records):
+        """
+        스냅샷 레코드로 키스페이스 교체 (일괄 적재)
+        
+        키 개수만큼 미리 크기를 잡은 HashMap에 넣으므로 적재 중 리사이징이 없습니다.
+        이미 만료된 키는 건너뜁니다.
+        
+        Args:
+            count: 레코드 개수 (HashMap 초기 용량 계산용)
+            records: (key, value, expire_ms 또는 None) 이터러블 (Hash는 value가 [필드, 값, ...] 리스트)
+            
+        Returns:
+            int: 적재한 키 개수
+        """
+        store_class = self._store_class
+        capacity = max(store_class.INITIAL_CAPACITY, int(count / store_class.LOAD_FACTOR_THRESHOLD) + 1)
+        self._store = self._new_store(capacity)
+        self._lru_list = self._new_lru_list()
+        self._ttl_heap = IndexedMinHeap()
+        self._ttl_handles = HashMap()
+        self._ttl_wheel = TimingWheel(mstime()) if self._use_ttl_wheel else None
+        self._ttl_map = HashMap()
+        self._eviction_pool.clear()
+        self._used_memory = 0
+        if self._slot_keys is not None:
+            self._slot_keys = [None] * CLUSTER_SLOTS
+        if self._prefix_index is not None:
+            self._prefix_index = SkipList()
+        
+        now = mstime()
+        loaded = 0
+        insert = self._insert_entry
+        for key, value, expire_ms in records:
+            if expire_ms is not None and now > expire_ms:
+                continue
+            if type(value) is list:
+                insert(key, self._hash_from_flat(value))
+            else:
+                insert(key, _encode_value(value))
+            if expire_ms is not None:
+                self._schedule_expire(key, expire_ms)
+            loaded += 1
+        
+        self._evict_until_within_limit()
+        self._dirty = 0
+        return loaded
+    
+    def _load_command(self, tokens):
+        """
+        AOF 재생용 명령어 적용
+        
+        명령어마다 만료 정리/메모리 제한 확인을 하지 않는 빠른 적재 경로입니다.
+        
+        Args:
+            tokens: 명령어 토큰 리스트
+            
+        Raises:
+            ValueError: 알 수 없는 명령어
+        """
+        command = tokens[0].upper()
+        store = self._store
+        
+        if command == "SET":
+            value = _encode_value(tokens[2])
+            entry = store.get(tokens[1])
+            if entry:
+                self._update_entry(entry, value)
+                if len(tokens) == 3:
+                    self._remove_expire(tokens[1])
+            else:
+                self._insert_entry(tokens[1], value)
+        elif command == "MSET":
+            for i in range(1, len(tokens), 2):
+                value = _encode_value(tokens[i + 1])
+                entry = store.get(tokens[i])
+                if entry:
+                    self._update_entry(entry, value)
+                    self._remove_expire(tokens[i])
+                else:
+                    self._insert_entry(tokens[i], value)
+        elif command == "INCRBY":
+            self._apply_incrby(tokens[1], store.get(tokens[1]), int(tokens[2]))
+        elif command == "HSET":
+            entry = store.get(tokens[1])
+            if entry is None:
+                self._insert_entry(tokens[1], self._hash_from_flat(tokens[2:]))
+            else:
+                for i in range(2, len(tokens), 2):
+                    self._hash_set(entry.value, tokens[i], tokens[i + 1])
+        elif command == "HDEL":
+            entry = store.get(tokens[1])
+            if entry is not None:
+                self._hash_delete(tokens[1], entry.value, tokens[2:])
+        elif command == "DEL":
+            for key in tokens[1:]:
+                self._delete_key_internal(key)
+        elif command == "PEXPIREAT":
+            if store.contains(tokens[1]):
+                self._set_expire_time(tokens[1], int(tokens[2]))
+        elif command == "PERSIST":
+            self._remove_expire(tokens[1])
+        else:
+            raise ValueError(f"unknown command '{command}' in append only file")
+    
+    def _scan_prefix(self, cursor, prefix, regex, count):
+        """
+        접두사 인덱스로 SCAN 처리 (scan 보조)
+        
+        커서는 마지막으로 방문한 키 자체를 정수로 바꾼 값입니다 (_key_cursor).
+        다음 호출은 그 키 바로 다음부터 이어가므로, 호출 사이에 키가 추가/삭제되어도
+        순회 내내 있던 키는 정확히 한 번 반환됩니다. 호출마다 접두사 범위의 키를 최대 count개 방문합니다.
+        
+        Args:
+            cursor: 이전 호출이 반환한 커서 (처음은 0)
+            prefix: 패턴의 와일드카드 없는 접두사
+            regex: 패턴 전체의 정규식
+            count: 방문할 키 개수
+            
+        Returns:
+            tuple: (다음 커서, 키 리스트)
+            
+        Raises:
+            ValueError: 커서가 올바르지 않은 경우
+        """
+        after = None if cursor == 0 else _cursor_key(cursor)
+        matched = []
+        visited = 0
+        next_cursor = 0
+        for key in self._prefix_index.iter_prefix(prefix, after):
+            if regex.fullmatch(key) is not None:
+                matched.append(key)
+            visited += 1
+            if visited >= count:
+                next_cursor = _key_cursor(key)
+                break
+        
+        # 순회가 끝난 뒤 만료된 키 삭제 (순회 중에는 인덱스를 바꾸지 않음)
+        keys = []
+        for key in matched:
+            if not self._expire_if_needed(key):
+                keys.append(key)
+        return next_cursor, keys
+    
+    def _prefix_keys(self, prefix):
+        """
+        prefix로 시작하는 키 리스트 (삭제 전에 모아 두기 위해 리스트로 반환)
+        
+        Args:
+            prefix: 접두사
+            
+        Returns:
+            list: 키 리스트
+        """
+        if self._prefix_index is not None:
+            return list(self._prefix_index.iter_prefix(prefix))
+        return [entry.key for entry in self._store.entries() if entry.key.startswith(prefix)]
+    
+    def _parse_int_config(self, value):
+        """
+        정수 설정 값 파싱
+        
+        Raises:
+            ValueError: 정수가 아닌 경우
+        """
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError("value is not an integer") from None
+    
+    def _parse_bool_config(self, value):
+        """
+        yes/no 설정 값 파싱
+        
+        Raises:
+            ValueError: yes/no가 아닌 경우
+        """
+        value = str(value).lower()
+        if value == "yes":
+            return True
+        if value == "no":
+            return False
+        raise ValueError("argument must be 'yes' or 'no'")
+    
+    def _slot_key_map(self, slot):
+        """
+        슬롯의 키 HashMap 반환
+        
+        Args:
+            slot: 해시 슬롯 번호
+            
+        Returns:
+            HashMap: 슬롯의 키 집합, 키가 들어온 적 없으면 None
+            
+        Raises:
+            RuntimeError: cluster_enabled가 아닌 경우
+            ValueError: 슬롯 번호가 범위를 벗어난 경우
+        """
+        if self._slot_keys is None:
+            raise RuntimeError("This instance has cluster support disabled")
+        if not 0 <= slot < CLUSTER_SLOTS:
+            raise ValueError("Invalid slot")
+        return self._slot_keys[slot]
+    
+    def _new_store(self, capacity=None):
+        """
+        키스페이스 해시맵 생성 (확장/재구성 시간을 지연 모니터의 hash-resize 이벤트로 보고)
+        
+        Args:
+            capacity: 초기 용량 (None이면 기본값)
+            
+        Returns:
+            HashMap 또는 OpenAddressingHashMap
+        """
+        store = self._store_class(capacity)
+        store.resize_listener = self._on_store_resize
+        return store
+    
+    def _on_store_resize(self, duration_ns):
+        """
+        키스페이스 해시맵 확장/재구성 시간 기록
+        
+        Args:
+            duration_ns: 걸린 시간 (나노초)
+        """
+        self._latency_monitor.add_sample("hash-resize", duration_ns)
+    
+    def _latency_event(self, event, start_ns):
+        """
+        start_ns부터 지금까지를 지연 이벤트로 기록 (임계값 미만이면 무시)
+        
+        Args:
+            event: 이벤트 이름
+            start_ns: 시작 시각 (time.perf_counter_ns)
+        """
+        self._latency_monitor.add_sample(event, time.perf_counter_ns() - start_ns)
+    
+    def _sorted_command_stats(self):
+        """
+        (명령어 이름, CommandStat) 리스트 (이름순)
+        
+        Returns:
+            list: (이름, CommandStat) 튜플 리스트
+        """
+        return sorted(self._command_stats.items())
+    
+    def _new_lru_list(self):
+        """
+        lru_tracking에 맞는 빈 LRU 리스트 생성
+        
+        Returns:
+            DoublyLinkedList, IndexLinkedList("indexed") 또는 ClockRing("clock")
+        """
+        if self._lru_tracking == "indexed":
+            return IndexLinkedList()
+        if self._lru_tracking == "clock":
+            return ClockRing()
+        return DoublyLinkedList()
+    
+    def _insert_entry(self, key, value):
+        """
+        새 키-값 쌍 추가 (만료 정리/메모리 제한 확인은 호출자 책임)
+        
+        Args:
+            key: 추가할 키
+            value: 저장할 값
+        """
+        # LRU 리스트에 추가 (맨 앞 = 최근, list 모드에서만)
+        lru_node = self._lru_list.insert_front(key) if self._use_lru_list else None
+        
+        # 해시맵에 저장
+        entry = self._store.put(key, value, lru_node)
+        self._lru_clock += 1
+        entry.lru = self._lru_clock
+        entry.lfu_counter = LFU_INIT_VAL
+        entry.lfu_decr_time = self._lfu_minutes()
+        self._used_memory += self._entry_size(key, value)
+        
+        if self._slot_keys is not None:
+            slot = key_hash_slot(key)
+            keys = self._slot_keys[slot]
+            if keys is None:
+                keys = self._slot_keys[slot] = HashMap()
+            keys.put(key, None)
+        
+        if self._prefix_index is not None:
+            self._prefix_index.insert(key)
+    
+    def _update_entry(self, entry, value):
+        """
+        기존 엔트리의 값 갱신 (메모리 제한 확인은 호출자 책임, _enforce_memory_limit_for_update 참고)
+        
+        Args:
+            entry: 갱신할 HashMapEntry
+            value: 새 값
+        """
+        # 값 크기 차이만큼 메모리 갱신
+        self._used_memory += self._value_size(value) - self._value_size(entry.value)
+        entry.value = value
+        # LRU/LFU 갱신
+        self._touch_entry(entry)
+    
+    def _apply_incrby(self, key, entry, increment):
+        """
+        INCRBY 적용 (incrby와 AOF 재생 공용, 만료 정리/메모리 제한 확인은 호출자 책임)
+        
+        Args:
+            key: 대상 키
+            entry: 키의 HashMapEntry (없으면 None)
+            increment: 더할 정수
+            
+        Returns:
+            int: 증가 후 값
+            
+        Raises:
+            ValueError: 값이 정수가 아니거나 결과가 64비트 범위를 벗어나는 경우
+            WrongTypeError: 키가 Hash인 경우
+        """
+        if entry is None:
+            self._insert_entry(key, increment)
+            return increment
+        
+        current = entry.value
+        if type(current) is not int:
+            if type(current) is HashObject:
+                raise WrongTypeError()
+            current = string_to_int64(str(current))
+            if current is None:
+                raise ValueError("value is not an integer or out of range")
+        value = current + increment
+        if not INT64_MIN <= value <= INT64_MAX:
+            raise ValueError("increment or decrement would overflow")
+        self._update_entry(entry, value)
+        return value
+    
+    def _incrbyfloat_result(self, entry, increment):
+        """
+        INCRBYFLOAT 결과 계산 (저장은 호출자 책임)
+        
+        Args:
+            entry: 키의 HashMapEntry (없으면 None)
+            increment: 더할 유한한 실수
+            
+        Returns:
+            str: 증가 후 값 문자열
+            
+        Raises:
+            ValueError: 값이 실수가 아니거나 결과가 NaN / 무한대인 경우
+            WrongTypeError: 키가 Hash인 경우
+        """
+        current = 0.0
+        if entry is not None:
+            current = entry.value
+            if type(current) is int:
+                current = float(current)
+            elif type(current) is HashObject:
+                raise WrongTypeError()
+            else:
+                current = string_to_float(str(current))
+                if current is None:
+                    raise ValueError("value is not a valid float")
+        result = current + increment
+        if math.isnan(result) or math.isinf(result):
+            raise ValueError("increment would produce NaN or Infinity")
+        
+        return _format_float(result)
+    
+    def _hash_for_read(self, key):
+        """
+        읽기 명령어용 해시 조회 (만료 확인, 타입 검사, LRU/LFU 갱신)
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            HashObject: 키의 해시, 키가 없으면 None
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
+        """
+        if self._expire_if_needed(key):
+            return None
+        
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value = entry.value
+        if type(value) is not HashObject:
+            raise WrongTypeError()
+        self._touch_entry(entry)
+        return value
+    
+    def _hash_for_write(self, key, incoming):
+        """
+        쓰기 명령어용 해시 조회 (없으면 빈 해시를 만들어 추가, 만료 정리는 호출자 책임)
+        
+        필드를 쓰기 전에 추가될 수 있는 최대 크기(incoming)만큼 정책에 따라 키를 제거하고
+        (noeviction이면 초과 시 거부), 제거 과정에서 이 키가 지워졌을 수 있으므로 다시 조회합니다.
+        
+        Args:
+            key: 대상 키
+            incoming: 이번 명령어로 늘어날 수 있는 필드 / 값 크기의 합
+            
+        Returns:
+            HashObject: 키의 해시
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
+            OutOfMemoryError: noeviction 정책에서 메모리 제한을 넘는 경우
+        """
+        entry = self._store.get(key)
+        if entry is not None:
+            if type(entry.value) is not HashObject:
+                raise WrongTypeError()
+        else:
+            incoming += len(key)
+        
+        if self._maxmemory > 0:
+            if not self._evict_until_within_limit(incoming):
+                raise OutOfMemoryError()
+            entry = self._store.get(key)
+        
+        if entry is None:
+            hash_object = HashObject()
+            self._insert_entry(key, hash_object)
+            return hash_object
+        self._touch_entry(entry)
+        return entry.value
+    
+    def _hash_set(self, hash_object, field, value):
+        """
+        해시 필드 하나 저장 (바뀐 크기만큼 메모리 카운터 갱신)
+        
+        Args:
+            hash_object: 키스페이스에 들어 있는 HashObject
+            field: 필드 이름
+            value: 값 문자열
+            
+        Returns:
+            bool: 새 필드면 True
+        """
+        before = hash_object.memory
+        added = hash_object.set(field, value, self._hash_max_listpack_entries, self._hash_max_listpack_value)
+        self._used_memory += hash_object.memory - before
+        return added
+    
+    def _hash_delete(self, key, hash_object, fields):
+        """
+        해시 필드 삭제 (hdel과 AOF 재생 공용, 빈 해시가 되면 키 삭제)
+        
+        Args:
+            key: 대상 키
+            hash_object: 키의 HashObject
+            fields: 삭제할 필드 이름 시퀀스
+            
+        Returns:
+            int: 삭제된 필드 개수
+        """
+        before = hash_object.memory
+        removed = 0
+        for field in fields:
+            if hash_object.delete(field):
+                removed += 1
+        self._used_memory -= before - hash_object.memory
+        if not len(hash_object):
+            self._delete_key_internal(key)
+        return removed
+    
+    def _hash_from_flat(self, flat):
+        """
+        [필드, 값, ...] 리스트로 새 HashObject 생성 (스냅샷 / AOF 적재용, 메모리 카운터는 삽입 시 반영)
+        
+        Args:
+            flat: 필드와 값을 번갈아 담은 리스트
+            
+        Returns:
+            HashObject: 새 해시
+        """
+        hash_object = HashObject()
+        max_entries = self._hash_max_listpack_entries
+        max_value = self._hash_max_listpack_value
+        for i in range(0, len(flat), 2):
+            hash_object.set(flat[i], flat[i + 1], max_entries, max_value)
+        return hash_object
+    
+    def _touch_entry(self, entry):
+        """
+        키 접근 기록 (LRU 클럭, LRU 리스트 위치, LFU 정책이면 빈도 카운터)
+        
+        Args:
+            entry: 접근한 HashMapEntry
+        """
+        self._lru_clock += 1
+        entry.lru = self._lru_clock
+        if entry.lru_node:
+            self._lru_list.move_to_front(entry.lru_node)
+        if self._use_lfu:
+            now = self._lfu_minutes()
+            counter = self._lfu_decr_and_return(entry, now)
+            entry.lfu_counter = self._lfu_log_incr(counter)
+            entry.lfu_decr_time = now
+    
+    def _lfu_minutes(self):
+        """
+        LFU 감쇠 기준 시각 (Unix epoch 분)
+        
+        Returns:
+            int: 현재 시각(분)
+        """
+        return int(time.time()) // 60
+    
+    def _lfu_log_incr(self, counter):
+        """
+        LFU 카운터의 로그 확률 증가
+        
+        카운터가 클수록 증가 확률 1 / ((counter - LFU_INIT_VAL) * lfu_log_factor + 1)이
+        작아지므로, 8비트만으로 수백만 회 수준의 접근 빈도를 구분할 수 있습니다.
+        
+        Args:
+            counter: 현재 카운터
+            
+        Returns:
+            int: 증가(또는 유지)된 카운터
+        """
+        if counter >= LFU_COUNTER_MAX:
+            return LFU_COUNTER_MAX
+        baseval = counter - LFU_INIT_VAL
+        if baseval < 0:
+            baseval = 0
+        if random.random() < 1.0 / (baseval * self._lfu_log_factor + 1):
+            counter += 1
+        return counter
+    
+    def _lfu_decr_and_return(self, entry, now):
+        """
+        마지막 감쇠 이후 지난 시간만큼 감소시킨 LFU 카운터 계산 (엔트리는 수정하지 않음)
+        
+        lfu-decay-time분이 지날 때마다 1씩 감소하므로,
+        한때 자주 접근되었지만 더 이상 쓰이지 않는 키도 결국 제거 대상이 됩니다.
+        
+        Args:
+            entry: 대상 HashMapEntry
+            now: 현재 시각 (분)
+            
+        Returns:
+            int: 감쇠가 반영된 카운터
+        """
+        counter = entry.lfu_counter
+        if self._lfu_decay_time > 0:
+            periods = (now - entry.lfu_decr_time) // self._lfu_decay_time
+            if periods > 0:
+                counter = counter - periods if periods < counter else 0
+        return counter
+    
+    def _delete_key_internal(self, key):
+        """
+        내부 키 삭제 로직
+        
+        해시맵, LRU 리스트, TTL 맵에서 모두 제거합니다.
+        
+        Args:
+            key: 삭제할 키
+            
+        Returns:
+            int: 삭제된 키 개수
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return 0
+        
+        # LRU 리스트에서 제거
+        if entry.lru_node:
+            self._lru_list.remove_node(entry.lru_node)
+        
+        # 해시맵에서 제거
+        self._store.remove(key)
+        
+        # TTL 맵 / TTL 인덱스에서 제거
+        self._remove_expire(key)
+        
+        # 슬롯별 키 인덱스에서 제거 (클러스터 모드)
+        if self._slot_keys is not None:
+            self._slot_keys[key_hash_slot(key)].remove(key)
+        
+        # 접두사 인덱스에서 제거
+        if self._prefix_index is not None:
+            self._prefix_index.remove(key)
+        
+        # 만료/제거로 인한 삭제도 AOF에 기록 (재생 시 되살아나지 않도록)
+        if self._aof is not None:
+            self._aof.feed(("DEL", key))
+        
+        # 메모리 사용량 차감
+        self._used_memory -= self._entry_size(entry.key, entry.value)
+        self._dirty += 1
+        
+        if self._debug_memory:
+            self._verify_memory_usage()
+        
+        return 1
+    
+    def _expire_key(self, key):
+        """
+        만료된 키 삭제 (만료 통계 포함)
+        
+        Args:
+            key: 만료된 키
+        """
+        self._delete_key_internal(key)
+        self._stat_expired_keys += 1
+    
+    def _expire_if_needed(self, key):
+        """
+        키가 만료되었으면 삭제 (접근 시점의 지연 만료)
+        
+        Args:
+            key: 확인할 키
+            
+        Returns:
+            bool: 만료되어 삭제했으면 True
+        """
+        if self._is_expired(key):
+            self._expire_key(key)
+            return True
+        return False
+    
+    def _is_expired(self, key):
+        """
+        키의 만료 여부 확인
+        
+        Args:
+            key: 확인할 키
+            
+        Returns:
+            bool: 만료되었으면 True
+        """
+        ttl_entry = self._ttl_map.get(key)
+        if ttl_entry is None:
+            return False
+        
+        return mstime() > ttl_entry.value
+    
+    def _cleanup_expired(self, limit=ACTIVE_EXPIRE_KEYS_PER_LOOP):
+        """
+        만료된 키 정리 (Lazy Expiration)
+        
+        TTL 인덱스(힙 또는 타이밍 휠)에서 만료된 키들을 확인하고 삭제합니다.
+        명령어마다 호출되므로 한 번에 꺼내는 항목을 limit개로 제한하여,
+        요청이 뜸했던 뒤에 들어온 명령어 하나가 쌓인 만료 키를 모두 떠안지 않게 합니다.
+        나머지는 능동 만료 주기와 키 접근 시 확인(_expire_if_needed)이 처리합니다.
+        
+        Args:
+            limit: 최대로 꺼낼 항목 개수 (None이면 제한 없음, AOF 적재 후 등)
+        """
+        if not self._use_ttl_wheel and self._ttl_heap.is_empty():
+            return
+        
+        current_time = mstime()
+        start = time.perf_counter_ns()
+        expired = 0
+        
+        if self._use_ttl_wheel:
+            # 타이밍 휠: current_time - 1까지 진행 (만료 조건이 now > expire_ms이므로)
+            for key in self._ttl_wheel.advance(current_time - 1, limit):
+                self._expire_key(key)
+                expired += 1
+        else:
+            while not self._ttl_heap.is_empty():
+                if limit is not None:
+                    if limit <= 0:
+                        break
+                    limit -= 1
+                
+                handle = self._ttl_heap.peek()
+                if handle.priority >= current_time:
+                    # 아직 만료 안됨
+                    break
+                
+                # 힙의 항목은 항상 TTL 맵과 일치하므로 바로 만료 처리
+                # (_expire_key -> _remove_expire에서 힙 항목도 제거됨)
+                key = handle.item
+                if self._store.contains(key):
+                    self._expire_key(key)
+                else:
+                    self._remove_expire(key)
+                expired += 1
+        
+        if expired:
+            self._latency_event("expire-cleanup", start)
+    
+    def _update_expire_rate(self):
+        """
+        초당 만료 키 수(instantaneous_expired_per_sec) 갱신 (1초 구간마다)
+        """
+        now = time.monotonic()
+        elapsed = now - self._expire_rate_time
+        if elapsed >= 1.0:
+            self._expired_per_sec = (self._stat_expired_keys - self._expire_rate_count) / elapsed
+            self._expire_rate_time = now
+            self._expire_rate_count = self._stat_expired_keys
+    
+    def _get_memory_usage(self):
+        """
+        현재 메모리 사용량 반환
+        
+        set/삭제 시 증분 갱신되는 카운터를 반환하므로 O(1)입니다.
+        
+        Returns:
+            int: 예상 메모리 사용량 (바이트)
+        """
+        return self._used_memory
+    
+    def _value_size(self, value):
+        """
+        값의 메모리 크기 계산
+        
+        간소화된 계산: int 인코딩 값은 INT_ENCODED_SIZE, Hash는 필드와 값 길이의 합(증분 유지),
+        그 외에는 값의 문자열 길이
+        
+        Args:
+            value: 크기를 계산할 값
+            
+        Returns:
+            int: 예상 크기 (바이트)
+        """
+        if type(value) is int:
+            return INT_ENCODED_SIZE
+        if type(value) is HashObject:
+            return value.memory
+        return len(str(value))
+    
+    def _entry_size(self, key, value):
+        """
+        키-값 쌍의 메모리 크기 계산
+        
+        Args:
+            key: 키
+            value: 값
+            
+        Returns:
+            int: 예상 크기 (바이트)
+        """
+        return len(str(key)) + self._value_size(value)
+    
+    def _recount_memory_usage(self):
+        """
+        전체 키스페이스를 순회하여 메모리 사용량 재계산
+        
+        시간 복잡도: O(n) - 디버그/검증 용도로만 사용합니다.
+        
+        Returns:
+            int: 재계산된 메모리 사용량 (바이트)
+        """
+        total = 0
+        for entry in self._store.entries():
+            total += self._entry_size(entry.key, entry.value)
+        return total
+    
+    def _verify_memory_usage(self):
+        """
+        증분 메모리 카운터를 전체 재계산 결과와 비교 (디버그 모드)
+        
+        Raises:
+            AssertionError: 카운터와 재계산 결과가 다를 때
+        """
+        actual = self._recount_memory_usage()
+        if actual != self._used_memory:
+            raise AssertionError(
+                f"used_memory counter mismatch: counter={self._used_memory}, "
+                f"recount={actual}"
+            )
+    
+    def _enforce_memory_limit(self, new_key, new_value):
+        """
+        메모리 제한 적용
+        
+        새 키-값을 추가해도 메모리 제한을 초과하지 않도록
+        maxmemory-policy에 따라 필요한 만큼 키를 제거합니다.
+        
+        Args:
+            new_key: 추가할 키
             new_value: 추가할 값
+            
+        Raises:
+            OutOfMemoryError: 제거할 수 있는 키가 없어 제한을 지킬 수 없는 경우
+                              (noeviction 정책 포함)
         """
         if self._maxmemory == 0:
             return  # 무제한
         
-        new_size = len(str(new_key)) + len(str(new_value))
+        if not self._evict_until_within_limit(self._entry_size(new_key, new_value)):
+            raise OutOfMemoryError()
+    
+    def _enforce_memory_limit_for_update(self, key, entry, new_value):
+        """
+        기존 키의 값을 바꾸기 전에 메모리 제한 적용
+        
+        새 값이 이전 값보다 크면 늘어나는 만큼이 제한 안에 들어오도록 정책에 따라 키를 제거합니다.
+        제거 대상에 이 키 자신이 포함될 수 있으므로 갱신할 엔트리를 다시 조회해 반환합니다.
+        
+        Args:
+            key: 갱신할 키
+            entry: 키의 HashMapEntry
+            new_value: 저장할 새 값 (인코딩된 값)
+            
+        Returns:
+            HashMapEntry: 갱신할 엔트리 (제거 과정에서 키가 지워졌으면 None)
+            
+        Raises:
+            OutOfMemoryError: 제거할 수 있는 키가 없어 제한을 지킬 수 없는 경우
+                              (noeviction 정책 포함)
+        """
+        if self._maxmemory == 0:
+            return entry
+        
+        growth = self._value_size(new_value) - self._value_size(entry.value)
+        if growth <= 0:
+            return entry
+        if not self._evict_until_within_limit(growth):
+            raise OutOfMemoryError()
+        return self._store.get(key)
+    
+    def _evict_until_within_limit(self, extra=0):
+        """
+        메모리 사용량(+extra)이 제한 이하가 될 때까지 정책에 따라 제거
+        
+        Args:
+            extra: 곧 추가될 데이터 크기 (바이트)
+            
+        Returns:
+            bool: 제한 이하가 되었으면 True, 더 제거할 키가 없으면 False
+        """
+        if self._maxmemory == 0 or self._get_memory_usage() + extra <= self._maxmemory:
+            return True  # 무제한이거나 제한 이하
+        
+        # 제거가 필요한 경우에만 시간을 재어 eviction-cycle 이벤트로 기록
+        start = time.perf_counter_ns()
+        within_limit = True
+        while self._get_memory_usage() + extra > self._maxmemory:
+            if not self._evict_one():
+                within_limit = False  # 더 이상 제거할 키 없음
+                break
+        self._latency_event("eviction-cycle", start)
+        return within_limit
+    
+    def _evict_one(self):
+        """
+        maxmemory-policy에 따라 키 하나 제거
+        
+        Returns:
+            bool: 제거 성공 여부
+        """
+        policy = self._maxmemory_policy
         
-        while self._get_memory_usage() + new_size > self._maxmemory:
-            if not self._evict_lru():
-                break  # 더 이상 제거할 키 없음
+        if policy == "noeviction":
+            return False
+        elif policy == "allkeys-lru":
+            if self._use_lru_list:
+                return self._evict_lru()
+            return self._evict_from_pool(self._store, self._lru_score)
+        elif policy == "volatile-lru":
+            return self._evict_from_pool(self._ttl_map, self._lru_score)
+        elif policy == "allkeys-lfu":
+            return self._evict_from_pool(self._store, self._lfu_score)
+        elif policy == "volatile-lfu":
+            return self._evict_from_pool(self._ttl_map, self._lfu_score)
+        elif policy == "volatile-ttl":
+            return self._evict_from_pool(self._ttl_map, self._ttl_score)
+        elif policy == "allkeys-random":
+            return self._evict_random(self._store)
+        elif policy == "volatile-random":
+            return self._evict_random(self._ttl_map)
+        return False
     
     def _evict_lru(self):
         """
-        LRU 정책으로 가장 오래된 키 제거
+        LRU 정책으로 가장 오래된 키 제거 (LRU 리스트 또는 CLOCK 사용)
         
         Returns:
             bool: 제거 성공 여부
         """
         # LRU 리스트에서 가장 오래된 키 (tail 쪽)
-        oldest_node = self._lru_list.get_back_node()
-        if oldest_node is None:
+        key = self._lru_list.peek_back()
+        if key is None:
             return False
         
-        key = oldest_node.data
         self._delete_key_internal(key)
         self._evicted_keys += 1
         
         return True
+    
+    def _evict_from_pool(self, source, score_fn):
+        """
+        표본 + 후보 풀 방식의 근사 제거
+        
+        source(전체 키스페이스 또는 TTL 맵)에서 maxmemory-samples개를 뽑아
+        점수를 매겨 후보 풀에 넣고, 풀에서 점수가 가장 높은 키를 제거합니다.
+        풀의 키는 이전 표본에서 들어온 것일 수 있으므로 꺼낼 때 유효성을 다시 확인합니다.
+        
+        Args:
+            source: 표본을 뽑을 HashMap (_store 또는 _ttl_map)
+            score_fn: 키 -> 점수 함수 (클수록 먼저 제거, 유효하지 않으면 None)
+            
+        Returns:
+            bool: 제거 성공 여부
+        """
+        pool = self._eviction_pool
+        
+        while source.size() > 0:
+            for entry in source.sample_entries(self._maxmemory_samples):
+                score = score_fn(entry.key)
+                if score is not None:
+                    pool.insert(score, entry.key)
+            
+            while True:
+                key = pool.pop_best()
+                if key is None:
+                    break
+                # 풀에 들어간 뒤 삭제되었거나 TTL이 사라진 키는 건너뜀
+                if not source.contains(key) or not self._store.contains(key):
+                    continue
+                self._delete_key_internal(key)
+                self._evicted_keys += 1
+                return True
+        
+        return False
+    
+    def _evict_random(self, source):
+        """
+        임의의 키 하나 제거
+        
+        Args:
+            source: 키를 고를 HashMap (_store 또는 _ttl_map)
+            
+        Returns:
+            bool: 제거 성공 여부
+        """
+        entry = source.random_entry()
+        if entry is None:
+            return False
+        self._delete_key_internal(entry.key)
+        self._evicted_keys += 1
+        return True
+    
+    def _lru_score(self, key):
+        """
+        LRU 제거 점수: 마지막 접근 이후 지난 클럭 수 (클수록 오래됨)
+        
+        Returns:
+            int: 유휴 클럭 수, 키가 없으면 None
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        return self._lru_clock - entry.lru
+    
+    def _lfu_score(self, key):
+        """
+        LFU 제거 점수: 감쇠가 반영된 접근 빈도가 낮을수록 큰 값
+        
+        Returns:
+            int: 255 - 카운터, 키가 없으면 None
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        return LFU_COUNTER_MAX - self._lfu_decr_and_return(entry, self._lfu_minutes())
+    
+    def _ttl_score(self, key):
+        """
+        volatile-ttl 제거 점수: 만료가 임박할수록 큰 값
+        
+        Returns:
+            float: 만료 시각의 음수, TTL이 없으면 None
+        """
+        ttl_entry = self._ttl_map.get(key)
+        if ttl_entry is None:
+            return None
+        return -ttl_entry.value
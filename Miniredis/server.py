@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Mini Redis 네트워크 서버
+
+asyncio 이벤트 루프 위에서 RESP2 / RESP3 프로토콜로 TCP / Unix 소켓 연결을 처리합니다.
+명령어 실행은 CLI.dispatch()를 그대로 사용하므로 REPL과 동일한 명령어 구현을 공유합니다.
+
+특징:
+- 단일 스레드 이벤트 루프: 수천 개의 동시 연결을 콜백 방식으로 처리
+- 파이프라이닝: 한 번의 read로 도착한 여러 명령어를 순서대로 실행하고,
+  응답을 하나의 bytearray에 이어 써서 한 번에 write (명령어마다 왕복하지 않음)
+- RESP3: 연결별로 HELLO 3을 보내면 이후 응답을 RESP3 타입(null, map 등)으로 인코딩
+- 흐름 제어: 클라이언트가 응답을 읽지 않으면 해당 연결의 읽기를 일시 중지
+- 주기 작업: hz 주기로 MiniRedis.cron() 실행 (능동 만료, AOF fsync, 재작성 완료 확인 등)
+- 클러스터 모드: --cluster-workers N이면 워커 프로세스 N개가 16384개 해시 슬롯을 나누어 맡음
+  (포트 port ~ port+N-1, 다른 워커의 키는 MOVED / ASK 리다이렉트, cluster.py 참고)
+
+실행 방법:
+    python server.py --port 6379
+    python server.py --unixsocket /tmp/mini-redis.sock
+    python server.py --appendonly yes --appendfsync everysec
+    python server.py --dbfilename dump.rdb
+    python server.py --cluster-workers 4 --port 7000
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import signal
+import sys
+import os
+import time
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import CLI
+from redis_core import MiniRedis
+from protocol import RespParser, ProtocolError, ErrorReply, StatusReply, encode_reply, encode_reply_into
+from cluster import ClusterNode, even_slot_ranges, new_node_id
+
+
+class RedisConnection(asyncio.Protocol):
+    """
+    클라이언트 연결 하나를 담당하는 asyncio 프로토콜
+
+    Attributes:
+        _server: 소속 MiniRedisServer
+        _parser: 연결별 RESP 증분 파서
+        _transport: asyncio 트랜스포트
+        _asking: 직전 명령어가 ASKING이었는지 여부 (클러스터 모드, 다음 명령어 하나에만 적용)
+        _protocol: 응답 인코딩 프로토콜 버전 (2, HELLO 3 이후 3)
+    """
+
+    def __init__(self, server):
+        """
+        연결 초기화
+
+        Args:
+            server: MiniRedisServer 인스턴스
+        """
+        self._server = server
+        self._parser = RespParser()
+        self._transport = None
+        self._closing = False
+        self._asking = False
+        self._protocol = 2
+
+    def connection_made(self, transport):
+        """새 연결 수립"""
+        self._transport = transport
+        self._server.connected_clients += 1
+        self._server.total_connections_received += 1
+
+    def connection_lost(self, exc):
+        """연결 종료"""
+        self._server.connected_clients -= 1
+        self._transport = None
+
+    def pause_writing(self):
+        """송신 버퍼가 가득 차면 수신도 멈춰 메모리 폭증 방지"""
+        if self._transport is not None:
+            self._transport.pause_reading()
+
+    def resume_writing(self):
+        """송신 버퍼가 비워지면 수신 재개"""
+        if self._transport is not None and not self._closing:
+            self._transport.resume_reading()
+
+    def data_received(self, data):
+        """
+        수신 데이터 처리
+
+        도착한 모든 완성 명령어를 순서대로 실행하면서 응답을 하나의 bytearray에 이어 쓰고,
+        배치가 끝나면 write() 한 번으로 전송합니다.
+        트랜스포트는 소켓에 다 쓰지 못한 부분을 복사하지 않고 참조로 보관하므로
+        버퍼는 배치마다 새로 만들어 넘깁니다 (재사용하면 전송 전에 내용이 바뀔 수 있음).
+
+        Args:
+            data: 수신 바이트
+        """
+        if self._closing:
+            return
+
+        self._parser.feed(data)
+        try:
+            commands = self._parser.get_commands()
+        except ProtocolError as e:
+            self._transport.write(encode_reply(ErrorReply(f"ERR Protocol error: {e}")))
+            self._close()
+            return
+
+        if not commands:
+            return
+
+        out = bytearray()
+        for tokens in commands:
+            command = tokens[0].upper()
+            if command == "QUIT":
+                # 같은 배치에서 QUIT 앞에 실행된 쓰기도 응답 전에 AOF에 기록
+                self._server.cli.redis.flush_aof()
+                encode_reply_into(out, StatusReply("OK"), self._protocol)
+                self._transport.write(out)
+                self._close()
+                return
+            if command == "ASKING" and self._server.cluster is not None:
+                self._asking = True
+                encode_reply_into(out, StatusReply("OK"), self._protocol)
+                continue
+            reply = self._server.execute(tokens, self._asking)
+            if command == "HELLO" and isinstance(reply, dict):
+                self._hello(tokens, reply)
+            encode_reply_into(out, reply, self._protocol)
+            self._asking = False
+
+        # 배치 전체의 AOF 기록을 write 한 번으로 묶은 뒤 응답 전송
+        self._server.cli.redis.flush_aof()
+        self._transport.write(out)
+
+    def _hello(self, tokens, reply):
+        """
+        HELLO 응답에 연결 상태 반영 (프로토콜 버전을 지정했으면 이 응답부터 전환)
+
+        Args:
+            tokens: HELLO 명령어 토큰
+            reply: CLI._cmd_hello가 반환한 dict
+        """
+        if len(tokens) > 1:
+            self._protocol = reply["proto"]
+        else:
+            reply["proto"] = self._protocol
+        if self._server.cluster is not None:
+            reply["mode"] = "cluster"
+
+    def _close(self):
+        """응답 전송 후 연결 종료"""
+        self._closing = True
+        self._transport.close()
+
+
+class MiniRedisServer:
+    """
+    Mini Redis RESP2 / RESP3 서버
+
+    Attributes:
+        cli: 명령어 디스패처 (CLI 인스턴스)
+        cluster: 클러스터 상태 (ClusterNode, 단독 실행이면 None)
+        host: TCP 바인드 주소 (None이면 TCP 비활성)
+        port: TCP 포트
+        unixsocket: Unix 소켓 경로 (None이면 비활성)
+        connected_clients: 현재 연결 수
+        total_connections_received: 누적 연결 수
+        total_commands_processed: 누적 처리 명령어 수
+    """
+
+    def __init__(self, redis=None, host="127.0.0.1", port=6379, unixsocket=None, backlog=4096, cluster=None):
+        """
+        서버 초기화
+
+        Args:
+            redis: 사용할 MiniRedis 인스턴스 (기본값: 새 인스턴스)
+            host: TCP 바인드 주소 (None이면 TCP 리스너를 열지 않음)
+            port: TCP 포트
+            unixsocket: Unix 소켓 경로
+            backlog: listen 백로그 크기
+            cluster: ClusterNode (클러스터 워커로 실행할 때)
+        """
+        self.cli = CLI(redis if redis is not None else MiniRedis())
+        self.cluster = cluster
+        self.host = host
+        self.port = port
+        self.unixsocket = unixsocket
+        self.backlog = backlog
+        self.connected_clients = 0
+        self.total_connections_received = 0
+        self.total_commands_processed = 0
+        self._servers = []
+        self._cron_task = None
+
+    def execute(self, tokens, asking=False):
+        """
+        명령어 하나 실행
+
+        핸들러에서 발생한 예외는 에러 응답으로 변환하여 연결을 유지합니다.
+        클러스터 모드에서는 먼저 슬롯 소유자를 확인하여 MOVED / ASK 리다이렉트를 반환할 수 있습니다.
+
+        Args:
+            tokens: 명령어 토큰 리스트
+            asking: 직전에 ASKING을 받았는지 여부 (클러스터 모드)
+
+        Returns:
+            응답 객체
+        """
+        self.total_commands_processed += 1
+        try:
+            if self.cluster is not None:
+                reply = self.cluster.route(tokens, asking)
+                if reply is not None:
+                    return reply
+            return self.cli.dispatch(tokens)
+        except Exception as e:
+            return ErrorReply(f"ERR {e}")
+
+    async def start(self):
+        """
+        리스너 시작 (TCP 및/또는 Unix 소켓)
+        """
+        loop = asyncio.get_running_loop()
+        factory = lambda: RedisConnection(self)
+
+        if self.host is not None:
+            server = await loop.create_server(
+                factory, self.host, self.port, backlog=self.backlog, reuse_address=True
+            )
+            # port=0이면 OS가 할당한 포트로 갱신
+            self.port = server.sockets[0].getsockname()[1]
+            self._servers.append(server)
+
+        if self.unixsocket is not None:
+            if os.path.exists(self.unixsocket):
+                os.unlink(self.unixsocket)
+            server = await loop.create_unix_server(factory, self.unixsocket, backlog=self.backlog)
+            self._servers.append(server)
+
+        self._cron_task = loop.create_task(self._cron_loop())
+
+    async def _cron_loop(self):
+        """
+        hz 주기로 MiniRedis.cron() 실행 (CONFIG SET hz는 다음 주기부터 반영)
+        """
+        redis = self.cli.redis
+        while True:
+            await asyncio.sleep(redis.cron_interval())
+            redis.cron()
+
+    async def serve_forever(self):
+        """
+        리스너를 시작하고 종료될 때까지 요청 처리
+        """
+        if not self._servers:
+            await self.start()
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in self._servers))
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        모든 리스너 종료
+        """
+        if self._cron_task is not None:
+            self._cron_task.cancel()
+            self._cron_task = None
+        for server in self._servers:
+            server.close()
+        self._servers = []
+        if self.unixsocket is not None and os.path.exists(self.unixsocket):
+            os.unlink(self.unixsocket)
+
+
+def parse_args(argv=None):
+    """
+    커맨드라인 인자 파싱
+
+    Args:
+        argv: 인자 리스트 (기본값: sys.argv)
+
+    Returns:
+        argparse.Namespace: 파싱 결과
+    """
+    parser = argparse.ArgumentParser(description="Mini Redis RESP2/RESP3 server")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP bind address")
+    parser.add_argument("--port", type=int, default=6379, help="TCP port (0 = disable TCP)")
+    parser.add_argument("--unixsocket", default=None, help="Unix socket path")
+    parser.add_argument("--maxmemory", type=int, default=0, help="maxmemory in bytes (0 = unlimited)")
+    parser.add_argument("--maxmemory-policy", default="allkeys-lru", help="eviction policy")
+    parser.add_argument("--lru-tracking", choices=("sampled", "list", "indexed", "clock"), default="sampled",
+                        help="sampled LRU, exact linked-list LRU, exact array-linked LRU, or CLOCK")
+    parser.add_argument("--ttl-index", choices=("heap", "wheel"), default="heap",
+                        help="TTL index: binary min-heap or hierarchical timing wheel")
+    parser.add_argument("--hash-table", choices=("chaining", "open"), default="chaining",
+                        help="keyspace hash table: bucket chaining or open addressing")
+    parser.add_argument("--prefix-index", choices=("yes", "no"), default="no",
+                        help="keep a sorted key index for prefix SCAN / COUNTPREFIX / DELPREFIX")
+    parser.add_argument("--hz", type=int, default=10, help="background task (active expire, fsync) frequency")
+    parser.add_argument("--dbfilename", default="dump.rdb", help="snapshot file path")
+    parser.add_argument("--appendonly", choices=("yes", "no"), default="no", help="enable AOF persistence")
+    parser.add_argument("--appendfilename", default="appendonly.aof", help="AOF file path")
+    parser.add_argument("--appendfsync", choices=("always", "everysec", "no"), default="everysec",
+                        help="AOF fsync policy")
+    parser.add_argument("--cluster-workers", type=int, default=0,
+                        help="run N cluster worker processes on ports port..port+N-1 (0 = standalone)")
+    return parser.parse_args(argv)
+
+
+def create_redis(args, cluster_enabled=False):
+    """
+    인자에 맞게 MiniRedis를 만들고 AOF 또는 스냅샷에서 복원
+
+    Args:
+        args: parse_args() 결과
+        cluster_enabled: 슬롯별 키 인덱스 유지 여부 (클러스터 워커)
+
+    Returns:
+        MiniRedis: 준비된 인스턴스
+    """
+    redis = MiniRedis(lru_tracking=args.lru_tracking, ttl_index=args.ttl_index,
+                      hash_table=args.hash_table, cluster_enabled=cluster_enabled,
+                      prefix_index=args.prefix_index == "yes")
+    redis.config_set("maxmemory-policy", args.maxmemory_policy)
+    if args.maxmemory:
+        redis.config_set_maxmemory(args.maxmemory)
+    redis.config_set("hz", args.hz)
+    redis.config_set("dbfilename", args.dbfilename)
+    if args.appendonly == "yes":
+        start = time.perf_counter()
+        loaded = redis.enable_aof(args.appendfilename, args.appendfsync)
+        if loaded:
+            elapsed = time.perf_counter() - start
+            print(f"AOF loaded: {loaded} commands in {elapsed:.3f} seconds")
+    elif os.path.exists(args.dbfilename):
+        # AOF가 꺼져 있으면 스냅샷에서 복원
+        loaded = redis.load_snapshot(args.dbfilename)
+        info = redis.info_persistence()
+        print(f"Snapshot loaded: {loaded} keys in {info['rdb_last_load_seconds']} seconds "
+              f"({info['rdb_last_load_mbps']} MB/s)")
+    return redis
+
+
+def serve(redis, host, port, unixsocket=None, cluster=None):
+    """
+    서버를 실행하고 종료(Ctrl+C)될 때까지 대기
+
+    Args:
+        redis: MiniRedis 인스턴스
+        host: TCP 바인드 주소 (None이면 TCP 비활성)
+        port: TCP 포트
+        unixsocket: Unix 소켓 경로
+        cluster: ClusterNode (클러스터 워커)
+    """
+    server = MiniRedisServer(redis, host=host, port=port, unixsocket=unixsocket, cluster=cluster)
+
+    async def run():
+        await server.start()
+        if host is not None:
+            print(f"Mini Redis listening on {host}:{server.port}")
+        if unixsocket is not None:
+            print(f"Mini Redis listening on unix:{unixsocket}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nBye!")
+    finally:
+        redis.shutdown()
+
+
+def _worker_filename(path, port):
+    """
+    워커별 영속성 파일 이름 (dump.rdb -> dump-7000.rdb)
+    """
+    base, ext = os.path.splitext(path)
+    return f"{base}-{port}{ext}"
+
+
+def run_cluster_worker(args, index, nodes):
+    """
+    클러스터 워커 프로세스 진입점
+
+    슬롯은 노드 순서대로 고르게 나누어 배치합니다. 슬롯 배치는 파일에 저장하지 않으므로
+    리샤딩 후 재시작하면 다시 처음 배치로 돌아갑니다.
+
+    Args:
+        args: parse_args() 결과
+        index: 이 워커의 순번 (nodes 순서)
+        nodes: 노드 ID -> (host, port) 딕셔너리 (모든 워커에 같은 값)
+    """
+    node_ids = list(nodes)
+    myid = node_ids[index]
+    host, port = nodes[myid]
+    args.dbfilename = _worker_filename(args.dbfilename, port)
+    args.appendfilename = _worker_filename(args.appendfilename, port)
+
+    # 런처의 terminate()(SIGTERM)도 Ctrl+C처럼 처리하여 AOF 기록 후 종료
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    redis = create_redis(args, cluster_enabled=True)
+    cluster = ClusterNode(redis, myid, nodes)
+    for (start, end), node_id in zip(even_slot_ranges(len(node_ids)), node_ids):
+        cluster.assign_slots(start, end, node_id)
+    serve(redis, host, port, cluster=cluster)
+
+
+def launch_cluster(args):
+    """
+    클러스터 워커 프로세스를 띄우고 모두 종료될 때까지 대기
+
+    SIGTERM / Ctrl+C를 받으면 워커를 모두 종료합니다.
+
+    Args:
+        args: parse_args() 결과 (--port부터 연속된 포트 사용)
+    """
+    nodes = {}
+    for index in range(args.cluster_workers):
+        nodes[new_node_id()] = (args.host, args.port + index)
+
+    workers = []
+    for index in range(args.cluster_workers):
+        process = multiprocessing.Process(target=run_cluster_worker, args=(args, index, nodes),
+                                          name=f"mini-redis-worker-{index}")
+        process.start()
+        workers.append(process)
+    print(f"Mini Redis cluster: {args.cluster_workers} workers on "
+          f"{args.host}:{args.port}-{args.port + args.cluster_workers - 1}")
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for process in workers:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in workers:
+            if process.is_alive():
+                process.terminate()
+        for process in workers:
+            process.join()
+
+
+def main(argv=None):
+    """
+    서버 진입점
+    """
+    args = parse_args(argv)
+
+    if args.cluster_workers > 0:
+        launch_cluster(args)
+        return
+
+    redis = create_redis(args)
+    host = args.host if args.port != 0 else None
+    serve(redis, host, args.port, args.unixsocket)
+
+
+if __name__ == "__main__":
+    main()
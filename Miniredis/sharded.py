@@ -0,0 +1,793 @@
+"""
+샤딩된 Mini Redis (멀티스레드 임베딩용)
+
+MiniRedis는 동기화가 없는 단일 객체이므로 스레드 여러 개가 함께 쓰려면
+모든 호출을 전역 락 하나로 감싸야 하고, 모든 스레드가 그 락에서 경합합니다.
+
+ShardedMiniRedis는 키를 해시로 N개의 독립된 MiniRedis 샤드(HashMap / LRU / TTL 인덱스)에
+나누고 샤드마다 락을 하나씩 둡니다. 서로 다른 샤드의 키를 다루는 스레드는 서로 기다리지 않습니다.
+
+- 단일 키 명령어: 키가 속한 샤드의 락만 잡음
+- 다중 키 명령어 (MSET, MGET, DEL, EXISTS): 관련 샤드의 락을 샤드 번호 오름차순으로 모두 잡은 뒤 실행
+  (모든 스레드가 같은 순서로 잡으므로 교착 상태가 생기지 않음)
+- SCAN / KEYS: 샤드를 차례로 순회 (SCAN 커서에 샤드 번호를 함께 담음)
+- maxmemory: 샤드 수로 나누어 샤드마다 따로 제거 예산을 가짐
+- 영속성(AOF, 스냅샷)은 지원하지 않습니다 (프로세스 내부 캐시 용도)
+"""
+
+import threading
+import sys
+import os
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data_structures.hash_map import HASH_MASK
+from redis_core import MiniRedis, SCAN_DEFAULT_COUNT
+
+
+# 기본 샤드 개수
+DEFAULT_SHARDS = 16
+
+# INFO stats 합산 시 합계 대신 최댓값을 쓰는 항목
+INFO_STATS_MAX_FIELDS = ("expire_cycle_last_ms", "expire_cycle_max_ms", "expired_stale_perc")
+
+
+class ShardedMiniRedis:
+    """
+    샤드별 락을 가진 스레드 안전 Mini Redis
+    
+    MiniRedis의 String / TTL / 설정 명령어와 같은 메서드를 제공합니다.
+    
+    Attributes:
+        _shards: 샤드별 MiniRedis 인스턴스 리스트
+        _locks: 샤드별 threading.Lock 리스트 (같은 번호의 샤드를 보호)
+        _maxmemory: 전체 메모리 제한 (바이트, 샤드마다 1/N씩 나누어 적용)
+    """
+    
+    def __init__(self, shards=DEFAULT_SHARDS, **options):
+        """
+        샤드 생성
+        
+        Args:
+            shards: 샤드 개수 (기본값: 16)
+            **options: 샤드마다 MiniRedis에 그대로 전달할 옵션
+                       (lru_tracking, ttl_index, hash_table 등)
+                       
+        Raises:
+            ValueError: 샤드 개수가 1 미만이거나 옵션이 올바르지 않은 경우
+        """
+        shards = int(shards)
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        
+        self._shards = [MiniRedis(**options) for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._maxmemory = 0
+    
+    # ==================== 샤드 선택 ====================
+    
+    def shard_count(self):
+        """
+        샤드 개수 반환
+        
+        Returns:
+            int: 샤드 개수
+        """
+        return len(self._shards)
+    
+    def shard_index(self, key):
+        """
+        키가 속한 샤드 번호 계산
+        
+        샤드 안의 HashMap은 해시값의 하위 비트로 버킷을 고르므로, 샤드 선택에는
+        상위 비트를 사용합니다. 하위 비트로 나누면 샤드마다 하위 비트가 고정되어
+        샤드 해시맵의 일부 버킷에만 키가 몰립니다.
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 0 ~ shard_count() - 1
+        """
+        return ((hash(key) & HASH_MASK) >> 32) % len(self._shards)
+    
+    def _group_by_shard(self, keys):
+        """
+        키 위치를 샤드별로 묶음
+        
+        Args:
+            keys: 키 시퀀스
+            
+        Returns:
+            list: (샤드 번호, 그 샤드에 속한 키 위치 리스트) 튜플 리스트, 샤드 번호 오름차순
+        """
+        positions = [None] * len(self._shards)
+        shard_index = self.shard_index
+        for position, key in enumerate(keys):
+            index = shard_index(key)
+            if positions[index] is None:
+                positions[index] = [position]
+            else:
+                positions[index].append(position)
+        return [(index, group) for index, group in enumerate(positions) if group is not None]
+    
+    def _acquire(self, indices):
+        """
+        샤드 락을 주어진 순서(오름차순)대로 획득
+        
+        Args:
+            indices: 샤드 번호 리스트 (오름차순)
+        """
+        locks = self._locks
+        for index in indices:
+            locks[index].acquire()
+    
+    def _release(self, indices):
+        """
+        샤드 락을 획득의 역순으로 해제
+        
+        Args:
+            indices: 샤드 번호 리스트 (오름차순)
+        """
+        locks = self._locks
+        for index in reversed(indices):
+            locks[index].release()
+    
+    # ==================== String 타입 기본 명령어 ====================
+    
+    def set(self, key, value, px=None, keepttl=False):
+        """
+        SET key value [PX milliseconds | KEEPTTL] - 키에 값 저장
+        
+        Args:
+            key: 저장할 키
+            value: 저장할 값
+            px: 만료 시간 (밀리초, 기본값: None)
+            keepttl: True이면 기존 TTL 유지
+            
+        Returns:
+            str: "OK"
+            
+        Raises:
+            OutOfMemoryError: noeviction 정책에서 샤드의 메모리 예산을 넘는 경우
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].set(key, value, px=px, keepttl=keepttl)
+    
+    def get(self, key):
+        """
+        GET key - 키의 값 조회
+        
+        Args:
+            key: 조회할 키
+            
+        Returns:
+            str: 값 또는 None (키가 없거나 만료됨)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].get(key)
+    
+    def incrby(self, key, increment):
+        """
+        INCRBY key increment - 정수 값에 increment를 더함 (샤드 락 안에서 읽기-수정-쓰기)
+        
+        Args:
+            key: 대상 키
+            increment: 더할 정수 (음수면 감소)
+            
+        Returns:
+            int: 증가 후 값
+            
+        Raises:
+            ValueError: 값이 정수가 아니거나 결과가 64비트 범위를 벗어나는 경우
+            OutOfMemoryError: noeviction 정책에서 샤드의 메모리 예산을 넘는 경우
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].incrby(key, increment)
+    
+    def incrbyfloat(self, key, increment):
+        """
+        INCRBYFLOAT key increment - 값에 실수 increment를 더함
+        
+        Args:
+            key: 대상 키
+            increment: 더할 실수
+            
+        Returns:
+            str: 증가 후 값 문자열
+            
+        Raises:
+            ValueError: 값이 실수가 아니거나 결과가 NaN / 무한대인 경우
+            OutOfMemoryError: noeviction 정책에서 샤드의 메모리 예산을 넘는 경우
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].incrbyfloat(key, increment)
+    
+    def delete(self, key):
+        """
+        DEL key - 키 삭제
+        
+        Args:
+            key: 삭제할 키
+            
+        Returns:
+            int: 삭제된 키 개수 (0 또는 1)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].delete(key)
+    
+    def exists(self, key):
+        """
+        EXISTS key - 키 존재 여부 확인
+        
+        Args:
+            key: 확인할 키
+            
+        Returns:
+            int: 1 (존재) 또는 0 (없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].exists(key)
+    
+    def dbsize(self):
+        """
+        DBSIZE - 전체 키 개수 반환 (샤드별 키 개수의 합)
+        
+        샤드 락을 하나씩 잡고 세므로, 다른 스레드가 쓰는 중이면 정확한 한 시점의 값은 아닙니다.
+        
+        Returns:
+            int: 키 개수
+        """
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                total += shard.dbsize()
+        return total
+    
+    # ==================== Hash 타입 ====================
+    
+    def hset(self, key, pairs):
+        """
+        HSET key field value [field value ...] - 해시 필드 값 저장
+        
+        Args:
+            key: 대상 키
+            pairs: (field, value) 튜플의 시퀀스
+            
+        Returns:
+            int: 새로 추가된 필드 개수
+            
+        Raises:
+            WrongTypeError: 키가 Hash가 아닌 경우
+            OutOfMemoryError: noeviction 정책에서 샤드의 메모리 예산을 넘는 경우
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hset(key, pairs)
+    
+    def hget(self, key, field):
+        """
+        HGET key field - 해시 필드 값 조회
+        
+        Args:
+            key: 대상 키
+            field: 필드 이름
+            
+        Returns:
+            str: 값, 키나 필드가 없으면 None
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hget(key, field)
+    
+    def hmget(self, key, fields):
+        """
+        HMGET key field [field ...] - 여러 해시 필드 값 조회
+        
+        Args:
+            key: 대상 키
+            fields: 필드 이름 시퀀스
+            
+        Returns:
+            list: 필드 순서와 같은 순서의 값 리스트 (없는 필드는 None)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hmget(key, fields)
+    
+    def hgetall(self, key):
+        """
+        HGETALL key - 해시의 모든 필드와 값
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            dict: 필드 -> 값
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hgetall(key)
+    
+    def hdel(self, key, fields):
+        """
+        HDEL key field [field ...] - 해시 필드 삭제
+        
+        Args:
+            key: 대상 키
+            fields: 삭제할 필드 이름 시퀀스
+            
+        Returns:
+            int: 삭제된 필드 개수
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hdel(key, fields)
+    
+    def hlen(self, key):
+        """
+        HLEN key - 해시 필드 개수
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 필드 개수
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hlen(key)
+    
+    def hexists(self, key, field):
+        """
+        HEXISTS key field - 해시 필드 존재 여부
+        
+        Args:
+            key: 대상 키
+            field: 필드 이름
+            
+        Returns:
+            int: 1 (존재) 또는 0 (없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hexists(key, field)
+    
+    def hincrby(self, key, field, increment):
+        """
+        HINCRBY key field increment - 해시 필드의 정수 값에 increment를 더함 (샤드 락 안에서 읽기-수정-쓰기)
+        
+        Args:
+            key: 대상 키
+            field: 필드 이름
+            increment: 더할 정수 (음수면 감소)
+            
+        Returns:
+            int: 증가 후 값
+            
+        Raises:
+            ValueError: 필드 값이 정수가 아니거나 결과가 64비트 범위를 벗어나는 경우
+            WrongTypeError: 키가 Hash가 아닌 경우
+            OutOfMemoryError: noeviction 정책에서 샤드의 메모리 예산을 넘는 경우
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].hincrby(key, field, increment)
+    
+    # ==================== 다중 키 (배치) 명령어 ====================
+    
+    def mset(self, pairs):
+        """
+        MSET key value [key value ...] - 여러 키-값 쌍을 한 번에 저장
+        
+        관련 샤드의 락을 모두 잡은 뒤 쓰므로 다른 스레드에게는 한 번에 적용된 것처럼 보입니다.
+        noeviction 정책에서 어느 한 샤드라도 예산을 넘으면 그 샤드 이전 샤드의 쓰기는 이미 적용된 상태입니다.
+        
+        Args:
+            pairs: (key, value) 튜플의 시퀀스
+            
+        Returns:
+            str: "OK"
+            
+        Raises:
+            OutOfMemoryError: noeviction 정책에서 샤드의 메모리 예산을 넘는 경우
+        """
+        pairs = list(pairs)
+        groups = self._group_by_shard([key for key, _ in pairs])
+        indices = [index for index, _ in groups]
+        self._acquire(indices)
+        try:
+            for index, positions in groups:
+                self._shards[index].mset([pairs[position] for position in positions])
+        finally:
+            self._release(indices)
+        return "OK"
+    
+    def mget(self, keys):
+        """
+        MGET key [key ...] - 여러 키의 값을 한 번에 조회
+        
+        Args:
+            keys: 조회할 키 시퀀스
+            
+        Returns:
+            list: 키 순서와 같은 순서의 값 리스트 (없는 키는 None)
+        """
+        keys = list(keys)
+        values = [None] * len(keys)
+        groups = self._group_by_shard(keys)
+        indices = [index for index, _ in groups]
+        self._acquire(indices)
+        try:
+            for index, positions in groups:
+                found = self._shards[index].mget([keys[position] for position in positions])
+                for position, value in zip(positions, found):
+                    values[position] = value
+        finally:
+            self._release(indices)
+        return values
+    
+    def delete_many(self, keys):
+        """
+        DEL key [key ...] - 여러 키를 한 번에 삭제
+        
+        Args:
+            keys: 삭제할 키 시퀀스
+            
+        Returns:
+            int: 실제로 삭제된 키 개수
+        """
+        keys = list(keys)
+        groups = self._group_by_shard(keys)
+        indices = [index for index, _ in groups]
+        deleted = 0
+        self._acquire(indices)
+        try:
+            for index, positions in groups:
+                deleted += self._shards[index].delete_many([keys[position] for position in positions])
+        finally:
+            self._release(indices)
+        return deleted
+    
+    def exists_many(self, keys):
+        """
+        EXISTS key [key ...] - 존재하는 키 개수 반환 (중복 지정한 키는 중복해서 셈)
+        
+        Args:
+            keys: 확인할 키 시퀀스
+            
+        Returns:
+            int: 존재하는 키 개수
+        """
+        keys = list(keys)
+        groups = self._group_by_shard(keys)
+        indices = [index for index, _ in groups]
+        count = 0
+        self._acquire(indices)
+        try:
+            for index, positions in groups:
+                count += self._shards[index].exists_many([keys[position] for position in positions])
+        finally:
+            self._release(indices)
+        return count
+    
+    # ==================== 키스페이스 순회 ====================
+    
+    def scan(self, cursor, match=None, count=SCAN_DEFAULT_COUNT):
+        """
+        SCAN cursor [MATCH pattern] [COUNT count] - 샤드를 차례로 커서 순회
+        
+        커서는 (샤드 안의 커서 * 샤드 수 + 샤드 번호)이며, 한 번의 호출은 샤드 하나의 락만 잡고
+        그 샤드의 MiniRedis.scan을 한 번 실행합니다.
+        
+        Args:
+            cursor: 이전 호출이 반환한 커서 (처음은 0)
+            match: 글롭 패턴 (None이면 모든 키)
+            count: 한 번에 방문할 키 개수 목표
+            
+        Returns:
+            tuple: (다음 커서, 키 리스트), 다음 커서가 0이면 순회 완료
+            
+        Raises:
+            ValueError: 커서가 음수이거나 count가 1 미만인 경우
+        """
+        if cursor < 0:
+            raise ValueError("invalid cursor")
+        count_shards = len(self._shards)
+        inner, index = divmod(cursor, count_shards)
+        with self._locks[index]:
+            inner, keys = self._shards[index].scan(inner, match, count)
+        
+        if inner == 0:
+            index += 1
+            if index == count_shards:
+                return 0, keys
+        return inner * count_shards + index, keys
+    
+    def keys(self, pattern="*"):
+        """
+        KEYS pattern - 패턴과 일치하는 모든 키
+        
+        yield 사이에 락을 잡고 있지 않도록 샤드 하나의 키를 락 안에서 모은 뒤 내보냅니다.
+        
+        Args:
+            pattern: 글롭 패턴
+            
+        Yields:
+            str: 일치하는 키
+        """
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                keys = list(shard.keys(pattern))
+            yield from keys
+    
+    def count_prefix(self, prefix):
+        """
+        COUNTPREFIX prefix - 모든 샤드의 prefix로 시작하는 키 개수 합
+        
+        Args:
+            prefix: 접두사
+            
+        Returns:
+            int: 키 개수
+        """
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                total += shard.count_prefix(prefix)
+        return total
+    
+    def delete_prefix(self, prefix):
+        """
+        DELPREFIX prefix - 샤드를 차례로 돌며 prefix로 시작하는 키 삭제
+        
+        Args:
+            prefix: 접두사
+            
+        Returns:
+            int: 삭제된 키 개수
+        """
+        deleted = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                deleted += shard.delete_prefix(prefix)
+        return deleted
+    
+    def unlink_prefix(self, prefix):
+        """
+        UNLINKPREFIX prefix - delete_prefix와 같지만 샤드마다 값 해제를 백그라운드로 미룸
+        
+        Args:
+            prefix: 접두사
+            
+        Returns:
+            int: 삭제된 키 개수
+        """
+        deleted = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                deleted += shard.unlink_prefix(prefix)
+        return deleted
+    
+    # ==================== TTL 관리 명령어 ====================
+    
+    def expire(self, key, seconds):
+        """
+        EXPIRE key seconds - 키의 만료 시간 설정
+        
+        Args:
+            key: 대상 키
+            seconds: 만료 시간 (초)
+            
+        Returns:
+            int: 1 (성공) 또는 0 (키 없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].expire(key, seconds)
+    
+    def pexpire(self, key, milliseconds):
+        """
+        PEXPIRE key milliseconds - 키의 만료 시간을 밀리초 단위로 설정
+        
+        Args:
+            key: 대상 키
+            milliseconds: 만료 시간 (밀리초)
+            
+        Returns:
+            int: 1 (성공) 또는 0 (키 없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].pexpire(key, milliseconds)
+    
+    def pexpireat(self, key, timestamp_ms):
+        """
+        PEXPIREAT key timestamp_ms - 절대 시각(밀리초)으로 만료 시간 설정
+        
+        Args:
+            key: 대상 키
+            timestamp_ms: 만료 시각 (Unix epoch 밀리초)
+            
+        Returns:
+            int: 1 (성공) 또는 0 (키 없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].pexpireat(key, timestamp_ms)
+    
+    def persist(self, key):
+        """
+        PERSIST key - 키의 만료 시간 제거
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 1 (TTL 제거됨) 또는 0 (키가 없거나 TTL 없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].persist(key)
+    
+    def ttl(self, key):
+        """
+        TTL key - 키의 남은 만료 시간 조회 (초)
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 남은 시간(초), -1(만료 없음), -2(키 없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].ttl(key)
+    
+    def pttl(self, key):
+        """
+        PTTL key - 키의 남은 만료 시간 조회 (밀리초)
+        
+        Args:
+            key: 대상 키
+            
+        Returns:
+            int: 남은 시간(밀리초), -1(만료 없음), -2(키 없음)
+        """
+        index = self.shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].pttl(key)
+    
+    # ==================== 설정 / 정보 ====================
+    
+    def config_set(self, param, value):
+        """
+        CONFIG SET parameter value - 모든 샤드의 설정 변경
+        
+        maxmemory는 샤드 수로 나누어 샤드마다 적용합니다 (나머지는 앞쪽 샤드에 1바이트씩).
+        샤드마다 따로 제거하므로 키가 한 샤드에 몰리면 전체 한도보다 먼저 제거가 시작될 수 있습니다.
+        
+        Args:
+            param: 설정 이름 (대소문자 무시)
+            value: 설정 값 (문자열)
+            
+        Returns:
+            str: "OK"
+            
+        Raises:
+            ValueError: 알 수 없는 설정이거나 값이 올바르지 않은 경우,
+                        또는 샤드 모드에서 지원하지 않는 영속성 설정인 경우
+        """
+        param = param.lower()
+        if param in ("appendonly", "appendfsync", "dbfilename",
+                     "auto-aof-rewrite-percentage", "auto-aof-rewrite-min-size"):
+            raise ValueError(f"config parameter '{param}' is not supported in sharded mode")
+        
+        if param == "maxmemory":
+            total = self._shards[0]._parse_int_config(value)
+            count = len(self._shards)
+            budget, remainder = divmod(total, count)
+            for index, (shard, lock) in enumerate(zip(self._shards, self._locks)):
+                with lock:
+                    shard.config_set_maxmemory(budget + (1 if index < remainder else 0))
+            self._maxmemory = total
+            return "OK"
+        
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.config_set(param, value)
+        return "OK"
+    
+    def config_get(self, param):
+        """
+        CONFIG GET parameter - 설정 조회 (maxmemory는 전체 한도, 그 외는 첫 샤드의 값)
+        
+        Args:
+            param: 설정 이름 (대소문자 무시)
+            
+        Returns:
+            str: 설정 값
+            
+        Raises:
+            ValueError: 알 수 없는 설정인 경우
+        """
+        param = param.lower()
+        if param == "maxmemory":
+            return str(self._maxmemory)
+        if param == "shards":
+            return str(len(self._shards))
+        with self._locks[0]:
+            return self._shards[0].config_get(param)
+    
+    def info_memory(self):
+        """
+        INFO memory - 메모리 정보 반환 (샤드별 사용량 / 제거 개수의 합)
+        
+        Returns:
+            dict: 메모리 사용 정보
+        """
+        used_memory = 0
+        evicted_keys = 0
+        ttl_index_entries = 0
+        info = None
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                info = shard.info_memory()
+            used_memory += info['used_memory']
+            evicted_keys += info['evicted_keys']
+            ttl_index_entries += info['ttl_index_entries']
+        
+        info['used_memory'] = used_memory
+        info['maxmemory'] = self._maxmemory
+        info['evicted_keys'] = evicted_keys
+        info['ttl_index_entries'] = ttl_index_entries
+        info['shards'] = len(self._shards)
+        return info
+    
+    def info_stats(self):
+        """
+        INFO stats - 만료 통계 반환 (샤드별 값의 합, 최근/최대 시간과 비율은 최댓값)
+        
+        Returns:
+            dict: 만료 통계
+        """
+        totals = {}
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                stats = shard.info_stats()
+            for name, value in stats.items():
+                if name not in totals:
+                    totals[name] = value
+                elif name in INFO_STATS_MAX_FIELDS:
+                    totals[name] = max(totals[name], value)
+                else:
+                    totals[name] += value
+        return totals
+    
+    # ==================== 주기 작업 ====================
+    
+    def cron_interval(self):
+        """
+        cron 호출 간격 (hz 설정의 역수)
+        
+        Returns:
+            float: 초 단위 간격
+        """
+        return self._shards[0].cron_interval()
+    
+    def cron(self):
+        """
+        모든 샤드의 주기 작업 실행 (능동 만료, 점진적 재해싱)
+        
+        샤드 락을 하나씩 잡고 실행하므로 다른 샤드의 명령어는 막지 않습니다.
+        """
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.cron()
@@ -0,0 +1,406 @@
+"""
+스냅샷(RDB 유사) 영속성 구현
+
+이 모듈은 특정 시점의 키스페이스와 TTL(만료 시각)을 길이 접두(length-prefixed)
+바이너리 형식으로 저장하고 읽어옵니다.
+
+파일 형식 (리틀 엔디언):
+    헤더:   b"MREDIS" + 버전(1바이트) + 키 개수(8바이트)
+    레코드: 타입(1) + 키 길이(4) + 값 길이(4) [+ 만료 시각 ms(8)] + 키 + 값
+    푸터:   EOF 마커(0xFF) + 헤더~레코드 전체의 CRC32(4)
+
+Hash 레코드는 값 길이 자리에 필드 개수를 쓰고, 키 뒤에 필드와 값을 번갈아
+길이(4) + 바이트로 이어 씁니다.
+
+레코드 타입:
+    TYPE_STRING      (0): TTL 없는 문자열
+    TYPE_STRING_TTL  (1): TTL 있는 문자열
+    TYPE_HASH        (2): TTL 없는 해시 (버전 2부터)
+    TYPE_HASH_TTL    (3): TTL 있는 해시 (버전 2부터)
+
+BGSAVE:
+    os.fork()로 자식 프로세스를 만들면 자식은 fork 시점의 메모리를 copy-on-write로 공유하므로
+    부모는 명령어를 계속 처리하고, 자식은 그 시점의 키스페이스를 임시 파일에 쓴 뒤 원자적으로 교체합니다.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+
+# 현재 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from protocol import ENCODING, ENCODING_ERRORS
+from data_structures.hash_object import HashObject
+
+
+MAGIC = b"MREDIS"
+VERSION = 2
+
+# 읽을 수 있는 버전 (버전 1은 String 레코드만 있음)
+SUPPORTED_VERSIONS = (1, 2)
+
+TYPE_STRING = 0
+TYPE_STRING_TTL = 1
+TYPE_HASH = 2
+TYPE_HASH_TTL = 3
+EOF_MARKER = 0xFF
+
+HEADER = struct.Struct("<6sBQ")
+RECORD = struct.Struct("<BII")
+RECORD_TTL = struct.Struct("<BIIq")
+LENGTH = struct.Struct("<I")
+FOOTER = struct.Struct("<BI")
+
+# 한 번에 write할 버퍼 크기
+WRITE_CHUNK = 1024 * 1024
+
+
+class SnapshotError(Exception):
+    """손상되었거나 형식이 맞지 않는 스냅샷 파일"""
+
+
+def write_snapshot(path, redis):
+    """
+    현재 키스페이스를 스냅샷 파일로 저장
+
+    임시 파일에 기록한 뒤 fsync하고 os.replace로 원자적으로 교체합니다.
+
+    Args:
+        path: 저장할 파일 경로
+        redis: MiniRedis 인스턴스
+
+    Returns:
+        int: 기록한 바이트 수
+    """
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    ttl_map = redis._ttl_map
+    pack = RECORD.pack
+    pack_ttl = RECORD_TTL.pack
+    pack_length = LENGTH.pack
+    crc = 0
+    total = 0
+
+    with open(tmp_path, "wb", buffering=0) as f:
+        header = HEADER.pack(MAGIC, VERSION, redis._store.size())
+        chunk = bytearray(header)
+
+        for entry in redis._store.entries():
+            key = entry.key.encode(ENCODING, ENCODING_ERRORS)
+            ttl_entry = ttl_map.get(entry.key)
+            if type(entry.value) is HashObject:
+                hash_object = entry.value
+                if ttl_entry is None:
+                    chunk += pack(TYPE_HASH, len(key), len(hash_object))
+                else:
+                    chunk += pack_ttl(TYPE_HASH_TTL, len(key), len(hash_object), ttl_entry.value)
+                chunk += key
+                for field, value in hash_object.items():
+                    field = field.encode(ENCODING, ENCODING_ERRORS)
+                    value = value.encode(ENCODING, ENCODING_ERRORS)
+                    chunk += pack_length(len(field))
+                    chunk += field
+                    chunk += pack_length(len(value))
+                    chunk += value
+            else:
+                value = str(entry.value).encode(ENCODING, ENCODING_ERRORS)
+                if ttl_entry is None:
+                    chunk += pack(TYPE_STRING, len(key), len(value))
+                else:
+                    chunk += pack_ttl(TYPE_STRING_TTL, len(key), len(value), ttl_entry.value)
+                chunk += key
+                chunk += value
+
+            if len(chunk) >= WRITE_CHUNK:
+                crc = zlib.crc32(chunk, crc)
+                f.write(chunk)
+                total += len(chunk)
+                chunk = bytearray()
+
+        crc = zlib.crc32(chunk, crc)
+        chunk += FOOTER.pack(EOF_MARKER, crc)
+        f.write(chunk)
+        total += len(chunk)
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+    return total
+
+
+def read_snapshot(path):
+    """
+    스냅샷 파일을 읽어 레코드를 순서대로 반환
+
+    파일 전체를 mmap으로 매핑하고 struct.unpack_from으로 레코드를 직접 해석하므로
+    작은 read를 반복하지 않습니다. CRC32는 읽기 전에 한 번에 검증합니다.
+
+    Args:
+        path: 스냅샷 파일 경로
+
+    Returns:
+        tuple: (키 개수, (key, value, expire_ms 또는 None) 제너레이터)
+               Hash 레코드의 value는 [필드, 값, ...] 리스트
+
+    Raises:
+        SnapshotError: 형식 오류 또는 체크섬 불일치
+    """
+    f = open(path, "rb")
+    size = os.fstat(f.fileno()).st_size
+    if size < HEADER.size + FOOTER.size:
+        f.close()
+        raise SnapshotError("snapshot file is truncated")
+
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, count = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        mm.close()
+        f.close()
+        raise SnapshotError("not a Mini Redis snapshot file")
+    if version not in SUPPORTED_VERSIONS:
+        mm.close()
+        f.close()
+        raise SnapshotError(f"unsupported snapshot version {version}")
+
+    body_end = size - FOOTER.size
+    marker, crc = FOOTER.unpack_from(mm, body_end)
+    view = memoryview(mm)
+    body = view[:body_end]
+    actual_crc = zlib.crc32(body)
+    body.release()
+    view.release()
+    if marker != EOF_MARKER or actual_crc != crc:
+        mm.close()
+        f.close()
+        raise SnapshotError("snapshot checksum mismatch")
+
+    def records():
+        unpack = RECORD.unpack_from
+        unpack_ttl = RECORD_TTL.unpack_from
+        unpack_length = LENGTH.unpack_from
+        record_size = RECORD.size
+        record_ttl_size = RECORD_TTL.size
+        length_size = LENGTH.size
+        pos = HEADER.size
+        try:
+            for _ in range(count):
+                rtype = mm[pos]
+                if rtype == TYPE_STRING or rtype == TYPE_HASH:
+                    _, key_len, value_len = unpack(mm, pos)
+                    expire_ms = None
+                    pos += record_size
+                elif rtype == TYPE_STRING_TTL or rtype == TYPE_HASH_TTL:
+                    _, key_len, value_len, expire_ms = unpack_ttl(mm, pos)
+                    pos += record_ttl_size
+                else:
+                    raise SnapshotError(f"unknown record type {rtype}")
+
+                key = mm[pos:pos + key_len].decode(ENCODING, ENCODING_ERRORS)
+                pos += key_len
+                if rtype >= TYPE_HASH:
+                    # value_len = 필드 개수
+                    value = []
+                    for _ in range(value_len * 2):
+                        (length,) = unpack_length(mm, pos)
+                        pos += length_size
+                        value.append(mm[pos:pos + length].decode(ENCODING, ENCODING_ERRORS))
+                        pos += length
+                else:
+                    value = mm[pos:pos + value_len].decode(ENCODING, ENCODING_ERRORS)
+                    pos += value_len
+                yield key, value, expire_ms
+        finally:
+            mm.close()
+            f.close()
+
+    return count, records()
+
+
+class SnapshotManager:
+    """
+    SAVE / BGSAVE 실행과 통계 관리
+
+    Attributes:
+        _child_pid: BGSAVE 자식 프로세스 PID (없으면 None)
+        last_save_time: 마지막 저장 성공 시각 (Unix epoch 초)
+        last_bgsave_status: 마지막 BGSAVE 결과 ("ok" / "err")
+        last_save_bytes: 마지막 저장 파일 크기
+        last_save_mbps: 마지막 저장 처리량 (MB/s)
+        last_load_*: 마지막 로드 통계
+    """
+
+    def __init__(self):
+        """
+        관리자 초기화
+        """
+        self._child_pid = None
+        self._child_pipe = None
+
+        self.last_save_time = int(time.time())
+        self.last_bgsave_status = "ok"
+        self.last_save_bytes = 0
+        self.last_save_seconds = 0.0
+        self.last_save_mbps = 0.0
+        self.last_load_keys = 0
+        self.last_load_bytes = 0
+        self.last_load_seconds = 0.0
+        self.last_load_mbps = 0.0
+        self.saves = 0
+
+    def in_progress(self):
+        """
+        BGSAVE 진행 여부
+
+        Returns:
+            bool: 진행 중이면 True
+        """
+        return self._child_pid is not None
+
+    def save(self, redis, path):
+        """
+        SAVE - 동기 저장 (저장이 끝날 때까지 명령어 처리 중단)
+
+        Args:
+            redis: MiniRedis 인스턴스
+            path: 저장 경로
+        """
+        start = time.perf_counter()
+        written = write_snapshot(path, redis)
+        self._record_save(written, time.perf_counter() - start)
+
+    def bgsave(self, redis, path):
+        """
+        BGSAVE - fork된 자식 프로세스에서 저장
+
+        fork를 지원하지 않는 플랫폼에서는 동기적으로 저장합니다.
+
+        Args:
+            redis: MiniRedis 인스턴스
+            path: 저장 경로
+
+        Raises:
+            RuntimeError: 이미 저장 중인 경우
+        """
+        if self._child_pid is not None:
+            raise RuntimeError("Background save already in progress")
+
+        if not hasattr(os, "fork"):
+            self.save(redis, path)
+            return
+
+        # 자식이 측정한 (기록 바이트, 소요 시간)을 부모에게 전달할 파이프
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # 자식 프로세스: fork 시점의 키스페이스(copy-on-write)를 기록
+            code = 0
+            try:
+                os.close(read_fd)
+                start = time.perf_counter()
+                written = write_snapshot(path, redis)
+                os.write(write_fd, f"{written} {time.perf_counter() - start}".encode())
+            except BaseException:
+                code = 1
+            os._exit(code)
+
+        os.close(write_fd)
+        self._child_pid = pid
+        self._child_pipe = read_fd
+
+    def cron(self):
+        """
+        BGSAVE 자식 프로세스 종료 확인 (서버 cron에서 호출)
+
+        Returns:
+            bool: 이번 호출에서 BGSAVE가 성공적으로 끝났으면 True
+        """
+        if self._child_pid is None:
+            return False
+
+        pid, status = os.waitpid(self._child_pid, os.WNOHANG)
+        if pid == 0:
+            return False  # 아직 진행 중
+
+        report = os.read(self._child_pipe, 128).decode()
+        os.close(self._child_pipe)
+        self._child_pid = None
+        self._child_pipe = None
+
+        if os.waitstatus_to_exitcode(status) != 0 or not report:
+            self.last_bgsave_status = "err"
+            return False
+
+        written, elapsed = report.split()
+        self._record_save(int(written), float(elapsed))
+        return True
+
+    def wait(self):
+        """
+        진행 중인 BGSAVE가 끝날 때까지 대기 (종료 처리용)
+        """
+        if self._child_pid is None:
+            return
+        os.waitpid(self._child_pid, 0)
+        os.close(self._child_pipe)
+        self._child_pid = None
+        self._child_pipe = None
+
+    def load(self, redis, path):
+        """
+        스냅샷 파일을 읽어 키스페이스 교체
+
+        Args:
+            redis: MiniRedis 인스턴스
+            path: 스냅샷 파일 경로
+
+        Returns:
+            int: 로드한 키 개수
+        """
+        start = time.perf_counter()
+        count, records = read_snapshot(path)
+        loaded = redis._load_snapshot_records(count, records)
+        elapsed = time.perf_counter() - start
+
+        self.last_load_keys = loaded
+        self.last_load_bytes = os.path.getsize(path)
+        self.last_load_seconds = elapsed
+        self.last_load_mbps = self._mbps(self.last_load_bytes, elapsed)
+        return loaded
+
+    def _record_save(self, written, elapsed):
+        """저장 성공 통계 기록"""
+        self.last_save_time = int(time.time())
+        self.last_bgsave_status = "ok"
+        self.last_save_bytes = written
+        self.last_save_seconds = elapsed
+        self.last_save_mbps = self._mbps(written, elapsed)
+        self.saves += 1
+
+    def _mbps(self, size, elapsed):
+        """처리량 (MB/s) 계산"""
+        if elapsed <= 0:
+            return 0.0
+        return round(size / elapsed / (1024 * 1024), 2)
+
+    def info(self):
+        """
+        INFO persistence용 스냅샷 통계
+
+        Returns:
+            dict: 스냅샷 상태 정보
+        """
+        return {
+            'rdb_bgsave_in_progress': 1 if self._child_pid is not None else 0,
+            'rdb_saves': self.saves,
+            'rdb_last_save_time': self.last_save_time,
+            'rdb_last_bgsave_status': self.last_bgsave_status,
+            'rdb_last_save_bytes': self.last_save_bytes,
+            'rdb_last_save_seconds': round(self.last_save_seconds, 3),
+            'rdb_last_save_mbps': self.last_save_mbps,
+            'rdb_last_load_keys': self.last_load_keys,
+            'rdb_last_load_bytes': self.last_load_bytes,
+            'rdb_last_load_seconds': round(self.last_load_seconds, 3),
+            'rdb_last_load_mbps': self.last_load_mbps,
+        }
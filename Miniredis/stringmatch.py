@@ -0,0 +1,153 @@
+"""
+Redis 글롭(glob) 패턴 매칭
+
+KEYS / SCAN MATCH 에서 쓰는 패턴 문법을 정규식으로 바꾸어 비교합니다.
+
+    *       임의의 문자열 (빈 문자열 포함)
+    ?       임의의 문자 하나
+    [abc]   괄호 안의 문자 하나, [^abc]는 괄호 안에 없는 문자 하나
+    [a-z]   범위 (Redis와 같이 [z-a]도 같은 범위로 취급)
+    \\x      x 자체 (특수 문자 이스케이프)
+
+변환한 정규식은 패턴별로 캐시하므로, 같은 패턴으로 키를 많이 비교해도
+패턴 해석은 한 번만 합니다.
+
+사용 예시:
+    glob_match("user:*", "user:1")       # True
+    glob_match("h[^e]llo", "hello")      # False
+"""
+
+import re
+from functools import lru_cache
+
+
+def glob_match(pattern, string):
+    """
+    string이 Redis 글롭 패턴과 일치하는지 확인
+
+    Args:
+        pattern: 글롭 패턴
+        string: 비교할 문자열
+
+    Returns:
+        bool: 일치하면 True
+    """
+    return compile_glob(pattern).fullmatch(string) is not None
+
+
+def matches_all(pattern):
+    """
+    모든 문자열과 일치하는 패턴인지 확인 (None 또는 '*'만으로 된 패턴)
+
+    Args:
+        pattern: 글롭 패턴 또는 None
+
+    Returns:
+        bool: 비교 없이 모든 키를 반환해도 되면 True
+    """
+    return pattern is None or (pattern != "" and pattern.strip("*") == "")
+
+
+@lru_cache(maxsize=128)
+def compile_glob(pattern):
+    """
+    글롭 패턴을 컴파일된 정규식으로 변환
+
+    Args:
+        pattern: 글롭 패턴
+
+    Returns:
+        re.Pattern: fullmatch로 비교할 정규식
+    """
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            while i + 1 < n and pattern[i + 1] == "*":
+                i += 1
+            parts.append(".*")
+        elif c == "?":
+            parts.append(".")
+        elif c == "[":
+            i = _translate_class(pattern, i + 1, parts)
+            continue
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return re.compile("".join(parts), re.DOTALL)
+
+
+def _translate_class(pattern, i, parts):
+    """
+    문자 클래스 [...] 하나를 정규식으로 변환 (compile_glob 보조)
+
+    Redis와 같이 닫는 괄호 없이 패턴이 끝나면 그 위치에서 클래스를 닫습니다.
+
+    Args:
+        pattern: 글롭 패턴
+        i: '[' 다음 위치
+        parts: 정규식 조각을 추가할 리스트
+
+    Returns:
+        int: 클래스 다음 위치
+    """
+    n = len(pattern)
+    negate = i < n and pattern[i] == "^"
+    if negate:
+        i += 1
+
+    items = []
+    while i < n and pattern[i] != "]":
+        c = pattern[i]
+        if c == "\\" and i + 1 < n:
+            i += 1
+            items.append(re.escape(pattern[i]))
+        elif i + 2 < n and pattern[i + 1] == "-" and pattern[i + 2] != "]":
+            start, end = c, pattern[i + 2]
+            if start > end:
+                start, end = end, start
+            items.append(f"{re.escape(start)}-{re.escape(end)}")
+            i += 2
+        else:
+            items.append(re.escape(c))
+        i += 1
+
+    if not items:
+        # []는 아무 문자와도, [^]는 모든 문자와 일치
+        parts.append("[^\\s\\S]" if not negate else ".")
+    else:
+        parts.append(("[^" if negate else "[") + "".join(items) + "]")
+    return i + 1
+
+
+def literal_prefix(pattern):
+    """
+    패턴 앞부분의 와일드카드 없는 문자열 (이스케이프 해제)
+
+    이 패턴과 일치하는 키는 모두 이 문자열로 시작하므로, 정렬된 키 인덱스에서
+    해당 범위만 훑으면 됩니다.
+
+    Args:
+        pattern: 글롭 패턴
+
+    Returns:
+        str: 접두사 (패턴이 와일드카드로 시작하면 빈 문자열)
+    """
+    chars = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c in "*?[":
+            break
+        if c == "\\" and i + 1 < n:
+            i += 1
+            c = pattern[i]
+        chars.append(c)
+        i += 1
+    return "".join(chars)